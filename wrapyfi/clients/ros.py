@@ -1,6 +1,5 @@
 import logging
 import sys
-import json
 import queue
 from typing import Optional, Any
 
@@ -63,11 +62,11 @@ class ROSNativeObjectClient(ROSClient):
         self._client = None
         self._queue = queue.Queue(maxsize=1)
 
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         self.persistent = persistent
 
@@ -103,13 +102,12 @@ class ROSNativeObjectClient(ROSClient):
         :param args: tuple: Positional arguments to send in the request.
         :param kwargs: dict: Keyword arguments to send in the request.
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._plugin_kwargs,
-                              serializer_kwrags=self._serializer_kwargs)
+        args_str = self._plugin_encoder.encode([args, kwargs])
         args_msg = std_msgs.msg.String()
         args_msg.data = args_str
 
         msg = self._client(args_msg)
-        obj = json.loads(msg.data, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+        obj = self._plugin_decoder.decode(msg.data)
         self._queue.put(obj, block=False)
 
     def _await_reply(self) -> Any:
@@ -165,9 +163,9 @@ class ROSImageClient(ROSClient):
         self._client = None
         self._queue = queue.Queue(maxsize=1)
 
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
 
         self.persistent = persistent
 
@@ -203,8 +201,7 @@ class ROSImageClient(ROSClient):
         :param args: tuple: Positional arguments to send in the request
         :param kwargs: dict: Keyword arguments to send in the request
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._plugin_kwargs,
-                              serializer_kwrags=self._serializer_kwargs)
+        args_str = self._plugin_encoder.encode([args, kwargs])
         args_msg = std_msgs.msg.String()
         args_msg.data = args_str
         msg = self._client(args_msg)
@@ -257,9 +254,9 @@ class ROSAudioChunkClient(ROSClient):
         self._client = self._req_msg = None
         self._queue = queue.Queue(maxsize=1)
 
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
 
         self.persistent = persistent
 
@@ -304,8 +301,7 @@ class ROSAudioChunkClient(ROSClient):
         :param args: tuple: Positional arguments to send in the request
         :param kwargs: dict: Keyword arguments to send in the request
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._plugin_kwargs,
-                              serializer_kwrags=self._serializer_kwargs)
+        args_str = self._plugin_encoder.encode([args, kwargs])
         args_msg = self._req_msg
         args_msg.request = args_str
         msg = self._client(args_msg).response
@@ -1,6 +1,5 @@
 import logging
 import sys
-import json
 import time
 import os
 import importlib.util
@@ -8,7 +7,6 @@ import queue
 from typing import Optional, Any
 
 import numpy as np
-import cv2
 import rclpy
 from rclpy.node import Node
 import std_msgs.msg
@@ -16,7 +14,7 @@ import sensor_msgs.msg
 
 from wrapyfi.connect.clients import Client, Clients
 from wrapyfi.middlewares.ros2 import ROS2Middleware
-from wrapyfi.encoders import JsonEncoder, JsonDecodeHook
+from wrapyfi.encoders import JsonEncoder, JsonDecodeHook, ImageCodecs
 
 
 class ROS2Client(Client, Node):
@@ -69,11 +67,11 @@ class ROS2NativeObjectClient(ROS2Client):
         self._client = None
         self._queue = queue.Queue(maxsize=1)
 
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
     def establish(self):
         """
@@ -119,8 +117,7 @@ class ROS2NativeObjectClient(ROS2Client):
         :param kwargs: dict: Keyword arguments to send in the request
         """
         # transmit args to server
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._plugin_kwargs,
-                              serializer_kwrags=self._serializer_kwargs)
+        args_str = self._plugin_encoder.encode([args, kwargs])
         self._req_msg.request = args_str
         future = self._client.call_async(self._req_msg)
         # receive message from server
@@ -129,7 +126,7 @@ class ROS2NativeObjectClient(ROS2Client):
             if future.done():
                 try:
                     msg = future.result()
-                    obj = json.loads(msg.response, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+                    obj = self._plugin_decoder.decode(msg.response)
                     self._queue.put(obj, block=False)
                 except Exception as e:
                     logging.error("[ROS 2] Service call failed: %s" % e)
@@ -153,7 +150,8 @@ class ROS2NativeObjectClient(ROS2Client):
 @Clients.register("Image", "ros2")
 class ROS2ImageClient(ROS2Client):
     def __init__(self, name: str, in_topic: str, width: int = -1, height: int = -1,
-                 rgb: bool = True, fp: bool = False, jpg: bool = False, serializer_kwargs: Optional[dict] = None, **kwargs):
+                 rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, serializer_kwargs: Optional[dict] = None, **kwargs):
         """
         The Image client using the ROS 2 Image message parsed to a numpy array.
 
@@ -164,6 +162,8 @@ class ROS2ImageClient(ROS2Client):
         :param rgb: bool: Whether the image is RGB. Default is True
         :param fp: bool: Whether to utilize floating-point precision. Default is False
         :param jpg: bool: True if the image should be decompressed from JPG. Default is False
+        :param codec: str: Any image codec other than 'raw' selects the compressed transport similar to ``jpg``. The codec
+                      is detected from the received image. Default is None
         :param serializer_kwargs: dict: Additional kwargs for the serializer
         """
         super().__init__(name, in_topic, **kwargs)
@@ -174,7 +174,7 @@ class ROS2ImageClient(ROS2Client):
         self.height = height
         self.rgb = rgb
         self.fp = fp
-        self.jpg = jpg
+        self.jpg = jpg or codec not in (None, "raw")
 
         if self.fp:
             self._encoding = '32FC3' if self.rgb else '32FC1'
@@ -187,9 +187,9 @@ class ROS2ImageClient(ROS2Client):
         self._client = None
         self._queue = queue.Queue(maxsize=1)
 
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
 
     def establish(self):
         """
@@ -239,8 +239,7 @@ class ROS2ImageClient(ROS2Client):
         :param kwargs: dict: Keyword arguments to send in the request
         """
         # transmit args to server
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._plugin_kwargs,
-                              serializer_kwrags=self._serializer_kwargs)
+        args_str = self._plugin_encoder.encode([args, kwargs])
         self._req_msg.request = args_str
         future = self._client.call_async(self._req_msg)
         # receive message from server
@@ -268,12 +267,8 @@ class ROS2ImageClient(ROS2Client):
         try:
             if self.jpg:
                 format, data = self._queue.get(block=True)
-                if format != 'jpeg':
-                    raise ValueError(f"Unsupported image format: {format}")
-                if self.rgb:
-                    img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
-                else:
-                    img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_GRAYSCALE)
+                # the codec is detected from the compressed image, therefore the format is not checked
+                img = ImageCodecs.decode(np.frombuffer(data, np.uint8), rgb=self.rgb)
             else:
                 height, width, encoding, is_bigendian, data = self._queue.get(block=True)
                 if encoding != self._encoding:
@@ -316,9 +311,9 @@ class ROS2AudioChunkClient(ROS2Client):
         self._client = None
         self._queue = queue.Queue(maxsize=1)
 
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
 
     def establish(self):
         """
@@ -363,8 +358,7 @@ class ROS2AudioChunkClient(ROS2Client):
         :param args: tuple: Positional arguments to send in the request
         :param kwargs: dict: Keyword arguments to send in the request
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._plugin_kwargs,
-                              serializer_kwrags=self._serializer_kwargs)
+        args_str = self._plugin_encoder.encode([args, kwargs])
         self._req_msg.request = args_str
         future = self._client.call_async(self._req_msg)
 
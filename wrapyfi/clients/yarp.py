@@ -1,5 +1,4 @@
 import logging
-import json
 import time
 from typing import Optional, Literal
 import queue
@@ -65,11 +64,11 @@ class YarpNativeObjectClient(YarpClient):
         self._port = None
         self._queue = queue.Queue(maxsize=1)
 
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
     def establish(self):
         """
@@ -108,8 +107,7 @@ class YarpNativeObjectClient(YarpClient):
         :param args: tuple: Positional arguments to send in the request
         :param kwargs: dict: Keyword arguments to send in the request
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._plugin_kwargs,
-                              serializer_kwrags=self._serializer_kwargs)
+        args_str = self._plugin_encoder.encode([args, kwargs])
         args_msg = yarp.Bottle()
         args_msg.clear()
         args_msg.addString(args_str)
@@ -118,7 +116,7 @@ class YarpNativeObjectClient(YarpClient):
         msg.clear()
 
         self._port.write(args_msg, msg)
-        obj = json.loads(msg.get(0).asString(), object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+        obj = self._plugin_decoder.decode(msg.get(0).asString())
         self._queue.put(obj, block=False)
 
     def _await_reply(self):
@@ -170,15 +168,14 @@ class YarpImageClient(YarpNativeObjectClient):
         :param args: tuple: Positional arguments to send in the request
         :param kwargs: dict: Keyword arguments to send in the request
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._plugin_kwargs,
-                              serializer_kwrags=self._serializer_kwargs)
+        args_str = self._plugin_encoder.encode([args, kwargs])
         args_msg = yarp.Bottle()
         args_msg.clear()
         args_msg.addString(args_str)
         msg = yarp.Bottle()
         msg.clear()
         self._port.write(args_msg, msg)
-        img = json.loads(msg.get(0).asString(), object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+        img = self._plugin_decoder.decode(msg.get(0).asString())
         height, width, channels = img.shape
         if 0 < self.width != width or 0 < self.height != height:
             raise ValueError("Incorrect image shape for client")
@@ -215,15 +212,14 @@ class YarpAudioChunkClient(YarpNativeObjectClient):
         :param args: tuple: Positional arguments to send in the request
         :param kwargs: dict: Keyword arguments to send in the request
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._plugin_kwargs,
-                              serializer_kwrags=self._serializer_kwargs)
+        args_str = self._plugin_encoder.encode([args, kwargs])
         args_msg = yarp.Bottle()
         args_msg.clear()
         args_msg.addString(args_str)
         msg = yarp.Bottle()
         msg.clear()
         self._port.write(args_msg, msg)
-        chunk, channels, rate, aud = json.loads(msg.get(0).asString(), object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+        chunk, channels, rate, aud = self._plugin_decoder.decode(msg.get(0).asString())
         if 0 < self.rate != rate:
             raise ValueError("Incorrect audio rate for client")
         if 0 < self.chunk != chunk or self.channels != channels or aud.size != chunk * channels:
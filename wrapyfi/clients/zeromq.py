@@ -2,15 +2,21 @@ import logging
 import json
 import queue
 import os
+import asyncio
+import itertools
+import threading
+from concurrent.futures import Future
 from typing import Optional
 
 import numpy as np
 import cv2
 import zmq
+import zmq.asyncio
 
 from wrapyfi.connect.clients import Client, Clients
-from wrapyfi.middlewares.zeromq import ZeroMQMiddlewareReqRep
-from wrapyfi.encoders import JsonEncoder, JsonDecodeHook
+from wrapyfi.middlewares.zeromq import ZeroMQMiddlewareReqRep, ZeroMQArrayHeader, ZEROMQ_AUDIO_HEADER, \
+    ZEROMQ_REQUEST_ID, zeromq_recv_into
+from wrapyfi.encoders import JsonEncoder, JsonDecodeHook, ImageCodecs
 
 SOCKET_IP = os.environ.get("WRAPYFI_ZEROMQ_SOCKET_IP", "127.0.0.1")
 SOCKET_REP_PORT = int(os.environ.get("WRAPYFI_ZEROMQ_SOCKET_REP_PORT", 5558))
@@ -39,9 +45,21 @@ class ZeroMQClient(Client):
         super().__init__(name, in_topic, carrier=carrier, **kwargs)
 
         self.socket_address = f"{carrier}://{socket_ip}:{socket_rep_port}"
+        self._asocket = None
 
         ZeroMQMiddlewareReqRep.activate(**zeromq_kwargs or {})
 
+    def _get_async_socket(self):
+        """
+        Get the ``zmq.asyncio`` socket shadowing the socket of the client, so that the replies are awaited on the event
+        loop.
+
+        :return: zmq.asyncio.Socket: The asynchronous socket
+        """
+        if self._asocket is None or self._asocket.underlying != self._socket.underlying:
+            self._asocket = zmq.asyncio.Socket.from_socket(self._socket)
+        return self._asocket
+
     def close(self):
         """
         Close the subscriber.
@@ -58,7 +76,7 @@ class ZeroMQClient(Client):
 class ZeroMQNativeObjectClient(ZeroMQClient):
     def __init__(self, name: str, in_topic: str, carrier: str = "tcp",
                  serializer_kwargs: Optional[dict] = None,
-                 deserializer_kwargs: Optional[dict] = None, **kwargs):
+                 deserializer_kwargs: Optional[dict] = None, pipelined: bool = False, **kwargs):
         """
         Specific client for handling native Python objects, serializing them to JSON strings for transmission.
 
@@ -67,31 +85,182 @@ class ZeroMQNativeObjectClient(ZeroMQClient):
         :param carrier: str: Carrier protocol. ZeroMQ currently only supports TCP for REQ/REP pattern. Default is 'tcp'
         :param serializer_kwargs: dict: Additional kwargs for the serializer
         :param deserializer_kwargs: dict: Additional kwargs for the deserializer
+        :param pipelined: bool: Whether to send the requests on a DEALER socket, tagging each request with an ID echoed
+                          in the reply, instead of a REQ socket. Pipelined clients allow many outstanding requests
+                          submitted with ``submit``, whose replies are resolved as futures. Default is False
         """
         super().__init__(name, in_topic, carrier=carrier, **kwargs)
-
-        self._plugin_encoder = JsonEncoder
+        self.pipelined = pipelined
+        self._request_ids = itertools.count()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._pipeline_push = None
+        self._pipeline_thread = None
+
+        self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs)
 
         self._queue = queue.Queue(maxsize=1)
 
         self.establish()
 
+    def _recv_array(self, shape: tuple, dtype: np.dtype, strides: tuple, out_buffer: Optional[np.ndarray] = None):
+        """
+        Internal method to receive a raw array frame, either into the output buffer or as an array viewing the
+        received frame without copying.
+
+        :param shape: tuple: The shape of the array
+        :param dtype: np.dtype: The dtype of the array
+        :param strides: tuple: The strides of the array in bytes
+        :param out_buffer: np.ndarray: Preallocated C-contiguous array to receive the frame into. Default is None
+        :return: np.ndarray: The received array
+        """
+        if out_buffer is None:
+            frame = self._socket.recv(copy=False)
+            return np.ndarray(shape, dtype=dtype, buffer=frame.buffer, strides=strides)
+        if out_buffer.shape != tuple(shape) or out_buffer.dtype != dtype:
+            # discard the frame, so the socket can send the next request
+            self._socket.recv(copy=False)
+            self._check_out_buffer(shape, dtype, out_buffer)
+        return zeromq_recv_into(self._socket, out_buffer)
+
+    def _frame_array(self, frame: zmq.Frame, shape: tuple, dtype: np.dtype, strides: tuple,
+                     out_buffer: Optional[np.ndarray] = None):
+        """
+        Internal method to view a received raw array frame as an array, copying it into the output buffer if provided.
+
+        :param frame: zmq.Frame: The received frame
+        :param shape: tuple: The shape of the array
+        :param dtype: np.dtype: The dtype of the array
+        :param strides: tuple: The strides of the array in bytes
+        :param out_buffer: np.ndarray: Preallocated C-contiguous array to copy the array into. Default is None
+        :return: np.ndarray: The received array
+        """
+        arr = np.ndarray(shape, dtype=dtype, buffer=frame.buffer, strides=strides)
+        if out_buffer is None:
+            return arr
+        self._check_out_buffer(shape, dtype, out_buffer)
+        np.copyto(out_buffer, arr)
+        return out_buffer
+
+    @staticmethod
+    def _check_out_buffer(shape: tuple, dtype: np.dtype, out_buffer: np.ndarray):
+        """
+        Internal method to check whether the output buffer matches the received array.
+
+        :param shape: tuple: The shape of the array
+        :param dtype: np.dtype: The dtype of the array
+        :param out_buffer: np.ndarray: The output buffer
+        """
+        if out_buffer.shape != tuple(shape) or out_buffer.dtype != dtype:
+            raise ValueError(f"Output buffer of shape {out_buffer.shape} and dtype {out_buffer.dtype} does not match "
+                             f"the received array of shape {tuple(shape)} and dtype {dtype}")
+
     def establish(self, **kwargs):
         """
         Establish the connection to the server.
         """
-        self._socket = zmq.Context().instance().socket(zmq.REQ)
+        if self.pipelined:
+            self._establish_pipeline()
+        else:
+            self._socket = self._create_socket(zmq.REQ)
+
+        self.established = True
+
+    def _create_socket(self, socket_type: int):
+        """
+        Internal method to create a socket connected to the device broker.
+
+        :param socket_type: int: The ZeroMQ socket type (e.g. ``zmq.REQ``)
+        :return: zmq.Socket: The socket
+        """
+        socket = zmq.Context().instance().socket(socket_type)
         for socket_property in ZeroMQMiddlewareReqRep().zeromq_kwargs.items():
             if isinstance(socket_property[1], str):
-                self._socket.setsockopt_string(getattr(zmq, socket_property[0]), socket_property[1])
+                socket.setsockopt_string(getattr(zmq, socket_property[0]), socket_property[1])
             else:
-                self._socket.setsockopt(getattr(zmq, socket_property[0]), socket_property[1])
-        self._socket.connect(self.socket_address)
+                socket.setsockopt(getattr(zmq, socket_property[0]), socket_property[1])
+        socket.connect(self.socket_address)
+        return socket
 
-        self.established = True
+    def _establish_pipeline(self):
+        """
+        Internal method to start the thread owning the DEALER socket of a pipelined client. The requests submitted by
+        any thread are forwarded to the pipeline thread through an inproc socket, since ZeroMQ sockets are not
+        thread-safe.
+        """
+        pipeline_address = f"inproc://wrapyfi_pipeline_{id(self)}"
+        requests = zmq.Context().instance().socket(zmq.PULL)
+        requests.bind(pipeline_address)
+        self._pipeline_push = zmq.Context().instance().socket(zmq.PUSH)
+        self._pipeline_push.connect(pipeline_address)
+        self._pipeline_thread = threading.Thread(name=f"wrapyfi_zeromq_pipeline_{self.__name__}",
+                                                 target=self._pipeline_loop,
+                                                 args=(self._create_socket(zmq.DEALER), requests), daemon=True)
+        self._pipeline_thread.start()
+
+    def _pipeline_loop(self, dealer: zmq.Socket, requests: zmq.Socket):
+        """
+        Internal method forwarding the submitted requests to the server and resolving the futures of their replies
+        until the client is closed.
+
+        :param dealer: zmq.Socket: The DEALER socket connected to the device broker
+        :param requests: zmq.Socket: The inproc socket receiving the submitted requests
+        """
+        poller = zmq.Poller()
+        poller.register(requests, zmq.POLLIN)
+        poller.register(dealer, zmq.POLLIN)
+        try:
+            while True:
+                events = dict(poller.poll())
+                if requests in events:
+                    frames = requests.recv_multipart()
+                    if frames == [b""]:
+                        break
+                    # the empty delimiter frame emulates the envelope of a REQ socket, expected by the REP servers
+                    dealer.send_multipart([b"", *frames])
+                if dealer in events:
+                    frames = dealer.recv_multipart(copy=False)
+                    with self._pending_lock:
+                        future = self._pending.pop(frames[1].bytes, None)
+                    if future is None:
+                        logging.warning(f"[ZeroMQ] Discarding reply to unknown request in {self.__class__.__name__}")
+                        continue
+                    try:
+                        future.set_result(self._check_reply(self._decode_reply(frames[2:])))
+                    except Exception as e:
+                        future.set_exception(e)
+        except zmq.ContextTerminated:
+            pass
+        finally:
+            dealer.close()
+            requests.close()
+            with self._pending_lock:
+                for future in self._pending.values():
+                    future.cancel()
+                self._pending.clear()
+
+    def submit(self, *args, **kwargs):
+        """
+        Serialize the provided Python objects to JSON strings and send a request to the server without awaiting the
+        reply. Many requests can be outstanding at once, and the replies are resolved in any order.
+
+        :param args: tuple: Arguments to be sent to the server
+        :param kwargs: dict: Keyword arguments to be sent to the server
+        :return: concurrent.futures.Future: The future resolving to the reply of the server
+        """
+        if not self.pipelined:
+            raise ValueError("Submitting requests requires a pipelined client")
+        future = Future()
+        request_id = ZEROMQ_REQUEST_ID.pack(next(self._request_ids))
+        with self._pending_lock:
+            args_str = self._plugin_encoder.encode_bytes([args, kwargs])
+            self._pending[request_id] = future
+            self._pipeline_push.send_multipart([request_id, args_str])
+        return future
 
     def request(self, *args, **kwargs):
         """
@@ -102,6 +271,8 @@ class ZeroMQNativeObjectClient(ZeroMQClient):
         :param kwargs: dict: Keyword arguments to be sent to the server
         :return: Any: The Python object received from the server, deserialized using the configured JSON decoder hook
         """
+        if self.pipelined:
+            return self.submit(*args, **kwargs).result()
         try:
             self._request(*args, **kwargs)
         except zmq.ZMQError as e:
@@ -115,13 +286,54 @@ class ZeroMQNativeObjectClient(ZeroMQClient):
         :param args: tuple: Arguments to be serialized and sent
         :param kwargs: dict: Keyword arguments to be serialized and sent
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._serializer_kwargs)
-        self._socket.send_string(args_str)
+        args_str = self._plugin_encoder.encode_bytes([args, kwargs])
+        self._socket.send(args_str)
 
-        obj_str = self._socket.recv_string()
-        obj = json.loads(obj_str, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+        obj_str = self._socket.recv()
+        obj = self._plugin_decoder.decode(obj_str)
         self._queue.put(obj, block=False)
 
+    async def arequest(self, *args, **kwargs):
+        """
+        Serialize the provided Python objects to JSON strings, send a request to the server, and await a reply without
+        blocking the event loop. The socket is shadowed by a ``zmq.asyncio`` socket, so that the reply is awaited on
+        the event loop.
+
+        :param args: tuple: Arguments to be sent to the server
+        :param kwargs: dict: Keyword arguments to be sent to the server
+        :return: Any: The Python object received from the server, deserialized using the configured JSON decoder hook
+        """
+        if self.pipelined:
+            return await asyncio.wrap_future(self.submit(*args, **kwargs))
+        try:
+            await self._arequest(*args, **kwargs)
+        except zmq.ZMQError as e:
+            logging.error("[ZeroMQ] Service call failed: %s" % e)
+        return self._await_reply()
+
+    async def _arequest(self, *args, **kwargs):
+        """
+        Internal method to serialize the request, send it to the server, and await the reply.
+
+        :param args: tuple: Arguments to be serialized and sent
+        :param kwargs: dict: Keyword arguments to be serialized and sent
+        """
+        args_str = self._plugin_encoder.encode_bytes([args, kwargs])
+        asocket = self._get_async_socket()
+        await asocket.send(args_str)
+
+        frames = await asocket.recv_multipart(copy=False)
+        self._queue.put(self._decode_reply(frames), block=False)
+
+    def _decode_reply(self, frames: list):
+        """
+        Internal method to decode the frames of a reply.
+
+        :param frames: List[zmq.Frame]: The reply frames
+        :return: Any: The Python object received from the server
+        """
+        return self._plugin_decoder.decode(frames[0].bytes)
+
     def _await_reply(self):
         """
         Internal method to retrieve the reply from the server from the queue and return it.
@@ -129,21 +341,43 @@ class ZeroMQNativeObjectClient(ZeroMQClient):
         :return: Any: The Python object received from the server, deserialized using the configured JSON decoder hook
         """
         try:
-            reply = self._queue.get(block=True)
-            return reply
+            return self._check_reply(self._queue.get(block=True))
         except queue.Empty:
             logging.warning(f"[ZeroMQ] Discarding data because queue is empty. "
                             f"This happened due to bad synchronization in {self.__class__.__name__}")
             return None
 
+    def _check_reply(self, reply):
+        """
+        Internal method to check the decoded reply and format it as returned by ``request``.
+
+        :param reply: Any: The decoded reply
+        :return: Any: The Python object received from the server
+        """
+        return reply
+
+    def close(self):
+        """
+        Close the client, stopping the pipeline thread of pipelined clients.
+        """
+        if getattr(self, "_pipeline_thread", None) is not None:
+            with self._pending_lock:
+                self._pipeline_push.send(b"")
+            self._pipeline_thread.join()
+            self._pipeline_push.close()
+            self._pipeline_thread = None
+        super().close()
+
 
 @Clients.register("Image", "zeromq")
 class ZeroMQImageClient(ZeroMQNativeObjectClient):
     def __init__(self, name: str, in_topic: str, carrier: str = "tcp",
                  width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
-                 serializer_kwargs: Optional[dict] = None, **kwargs):
+                 out_buffer: Optional[np.ndarray] = None, serializer_kwargs: Optional[dict] = None, **kwargs):
         """
-        The Image client using the ZeroMQ message construct parsed to a numpy array.
+        The Image client using the ZeroMQ message construct parsed to a numpy array. Raw images are returned as arrays
+        viewing the received message frame without copying, whereas compressed images are decoded using the codec
+        detected from the reply header.
 
         :param name: str: Name of the client
         :param in_topic: str: Topics are not supported for the REQ/REP pattern in ZeroMQ. Any given topic is ignored
@@ -152,7 +386,11 @@ class ZeroMQImageClient(ZeroMQNativeObjectClient):
         :param height: int: Height of the image. Default is -1 (use the height of the received image)
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
-        :param jpg: bool: True if the image should be compressed to JPG before sending. Default is False
+        :param jpg: bool: True if the image should be decompressed from JPG when replied by earlier Wrapyfi versions
+                    not transmitting the codec in the reply header. Default is False
+        :param out_buffer: np.ndarray: Preallocated C-contiguous array (e.g. in pinned memory) matching the shape and
+                           dtype of the replied images. When provided, each image is received into the buffer, which
+                           is returned instead of a new array. Default is None
         :param serializer_kwargs: dict: Additional kwargs for the serializer
         """
         super().__init__(name, in_topic, carrier=carrier, serializer_kwargs=serializer_kwargs, **kwargs)
@@ -161,8 +399,12 @@ class ZeroMQImageClient(ZeroMQNativeObjectClient):
         self.rgb = rgb
         self.fp = fp
         self.jpg = jpg
+        if out_buffer is not None and not out_buffer.flags['C_CONTIGUOUS']:
+            raise ValueError("The output buffer must be C-contiguous")
+        self.out_buffer = out_buffer
 
         self._type = np.float32 if self.fp else np.uint8
+        self._codecs = {}
 
     def _request(self, *args, **kwargs):
         """
@@ -171,43 +413,92 @@ class ZeroMQImageClient(ZeroMQNativeObjectClient):
         :param args: tuple: Arguments to be serialized and sent
         :param kwargs: dict: Keyword arguments to be serialized and sent
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._serializer_kwargs)
-        self._socket.send_string(args_str)
+        args_str = self._plugin_encoder.encode_bytes([args, kwargs])
+        self._socket.send(args_str)
+
+        reply_header = self._socket.recv()
+        header = ZeroMQArrayHeader.unpack(reply_header)
+        if header is None:
+            reply_img = self._decode_legacy(reply_header)
+        elif header["codec"] == "raw":
+            reply_img = self._recv_array(header["shape"], header["dtype"], header["strides"], self.out_buffer)
+            self._queue.put(reply_img, block=False)
+            return
+        else:
+            reply_img = self._decode_image(header, self._socket.recv(copy=False).buffer)
+        self._queue.put(self._copy_to_out_buffer(reply_img), block=False)
+
+    def _decode_reply(self, frames: list):
+        """
+        Internal method to decode the frames of a reply.
 
+        :param frames: List[zmq.Frame]: The reply frames
+        :return: np.ndarray: The image received from the server
+        """
+        header = ZeroMQArrayHeader.unpack(frames[0].bytes)
+        if header is None:
+            return self._copy_to_out_buffer(self._decode_legacy(frames[0].bytes))
+        elif header["codec"] == "raw":
+            return self._frame_array(frames[1], header["shape"], header["dtype"], header["strides"], self.out_buffer)
+        return self._copy_to_out_buffer(self._decode_image(header, frames[1].buffer))
+
+    def _decode_legacy(self, reply: bytes):
+        """
+        Internal method to decode an image replied by earlier versions as a single JPG or JSON frame.
+
+        :param reply: bytes: The reply frame
+        :return: np.ndarray: The decoded image
+        """
         if self.jpg:
-            reply_bytes = self._socket.recv()
-            reply_img = cv2.imdecode(np.frombuffer(reply_bytes, np.uint8), cv2.IMREAD_ANYCOLOR)
-        else:
-            reply_str = self._socket.recv_string()
-            reply_img_list = json.loads(reply_str)
-            reply_img = np.array(reply_img_list["img"], dtype=self._type)
-        self._queue.put(reply_img, block=False)
+            return cv2.imdecode(np.frombuffer(reply, np.uint8), cv2.IMREAD_ANYCOLOR)
+        return np.array(json.loads(reply)["img"], dtype=self._type)
 
-    def _await_reply(self):
+    def _decode_image(self, header: dict, img_buffer):
         """
-        Internal method to retrieve the reply from the server from the queue and return it.
+        Internal method to decompress an image using the codec specified in the reply header.
 
-        :return: np.ndarray: The image received from the server as a NumPy array
+        :param header: dict: The unpacked reply header
+        :param img_buffer: memoryview: The compressed image
+        :return: np.ndarray: The decompressed image
         """
-        try:
-            img = self._queue.get(block=True)
-            height, width, channels = img.shape
-            if 0 < self.width != width or 0 < self.height != height or img.size != height * width * (3 if self.rgb else 1):
-                raise ValueError("Incorrect image shape for subscriber")
+        codec = self._codecs.get(header["codec"])
+        if codec is None:
+            codec = self._codecs[header["codec"]] = ImageCodecs.create(header["codec"])
+        return codec.decode(img_buffer, dtype=header["dtype"], shape=header["shape"])
+
+    def _copy_to_out_buffer(self, img: np.ndarray):
+        """
+        Internal method to copy a decoded image into the output buffer if provided.
+
+        :param img: np.ndarray: The decoded image
+        :return: np.ndarray: The decoded image or the output buffer
+        """
+        if self.out_buffer is None:
             return img
-        except queue.Empty:
-            logging.warning(f"[ZeroMQ] Discarding data because queue is empty. "
-                            f"This happened due to bad synchronization in {self.__class__.__name__}")
-            return None
+        np.copyto(self.out_buffer, img.reshape(self.out_buffer.shape))
+        return self.out_buffer
+
+    def _check_reply(self, img: np.ndarray):
+        """
+        Internal method to check the shape of the replied image.
+
+        :param img: np.ndarray: The decoded image
+        :return: np.ndarray: The image received from the server as a NumPy array
+        """
+        height, width, channels = img.shape
+        if 0 < self.width != width or 0 < self.height != height or img.size != height * width * (3 if self.rgb else 1):
+            raise ValueError("Incorrect image shape for subscriber")
+        return img
 
 
 @Clients.register("AudioChunk", "zeromq")
 class ZeroMQAudioChunkClient(ZeroMQNativeObjectClient):
     def __init__(self, name: str, in_topic: str, carrier: str = "tcp",
                  channels: int = 1, rate: int = 44100, chunk: int = -1,
-                 serializer_kwargs: Optional[dict] = None, **kwargs):
+                 out_buffer: Optional[np.ndarray] = None, serializer_kwargs: Optional[dict] = None, **kwargs):
         """
-        The AudioChunk client using the ZeroMQ message construct parsed to a numpy array.
+        The AudioChunk client using the ZeroMQ message construct parsed to a numpy array. The audio chunks are
+        returned as arrays viewing the received message frame without copying.
 
         :param name: str: Name of the client
         :param in_topic: str: Topics are not supported for the REQ/REP pattern in ZeroMQ. Any given topic is ignored
@@ -217,12 +508,17 @@ class ZeroMQAudioChunkClient(ZeroMQNativeObjectClient):
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
         :param jpg: bool: True if the image should be compressed to JPG before sending. Default is False
+        :param out_buffer: np.ndarray: Preallocated C-contiguous float32 array of shape (chunk, channels) to receive
+                           the audio chunks into, which is returned instead of a new array. Default is None
         :param serializer_kwargs: dict: Additional kwargs for the serializer
         """
         super().__init__(name, in_topic, carrier=carrier, serializer_kwargs=serializer_kwargs, **kwargs)
         self.channels = channels
         self.rate = rate
         self.chunk = chunk
+        if out_buffer is not None and not out_buffer.flags['C_CONTIGUOUS']:
+            raise ValueError("The output buffer must be C-contiguous")
+        self.out_buffer = out_buffer
 
     def _request(self, *args, **kwargs):
         """
@@ -231,29 +527,58 @@ class ZeroMQAudioChunkClient(ZeroMQNativeObjectClient):
         :param args: tuple: Arguments to be serialized and sent
         :param kwargs: dict: Keyword arguments to be serialized and sent
         """
-        args_str = json.dumps([args, kwargs], cls=self._plugin_encoder, **self._serializer_kwargs)
-        self._socket.send_string(args_str)
+        args_str = self._plugin_encoder.encode_bytes([args, kwargs])
+        self._socket.send(args_str)
+
+        reply_header = self._socket.recv()
+        header = ZeroMQArrayHeader.unpack(reply_header)
+        if header is None:
+            self._queue.put(self._decode_legacy(reply_header), block=False)
+            return
+        chunk, channels = header["shape"]
+        rate, = ZEROMQ_AUDIO_HEADER.unpack(self._socket.recv())
+        reply_aud = self._recv_array(header["shape"], header["dtype"], header["strides"], self.out_buffer)
+        self._queue.put((chunk, channels, rate, reply_aud), block=False)
 
-        reply_str = self._socket.recv_string()
-        reply_aud_list = json.loads(reply_str)
-        chunk, channels, rate, aud = reply_aud_list["aud"]
+    def _decode_reply(self, frames: list):
+        """
+        Internal method to decode the frames of a reply.
+
+        :param frames: List[zmq.Frame]: The reply frames
+        :return: Tuple[int, int, int, np.ndarray]: The chunk size, number of channels, sampling rate, and audio chunk
+        """
+        header = ZeroMQArrayHeader.unpack(frames[0].bytes)
+        if header is None:
+            return self._decode_legacy(frames[0].bytes)
+        chunk, channels = header["shape"]
+        rate, = ZEROMQ_AUDIO_HEADER.unpack(frames[1].bytes)
+        reply_aud = self._frame_array(frames[2], header["shape"], header["dtype"], header["strides"], self.out_buffer)
+        return chunk, channels, rate, reply_aud
+
+    def _decode_legacy(self, reply: bytes):
+        """
+        Internal method to decode an audio chunk replied by earlier versions as a single JSON frame.
+
+        :param reply: bytes: The reply frame
+        :return: Tuple[int, int, int, np.ndarray]: The chunk size, number of channels, sampling rate, and audio chunk
+        """
+        chunk, channels, rate, aud = json.loads(reply)["aud"]
         reply_aud = np.array(aud, dtype=np.float32)
-        self._queue.put((chunk, channels, rate, reply_aud), block=False)
+        if self.out_buffer is not None:
+            np.copyto(self.out_buffer, reply_aud.reshape(self.out_buffer.shape))
+            reply_aud = self.out_buffer
+        return chunk, channels, rate, reply_aud
 
-    def _await_reply(self):
+    def _check_reply(self, reply: tuple):
         """
-        Internal method to retrieve the reply from the server from the queue and return it.
+        Internal method to check the rate and shape of the replied audio chunk.
 
+        :param reply: Tuple[int, int, int, np.ndarray]: The chunk size, number of channels, sampling rate, and audio chunk
         :return: Tuple[np.ndarray, int]: Audio chunk received formatted as (np.ndarray[audio_chunk, channels], int[samplerate])
         """
-        try:
-            chunk, channels, rate, aud = self._queue.get(block=True)
-            if 0 < self.rate != rate:
-                raise ValueError("Incorrect audio rate for listener")
-            if 0 < self.chunk != chunk or self.channels != channels or aud.size != chunk * channels:
-                raise ValueError("Incorrect audio shape for listener")
-            return aud, rate
-        except queue.Empty:
-            logging.warning(f"[ZeroMQ] Discarding data because queue is empty. "
-                            f"This happened due to bad synchronization in {self.__class__.__name__}")
-            return None
\ No newline at end of file
+        chunk, channels, rate, aud = reply
+        if 0 < self.rate != rate:
+            raise ValueError("Incorrect audio rate for listener")
+        if 0 < self.chunk != chunk or self.channels != channels or aud.size != chunk * channels:
+            raise ValueError("Incorrect audio shape for listener")
+        return aud, rate
@@ -1,15 +1,20 @@
 import logging
 import os
+import time
+import asyncio
+from functools import partial
 from glob import glob
+from typing import Optional
 
-from wrapyfi.utils import dynamic_module_import
+from wrapyfi.utils import dynamic_module_import, MiddlewareRegistry, MIDDLEWARE_LAZY, ResponseCache
+from wrapyfi.metrics import MetricsRegistry, CommunicatorMetrics
 
 
 class Clients(object):
     """
     A class that holds all clients and their corresponding middleware communicators.
     """
-    registry = {}
+    registry = MiddlewareRegistry()
     mwares = set()
 
     @classmethod
@@ -23,17 +28,26 @@ class Clients(object):
         def decorator(cls_):
             cls.registry[data_type + ":" + communicator] = cls_
             cls.mwares.add(communicator)
+            cls_.data_type = data_type
+            cls_.middleware = communicator
             return cls_
         return decorator
 
     @staticmethod
-    def scan():
+    def scan(lazy: bool = MIDDLEWARE_LAZY):
         """
         Scan for clients and add them to the registry.
+
+        :param lazy: bool: Whether to declare the middleware modules listed in the middleware manifest instead of
+                     importing them. Default is True (unless the environment variable ``WRAPYFI_MIDDLEWARE_LAZY=False``)
         """
+        from wrapyfi.clients import MIDDLEWARE_MANIFEST
         modules = glob(os.path.join(os.path.dirname(__file__), "..", "clients", "*.py"), recursive=True)
         modules = ["wrapyfi.clients." + module.replace(os.path.dirname(__file__) + "/../clients/", "") for module in
                    modules]
+        if lazy:
+            Clients.registry.declare("wrapyfi.clients", MIDDLEWARE_MANIFEST, Clients.mwares)
+            modules = [module for module in modules if module[len("wrapyfi.clients."):-3] not in MIDDLEWARE_MANIFEST]
         dynamic_module_import(modules, globals())
 
 
@@ -41,19 +55,48 @@ class Client(object):
     """
     A base class for clients.
     """
-    def __init__(self, name: str, in_topic: str, carrier: str = "", **kwargs):
+    data_type = None
+    middleware = None
+
+    def __init__(self, name: str, in_topic: str, carrier: str = "", cache_size: int = 0,
+                 cache_ttl: Optional[float] = None, **kwargs):
         """
         Initialize the client.
 
         :param name: str: The name of the client
         :param in_topic: str: The topic to listen to
         :param carrier: str: The middleware carrier to use
+        :param cache_size: int: The maximum number of replies cached by ``request`` and ``arequest``, keyed on the
+                           serialized request. Identical requests return the cached reply without contacting the server,
+                           and concurrent identical requests are coalesced, so that a single request is sent. The cached
+                           replies are shared, and must not be modified. Default is 0 (no caching)
+        :param cache_ttl: float: The seconds a reply remains cached. Default is None (replies do not expire)
         """
         self.__name__ = name
         self.in_topic = in_topic
         self.carrier = carrier
         self.established = False
 
+        self.metrics = CommunicatorMetrics("client", self, in_topic, ("request",)) if MetricsRegistry.enabled else None
+        if self.metrics is not None:
+            # metering wraps the transmission, so it is applied before the caching wrappers and only counts the
+            # requests sent to the server
+            self._request_unmetered = self.request
+            self.request = self._metered_request
+            if type(self).arequest is not Client.arequest:
+                self._arequest_unmetered = self.arequest
+                self.arequest = self._metered_arequest
+
+        self.response_cache = ResponseCache(cache_size, cache_ttl) if cache_size > 0 else None
+        if self.response_cache is not None:
+            # the subclass methods are wrapped on the instance, since they are overridden by each client
+            self._request_uncached = self.request
+            self.request = self._cached_request
+            # the default ``arequest`` runs the cached ``request`` in the executor
+            if type(self).arequest is not Client.arequest:
+                self._arequest_uncached = self.arequest
+                self.arequest = self._cached_arequest
+
     def establish(self):
         """
         Establish the client.
@@ -66,6 +109,84 @@ class Client(object):
         """
         raise NotImplementedError
 
+    async def arequest(self, *args, **kwargs):
+        """
+        Send a request to the server and await the reply without blocking the event loop. The blocking ``request`` runs
+        in the default executor of the event loop, unless the middleware client overrides this method.
+
+        :param args: tuple: Arguments to be sent to the server
+        :param kwargs: dict: Keyword arguments to be sent to the server
+        :return: Any: The reply received from the server
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, partial(self.request, *args, **kwargs))
+
+    def _metered_request(self, *args, **kwargs):
+        """
+        Internal method sending a request to the server, recording the request count and the round-trip latency.
+
+        :param args: tuple: Arguments to be sent to the server
+        :param kwargs: dict: Keyword arguments to be sent to the server
+        :return: Any: The reply received from the server
+        """
+        metrics = self.metrics
+        if not metrics.attached:
+            metrics.attach(self)
+        start = time.perf_counter_ns()
+        reply = self._request_unmetered(*args, **kwargs)
+        metrics.request.record(time.perf_counter_ns() - start)
+        metrics.messages.inc()
+        return reply
+
+    async def _metered_arequest(self, *args, **kwargs):
+        """
+        Internal method sending a request to the server and awaiting the reply, recording the request count and the
+        round-trip latency.
+
+        :param args: tuple: Arguments to be sent to the server
+        :param kwargs: dict: Keyword arguments to be sent to the server
+        :return: Any: The reply received from the server
+        """
+        metrics = self.metrics
+        if not metrics.attached:
+            metrics.attach(self)
+        start = time.perf_counter_ns()
+        reply = await self._arequest_unmetered(*args, **kwargs)
+        metrics.request.record(time.perf_counter_ns() - start)
+        metrics.messages.inc()
+        return reply
+
+    def _cached_request(self, *args, **kwargs):
+        """
+        Internal method returning the cached reply of an identical request, or sending the request and caching its reply.
+
+        :param args: tuple: Arguments to be sent to the server
+        :param kwargs: dict: Keyword arguments to be sent to the server
+        :return: Any: The reply received from the server
+        """
+        return self.response_cache.get_or_compute(self._cache_key(args, kwargs),
+                                                  partial(self._request_uncached, *args, **kwargs))
+
+    async def _cached_arequest(self, *args, **kwargs):
+        """
+        Internal method returning the cached reply of an identical request, or awaiting the reply and caching it.
+
+        :param args: tuple: Arguments to be sent to the server
+        :param kwargs: dict: Keyword arguments to be sent to the server
+        :return: Any: The reply received from the server
+        """
+        return await self.response_cache.aget_or_compute(self._cache_key(args, kwargs),
+                                                         partial(self._arequest_uncached, *args, **kwargs))
+
+    def _cache_key(self, args: tuple, kwargs: dict):
+        """
+        Internal method to serialize a request into the key of its cached reply.
+
+        :param args: tuple: Arguments to be sent to the server
+        :param kwargs: dict: Keyword arguments to be sent to the server
+        :return: bytes: The serialized request
+        """
+        return self._plugin_encoder.encode_bytes([args, kwargs])
+
     def _request(self, *args, **kwargs):
         """
         Internal method for sending a request to the server in the background.
@@ -1,8 +1,17 @@
 import logging
 import os
+import time
+import asyncio
+from collections import deque
 from glob import glob
+from typing import Optional
 
-from wrapyfi.utils import SingletonOptimized, dynamic_module_import
+from wrapyfi.utils import SingletonOptimized, dynamic_module_import, MiddlewareRegistry, MIDDLEWARE_LAZY
+from wrapyfi.encoders import MessageBatch, MessageTrace
+from wrapyfi.metrics import MetricsRegistry, CommunicatorMetrics, MessageTracer
+
+
+STREAM_POLL_INTERVAL = float(os.environ.get("WRAPYFI_STREAM_POLL_INTERVAL", 0.001))
 
 
 class ListenerWatchDog(metaclass=SingletonOptimized):
@@ -53,7 +62,7 @@ class Listeners(object):
     """
     A class that holds all listeners and their corresponding middleware communicators.
     """
-    registry = {}
+    registry = MiddlewareRegistry()
     mwares = set()
 
     @classmethod
@@ -67,17 +76,26 @@ class Listeners(object):
         def decorator(cls_):
             cls.registry[data_type + ":" + communicator] = cls_
             cls.mwares.add(communicator)
+            cls_.data_type = data_type
+            cls_.middleware = communicator
             return cls_
         return decorator
 
     @staticmethod
-    def scan():
+    def scan(lazy: bool = MIDDLEWARE_LAZY):
         """
         Scan for listeners and add them to the registry.
+
+        :param lazy: bool: Whether to declare the middleware modules listed in the middleware manifest instead of
+                     importing them. Default is True (unless the environment variable ``WRAPYFI_MIDDLEWARE_LAZY=False``)
         """
+        from wrapyfi.listeners import MIDDLEWARE_MANIFEST
         modules = glob(os.path.join(os.path.dirname(__file__), "..", "listeners", "*.py"), recursive=True)
         modules = ["wrapyfi.listeners." + module.replace(os.path.dirname(__file__) + "/../listeners/", "") for module in
                    modules]
+        if lazy:
+            Listeners.registry.declare("wrapyfi.listeners", MIDDLEWARE_MANIFEST, Listeners.mwares)
+            modules = [module for module in modules if module[len("wrapyfi.listeners."):-3] not in MIDDLEWARE_MANIFEST]
         dynamic_module_import(modules, globals())
 
 
@@ -85,7 +103,12 @@ class Listener(object):
     """
     A base class for listeners.
     """
-    def __init__(self, name: str, in_topic: str, carrier: str = "", should_wait: bool = True, **kwargs):
+    BATCH_MODES = ("items", "list")
+    data_type = None
+    middleware = None
+
+    def __init__(self, name: str, in_topic: str, carrier: str = "", should_wait: bool = True,
+                 batch_mode: str = "items", **kwargs):
         """
         Initialize the Listener.
 
@@ -93,6 +116,9 @@ class Listener(object):
         :param in_topic: str: The topic to listen to
         :param carrier: str: The middleware carrier to use
         :param should_wait: bool: Whether to wait for the listener to be established or not
+        :param batch_mode: str: How NativeObject listeners return the messages of batching publishers: 'items' returns
+                           the batched objects one per call, and 'list' returns all the batched objects in a list.
+                           Default is 'items'
         """
         self.__name__ = name
         self.in_topic = in_topic
@@ -100,6 +126,117 @@ class Listener(object):
         self.should_wait = should_wait
         self.established = False
 
+        if batch_mode not in self.BATCH_MODES:
+            raise ValueError(f"Unsupported batch mode: {batch_mode}. "
+                             f"Supported modes are: {', '.join(self.BATCH_MODES)}")
+        self.batch_mode = batch_mode
+        self.tracer = None
+        self.metrics = CommunicatorMetrics("listener", self, in_topic, ("listen",)) if MetricsRegistry.enabled else None
+        if self.metrics is not None:
+            # metering wraps the reception, so it is applied before the unbatching wrappers
+            self._listen_unmetered = self.listen
+            self.listen = self._metered_listen
+            if type(self).alisten is not Listener.alisten:
+                self._alisten_unmetered = self.alisten
+                self.alisten = self._metered_alisten
+        if self.data_type == "NativeObject":
+            self._batch = deque()
+            # the subclass methods are wrapped on the instance, since they are overridden by each listener
+            self._listen_batch = self.listen
+            self.listen = self._listen_unbatched
+            self._alisten_batch = self.alisten
+            self.alisten = self._alisten_unbatched
+
+    def _metered_listen(self):
+        """
+        Listen for incoming data, recording the message count and listening latency of the received messages.
+
+        :return: Any: The received object
+        """
+        metrics = self.metrics
+        if not metrics.attached:
+            metrics.attach(self)
+        start = time.perf_counter_ns()
+        obj = self._listen_unmetered()
+        if not self._is_empty(obj):
+            metrics.listen.record(time.perf_counter_ns() - start)
+            metrics.messages.inc()
+        return obj
+
+    async def _metered_alisten(self):
+        """
+        Listen for incoming data asynchronously, recording the message count and listening latency of the received
+        messages.
+
+        :return: Any: The received object
+        """
+        metrics = self.metrics
+        if not metrics.attached:
+            metrics.attach(self)
+        start = time.perf_counter_ns()
+        obj = await self._alisten_unmetered()
+        if not self._is_empty(obj):
+            metrics.listen.record(time.perf_counter_ns() - start)
+            metrics.messages.inc()
+        return obj
+
+    def _listen_unbatched(self):
+        """
+        Listen for incoming data, unbatching the messages of batching publishers according to the ``batch_mode``.
+
+        :return: Any: The received object, or the list of batched objects when the ``batch_mode`` is 'list'
+        """
+        if self._batch:
+            return self._untrace(self._batch.popleft())
+        return self._untrace(self._unbatch(self._listen_batch()))
+
+    async def _alisten_unbatched(self):
+        """
+        Listen for incoming data asynchronously, unbatching the messages of batching publishers according to the
+        ``batch_mode``.
+
+        :return: Any: The received object, or the list of batched objects when the ``batch_mode`` is 'list'
+        """
+        if self._batch:
+            return self._untrace(self._batch.popleft())
+        return self._untrace(self._unbatch(await self._alisten_batch()))
+
+    def _unbatch(self, obj):
+        """
+        Unbatch a received object according to the ``batch_mode``, queueing the remaining batched objects.
+
+        :param obj: Any: The received object
+        :return: Any: The received object, the first batched object, or the list of batched objects
+        """
+        if type(obj) is not MessageBatch:
+            return obj
+        if self.batch_mode == "list":
+            return [self._untrace(item) for item in obj]
+        self._batch.extend(obj)
+        return self._batch.popleft() if self._batch else None
+
+    def _untrace(self, obj):
+        """
+        Unwrap an object received in a tracing envelope, recording the envelope.
+
+        :param obj: Any: The received object
+        :return: Any: The traced object, or the received object if it was not traced
+        """
+        if type(obj) is not MessageTrace:
+            return obj
+        self._record_trace(obj)
+        return obj.obj
+
+    def _record_trace(self, trace: MessageTrace):
+        """
+        Record the tracing envelope of a received message, creating the tracer on the first traced message.
+
+        :param trace: MessageTrace: The tracing envelope
+        """
+        if self.tracer is None:
+            self.tracer = MessageTracer(self.metrics)
+        self.tracer.record(trace)
+
     def check_establishment(self, established: bool):
         """
         Check if the listener is established or not.
@@ -131,6 +268,83 @@ class Listener(object):
         """
         raise NotImplementedError
 
+    async def alisten(self):
+        """
+        Listen for incoming data without blocking the event loop. The blocking ``listen`` runs in the default executor
+        of the event loop, unless the middleware listener receives the messages asynchronously.
+
+        :return: Any: The received message
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.listen)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        """
+        Await the next message when iterating over the listener asynchronously (``async for``), skipping empty listens.
+
+        :return: Any: The received message
+        """
+        while True:
+            obj = await self.alisten()
+            if not self._is_empty(obj):
+                return obj
+            await asyncio.sleep(STREAM_POLL_INTERVAL)
+
+    def _is_empty(self, obj):
+        """
+        Check whether a listen returned no message. AudioChunk listeners return None audio along with the expected
+        sampling rate when no message is received.
+
+        :param obj: Any: The object returned by ``listen``
+        :return: bool: True if no message was received, False otherwise
+        """
+        return obj is None or (self.data_type == "AudioChunk" and obj[0] is None)
+
+    def stream(self, max_batch: Optional[int] = None, timeout: Optional[float] = None):
+        """
+        Continuously listen for incoming data, yielding the messages as they are received. Messages are yielded one
+        at a time, or in lists of up to ``max_batch`` messages to drain bursts in one go. A batch is started by the
+        first message received, and is yielded once ``max_batch`` messages are collected or ``timeout`` seconds have
+        elapsed since its first message. Empty listens are skipped, polling every ``STREAM_POLL_INTERVAL``
+        seconds when the listener does not wait for messages.
+
+        :param max_batch: int: The maximum number of messages yielded in a list. Default is None (messages yielded one at a time)
+        :param timeout: float: The seconds to wait for more messages after the first message of a batch is received.
+                        0 only collects the messages already received, and None waits until the batch is full. Default is None
+        :return: Generator[Any]: The received messages, or lists of received messages when ``max_batch`` is set
+        """
+        if max_batch is not None and max_batch < 1:
+            raise ValueError(f"max_batch must be a positive integer, got {max_batch}")
+        while True:
+            obj = self.listen()
+            if self._is_empty(obj):
+                time.sleep(STREAM_POLL_INTERVAL)
+                continue
+            if max_batch is None:
+                yield obj
+                continue
+
+            batch = [obj]
+            deadline = None if timeout is None else time.monotonic() + timeout
+            # the listener stops waiting for messages or connections, so that the batch deadline can be honoured
+            should_wait = self.should_wait
+            if deadline is not None:
+                self.should_wait = False
+            try:
+                while len(batch) < max_batch:
+                    obj = self.listen()
+                    if not self._is_empty(obj):
+                        batch.append(obj)
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                    if self._is_empty(obj):
+                        time.sleep(STREAM_POLL_INTERVAL)
+            finally:
+                self.should_wait = should_wait
+            yield batch
+
     def close(self):
         """
         Close the connection.
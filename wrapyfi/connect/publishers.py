@@ -1,8 +1,18 @@
 import logging
 import os
+import time
+import asyncio
+import queue
+import itertools
+import threading
 from glob import glob
 
-from wrapyfi.utils import SingletonOptimized, dynamic_module_import
+from wrapyfi.utils import SingletonOptimized, dynamic_module_import, MiddlewareRegistry, MIDDLEWARE_LAZY
+from wrapyfi.encoders import HOSTNAME, MessageTrace
+from wrapyfi.metrics import MetricsRegistry, CommunicatorMetrics
+
+
+TRACE_MESSAGES = os.environ.get("WRAPYFI_TRACE", "False") == "True"
 
 
 class PublisherWatchDog(metaclass=SingletonOptimized):
@@ -53,7 +63,7 @@ class Publishers(object):
     """
     A class that holds all publishers and their corresponding middleware communicators.
     """
-    registry = {}
+    registry = MiddlewareRegistry()
     mwares = set()
 
     @classmethod
@@ -68,17 +78,26 @@ class Publishers(object):
         def decorator(cls_):
             cls.registry[data_type + ":" + communicator] = cls_
             cls.mwares.add(communicator)
+            cls_.data_type = data_type
+            cls_.middleware = communicator
             return cls_
         return decorator
 
     @staticmethod
-    def scan():
+    def scan(lazy: bool = MIDDLEWARE_LAZY):
         """
         Scan for publishers and add them to the registry.
+
+        :param lazy: bool: Whether to declare the middleware modules listed in the middleware manifest instead of
+                     importing them. Default is True (unless the environment variable ``WRAPYFI_MIDDLEWARE_LAZY=False``)
         """
+        from wrapyfi.publishers import MIDDLEWARE_MANIFEST
         modules = glob(os.path.join(os.path.dirname(__file__), "..", "publishers", "*.py"), recursive=True)
         modules = ["wrapyfi.publishers." + module.replace(os.path.dirname(__file__) + "/../publishers/", "") for module in
                    modules]
+        if lazy:
+            Publishers.registry.declare("wrapyfi.publishers", MIDDLEWARE_MANIFEST, Publishers.mwares)
+            modules = [module for module in modules if module[len("wrapyfi.publishers."):-3] not in MIDDLEWARE_MANIFEST]
         dynamic_module_import(modules, globals())
 
 
@@ -86,7 +105,14 @@ class Publisher(object):
     """
     A base class for all publishers.
     """
-    def __init__(self, name: str, out_topic: str, carrier: str = "", should_wait: bool = True, **kwargs):
+    ASYNC_OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+    data_type = None
+    middleware = None
+    _publisher_index = itertools.count()
+
+    def __init__(self, name: str, out_topic: str, carrier: str = "", should_wait: bool = True,
+                 async_publish: bool = False, async_queue_size: int = 10, async_overflow: str = "drop_oldest",
+                 batch_size: int = 1, batch_timeout: float = 0.01, trace: bool = TRACE_MESSAGES, **kwargs):
         """
         Initialize the Publisher.
 
@@ -94,6 +120,23 @@ class Publisher(object):
         :param out_topic: str: The name of the output topic
         :param carrier: str: The name of the carrier to use
         :param should_wait: bool: Whether to wait for the publisher to be established or not
+        :param async_publish: bool: Whether to return immediately from ``publish``, leaving the serialization and
+                              transmission to a background thread. The published objects must not be modified after
+                              publishing. Default is False
+        :param async_queue_size: int: The maximum number of objects awaiting transmission when ``async_publish`` is
+                                 True. Default is 10
+        :param async_overflow: str: The policy applied when the queue is full: 'drop_oldest' discards the oldest
+                               queued object, 'drop_newest' discards the object being published, and 'block' waits
+                               until the queue has space. Default is 'drop_oldest'
+        :param batch_size: int: The number of objects accumulated before publishing them as a single message. Only
+                           supported by NativeObject publishers. The listeners unbatch the messages transparently.
+                           Default is 1 (no batching)
+        :param batch_timeout: float: The maximum time in seconds an object waits for the batch to fill before the
+                              incomplete batch is published. Default is 0.01
+        :param trace: bool: Whether to transmit a tracing envelope (``wrapyfi.encoders.MessageTrace``) holding the
+                      publisher ID, sequence number, and publishing times with each object, from which the listeners
+                      measure the transit latency and detect lost and reordered messages. Supported by all NativeObject
+                      publishers, and by the ZeroMQ Image and AudioChunk publishers. Default is False
         """
         self.__name__ = name
         self.out_topic = out_topic
@@ -101,6 +144,194 @@ class Publisher(object):
         self.should_wait = should_wait
         self.established = False
 
+        self.metrics = CommunicatorMetrics("publisher", self, out_topic, ("publish",)) if MetricsRegistry.enabled else None
+        if self.metrics is not None:
+            # metering wraps the transmission, so it is applied before the asynchronous and batching wrappers
+            self._publish_unmetered = self.publish
+            self.publish = self._metered_publish
+
+        self.async_publish = async_publish
+        self.published_messages = 0
+        self.dropped_messages = 0
+        if async_publish:
+            if async_overflow not in self.ASYNC_OVERFLOW_POLICIES:
+                raise ValueError(f"Unsupported overflow policy: {async_overflow}. "
+                                 f"Supported policies are: {', '.join(self.ASYNC_OVERFLOW_POLICIES)}")
+            self.async_overflow = async_overflow
+            self._async_queue = queue.Queue(maxsize=max(1, async_queue_size))
+            self._async_lock = threading.Lock()
+            # the subclass methods are wrapped on the instance, since they are overridden by each publisher
+            self._publish = self.publish
+            self._close = self.close
+            self.publish = self._enqueue_publish
+            self.close = self._close_async
+            self._async_thread = threading.Thread(name=f"wrapyfi_async_publisher_{out_topic}",
+                                                  target=self._async_publish_loop, daemon=True)
+            self._async_thread.start()
+
+        self.batch_size = batch_size
+        if batch_size > 1:
+            if self.data_type != "NativeObject":
+                raise ValueError(f"Batching is only supported by NativeObject publishers, not {self.data_type}")
+            self.batch_timeout = batch_timeout
+            self._batch = []
+            self._batch_deadline = None
+            self._batch_closed = False
+            self._batch_cond = threading.Condition()
+            # batching wraps the (possibly asynchronous) publish method, so complete batches are queued as one object
+            self._publish_batch = self.publish
+            self._close_batch = self.close
+            self.publish = self._enqueue_batch
+            self.close = self._close_batching
+            self._batch_thread = threading.Thread(name=f"wrapyfi_batch_publisher_{out_topic}",
+                                                  target=self._batch_flush_loop, daemon=True)
+            self._batch_thread.start()
+
+        self.trace = trace
+        if trace:
+            self.publisher_id = f"{HOSTNAME}:{os.getpid()}:{next(Publisher._publisher_index)}"
+            self._trace_seq = itertools.count()
+            if self.data_type == "NativeObject":
+                # tracing wraps the (possibly batching) publish method, so each object is traced when published
+                self._publish_untraced = self.publish
+                self.publish = self._traced_publish
+
+    def _next_trace(self):
+        """
+        Create the tracing envelope of the next published message.
+
+        :return: MessageTrace: The tracing envelope
+        """
+        return MessageTrace.now(self.publisher_id, next(self._trace_seq))
+
+    def _traced_publish(self, obj):
+        """
+        Publish an object wrapped in its tracing envelope.
+
+        :param obj: Any: The object to publish
+        """
+        return self._publish_untraced(self._next_trace().wrap(obj))
+
+    def _metered_publish(self, obj):
+        """
+        Publish an object, recording the message count and publishing latency.
+
+        :param obj: Any: The object to publish
+        """
+        metrics = self.metrics
+        if not metrics.attached:
+            metrics.attach(self)
+        start = time.perf_counter_ns()
+        ret = self._publish_unmetered(obj)
+        metrics.publish.record(time.perf_counter_ns() - start)
+        metrics.messages.inc()
+        return ret
+
+    @property
+    def queued_messages(self):
+        """
+        The number of objects awaiting transmission when publishing asynchronously.
+
+        :return: int: The number of queued objects
+        """
+        return self._async_queue.qsize() if self.async_publish else 0
+
+    def _enqueue_publish(self, obj):
+        """
+        Queue an object for publishing by the background thread, applying the overflow policy when the queue is full.
+
+        :param obj: Any: The object to publish
+        """
+        if self.async_overflow == "block":
+            self._async_queue.put(obj)
+            return
+        with self._async_lock:
+            try:
+                self._async_queue.put_nowait(obj)
+            except queue.Full:
+                self.dropped_messages += 1
+                if self.async_overflow == "drop_oldest":
+                    try:
+                        self._async_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._async_queue.put_nowait(obj)
+
+    def _async_publish_loop(self):
+        """
+        Publish the queued objects until the publisher is closed.
+        """
+        while True:
+            obj = self._async_queue.get()
+            if obj is self._async_queue:
+                break
+            try:
+                self._publish(obj)
+                self.published_messages += 1
+            except Exception as e:
+                logging.error(f"[Publisher] Failed to publish on topic {self.out_topic} asynchronously: {e}")
+
+    def _close_async(self):
+        """
+        Stop the background thread after publishing the queued objects, then close the connection.
+        """
+        if self._async_thread.is_alive() and self._async_thread is not threading.current_thread():
+            # the queue itself marks the end of the queued objects
+            self._async_queue.put(self._async_queue)
+            self._async_thread.join()
+        self._close()
+
+    def _enqueue_batch(self, obj):
+        """
+        Add an object to the current batch, publishing the batch once it holds ``batch_size`` objects.
+
+        :param obj: Any: The object to publish
+        """
+        with self._batch_cond:
+            self._batch.append(obj)
+            if len(self._batch) >= self.batch_size:
+                self._flush_batch()
+            elif len(self._batch) == 1:
+                self._batch_deadline = time.monotonic() + self.batch_timeout
+                self._batch_cond.notify()
+
+    def _flush_batch(self):
+        """
+        Publish the current batch as a single message. Must be called while holding the batch condition.
+        """
+        batch, self._batch = self._batch, []
+        self._batch_deadline = None
+        try:
+            self._publish_batch(dict(__wrapyfi__=["batch", batch]))
+        except Exception as e:
+            logging.error(f"[Publisher] Failed to publish a batch of {len(batch)} objects on topic {self.out_topic}: {e}")
+
+    def _batch_flush_loop(self):
+        """
+        Publish incomplete batches once their oldest object waited for ``batch_timeout`` seconds.
+        """
+        with self._batch_cond:
+            while not self._batch_closed:
+                if self._batch_deadline is None:
+                    self._batch_cond.wait()
+                    continue
+                remaining = self._batch_deadline - time.monotonic()
+                if remaining > 0:
+                    self._batch_cond.wait(remaining)
+                else:
+                    self._flush_batch()
+
+    def _close_batching(self):
+        """
+        Publish the incomplete batch and stop the background thread, then close the connection.
+        """
+        with self._batch_cond:
+            if self._batch:
+                self._flush_batch()
+            self._batch_closed = True
+            self._batch_cond.notify()
+        self._close_batch()
+
     def check_establishment(self, established: bool):
         """
         Check if the publisher is established and remove it from the ring if it is.
@@ -132,6 +363,15 @@ class Publisher(object):
         """
         raise NotImplementedError
 
+    async def apublish(self, obj):
+        """
+        Publish an object without blocking the event loop. The blocking ``publish`` runs in the default executor of the
+        event loop, unless the middleware publisher overrides this method.
+
+        :param obj: Any: The object to publish
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.publish, obj)
+
     def close(self):
         """
         Close the connection.
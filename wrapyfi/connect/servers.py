@@ -1,16 +1,24 @@
 import logging
 import os
+import time
+from functools import partial
 from glob import glob
-from typing import Optional
+from typing import Callable, Optional
 
-from wrapyfi.utils import dynamic_module_import
+from wrapyfi.utils import dynamic_module_import, MiddlewareRegistry, MIDDLEWARE_LAZY, ResponseCache
+from wrapyfi.metrics import MetricsRegistry, CommunicatorMetrics
+from wrapyfi.encoders import JsonEncoder
+
+
+# serializes the cache keys of servers without an encoder (e.g. servers of Image and AudioChunk messages)
+_CACHE_KEY_ENCODER = JsonEncoder()
 
 
 class Servers(object):
     """
     A class that holds all servers and their corresponding middleware communicators.
     """
-    registry = {}
+    registry = MiddlewareRegistry()
     mwares = set()
 
     @classmethod
@@ -25,17 +33,26 @@ class Servers(object):
         def decorator(cls_):
             cls.registry[data_type + ":" + communicator] = cls_
             cls.mwares.add(communicator)
+            cls_.data_type = data_type
+            cls_.middleware = communicator
             return cls_
         return decorator
 
     @staticmethod
-    def scan():
+    def scan(lazy: bool = MIDDLEWARE_LAZY):
         """
         Scan for servers and add them to the registry.
+
+        :param lazy: bool: Whether to declare the middleware modules listed in the middleware manifest instead of
+                     importing them. Default is True (unless the environment variable ``WRAPYFI_MIDDLEWARE_LAZY=False``)
         """
+        from wrapyfi.servers import MIDDLEWARE_MANIFEST
         modules = glob(os.path.join(os.path.dirname(__file__), "..", "servers", "*.py"), recursive=True)
         modules = ["wrapyfi.servers." + module.replace(os.path.dirname(__file__) + "/../servers/", "") for module in
                    modules]
+        if lazy:
+            Servers.registry.declare("wrapyfi.servers", MIDDLEWARE_MANIFEST, Servers.mwares)
+            modules = [module for module in modules if module[len("wrapyfi.servers."):-3] not in MIDDLEWARE_MANIFEST]
         dynamic_module_import(modules, globals())
 
 
@@ -43,7 +60,11 @@ class Server(object):
     """
     A base class for servers.
     """
-    def __init__(self, name: str, out_topic: str, carrier: str = "", out_topic_connect: Optional[str] = None, **kwargs):
+    data_type = None
+    middleware = None
+
+    def __init__(self, name: str, out_topic: str, carrier: str = "", out_topic_connect: Optional[str] = None,
+                 cache_size: int = 0, cache_ttl: Optional[float] = None, **kwargs):
         """
         Initialize the server.
 
@@ -51,12 +72,19 @@ class Server(object):
         :param out_topic: str: The topic to publish to
         :param carrier: str: The middleware carrier to use
         :param out_topic_connect: str: The topic to connect to (this is deprecated and will be removed in the future since its usage is limited to YARP)
+        :param cache_size: int: The maximum number of responses cached by ``respond``, keyed on the serialized request.
+                           Identical requests are replied with the cached response, and concurrent identical requests
+                           are coalesced, so that the response is computed once. Only suitable for idempotent
+                           functions. Default is 0 (no caching)
+        :param cache_ttl: float: The seconds a response remains cached. Default is None (responses do not expire)
         """
         self.__name__ = name
         self.out_topic = out_topic
         self.carrier = carrier
         self.out_topic_connect = out_topic + ":out" if out_topic_connect is None else out_topic_connect
         self.established = False
+        self.response_cache = ResponseCache(cache_size, cache_ttl) if cache_size > 0 else None
+        self.metrics = CommunicatorMetrics("server", self, out_topic, ("respond",)) if MetricsRegistry.enabled else None
 
     def establish(self):
         """
@@ -76,6 +104,99 @@ class Server(object):
         """
         raise NotImplementedError
 
+    def respond(self, func: Callable, args: list, kwargs: dict, key: Optional[bytes] = None):
+        """
+        Compute the response to a request, returning the cached response of an identical request if the response cache
+        is enabled.
+
+        :param func: Callable: The function computing the response
+        :param args: list: The arguments of the request
+        :param kwargs: dict: The keyword arguments of the request
+        :param key: bytes: The serialized request. Default is None (serialize the arguments and keyword arguments)
+        :return: Any: The response
+        """
+        if self.metrics is not None:
+            start = self._meter_request()
+            try:
+                return self._respond(func, args, kwargs, key)
+            finally:
+                self.metrics.respond.record(time.perf_counter_ns() - start)
+        return self._respond(func, args, kwargs, key)
+
+    def _respond(self, func: Callable, args: list, kwargs: dict, key: Optional[bytes] = None):
+        """
+        Internal method to compute the response to a request, returning the cached response of an identical request if
+        the response cache is enabled.
+
+        :param func: Callable: The function computing the response
+        :param args: list: The arguments of the request
+        :param kwargs: dict: The keyword arguments of the request
+        :param key: bytes: The serialized request. Default is None (serialize the arguments and keyword arguments)
+        :return: Any: The response
+        """
+        if self.response_cache is None:
+            return func(*args, **kwargs)
+        return self.response_cache.get_or_compute(self._cache_key(args, kwargs) if key is None else key,
+                                                  partial(func, *args, **kwargs))
+
+    async def arespond(self, func: Callable, args: list, kwargs: dict, key: Optional[bytes] = None):
+        """
+        Await the response to a request computed by a coroutine function, returning the cached response of an
+        identical request if the response cache is enabled.
+
+        :param func: Callable: The coroutine function computing the response
+        :param args: list: The arguments of the request
+        :param kwargs: dict: The keyword arguments of the request
+        :param key: bytes: The serialized request. Default is None (serialize the arguments and keyword arguments)
+        :return: Any: The response
+        """
+        start = self._meter_request() if self.metrics is not None else None
+        try:
+            if self.response_cache is None:
+                return await func(*args, **kwargs)
+            return await self.response_cache.aget_or_compute(self._cache_key(args, kwargs) if key is None else key,
+                                                             partial(func, *args, **kwargs))
+        finally:
+            if start is not None:
+                self.metrics.respond.record(time.perf_counter_ns() - start)
+
+    def _meter_request(self):
+        """
+        Internal method to count a request, attaching the metrics to the encoder and decoder of the server once they
+        are established.
+
+        :return: int: The ``time.perf_counter_ns`` timestamp at which the request started being responded to
+        """
+        metrics = self.metrics
+        if not metrics.attached:
+            metrics.attach(self)
+        metrics.messages.inc()
+        return time.perf_counter_ns()
+
+    def _cache_key(self, args: list, kwargs: dict):
+        """
+        Internal method to serialize a request into the key of its cached response.
+
+        :param args: list: The arguments of the request
+        :param kwargs: dict: The keyword arguments of the request
+        :return: bytes: The serialized request
+        """
+        return getattr(self, "_plugin_encoder", _CACHE_KEY_ENCODER).encode_bytes([args, kwargs])
+
+    def serve(self, handler: Callable, workers: int = 4, spawn: str = "thread"):
+        """
+        Serve the client requests with the handler on a pool of workers, each receiving requests and replying to them
+        independently. The method does not block: it returns once the workers are spawned, and the workers are stopped
+        when the server is closed. Middleware without worker pools raise a NotImplementedError.
+
+        :param handler: Callable: The function handling the requests, called with the arguments and keyword arguments
+                        of each request. Its return value is sent as the reply
+        :param workers: int: Number of workers. Default is 4
+        :param spawn: str: Whether to spawn the workers as 'thread' or 'process'. Default is 'thread'
+        :return: None
+        """
+        raise NotImplementedError
+
     def close(self):
         """
         Close the connection.
@@ -1,5 +1,7 @@
 import os
-from functools import wraps
+import asyncio
+import inspect
+from functools import wraps, partial
 import re
 from typing import Union, List, Any, Callable, Optional
 
@@ -18,6 +20,7 @@ DEFAULT_COMMUNICATOR = os.environ.get("WRAPYFI_DEFAULT_MWARE", DEFAULT_COMMUNICA
 
 class MiddlewareCommunicator(object):
     __registry = {}
+    __dispatch_plans = {}
 
     def __init__(self):
         """
@@ -29,16 +32,14 @@ class MiddlewareCommunicator(object):
                 self.activate_communication(getattr(self.__class__, key), mode=value)
 
     @classmethod
-    def __trigger_publish(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds, **kwds):
+    def __instantiate_publishers(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds):
         """
-        Triggers the publish mode of the middleware communicator.
+        Instantiates the publishers of a function instance, unless they were already instantiated.
 
-        :param func: Callable[..., Any]: The function to be triggered and whose return values are to be published
+        :param func: Callable[..., Any]: The function associated with the publishers
         :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
-        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the publisher instantiation and function invocation
-        :param wds: tuple: Variable positional arguments to be passed to the function
-        :param kwds: dict: Additional keyword arguments to be passed to the function
-        :return: Any: The return values of the triggered function (`func`). The data type and structure depend on the output of `func`
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and utilized during the publisher instantiation
+        :param wds: tuple: Variable positional arguments to be matched and utilized during the publisher instantiation
 
         :raises: KeyError: If the intended publisher type and middleware are unavailable, resorting to a fallback publisher
         """
@@ -91,11 +92,24 @@ class MiddlewareCommunicator(object):
                                                     **new_kwargs))
                             communicator["return_func_type"][comm_idx] = "MMO:"
 
+    @classmethod
+    def __trigger_publish(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds, **kwds):
+        """
+        Triggers the publish mode of the middleware communicator.
+
+        :param func: Callable[..., Any]: The function to be triggered and whose return values are to be published
+        :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the publisher instantiation and function invocation
+        :param wds: tuple: Variable positional arguments to be passed to the function
+        :param kwds: dict: Additional keyword arguments to be passed to the function
+        :return: Any: The return values of the triggered function (`func`). The data type and structure depend on the output of `func`
+        """
+        cls.__instantiate_publishers(func, instance_id, kwd, *wds)
+
+        communicators = cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"]
         returns = func(*wds, **kwds)
         for ret_idx, ret in enumerate(returns):
-            wrp_exec = \
-            cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"][ret_idx][
-                "wrapped_executor"]
+            wrp_exec = communicators[ret_idx]["wrapped_executor"]
             # single element
             if isinstance(wrp_exec, pub.Publisher):
                 wrp_exec.publish(ret)
@@ -106,16 +120,14 @@ class MiddlewareCommunicator(object):
         return returns
 
     @classmethod
-    def __trigger_listen(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds, **kwds):
+    def __instantiate_listeners(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds):
         """
-        Triggers the listen mode of the middleware communicator.
+        Instantiates the listeners of a function instance, unless they were already instantiated.
 
-        :param func: Callable[..., Any]: The function associated with the listener and whose return values might be utilized
+        :param func: Callable[..., Any]: The function associated with the listeners
         :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
-        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the listener instantiation and function invocation
-        :param wds: tuple: Variable positional arguments to be passed to the function
-        :param kwds: dict: Additional keyword arguments to be passed to the function (not used since the listener does not accept any additional arguments, given that it does not execute any function or transmit any arguments)
-        :return: Any: The return values obtained from the listeners. The data type and structure depend on the output of the listener
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and utilized during the listener instantiation
+        :param wds: tuple: Variable positional arguments to be matched and utilized during the listener instantiation
 
         :raises: KeyError: If the intended listener type and middleware are unavailable, resorting to a fallback listener
         """
@@ -167,11 +179,23 @@ class MiddlewareCommunicator(object):
                                                     **new_kwargs))
                             communicator["return_func_type"][comm_idx] = "MMO:"
 
+    @classmethod
+    def __trigger_listen(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds, **kwds):
+        """
+        Triggers the listen mode of the middleware communicator.
+
+        :param func: Callable[..., Any]: The function associated with the listener and whose return values might be utilized
+        :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the listener instantiation and function invocation
+        :param wds: tuple: Variable positional arguments to be passed to the function
+        :param kwds: dict: Additional keyword arguments to be passed to the function (not used since the listener does not accept any additional arguments, given that it does not execute any function or transmit any arguments)
+        :return: Any: The return values obtained from the listeners. The data type and structure depend on the output of the listener
+        """
+        cls.__instantiate_listeners(func, instance_id, kwd, *wds)
+
         returns = []
-        for ret_idx in range(
-                len(cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"])):
-            wrp_exec = cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"][ret_idx][
-                "wrapped_executor"]
+        for functor in cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"]:
+            wrp_exec = functor["wrapped_executor"]
             # single element
             if isinstance(wrp_exec, lsn.Listener):
                 returns.append(wrp_exec.listen())
@@ -184,16 +208,14 @@ class MiddlewareCommunicator(object):
         return returns
 
     @classmethod
-    def __trigger_reply(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+    def __instantiate_servers(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds):
         """
-        Triggers the reply mode of the middleware communicator.
+        Instantiates the servers of a function instance, unless they were already instantiated.
 
-        :param func: Callable[..., Any]: The function to be triggered and whose return values may be used in replies
+        :param func: Callable[..., Any]: The function associated with the servers
         :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
-        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the server instantiation and function invocation
-        :param wds: tuple: Variable positional arguments to be passed to the function
-        :param kwds: dict: Additional keyword arguments to be passed to the function
-        :return: Any: The return values of the triggered function (`func`). The data type and structure depend on the output of `func`
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and utilized during the server instantiation
+        :param wds: tuple: Variable positional arguments to be matched and utilized during the server instantiation
 
         :raises: KeyError: If the intended server type and middleware are unavailable, resorting to a fallback server
         """
@@ -248,6 +270,20 @@ class MiddlewareCommunicator(object):
                                                     **new_kwargs))
                             communicator["return_func_type"][comm_idx] = "MMO:"
 
+    @classmethod
+    def __trigger_reply(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+        """
+        Triggers the reply mode of the middleware communicator.
+
+        :param func: Callable[..., Any]: The function to be triggered and whose return values may be used in replies
+        :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the server instantiation and function invocation
+        :param wds: tuple: Variable positional arguments to be passed to the function
+        :param kwds: dict: Additional keyword arguments to be passed to the function
+        :return: Any: The return values of the triggered function (`func`). The data type and structure depend on the output of `func`
+        """
+        cls.__instantiate_servers(func, instance_id, kwd, *wds)
+
         returns = None
         for ret_idx, functor in enumerate(
                 cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"]):
@@ -256,7 +292,7 @@ class MiddlewareCommunicator(object):
             if isinstance(wrp_exec, srv.Server):
                 new_args, new_kwargs = wrp_exec.await_request(*wds[1:], **kwds)
                 if returns is None:
-                    returns = func(wds[0], *new_args, **new_kwargs)
+                    returns = wrp_exec.respond(partial(func, wds[0]), new_args, new_kwargs)
                 ret = returns[ret_idx]
                 wrp_exec.reply(ret)
             # list for single return
@@ -264,22 +300,20 @@ class MiddlewareCommunicator(object):
                 for wrp_idx, wrp in enumerate(wrp_exec):
                     new_args, new_kwargs = wrp.await_request(*wds[1:], **kwds)
                     if returns is None:
-                        returns = func(wds[0], *new_args, **new_kwargs)
+                        returns = wrp.respond(partial(func, wds[0]), new_args, new_kwargs)
                     ret = returns[ret_idx][wrp_idx]
                     wrp.reply(ret)
         return returns
 
     @classmethod
-    def __trigger_request(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+    def __instantiate_clients(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds):
         """
-        Triggers the request mode of the middleware communicator.
+        Instantiates the clients of a function instance, unless they were already instantiated.
 
-        :param func: Callable[..., Any]: The function associated with the client requests and might utilize the request results
+        :param func: Callable[..., Any]: The function associated with the clients
         :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
-        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the client instantiation and function invocation
-        :param wds: tuple: Variable positional arguments to be passed to the function
-        :param kwds: dict: Additional keyword arguments to be passed to the function
-        :return: Any: The return values obtained from the clients' requests. The data type and structure depend on the output of the client requests
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and utilized during the client instantiation
+        :param wds: tuple: Variable positional arguments to be matched and utilized during the client instantiation
 
         :raises: KeyError: If the intended client type and middleware are unavailable, resorting to a fallback client
         """
@@ -331,6 +365,20 @@ class MiddlewareCommunicator(object):
                                                     **new_kwargs))
                             communicator["return_func_type"][comm_idx] = "MMO:"
 
+    @classmethod
+    def __trigger_request(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+        """
+        Triggers the request mode of the middleware communicator.
+
+        :param func: Callable[..., Any]: The function associated with the client requests and might utilize the request results
+        :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the client instantiation and function invocation
+        :param wds: tuple: Variable positional arguments to be passed to the function
+        :param kwds: dict: Additional keyword arguments to be passed to the function
+        :return: Any: The return values obtained from the clients' requests. The data type and structure depend on the output of the client requests
+        """
+        cls.__instantiate_clients(func, instance_id, kwd, *wds)
+
         returns = []
         for ret_idx, functor in enumerate(
                 cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"]):
@@ -348,6 +396,221 @@ class MiddlewareCommunicator(object):
                 returns.append(subreturns)
         return returns
 
+    @classmethod
+    def __trigger_disable(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+        """
+        Triggers the disable mode of the middleware communicator. WARNING: use with caution. This produces "None" for
+        all the method's returns.
+
+        :param func: Callable[..., Any]: The function whose returns are disabled
+        :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
+        :param kwd: dict: A dictionary containing keyword arguments (not used)
+        :param wds: tuple: Variable positional arguments (not used)
+        :param kwds: dict: Additional keyword arguments (not used)
+        :return: List[None]: A list of "None" with one element per return
+        """
+        entry = cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]
+        entry["last_results"] = [None] * len(entry["communicator"])
+        return entry["last_results"]
+
+    @classmethod
+    def __trigger_undefined(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+        """
+        Triggers an undefined mode of the middleware communicator, neither executing the function nor communicating.
+
+        :return: None
+        """
+        return None
+
+    @classmethod
+    async def __atrigger_publish(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds, **kwds):
+        """
+        Triggers the publish mode of the middleware communicator for a coroutine function, awaiting the function and
+        publishing its return values without blocking the event loop.
+
+        :param func: Callable[..., Any]: The coroutine function to be awaited and whose return values are to be published
+        :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the publisher instantiation and function invocation
+        :param wds: tuple: Variable positional arguments to be passed to the function
+        :param kwds: dict: Additional keyword arguments to be passed to the function
+        :return: Any: The return values of the awaited function (`func`). The data type and structure depend on the output of `func`
+        """
+        cls.__instantiate_publishers(func, instance_id, kwd, *wds)
+
+        communicators = cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"]
+        returns = await func(*wds, **kwds)
+        for ret_idx, ret in enumerate(returns):
+            wrp_exec = communicators[ret_idx]["wrapped_executor"]
+            # single element
+            if isinstance(wrp_exec, pub.Publisher):
+                await wrp_exec.apublish(ret)
+            # list for single return
+            elif isinstance(wrp_exec, list):
+                for wrp_idx, wrp in enumerate(wrp_exec):
+                    await wrp.apublish(ret[wrp_idx])
+        return returns
+
+    @classmethod
+    async def __atrigger_listen(cls, func: Callable[..., Any], instance_id: str, kwd: dict, *wds, **kwds):
+        """
+        Triggers the listen mode of the middleware communicator for a coroutine function, awaiting the messages
+        without blocking the event loop.
+
+        :param func: Callable[..., Any]: The coroutine function associated with the listener
+        :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the listener instantiation
+        :param wds: tuple: Variable positional arguments matched during the listener instantiation
+        :param kwds: dict: Additional keyword arguments (not used)
+        :return: Any: The return values obtained from the listeners. The data type and structure depend on the output of the listener
+        """
+        cls.__instantiate_listeners(func, instance_id, kwd, *wds)
+
+        returns = []
+        for functor in cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"]:
+            wrp_exec = functor["wrapped_executor"]
+            # single element
+            if isinstance(wrp_exec, lsn.Listener):
+                returns.append(await wrp_exec.alisten())
+            # list for single return
+            elif isinstance(wrp_exec, list):
+                subreturns = []
+                for wrp_idx, wrp in enumerate(wrp_exec):
+                    subreturns.append(await wrp.alisten())
+                returns.append(subreturns)
+        return returns
+
+    @classmethod
+    async def __atrigger_reply(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+        """
+        Triggers the reply mode of the middleware communicator for a coroutine function. The servers await the
+        requests in the default executor of the event loop, since servers do not provide asynchronous methods.
+
+        :param func: Callable[..., Any]: The coroutine function to be awaited and whose return values may be used in replies
+        :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the server instantiation and function invocation
+        :param wds: tuple: Variable positional arguments to be passed to the function
+        :param kwds: dict: Additional keyword arguments to be passed to the function
+        :return: Any: The return values of the awaited function (`func`). The data type and structure depend on the output of `func`
+        """
+        cls.__instantiate_servers(func, instance_id, kwd, *wds)
+
+        loop = asyncio.get_running_loop()
+        returns = None
+        for ret_idx, functor in enumerate(
+                cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"]):
+            wrp_exec = functor["wrapped_executor"]
+            # single element
+            if isinstance(wrp_exec, srv.Server):
+                new_args, new_kwargs = await loop.run_in_executor(None, partial(wrp_exec.await_request, *wds[1:], **kwds))
+                if returns is None:
+                    returns = await wrp_exec.arespond(partial(func, wds[0]), new_args, new_kwargs)
+                wrp_exec.reply(returns[ret_idx])
+            # list for single return
+            elif isinstance(wrp_exec, list):
+                for wrp_idx, wrp in enumerate(wrp_exec):
+                    new_args, new_kwargs = await loop.run_in_executor(None, partial(wrp.await_request, *wds[1:], **kwds))
+                    if returns is None:
+                        returns = await wrp.arespond(partial(func, wds[0]), new_args, new_kwargs)
+                    wrp.reply(returns[ret_idx][wrp_idx])
+        return returns
+
+    @classmethod
+    async def __atrigger_request(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+        """
+        Triggers the request mode of the middleware communicator for a coroutine function, awaiting the replies
+        without blocking the event loop.
+
+        :param func: Callable[..., Any]: The coroutine function associated with the client requests
+        :param instance_id: str: The unique identifier of the function instance, utilized to access the middleware communicator registry and manage different instances of communications
+        :param kwd: dict: A dictionary containing keyword arguments to be matched and potentially utilized during the client instantiation and function invocation
+        :param wds: tuple: Variable positional arguments to be passed to the function
+        :param kwds: dict: Additional keyword arguments to be passed to the function
+        :return: Any: The return values obtained from the clients' requests. The data type and structure depend on the output of the client requests
+        """
+        cls.__instantiate_clients(func, instance_id, kwd, *wds)
+
+        returns = []
+        for ret_idx, functor in enumerate(
+                cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"]):
+            wrp_exec = functor["wrapped_executor"]
+            # single element
+            if isinstance(wrp_exec, clt.Client):
+                returns.append(await wrp_exec.arequest(*wds[1:], **kwds))
+            # list for single return
+            elif isinstance(wrp_exec, list):
+                subreturns = []
+                for wrp_idx, wrp in enumerate(wrp_exec):
+                    ret = await wrp.arequest(*wds[1:], **kwds)
+                    subreturns.append(ret[wrp_idx])
+                returns.append(subreturns)
+        return returns
+
+    @classmethod
+    async def __atrigger_disable(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+        """
+        Triggers the disable mode of the middleware communicator for a coroutine function.
+
+        :return: List[None]: A list of "None" with one element per return
+        """
+        return cls.__trigger_disable(func, instance_id, kwd, *wds, **kwds)
+
+    @classmethod
+    async def __atrigger_undefined(cls, func: Callable[..., Any], instance_id: str, kwd, *wds, **kwds):
+        """
+        Triggers an undefined mode of the middleware communicator for a coroutine function, neither awaiting the
+        function nor communicating.
+
+        :return: None
+        """
+        return None
+
+    @classmethod
+    def __compile_dispatch_plan(cls, func: Callable[..., Any], instance: Any):
+        """
+        Resolves the registry entry and communication mode trigger of a function instance. The resulting plan is cached
+        per function and instance until the registry changes (i.e., ``activate_communication`` or ``close_instance`` is
+        called), avoiding the instance lookup and mode resolution on every call.
+
+        :param func: Callable[..., Any]: The registered function
+        :param instance: Any: The instance of the class calling the function
+        :return: Tuple[str, Optional[Callable[..., Any]]]: The instance identifier and the trigger of the communication mode (None if no mode is set)
+
+        :raises: ValueError: If the instance address cannot be found in the registry
+        """
+        instance_address = hex(id(instance))
+        try:
+            instance_id = cls._MiddlewareCommunicator__registry[func.__qualname__]["__WRAPYFI_INSTANCES"].index(instance_address) + 1
+            instance_id = "" if instance_id <= 1 else "." + str(instance_id)
+        except KeyError:
+            instance_id = ""
+
+        mode = cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["mode"]
+        if mode is None:
+            # execute the method as usual
+            trigger = None
+        elif inspect.iscoroutinefunction(func):
+            trigger = {
+                "publish": cls.__atrigger_publish,
+                "listen": cls.__atrigger_listen,
+                "reply": cls.__atrigger_reply,
+                "request": cls.__atrigger_request,
+                "disable": cls.__atrigger_disable
+            }.get(mode, cls.__atrigger_undefined)
+        else:
+            trigger = {
+                # publishes the method returns
+                "publish": cls.__trigger_publish,
+                # listens to the publisher and returns the messages
+                "listen": cls.__trigger_listen,
+                # server awaits request from client and replies with method returns
+                "reply": cls.__trigger_reply,
+                # client requests with args from server and awaits reply
+                "request": cls.__trigger_request,
+                # WARNING: use with caution. This produces "None" for all the method's returns
+                "disable": cls.__trigger_disable
+            }.get(mode, cls.__trigger_undefined)
+        return instance_id, trigger
+
     @classmethod
     def register(cls, data_type: Union[str, List[Any]], middleware: str = DEFAULT_COMMUNICATOR, *args, **kwargs):
         """
@@ -401,49 +664,60 @@ class MiddlewareCommunicator(object):
                     "return_func_type": return_func_type}]}
             cls.__registry[func_qualname]["mode"] = None
 
+            # resolved once per function, since the signature and stacked decorators do not change
+            func_wrapped = hasattr(func, "__wrapped__")
+            func_default_kwargs = get_default_args(func)
+            dispatch_plans = cls._MiddlewareCommunicator__dispatch_plans
+
+            # coroutine functions are wrapped by a coroutine function, whose triggers await the function and communicators
+            if inspect.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*wds, **kwds):  # triggers on awaiting the method
+                    if func_wrapped:
+                        return await func(*wds, **kwds)
+
+                    dispatch_key = (func_qualname, id(wds[0]))
+                    try:
+                        instance_id, trigger = dispatch_plans[dispatch_key]
+                    except KeyError:
+                        instance_id, trigger = dispatch_plans[dispatch_key] = \
+                            cls._MiddlewareCommunicator__compile_dispatch_plan(func, wds[0])
+
+                    # await the method as usual
+                    if trigger is None:
+                        return await func(*wds, **kwds)
+
+                    kwd = dict(func_default_kwargs)
+                    kwd.update(kwds)
+                    entry = cls._MiddlewareCommunicator__registry[func_qualname + instance_id]
+                    entry["args"] = wds
+                    entry["kwargs"] = kwd
+                    return await trigger(func, instance_id, kwd, *wds, **kwds)
+
+                return async_wrapper
+
             @wraps(func)
             def wrapper(*wds, **kwds):  # triggers on calling the method
-                if hasattr(func, "__wrapped__"):
+                if func_wrapped:
                     return func(*wds, **kwds)
 
-                instance_address = hex(id(wds[0]))
+                dispatch_key = (func_qualname, id(wds[0]))
                 try:
-                    instance_id = cls._MiddlewareCommunicator__registry[func.__qualname__]["__WRAPYFI_INSTANCES"].index(instance_address) + 1
-                    instance_id = "" if instance_id <= 1 else "." + str(instance_id)
+                    instance_id, trigger = dispatch_plans[dispatch_key]
                 except KeyError:
-                    instance_id = ""
+                    instance_id, trigger = dispatch_plans[dispatch_key] = \
+                        cls._MiddlewareCommunicator__compile_dispatch_plan(func, wds[0])
 
                 # execute the method as usual
-                if cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["mode"] is None:
+                if trigger is None:
                     return func(*wds, **kwds)
 
-                kwd = get_default_args(func)
+                kwd = dict(func_default_kwargs)
                 kwd.update(kwds)
-                cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["args"] = wds
-                cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["kwargs"] = kwd
-
-                # publishes the method returns
-                if cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["mode"] == "publish":
-                    return cls.__trigger_publish(func, instance_id, kwd, *wds, **kwds)
-
-                # listens to the publisher and returns the messages
-                elif cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["mode"] == "listen":
-                    return cls.__trigger_listen(func, instance_id, kwd, *wds, **kwds)
-
-                # server awaits request from client and replies with method returns
-                elif cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["mode"] == "reply":
-                    return cls.__trigger_reply(func, instance_id, kwd, *wds, **kwds)
-
-                # client requests with args from server and awaits reply
-                elif cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["mode"] == "request":
-                    return cls.__trigger_request(func, instance_id, kwd, *wds, **kwds)
-
-                # WARNING: use with caution. This produces "None" for all the method's returns
-                elif cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["mode"] == "disable":
-                    cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["last_results"] = []
-                    for ret_idx in range(len(cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["communicator"])):
-                        cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["last_results"].append(None)
-                    return cls._MiddlewareCommunicator__registry[func.__qualname__ + instance_id]["last_results"]
+                entry = cls._MiddlewareCommunicator__registry[func_qualname + instance_id]
+                entry["args"] = wds
+                entry["kwargs"] = kwd
+                return trigger(func, instance_id, kwd, *wds, **kwds)
 
             return wrapper
         return encapsulate
@@ -465,6 +739,7 @@ class MiddlewareCommunicator(object):
             func = getattr(self, func)
         entry = self.__registry.get(func.__qualname__, None)
         if entry is not None:
+            self.__dispatch_plans.clear()
             instance_addr = hex(id(self))
             wrapyfi_instances = entry.get("__WRAPYFI_INSTANCES", None)
             if wrapyfi_instances is None:
@@ -491,6 +766,117 @@ class MiddlewareCommunicator(object):
                 self.__registry[instance_qualname]["mode"] = mode
             self.__registry[instance_qualname]["instance_addr"] = instance_addr
 
+    def stream(self, func: Union[str, Callable[..., Any]], *args, max_batch: Optional[int] = None,
+               timeout: Optional[float] = None, **kwargs):
+        """
+        Continuously listens to the listeners of a registered function in listen mode, yielding the received messages
+        without invoking the function wrapper for every message. Each message is yielded in the same structure as the
+        function returns in listen mode (one element per return). When ``max_batch`` is set, lists of up to
+        ``max_batch`` such messages are yielded instead (see ``Listener.stream``).
+
+        :param func: Union[str, Callable[..., Any]]: The function or the name of the function whose listeners are streamed
+        :param args: tuple: Positional arguments matched to the listener arguments, as when invoking the function
+        :param max_batch: int: The maximum number of messages yielded in a list. Default is None (messages yielded one at a time)
+        :param timeout: float: The seconds to wait for more messages after the first message of a batch is received. Default is None
+        :param kwargs: dict: Keyword arguments matched to the listener arguments, as when invoking the function
+        :return: Generator[Any]: The received messages, or lists of received messages when ``max_batch`` is set
+
+        :raises: ValueError: If the function is not in listen mode, or ``max_batch`` is set for a function with multiple returns
+        """
+        if isinstance(func, str):
+            func = getattr(self, func)
+        func = getattr(func, "__func__", func)
+        if hex(id(self)) not in self.__registry.get(func.__qualname__, {}).get("__WRAPYFI_INSTANCES", []):
+            raise ValueError(f"Streaming requires the listen mode, but {func.__qualname__} is not activated")
+        instance_id, _ = self.__compile_dispatch_plan(func, self)
+        entry = self.__registry[func.__qualname__ + instance_id]
+        if entry["mode"] != "listen":
+            raise ValueError(f"Streaming requires the listen mode, but {func.__qualname__} is in mode: {entry['mode']}")
+
+        wds = (self,) + args
+        kwd = get_default_args(func)
+        kwd.update(kwargs)
+        entry["args"] = wds
+        entry["kwargs"] = kwd
+        self.__instantiate_listeners(func, instance_id, kwd, *wds)
+
+        wrapped_executors = [communicator["wrapped_executor"] for communicator in entry["communicator"]]
+        if len(wrapped_executors) == 1 and isinstance(wrapped_executors[0], lsn.Listener):
+            stream = wrapped_executors[0].stream(max_batch=max_batch, timeout=timeout)
+            if max_batch is None:
+                for obj in stream:
+                    yield [obj]
+            else:
+                for batch in stream:
+                    yield [[obj] for obj in batch]
+            return
+
+        if max_batch is not None:
+            raise ValueError("Batched streaming is only supported for functions with a single return")
+        streams = []
+        for wrp_exec in wrapped_executors:
+            # single element
+            if isinstance(wrp_exec, lsn.Listener):
+                streams.append(wrp_exec.stream())
+            # list for single return
+            elif isinstance(wrp_exec, list):
+                streams.append(map(list, zip(*[wrp.stream() for wrp in wrp_exec])))
+        for objs in zip(*streams):
+            yield list(objs)
+
+    def serve(self, func: Union[str, Callable[..., Any]], *args, workers: int = 4, spawn: str = "thread", **kwargs):
+        """
+        Serves the requests of a registered function in reply mode on a pool of workers (see ``Server.serve``),
+        instead of awaiting a single request on every invocation of the function wrapper. Each worker invokes the
+        function with the arguments of a request and replies with its return. The method returns immediately, and the
+        workers are stopped when the instance is closed.
+
+        :param func: Union[str, Callable[..., Any]]: The function or the name of the function whose requests are served
+        :param args: tuple: Positional arguments matched to the server arguments, as when invoking the function
+        :param workers: int: Number of workers. Default is 4
+        :param spawn: str: Whether to spawn the workers as threads or processes. Default is 'thread'
+        :param kwargs: dict: Keyword arguments matched to the server arguments, as when invoking the function
+
+        :raises: ValueError: If the function is not in reply mode, or the function has multiple returns
+        """
+        if isinstance(func, str):
+            func = getattr(self, func)
+        func = getattr(func, "__func__", func)
+        if hex(id(self)) not in self.__registry.get(func.__qualname__, {}).get("__WRAPYFI_INSTANCES", []):
+            raise ValueError(f"Serving requires the reply mode, but {func.__qualname__} is not activated")
+        instance_id, _ = self.__compile_dispatch_plan(func, self)
+        entry = self.__registry[func.__qualname__ + instance_id]
+        if entry["mode"] != "reply":
+            raise ValueError(f"Serving requires the reply mode, but {func.__qualname__} is in mode: {entry['mode']}")
+
+        wds = (self,) + args
+        kwd = get_default_args(func)
+        kwd.update(kwargs)
+        entry["args"] = wds
+        entry["kwargs"] = kwd
+        self.__instantiate_servers(func, instance_id, kwd, *wds)
+
+        wrapped_executors = [communicator["wrapped_executor"] for communicator in entry["communicator"]]
+        if len(wrapped_executors) != 1 or not isinstance(wrapped_executors[0], srv.Server):
+            raise ValueError("Serving is only supported for functions with a single return")
+        wrapped_executors[0].serve(partial(self.__serve_request, func.__wrapped__, self), workers=workers, spawn=spawn)
+
+    @staticmethod
+    def __serve_request(func: Callable[..., Any], instance, *args, **kwargs):
+        """
+        Invokes the unwrapped function with the arguments of a request, returning its single return.
+
+        :param func: Callable[..., Any]: The unwrapped function
+        :param instance: MiddlewareCommunicator: The instance the function is bound to
+        :param args: tuple: The arguments of the request
+        :param kwargs: dict: The keyword arguments of the request
+        :return: Any: The return of the function
+        """
+        returns = func(instance, *args, **kwargs)
+        if inspect.isawaitable(returns):
+            returns = asyncio.run(returns)
+        return returns[0]
+
     def close(self):
         """
         Closes this middleware communicator instance.
@@ -529,6 +915,7 @@ class MiddlewareCommunicator(object):
 
         Note that the instance address is the hex representation of the instance's id. If no instance address is provided, all instances will be closed.
         """
+        cls._MiddlewareCommunicator__dispatch_plans.clear()
         while True:
             del_entry = False
             del_entry_name = None
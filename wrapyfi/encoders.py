@@ -1,14 +1,679 @@
 import abc
 import io
+import importlib
+import os
+import time
 import json
 import base64
+import socket
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Optional
 
 import numpy as np
 
 from wrapyfi.utils import *
 
 
+HOSTNAME = socket.gethostname()
+
+
+IMAGE_CODEC_WORKERS = int(os.environ.get("WRAPYFI_IMAGE_CODEC_WORKERS", os.cpu_count() or 1))
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _import_optional(module: str, message: str):
+    """
+    Import an optional dependency when it is first needed, rather than when Wrapyfi is imported.
+
+    :param module: str: The name of the module to import
+    :param message: str: The message of the ImportError raised if the module is not installed
+    :return: module: The imported module
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(message) from None
+
+
+def _hint_tuples(item):
+    """
+    Replace tuples nested within lists and dictionaries by hints, since most serializers encode tuples as lists.
+    Scalars are skipped without recursion.
+
+    :param item: Any: The object to pre-process
+    :return: Any: The pre-processed object
+    """
+    if type(item) in _SCALAR_TYPES:
+        return item
+    if isinstance(item, tuple):
+        return dict(__wrapyfi__=('tuple', item))
+    if isinstance(item, list):
+        return [e if type(e) in _SCALAR_TYPES else _hint_tuples(e) for e in item]
+    if isinstance(item, dict):
+        return {key: value if type(value) in _SCALAR_TYPES else _hint_tuples(value) for key, value in item.items()}
+    else:
+        return item
+
+
+class MessageBatch(list):
+    """
+    The objects of a message published by a batching publisher (``batch_size`` > 1), transmitted as
+    ``{"__wrapyfi__": ["batch", [obj, ...]]}``. Listeners unbatch the message transparently.
+    """
+
+
+class MessageTrace(object):
+    """
+    The tracing envelope of a message published by a tracing publisher (``trace=True``), holding the ID of the
+    publisher, the sequence number of the message, and the monotonic and wall-clock times at which it was published in
+    nanoseconds. NativeObject messages are transmitted as
+    ``{"__wrapyfi__": ["trace", [publisher_id, seq, monotonic_ns, wall_ns], obj]}``, whereas middleware transmitting
+    arrays in separate frames pack the envelope into an additional frame. Listeners unwrap the traced object
+    transparently.
+    """
+    __slots__ = ("publisher_id", "seq", "monotonic_ns", "wall_ns", "obj", "transit_ns")
+    HEADER = struct.Struct("<Qqq")
+
+    def __init__(self, publisher_id: str, seq: int, monotonic_ns: int, wall_ns: int, obj=None):
+        """
+        Initialize the tracing envelope.
+
+        :param publisher_id: str: The ID of the publisher formatted as 'hostname:pid:index'
+        :param seq: int: The sequence number of the message, counted per publisher
+        :param monotonic_ns: int: The monotonic time at which the message was published in nanoseconds
+        :param wall_ns: int: The wall-clock time at which the message was published in nanoseconds since the epoch
+        :param obj: Any: The traced object. Default is None
+        """
+        self.publisher_id = publisher_id
+        self.seq = seq
+        self.monotonic_ns = monotonic_ns
+        self.wall_ns = wall_ns
+        self.obj = obj
+        self.transit_ns = None
+
+    @classmethod
+    def now(cls, publisher_id: str, seq: int):
+        """
+        Create the tracing envelope of a message published now.
+
+        :param publisher_id: str: The ID of the publisher
+        :param seq: int: The sequence number of the message
+        :return: MessageTrace: The tracing envelope
+        """
+        return cls(publisher_id, seq, time.monotonic_ns(), time.time_ns())
+
+    @property
+    def host(self):
+        """
+        The hostname of the publisher. The monotonic times are only comparable between processes on the same host.
+
+        :return: str: The hostname
+        """
+        return self.publisher_id.rsplit(":", 2)[0]
+
+    def wrap(self, obj):
+        """
+        Wrap an object in the tracing envelope for encoding with the ``JsonEncoder``.
+
+        :param obj: Any: The object to trace
+        :return: dict: The traced object
+        """
+        return dict(__wrapyfi__=["trace", [self.publisher_id, self.seq, self.monotonic_ns, self.wall_ns], obj])
+
+    def pack(self):
+        """
+        Pack the tracing envelope into bytes.
+
+        :return: bytes: The packed envelope
+        """
+        return self.HEADER.pack(self.seq, self.monotonic_ns, self.wall_ns) + self.publisher_id.encode()
+
+    @classmethod
+    def unpack(cls, data):
+        """
+        Unpack a tracing envelope packed by ``pack``.
+
+        :param data: Union[bytes, memoryview]: The packed envelope
+        :return: MessageTrace: The tracing envelope
+        """
+        data = bytes(data)
+        seq, monotonic_ns, wall_ns = cls.HEADER.unpack_from(data)
+        return cls(data[cls.HEADER.size:].decode(), seq, monotonic_ns, wall_ns)
+
+
+class Serializers(object):
+    """
+    Registry of the serializer backends used by the ``JsonEncoder`` and ``JsonDecodeHook``. The backend is selected
+    per communicator by passing ``serializer`` within the ``serializer_kwargs`` (encoding) and ``deserializer_kwargs``
+    (decoding) of the communicator, e.g. ``serializer_kwargs={"serializer": "msgpack"}``. All remaining kwargs are
+    passed to the backend.
+    The libraries of the backends are imported when the backend is first instantiated.
+    """
+    registry = {}
+
+    @staticmethod
+    def register(name: str):
+        """
+        Register a serializer backend.
+
+        :param name: str: The name of the serializer
+        """
+        def wrapper(cls):
+            cls.name = name
+            Serializers.registry[name] = cls
+            return cls
+        return wrapper
+
+    @staticmethod
+    def create(name: str = "json", text_only: bool = False, **kwargs):
+        """
+        Instantiate a serializer backend.
+
+        :param name: str: The name of the serializer. Default is 'json'
+        :param text_only: bool: Whether the transport only supports text. Raises a ValueError for binary serializers. Default is False
+        :param kwargs: dict: Additional keyword arguments passed to the serializer
+        :return: Serializer: The serializer backend
+        """
+        if name not in Serializers.registry:
+            raise ValueError(f"Serializer {name} is not supported. "
+                             f"Available serializers: {', '.join(Serializers.registry.keys())}")
+        serializer_cls = Serializers.registry[name]
+        if text_only and serializer_cls.binary:
+            raise ValueError(f"Serializer {name} produces binary data, which is not supported by this middleware")
+        return serializer_cls(**kwargs)
+
+
+class Serializer(object):
+    """
+    Base class for serializer backends. The backends convert the python objects pre-processed by the ``JsonEncoder``
+    into a string or bytes, and back into python objects post-processed by the ``JsonDecodeHook``. Binary serializers
+    transmit numpy arrays, bytes and binary plugin data natively instead of base64 strings.
+    """
+    name = None
+    binary = False
+
+    def __init__(self, **kwargs):
+        """
+        Initialize the serializer.
+
+        :param kwargs: dict: Additional keyword arguments passed to the underlying library
+        """
+        self.kwargs = kwargs
+
+    def dumps(self, encoder, obj):
+        """
+        Serialize an object.
+
+        :param encoder: JsonEncoder: The encoder providing the ``default`` method for objects not supported natively
+        :param obj: Any: The object to serialize
+        :return: Union[str, bytes]: The serialized object
+        """
+        raise NotImplementedError
+
+    def loads(self, decoder, data):
+        """
+        Deserialize an object.
+
+        :param decoder: JsonDecodeHook: The decoder providing the ``object_hook`` for post-processing dictionaries
+        :param data: Union[str, bytes, memoryview]: The serialized object
+        :return: Any: The deserialized object
+        """
+        raise NotImplementedError
+
+
+@Serializers.register("json")
+class JsonSerializer(Serializer):
+    """
+    The default serializer using the ``json`` standard library. The ``serializer_kwargs`` are passed to the
+    ``json.JSONEncoder`` and the ``deserializer_kwargs`` to ``json.loads``.
+    """
+    def dumps(self, encoder, obj):
+        return json.JSONEncoder.encode(encoder, obj)
+
+    def loads(self, decoder, data):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data, object_hook=decoder.object_hook, **self.kwargs)
+
+
+@Serializers.register("orjson")
+class OrjsonSerializer(Serializer):
+    """
+    JSON serializer using ``orjson``. The output is compatible with the ``json`` serializer, therefore communicators
+    using different JSON serializers can exchange messages. Additional ``orjson`` options can be passed as ``option``.
+    """
+    def __init__(self, option: int = 0, **kwargs):
+        self._orjson = _import_optional(
+            "orjson", "The orjson serializer requires orjson to be installed: pip install orjson")
+        super().__init__(**kwargs)
+        # datetime objects are passed to the encoder to retain their type when decoding
+        self.option = option | self._orjson.OPT_NON_STR_KEYS | self._orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, encoder, obj):
+        return self._orjson.dumps(obj, default=encoder.default, option=self.option)
+
+    def loads(self, decoder, data):
+        return decoder.apply_object_hook(self._orjson.loads(data))
+
+
+@Serializers.register("msgpack")
+class MsgpackSerializer(Serializer):
+    """
+    Binary serializer using ``msgpack``. Additional kwargs are passed to ``msgpack.packb`` (``serializer_kwargs``) and
+    ``msgpack.unpackb`` (``deserializer_kwargs``).
+    """
+    binary = True
+
+    def __init__(self, **kwargs):
+        self._msgpack = _import_optional(
+            "msgpack", "The msgpack serializer requires msgpack to be installed: pip install msgpack")
+        super().__init__(**kwargs)
+
+    def dumps(self, encoder, obj):
+        return self._msgpack.packb(obj, default=encoder.default, use_bin_type=True, **self.kwargs)
+
+    def loads(self, decoder, data):
+        return self._msgpack.unpackb(data, object_hook=decoder.object_hook, raw=False, strict_map_key=False, **self.kwargs)
+
+
+@Serializers.register("cbor")
+class CborSerializer(Serializer):
+    """
+    Binary serializer using ``cbor2``. Sets and timezone-aware datetime objects are encoded natively by CBOR. Additional
+    kwargs are passed to ``cbor2.dumps`` (``serializer_kwargs``) and ``cbor2.loads`` (``deserializer_kwargs``).
+    """
+    binary = True
+
+    def __init__(self, **kwargs):
+        self._cbor2 = _import_optional(
+            "cbor2", "The cbor serializer requires cbor2 to be installed: pip install cbor2")
+        super().__init__(**kwargs)
+
+    def dumps(self, encoder, obj):
+        return self._cbor2.dumps(obj, default=lambda cbor_encoder, value: cbor_encoder.encode(encoder.default(value)),
+                           **self.kwargs)
+
+    def loads(self, decoder, data):
+        return self._cbor2.loads(data, object_hook=lambda cbor_decoder, value: decoder.object_hook(value), **self.kwargs)
+
+
+class ImageCodecs(object):
+    """
+    Registry of the codecs compressing the images transmitted by the Image publishers and servers. The codec is
+    selected per communicator by passing ``codec`` (e.g. ``codec="png"``) and its parameters as ``codec_kwargs``
+    (e.g. ``codec_kwargs={"level": 3}``). Each codec holds a unique ``codec_id`` which is transmitted in the message
+    header by middleware supporting it, allowing the receivers to detect the codec automatically. The libraries of the
+    codecs (e.g. OpenCV or ``zstandard``) are imported when the codec is first instantiated.
+    """
+    registry = {}
+    ids = {}
+
+    @staticmethod
+    def register(name: str, codec_id: int):
+        """
+        Register an image codec.
+
+        :param name: str: The name of the codec
+        :param codec_id: int: The unique identifier of the codec in the range [0, 255], transmitted in message headers
+        """
+        def wrapper(cls):
+            if codec_id in ImageCodecs.ids and ImageCodecs.ids[codec_id].name != name:
+                raise ValueError(f"Codec ID {codec_id} is already registered for {ImageCodecs.ids[codec_id].name}")
+            cls.name = name
+            cls.codec_id = codec_id
+            ImageCodecs.registry[name] = cls
+            ImageCodecs.ids[codec_id] = cls
+            return cls
+        return wrapper
+
+    @staticmethod
+    def create(name: str = "raw", self_describing: bool = False, **kwargs):
+        """
+        Instantiate an image codec.
+
+        :param name: str: The name of the codec. Default is 'raw'
+        :param self_describing: bool: Whether the middleware transmits the compressed image without a header describing
+                                the dtype and shape of the image. Raises a ValueError for codecs which cannot be decoded
+                                without the header. Default is False
+        :param kwargs: dict: Additional keyword arguments passed to the codec
+        :return: ImageCodec: The image codec
+        """
+        if name not in ImageCodecs.registry:
+            raise ValueError(f"Image codec {name} is not supported. "
+                             f"Available codecs: {', '.join(ImageCodecs.registry.keys())}")
+        codec_cls = ImageCodecs.registry[name]
+        if self_describing and not codec_cls.self_describing:
+            raise ValueError(f"Image codec {name} requires a message header, which is not supported by this middleware")
+        return codec_cls(**kwargs)
+
+    @staticmethod
+    def resolve(jpg: bool = False, codec: Optional[str] = None, codec_kwargs: Optional[dict] = None,
+                self_describing: bool = False):
+        """
+        Resolve the codec of an Image communicator, where ``jpg=True`` is equivalent to ``codec="jpg"``.
+
+        :param jpg: bool: Whether the image should be compressed as JPG. Ignored if ``codec`` is provided. Default is False
+        :param codec: str: The name of the codec. Default is None
+        :param codec_kwargs: dict: Additional keyword arguments passed to the codec. Default is None
+        :param self_describing: bool: Whether the middleware transmits the compressed image without a header. Default is False
+        :return: ImageCodec: The image codec or None if the image is transmitted uncompressed
+        """
+        if codec is None:
+            codec = "jpg" if jpg else "raw"
+        if codec == "raw":
+            return None
+        return ImageCodecs.create(codec, self_describing=self_describing, **(codec_kwargs or {}))
+
+    @staticmethod
+    def detect(data):
+        """
+        Detect the self-describing codec of a compressed image from its leading bytes.
+
+        :param data: Union[bytes, memoryview, np.ndarray]: The compressed image
+        :return: type: The codec class or None if the codec is not detected
+        """
+        data = memoryview(data).cast("B")
+        for codec_cls in ImageCodecs.registry.values():
+            if codec_cls.self_describing and codec_cls.matches(data):
+                return codec_cls
+        return None
+
+    @staticmethod
+    def decode(data, rgb: Optional[bool] = None):
+        """
+        Decode a compressed image using the self-describing codec detected from its leading bytes.
+
+        :param data: Union[bytes, memoryview, np.ndarray]: The compressed image
+        :param rgb: bool: Whether to convert the image to 3 channels (True) or to a single channel (False). Default is
+                    None (keep the channels of the compressed image)
+        :return: np.ndarray: The decoded image
+        """
+        codec_cls = ImageCodecs.detect(data)
+        if codec_cls is None:
+            raise ValueError("Unsupported image format")
+        img = codec_cls().decode(data)
+        if (rgb and img.ndim == 2) or (rgb is False and img.ndim == 3):
+            cv2 = _import_optional(
+                "cv2", "Converting the image channels requires OpenCV to be installed: pip install opencv-python")
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR if rgb else cv2.COLOR_BGR2GRAY)
+        return img
+
+
+class ImageCodecPool(object):
+    """
+    Thread pool shared by all the Image communicators of a process, encoding and decoding images in parallel. OpenCV,
+    ``lz4`` and ``zstandard`` release the GIL while (de)compressing, therefore the codecs scale across cores. The pool
+    is created on first use with ``WRAPYFI_IMAGE_CODEC_WORKERS`` threads (the number of cores by default). Communicators
+    consume the returned futures in submission order, retaining the order of the images on each topic.
+    """
+    _executor = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def submit(fn, *args, **kwargs):
+        """
+        Schedule a codec call on the shared pool.
+
+        :param fn: Callable: The codec method (e.g. ``ImageCodec.encode``)
+        :param args: tuple: Arguments passed to the codec method
+        :param kwargs: dict: Keyword arguments passed to the codec method
+        :return: concurrent.futures.Future: The future holding the result of the codec method
+        """
+        if ImageCodecPool._executor is None:
+            with ImageCodecPool._lock:
+                if ImageCodecPool._executor is None:
+                    ImageCodecPool._executor = ThreadPoolExecutor(max_workers=IMAGE_CODEC_WORKERS,
+                                                                  thread_name_prefix="wrapyfi_image_codec")
+        return ImageCodecPool._executor.submit(fn, *args, **kwargs)
+
+    @staticmethod
+    def _reset():
+        """
+        Discard the pool inherited by forked processes, since its threads do not survive the fork.
+        """
+        ImageCodecPool._executor = None
+        ImageCodecPool._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=ImageCodecPool._reset)
+
+
+class ImageCodec(object):
+    """
+    Base class for image codecs. Self-describing codecs produce image files (e.g. JPG) which are decoded without
+    knowing the dtype and shape of the image, whereas the remaining codecs compress the raw pixels and rely on the
+    message header describing the image. The ``encode`` and ``decode`` methods may be called from multiple threads
+    at once by the ``ImageCodecPool``.
+    """
+    name = None
+    codec_id = None
+    lossless = True
+    self_describing = False
+    magic = None
+
+    def __init__(self, **kwargs):
+        """
+        Initialize the codec.
+
+        :param kwargs: dict: Additional keyword arguments passed to the underlying library
+        """
+        self.kwargs = kwargs
+
+    @classmethod
+    def matches(cls, data: memoryview):
+        """
+        Check whether the compressed image was produced by the codec.
+
+        :param data: memoryview: The compressed image
+        :return: bool: True if the leading bytes of the compressed image match the codec
+        """
+        return cls.magic is not None and data[:len(cls.magic)] == cls.magic
+
+    def encode(self, img: np.ndarray):
+        """
+        Compress an image.
+
+        :param img: np.ndarray: The C-contiguous image to compress
+        :return: Union[bytes, np.ndarray]: The compressed image
+        """
+        raise NotImplementedError
+
+    def decode(self, data, dtype: Optional[np.dtype] = None, shape: Optional[tuple] = None,
+               out: Optional[np.ndarray] = None):
+        """
+        Decompress an image.
+
+        :param data: Union[bytes, memoryview]: The compressed image
+        :param dtype: np.dtype: The dtype of the image. Required by codecs which are not self-describing. Default is None
+        :param shape: tuple: The shape of the image. Required by codecs which are not self-describing. Default is None
+        :param out: np.ndarray: Preallocated C-contiguous array to decompress the image into. Default is None
+        :return: np.ndarray: The decompressed image
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _to_out(img: np.ndarray, out: Optional[np.ndarray] = None):
+        if out is None:
+            return img
+        np.copyto(out, img.reshape(out.shape))
+        return out
+
+
+@ImageCodecs.register("raw", 0)
+class RawImageCodec(ImageCodec):
+    """
+    Transmits the pixels uncompressed.
+    """
+    def encode(self, img):
+        return img
+
+    def decode(self, data, dtype=None, shape=None, out=None):
+        return self._to_out(np.frombuffer(data, dtype=dtype).reshape(shape), out)
+
+
+class Cv2ImageCodec(ImageCodec):
+    """
+    Base class for the image file formats supported by OpenCV.
+    """
+    self_describing = True
+    extension = None
+    dtypes = (np.uint8,)
+
+    def __init__(self, **kwargs):
+        self._cv2 = _import_optional(
+            "cv2", f"The {self.name} codec requires OpenCV to be installed: pip install opencv-python")
+        if not self._cv2.haveImageWriter(self.extension):
+            raise ImportError(f"The {self.name} codec is not supported by the installed OpenCV build")
+        super().__init__(**kwargs)
+        self.params = []
+
+    def encode(self, img):
+        if img.dtype not in self.dtypes:
+            raise ValueError(f"The {self.name} codec does not support images of dtype {img.dtype}")
+        success, img_encoded = self._cv2.imencode(self.extension, img, self.params)
+        if not success:
+            raise ValueError(f"Failed to encode the image using the {self.name} codec")
+        return img_encoded
+
+    def decode(self, data, dtype=None, shape=None, out=None):
+        img = self._cv2.imdecode(np.frombuffer(data, np.uint8), self._cv2.IMREAD_UNCHANGED)
+        if img is None:
+            raise ValueError(f"Failed to decode the image using the {self.name} codec")
+        return self._to_out(img, out)
+
+
+@ImageCodecs.register("jpg", 1)
+class JpgImageCodec(Cv2ImageCodec):
+    """
+    Lossy JPG compression of 8-bit images. The ``quality`` is in the range [0, 100].
+    """
+    lossless = False
+    extension = ".jpg"
+    magic = b"\xff\xd8\xff"
+
+    def __init__(self, quality: int = 95, **kwargs):
+        super().__init__(**kwargs)
+        self.params = [self._cv2.IMWRITE_JPEG_QUALITY, quality]
+
+
+@ImageCodecs.register("png", 2)
+class PngImageCodec(Cv2ImageCodec):
+    """
+    Lossless PNG compression of 8-bit and 16-bit images. The compression ``level`` is in the range [0, 9], trading
+    speed for size.
+    """
+    extension = ".png"
+    magic = b"\x89PNG"
+    dtypes = (np.uint8, np.uint16)
+
+    def __init__(self, level: int = 1, **kwargs):
+        super().__init__(**kwargs)
+        self.params = [self._cv2.IMWRITE_PNG_COMPRESSION, level]
+
+
+@ImageCodecs.register("webp", 3)
+class WebpImageCodec(Cv2ImageCodec):
+    """
+    WebP compression of 8-bit images. The ``quality`` is in the range [1, 100], whereas a quality above 100 selects
+    lossless compression.
+    """
+    extension = ".webp"
+
+    def __init__(self, quality: int = 90, **kwargs):
+        super().__init__(**kwargs)
+        self.lossless = quality > 100
+        self.params = [self._cv2.IMWRITE_WEBP_QUALITY, quality]
+
+    @classmethod
+    def matches(cls, data):
+        return data[:4] == b"RIFF" and data[8:12] == b"WEBP"
+
+
+@ImageCodecs.register("qoi", 4)
+class QoiImageCodec(ImageCodec):
+    """
+    Fast lossless QOI compression of 8-bit images with 3 or 4 channels.
+    """
+    self_describing = True
+    magic = b"qoif"
+
+    def __init__(self, **kwargs):
+        self._qoi = _import_optional("qoi", "The qoi codec requires qoi to be installed: pip install qoi")
+        super().__init__(**kwargs)
+
+    def encode(self, img):
+        if img.dtype != np.uint8 or img.ndim != 3 or img.shape[2] not in (3, 4):
+            raise ValueError("The qoi codec only supports 8-bit images with 3 or 4 channels")
+        # QOI stores RGB(A) pixels, whereas the images are formatted as BGR(A)
+        return self._qoi.encode(np.ascontiguousarray(img[..., [2, 1, 0, 3][:img.shape[2]]]))
+
+    def decode(self, data, dtype=None, shape=None, out=None):
+        img = self._qoi.decode(data)
+        return self._to_out(img[..., [2, 1, 0, 3][:img.shape[2]]], out)
+
+
+@ImageCodecs.register("lz4", 5)
+class Lz4ImageCodec(ImageCodec):
+    """
+    Fast lossless LZ4 compression of the raw pixels, supporting all dtypes (e.g. depth and floating point images).
+    The compression ``level`` is in the range [0, 16], where levels above 2 select the slower high compression mode.
+    """
+    def __init__(self, level: int = 0, **kwargs):
+        self._lz4 = _import_optional("lz4.frame", "The lz4 codec requires lz4 to be installed: pip install lz4")
+        super().__init__(**kwargs)
+        self.level = level
+
+    def encode(self, img):
+        return self._lz4.compress(img, compression_level=self.level, **self.kwargs)
+
+    def decode(self, data, dtype=None, shape=None, out=None):
+        # decompressing into a bytearray returns a writable image
+        img = np.frombuffer(self._lz4.decompress(data, return_bytearray=True), dtype=dtype).reshape(shape)
+        return self._to_out(img, out)
+
+
+@ImageCodecs.register("zstd", 6)
+class ZstdImageCodec(ImageCodec):
+    """
+    Lossless Zstandard compression of the raw pixels, supporting all dtypes (e.g. depth and floating point images).
+    The compression ``level`` is in the range [1, 22], trading speed for size.
+    """
+    def __init__(self, level: int = 3, **kwargs):
+        self._zstandard = _import_optional(
+            "zstandard", "The zstd codec requires zstandard to be installed: pip install zstandard")
+        super().__init__(**kwargs)
+        self.level = level
+        # the compression contexts cannot be shared between threads (e.g. of the ImageCodecPool)
+        self._contexts = threading.local()
+
+    def _get_contexts(self):
+        if not hasattr(self._contexts, "compressor"):
+            self._contexts.compressor = self._zstandard.ZstdCompressor(level=self.level, **self.kwargs)
+            self._contexts.decompressor = self._zstandard.ZstdDecompressor()
+        return self._contexts
+
+    def encode(self, img):
+        return self._get_contexts().compressor.compress(img)
+
+    def decode(self, data, dtype=None, shape=None, out=None):
+        # the pixels are decompressed directly into the returned image
+        img = np.empty(shape, dtype=dtype) if out is None else out
+        img_bytes = memoryview(img).cast("B")
+        with self._get_contexts().decompressor.stream_reader(data) as reader:
+            received = 0
+            while received < img.nbytes:
+                count = reader.readinto(img_bytes[received:])
+                if not count:
+                    raise ValueError("The decompressed image is smaller than its shape")
+                received += count
+        return img
+
+
 class JsonEncoder(json.JSONEncoder):
     """
     A custom JSON encoder that can encode:
@@ -17,32 +682,85 @@ class JsonEncoder(json.JSONEncoder):
     - Numpy datetime64 objects
     - Numpy ndarray objects
     - Objects registered with the PluginRegistrar
+
+    When encoding with ``encode_buffers``, numpy arrays and bytes-like objects are not embedded in the JSON string.
+    Instead, their raw memory is collected into a list of buffers which can be transmitted separately (e.g., as
+    additional ZeroMQ frames) and referenced from the JSON string by their index.
+
+    The pre-processed objects are serialized using the backend selected by the ``serializer`` key of the
+    ``serializer_kwargs`` (see ``Serializers``). Binary serializers embed numpy arrays and bytes without base64 encoding
+    and call the ``encode_binary`` method of the plugins, as do text serializers encoding with ``encode_buffers`` for
+    plugins supporting ``raw_buffers``.
     """
-    def __init__(self, **kwargs):
+    def __init__(self, text_only: bool = False, **kwargs):
         """
         Initialize the JsonEncoder.
 
-        :param kwargs: dict: Additional keyword arguments extracting values from the 'serializer_kwargs' key and passing them to the base class. All other keyword arguments are passed to the corresponding Plugin.
+        :param text_only: bool: Whether the transport only supports text, disallowing binary serializers. Default is False
+        :param kwargs: dict: Additional keyword arguments extracting values from the 'serializer_kwargs' key and passing them to the serializer (and the base class for the 'json' serializer). All other keyword arguments are passed to the corresponding Plugin.
         """
-        super().__init__(**kwargs.get('serializer_kwargs', {}))
+        serializer_kwargs = dict(kwargs.get('serializer_kwargs', {}))
+        serializer = serializer_kwargs.pop('serializer', 'json')
+        super().__init__(**(serializer_kwargs if serializer == 'json' else {}))
+        self.serializer = Serializers.create(serializer, text_only=text_only,
+                                             **(serializer_kwargs if serializer != 'json' else {}))
+        self.binary = self.serializer.binary
+        self.buffers = None
+        self.metrics = None
         self.plugins = dict()
-        for plugin_key, plugin_val in PluginRegistrar.encoder_registry.items():
-            self.plugins[plugin_key] = plugin_val(**kwargs)
+        self._plugin_kwargs = kwargs
+        self._plugins_version = None
+        self._plugin_cache = dict()
+        self.update_plugins()
+
+    def update_plugins(self):
+        """
+        Instantiate the plugins registered with the PluginRegistrar since the last update and clear the cached type
+        resolutions. Plugins which are already instantiated are reused. This method is called automatically whenever
+        the PluginRegistrar version changes.
+        """
+        self.plugins = {plugin_key: self.plugins[plugin_key]
+                        if type(self.plugins.get(plugin_key, None)) is plugin_val
+                        else plugin_val(**self._plugin_kwargs)
+                        for plugin_key, plugin_val in PluginRegistrar.encoder_registry.items()}
+        self._plugin_cache.clear()
+        self._plugins_version = PluginRegistrar.version
 
     def find_plugin(self, obj):
         """
-        Find the plugin for a given object.
+        Find the plugin for a given object. The resolved plugin is cached per type until a new plugin is registered.
 
         :param obj: Any: The object to find the plugin for
         :return: Plugin: The plugin for the given object if its type is registered, None otherwise
         """
-        for cls in reversed(type(obj).__mro__[:-1]):
+        if self._plugins_version != PluginRegistrar.version:
+            self.update_plugins()
+        obj_type = type(obj)
+        try:
+            return self._plugin_cache[obj_type]
+        except KeyError:
+            plugin = self._plugin_cache[obj_type] = self._resolve_plugin(obj_type)
+            return plugin
+
+    def _resolve_plugin(self, obj_type):
+        """
+        Resolve the plugin for a given type by walking its method resolution order. Plugin modules declared for the
+        type (or its base classes) are imported if no plugin is registered for it.
+
+        :param obj_type: type: The type to resolve the plugin for
+        :return: Plugin: The plugin for the given type if registered, None otherwise
+        """
+        for cls in reversed(obj_type.__mro__[:-1]):
             if cls.__module__ == 'collections.abc':
                 continue  # skip classes from collections.abc
             if issubclass(cls, abc.ABCMeta):
                 if cls.__abstractmethods__:
                     continue  # skip abstract classes with abstract methods
-            return self.plugins.get(cls, None)
+            plugin = self.plugins.get(cls, None)
+            if plugin is None and PluginRegistrar.load_type(obj_type):
+                self.update_plugins()
+                return self._resolve_plugin(obj_type)
+            return plugin
         return None
 
     def encode(self, obj):
@@ -50,19 +768,57 @@ class JsonEncoder(json.JSONEncoder):
         Encode an object into a JSON string and ensure that tuples are not encoded as lists.
 
         :param obj: Any: The object to encode
-        :return: str: The JSON string representation of the object returned by the base class
-        """
-        def hint_tuples(item):
-            if isinstance(item, tuple):
-                return dict(__wrapyfi__=('tuple', item))
-            if isinstance(item, list):
-                return [hint_tuples(e) for e in item]
-            if isinstance(item, dict):
-                return {key: hint_tuples(value) for key, value in item.items()}
-            else:
-                return item
+        :return: Union[str, bytes]: The JSON string representation of the object, or bytes for binary serializers
+        """
+        obj_str = self.serialize(obj)
+        if not self.binary and isinstance(obj_str, bytes):
+            return obj_str.decode()
+        return obj_str
+
+    def encode_bytes(self, obj):
+        """
+        Encode an object into bytes, avoiding the intermediate string for serializers producing bytes directly.
+
+        :param obj: Any: The object to encode
+        :return: bytes: The encoded object
+        """
+        obj_str = self.serialize(obj)
+        if isinstance(obj_str, str):
+            return obj_str.encode()
+        return obj_str
+
+    def serialize(self, obj):
+        """
+        Serialize an object using the serializer backend and ensure that tuples are not encoded as lists.
+
+        :param obj: Any: The object to serialize
+        :return: Union[str, bytes]: The output of the serializer backend
+        """
+        if self.metrics is None:
+            return self.serializer.dumps(self, _hint_tuples(obj))
+        start = time.perf_counter_ns()
+        obj_str = self.serializer.dumps(self, _hint_tuples(obj))
+        self.metrics.serialize.record(time.perf_counter_ns() - start)
+        self.metrics.bytes_out.inc(len(obj_str))
+        return obj_str
+
+    def encode_buffers(self, obj, as_bytes: bool = False):
+        """
+        Encode an object into a JSON string, extracting the raw memory of numpy arrays and bytes-like objects into a
+        separate list of buffers. The buffers are not copied unless the numpy array is not C-contiguous.
 
-        return super(JsonEncoder, self).encode(hint_tuples(obj))
+        :param obj: Any: The object to encode
+        :param as_bytes: bool: Whether to return the encoded object as bytes (see ``encode_bytes``). Default is False
+        :return: Tuple[Union[str, bytes], List[memoryview]]: The encoded object and the list of buffers referenced by it
+        """
+        self.buffers = []
+        try:
+            obj_str = self.encode_bytes(obj) if as_bytes else self.encode(obj)
+            if self.metrics is not None:
+                self.metrics.bytes_out.inc(sum(memoryview(buffer).nbytes for buffer in self.buffers))
+            return obj_str, self.buffers
+        finally:
+            self.buffers = None
 
     def default(self, obj):
         """
@@ -80,6 +836,21 @@ class JsonEncoder(json.JSONEncoder):
         elif isinstance(obj, np.datetime64):
             return dict(__wrapyfi__=('numpy.datetime64', str(obj)))
 
+        elif (self.buffers is not None or self.binary) and isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+            obj_data = memoryview(np.ascontiguousarray(obj).reshape(-1).view(np.uint8))
+            if self.buffers is not None:
+                self.buffers.append(obj_data)
+                obj_data = dict(__wrapyfi__=('buffer', len(self.buffers) - 1))
+            return dict(__wrapyfi__=('numpy.ndarray.raw', np.lib.format.dtype_to_descr(obj.dtype),
+                                     list(obj.shape), obj_data))
+
+        elif self.buffers is not None and isinstance(obj, memoryview):
+            self.buffers.append(obj)
+            return dict(__wrapyfi__=('buffer', len(self.buffers) - 1))
+
+        elif self.buffers is not None and isinstance(obj, (bytes, bytearray)):
+            return dict(__wrapyfi__=('bytes', memoryview(obj)))
+
         elif isinstance(obj, (np.ndarray, np.generic)):
             with io.BytesIO() as memfile:
                 np.save(memfile, obj)
@@ -88,7 +859,10 @@ class JsonEncoder(json.JSONEncoder):
 
         plugin_match = self.find_plugin(obj)
         if plugin_match is not None:
-            detected, plugin_return = plugin_match.encode(obj)
+            if self.binary or (self.buffers is not None and getattr(plugin_match, "raw_buffers", False)):
+                detected, plugin_return = plugin_match.encode_binary(obj)
+            else:
+                detected, plugin_return = plugin_match.encode(obj)
             if detected:
                 return plugin_return
 
@@ -105,16 +879,73 @@ class JsonDecodeHook(object):
     - Numpy datetime64 objects
     - Numpy ndarray objects
     - Objects registered with the PluginRegistrar
+
+    Buffers referenced by the JSON string (see ``JsonEncoder.encode_buffers``) are resolved from the ``buffers``
+    attribute, which must be set to the list of received buffers before decoding. Numpy arrays are reconstructed
+    directly over the received buffers without copying, and are therefore read-only when the buffers are.
+
+    Messages are deserialized with ``decode`` using the backend selected by the ``serializer`` key of the
+    ``deserializer_kwargs``, which must match the serializer of the sender.
     """
-    def __init__(self, **kwargs):
+    def __init__(self, text_only: bool = False, deserializer_kwargs: Optional[dict] = None, **kwargs):
         """
         Initialize the JsonDecodeHook.
 
+        :param text_only: bool: Whether the transport only supports text, disallowing binary serializers. Default is False
+        :param deserializer_kwargs: dict: Keyword arguments extracting the 'serializer' key and passing the remaining ones to the serializer
         :param kwargs: dict: Additional keyword arguments are passed to the corresponding Plugin.
         """
+        deserializer_kwargs = dict(deserializer_kwargs or {})
+        self.serializer = Serializers.create(deserializer_kwargs.pop('serializer', 'json'), text_only=text_only,
+                                             **deserializer_kwargs)
+        self.binary = self.serializer.binary
+        self.buffers = None
+        self.metrics = None
         self.plugins = dict()
-        for plugin_key, plugin_val in PluginRegistrar.decoder_registry.items():
-            self.plugins[plugin_key] = plugin_val(**kwargs)
+        self._plugin_kwargs = kwargs
+        self._plugins_version = None
+        self.update_plugins()
+
+    def update_plugins(self):
+        """
+        Instantiate the plugins registered with the PluginRegistrar since the last update. Plugins which are already
+        instantiated are reused. This method is called automatically whenever the PluginRegistrar version changes.
+        """
+        self.plugins = {plugin_key: self.plugins[plugin_key]
+                        if type(self.plugins.get(plugin_key, None)) is plugin_val
+                        else plugin_val(**self._plugin_kwargs)
+                        for plugin_key, plugin_val in PluginRegistrar.decoder_registry.items()}
+        self._plugins_version = PluginRegistrar.version
+
+    def decode(self, data):
+        """
+        Deserialize a message using the serializer backend.
+
+        :param data: Union[str, bytes, memoryview]: The serialized message
+        :return: Any: The decoded object
+        """
+        if self.metrics is None:
+            return self.serializer.loads(self, data)
+        start = time.perf_counter_ns()
+        obj = self.serializer.loads(self, data)
+        self.metrics.deserialize.record(time.perf_counter_ns() - start)
+        self.metrics.bytes_in.inc(len(data) + sum(memoryview(buffer).nbytes for buffer in self.buffers or ()))
+        return obj
+
+    def apply_object_hook(self, obj):
+        """
+        Apply the object hook to all dictionaries nested within an object, innermost first. Used by serializers which
+        do not support object hooks natively.
+
+        :param obj: Any: The deserialized object
+        :return: Any: The decoded object
+        """
+        if isinstance(obj, dict):
+            return self.object_hook({key: self.apply_object_hook(value) if type(value) in (dict, list) else value
+                                     for key, value in obj.items()})
+        if isinstance(obj, list):
+            return [self.apply_object_hook(item) if type(item) in (dict, list) else item for item in obj]
+        return obj
 
     def object_hook(self, obj):
         """
@@ -144,9 +975,33 @@ class JsonDecodeHook(object):
                     with io.BytesIO(base64.b64decode(wrapyfi[1].encode('ascii'))) as memfile:
                         return np.load(memfile)
 
+                elif obj_type == 'numpy.ndarray.raw':
+                    # the data is a bytes-like object (binary serializers) or a buffer resolved by this hook
+                    return np.frombuffer(wrapyfi[3], dtype=np.lib.format.descr_to_dtype(wrapyfi[1])).reshape(wrapyfi[2])
+
+                elif obj_type == 'buffer':
+                    return self.buffers[wrapyfi[1]]
+
+                elif obj_type == 'bytes':
+                    return bytes(wrapyfi[1])
+
+                elif obj_type == 'batch':
+                    return MessageBatch(wrapyfi[1])
+
+                elif obj_type == 'trace':
+                    return MessageTrace(*wrapyfi[1], obj=wrapyfi[2])
+
+                if self._plugins_version != PluginRegistrar.version:
+                    self.update_plugins()
                 plugin_match = self.plugins.get(obj_type, None)
+                if plugin_match is None and PluginRegistrar.load_tag(obj_type):
+                    self.update_plugins()
+                    plugin_match = self.plugins.get(obj_type, None)
                 if plugin_match is not None:
-                    detected, plugin_return = plugin_match.decode(obj_type, wrapyfi)
+                    if self.binary:
+                        detected, plugin_return = plugin_match.decode_binary(obj_type, wrapyfi)
+                    else:
+                        detected, plugin_return = plugin_match.decode(obj_type, wrapyfi)
                     if detected:
                         return plugin_return
 
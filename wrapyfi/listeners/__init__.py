@@ -1,5 +1,27 @@
+"""
+Builtin listeners of Wrapyfi.
+
+The middleware modules are not imported when Wrapyfi is imported, since they import the middleware frameworks.
+Instead, ``MIDDLEWARE_MANIFEST`` declares the data types registered by each module and the top-level packages it
+requires, and ``Listeners.registry`` imports a module when one of its listeners is first instantiated. New middleware
+modules must be added to the manifest, otherwise they are imported when Wrapyfi is imported.
+"""
 import logging
 
+# defined before importing wrapyfi.connect, whose scan reads the manifest of this partially initialized package
+MIDDLEWARE_MANIFEST = {
+    "ros": {"data_types": ("NativeObject", "Image", "AudioChunk", "Properties", "ROSMessage"),
+            "requires": ("numpy", "rospy", "rostopic", "std_msgs", "sensor_msgs")},
+    "ros2": {"data_types": ("NativeObject", "Image", "AudioChunk", "Properties", "ROS2Message"),
+             "requires": ("numpy", "rclpy", "std_msgs", "sensor_msgs")},
+    "shm": {"data_types": ("NativeObject", "Image", "AudioChunk", "Properties"),
+            "requires": ("numpy", "zmq")},
+    "yarp": {"data_types": ("NativeObject", "Image", "AudioChunk", "Properties"),
+             "requires": ("numpy", "yarp")},
+    "zeromq": {"data_types": ("NativeObject", "Image", "AudioChunk", "Properties"),
+               "requires": ("numpy", "cv2", "zmq")},
+}
+
 from wrapyfi.connect.listeners import Listener, Listeners, ListenerWatchDog
 
 
@@ -1,5 +1,4 @@
 import logging
-import json
 import queue
 import time
 import os
@@ -8,7 +7,6 @@ import sys
 import importlib
 
 import numpy as np
-import cv2
 import rclpy
 from rclpy import Parameter
 from rclpy.node import Node
@@ -17,7 +15,7 @@ import sensor_msgs.msg
 
 from wrapyfi.connect.listeners import Listener, Listeners, ListenerWatchDog
 from wrapyfi.middlewares.ros2 import ROS2Middleware
-from wrapyfi.encoders import JsonDecodeHook
+from wrapyfi.encoders import JsonDecodeHook, ImageCodecs
 
 
 WAIT = {True: None, False: 0}
@@ -82,8 +80,8 @@ class ROS2NativeObjectListener(ROS2Listener):
 
         self._subscriber = self._queue = None
 
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         ListenerWatchDog().add_listener(self)
 
@@ -106,7 +104,7 @@ class ROS2NativeObjectListener(ROS2Listener):
         try:
             rclpy.spin_once(self, timeout_sec=WAIT[self.should_wait])
             obj_str = self._queue.get(block=self.should_wait)
-            return json.loads(obj_str, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+            return self._plugin_decoder.decode(obj_str)
         except queue.Empty:
             return None
 
@@ -126,7 +124,8 @@ class ROS2NativeObjectListener(ROS2Listener):
 class ROS2ImageListener(ROS2Listener):
 
     def __init__(self, name: str, in_topic: str, should_wait: bool = True, queue_size: int = QUEUE_SIZE,
-                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False, **kwargs):
+                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, **kwargs):
         """
         The Image listener using the ROS 2 Image message parsed to a numpy array.
 
@@ -139,13 +138,15 @@ class ROS2ImageListener(ROS2Listener):
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
         :param jpg: bool: True if the image should be decompressed from JPG. Default is False
+        :param codec: str: Any image codec other than 'raw' selects the compressed transport similar to ``jpg``. The codec
+                      is detected from the received image. Default is None
         """
         super().__init__(name, in_topic, should_wait=should_wait, queue_size=queue_size, **kwargs)
         self.width = width
         self.height = height
         self.rgb = rgb
         self.fp = fp
-        self.jpg = jpg
+        self.jpg = jpg or codec not in (None, "raw")
 
         if self.fp:
             self._encoding = '32FC3' if self.rgb else '32FC1'
@@ -186,12 +187,8 @@ class ROS2ImageListener(ROS2Listener):
             rclpy.spin_once(self, timeout_sec=WAIT[self.should_wait])
             if self.jpg:
                 format, data = self._queue.get(block=self.should_wait)
-                if format != 'jpeg':
-                    raise ValueError(f"Unsupported image format: {format}")
-                if self.rgb:
-                    img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
-                else:
-                    img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_GRAYSCALE)
+                # the codec is detected from the compressed image, therefore the format is not checked
+                img = ImageCodecs.decode(np.frombuffer(data, np.uint8), rgb=self.rgb)
             else:
                 height, width, encoding, is_bigendian, data = self._queue.get(block=self.should_wait)
                 if encoding != self._encoding:
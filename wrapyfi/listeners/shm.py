@@ -0,0 +1,267 @@
+import logging
+import time
+import os
+from typing import Optional
+
+import numpy as np
+import zmq
+
+from wrapyfi.connect.listeners import Listener, Listeners, ListenerWatchDog
+from wrapyfi.middlewares.shm import ShmMiddleware, ShmRingBuffer, SHM_NOTIFY_HEADER, SHM_BUFFER_ENTRY
+from wrapyfi.encoders import JsonDecodeHook, ImageCodecs
+
+
+SHM_IPC_DIR = os.environ.get("WRAPYFI_SHM_IPC_DIR", None)
+WATCHDOG_POLL_REPEAT = None
+
+
+class ShmListener(Listener):
+
+    def __init__(self, name: str, in_topic: str, carrier: str = "ipc", should_wait: bool = True,
+                 ipc_dir: Optional[str] = SHM_IPC_DIR, deserializer_kwargs: Optional[dict] = None, **kwargs):
+        """
+        Initialize the subscriber. The data is read directly from the shared memory ring buffer of the publisher upon
+        receiving a notification over the ZeroMQ ``ipc://`` endpoint. Numpy arrays are returned as read-only views of
+        the shared memory, which remain valid until the publisher laps the ring buffer.
+
+        :param name: str: Name of the subscriber
+        :param in_topic: str: Name of the input topic preceded by '/' (e.g. '/topic')
+        :param carrier: str: Carrier protocol. The shared memory middleware only supports 'ipc' and ignores any other carrier. Default is 'ipc'
+        :param should_wait: bool: Whether the subscriber should wait for the publisher to transmit a message. Default is True
+        :param ipc_dir: str: Directory in which the ``ipc://`` notification endpoints are created. Default is the temporary directory
+        :param deserializer_kwargs: dict: Additional kwargs for the deserializer
+        :param kwargs: dict: Additional kwargs for the subscriber
+        """
+        carrier = "ipc"
+        super().__init__(name, in_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+        ShmMiddleware.activate(ipc_dir=ipc_dir)
+
+        self._socket = self._ring = None
+        self.skipped_messages = 0
+
+        self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs)
+
+        if not self.should_wait:
+            ListenerWatchDog().add_listener(self)
+
+    def establish(self, repeats: Optional[int] = None, **kwargs):
+        """
+        Establish the connection to the publisher.
+
+        :param repeats: int: Number of repeats to await connection. None for infinite. Default is None
+        :return: bool: True if connection established, False otherwise
+        """
+        if self._socket is None:
+            self._socket = zmq.Context.instance().socket(zmq.SUB)
+            self._socket.setsockopt(zmq.LINGER, 0)
+            self._socket.connect(ShmMiddleware().get_ipc_address(self.in_topic))
+            self._socket.setsockopt(zmq.SUBSCRIBE, b"")
+        established = self.await_connection(repeats=repeats)
+        return self.check_establishment(established)
+
+    def await_connection(self, repeats: Optional[int] = None):
+        """
+        Wait for the publisher to bind the notification endpoint.
+
+        :param repeats: int: Number of repeats to await connection. None for infinite. Default is None
+        :return: bool: True if connection established, False otherwise
+        """
+        connected = False
+        logging.info(f"[SHM] Waiting for input port: {self.in_topic}")
+        if repeats is None:
+            if self.should_wait:
+                repeats = -1
+            else:
+                return True
+        while repeats > 0 or repeats <= -1:
+            repeats -= 1
+            connected = os.path.exists(ShmMiddleware().get_ipc_path(self.in_topic))
+            if connected:
+                logging.info(f"[SHM] Connected to input port: {self.in_topic}")
+                break
+            time.sleep(0.2)
+        return connected
+
+    def _attach_ring(self, ring_name: str):
+        """
+        Attach to the shared memory segment of the publisher, replacing the previously attached segment if the
+        publisher reallocated its ring buffer.
+
+        :param ring_name: str: Name of the shared memory segment
+        :return: ShmRingBuffer: The attached ring buffer or None if the segment no longer exists
+        """
+        if self._ring is not None:
+            if self._ring.name == ring_name:
+                return self._ring
+            self._ring.close()
+            self._ring = None
+        try:
+            self._ring = ShmRingBuffer(ring_name)
+        except FileNotFoundError:
+            return None
+        return self._ring
+
+    def _read(self):
+        """
+        Receive a notification and decode the corresponding message from shared memory. Messages overwritten by the
+        publisher before they were decoded are dropped and counted in ``skipped_messages``.
+
+        :return: Any: The decoded message or None if no message was received
+        """
+        while self._socket.poll(timeout=None if self.should_wait else 0):
+            header, ring_name, obj_str, entries = self._socket.recv_multipart()
+            seq, slot_offset = SHM_NOTIFY_HEADER.unpack(header)
+            ring = None
+            buffers = []
+            if entries:
+                ring = self._attach_ring(ring_name.decode())
+                if ring is None:
+                    self.skipped_messages += 1
+                    continue
+                buffers = ring.read(list(SHM_BUFFER_ENTRY.iter_unpack(entries)))
+            self._plugin_decoder.buffers = buffers
+            try:
+                obj = self._plugin_decoder.decode(obj_str)
+            finally:
+                self._plugin_decoder.buffers = None
+            if ring is not None and not ring.is_valid(slot_offset, seq):
+                logging.warning(f"[SHM] Message {seq} on {self.in_topic} was overwritten before being read. "
+                                f"Consider increasing the slot_count of the publisher")
+                self.skipped_messages += 1
+                continue
+            return obj
+        return None
+
+    def close(self):
+        """
+        Close the subscriber.
+        """
+        if hasattr(self, "_socket") and self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if hasattr(self, "_ring") and self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    def __del__(self):
+        self.close()
+
+
+@Listeners.register("NativeObject", "shm")
+class ShmNativeObjectListener(ShmListener):
+
+    def __init__(self, name: str, in_topic: str, carrier: str = "ipc", should_wait: bool = True, **kwargs):
+        """
+        The NativeObject listener using shared memory. Deserializes the notification (including plugins) using the
+        decoder and resolves numpy arrays and bytes-like objects from shared memory.
+
+        :param name: str: Name of the subscriber
+        :param in_topic: str: Name of the input topic preceded by '/' (e.g. '/topic')
+        :param carrier: str: Carrier protocol. The shared memory middleware only supports 'ipc'. Default is 'ipc'
+        :param should_wait: bool: Whether the subscriber should wait for the publisher to transmit a message. Default is True
+        """
+        super().__init__(name, in_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+
+    def listen(self):
+        """
+        Listen for a message.
+
+        :return: Any: The received message as a native python object
+        """
+        if not self.established:
+            established = self.establish(repeats=WATCHDOG_POLL_REPEAT)
+            if not established:
+                return None
+        return self._read()
+
+
+@Listeners.register("Image", "shm")
+class ShmImageListener(ShmNativeObjectListener):
+
+    def __init__(self, name: str, in_topic: str, carrier: str = "ipc", should_wait: bool = True,
+                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, **kwargs):
+        """
+        The Image listener using shared memory parsed to a read-only numpy array.
+
+        :param name: str: Name of the subscriber
+        :param in_topic: str: Name of the input topic preceded by '/' (e.g. '/topic')
+        :param carrier: str: Carrier protocol. The shared memory middleware only supports 'ipc'. Default is 'ipc'
+        :param should_wait: bool: Whether the subscriber should wait for the publisher to transmit a message. Default is True
+        :param width: int: Width of the image. Default is -1 (use the width of the received image)
+        :param height: int: Height of the image. Default is -1 (use the height of the received image)
+        :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
+        :param fp: bool: True if the image is floating point, False if it is integer. Default is False
+        :param jpg: bool: True if the image should be decompressed from JPG. Default is False
+        :param codec: str: Any image codec other than 'raw' selects the compressed transport similar to ``jpg``. The codec
+                      is detected from the received image. Default is None
+        """
+        super().__init__(name, in_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+        self.width = width
+        self.height = height
+        self.rgb = rgb
+        self.fp = fp
+        self.jpg = jpg or codec not in (None, "raw")
+
+        self._type = np.float32 if self.fp else np.uint8
+
+    def listen(self):
+        """
+        Listen for a message.
+
+        :return: np.ndarray: The received message as a numpy array formatted as a cv2 image np.ndarray[img_height, img_width, channels]
+        """
+        img = super().listen()
+        if img is None:
+            return None
+        if self.jpg:
+            return ImageCodecs.decode(img, rgb=self.rgb)
+        if 0 < self.width != img.shape[1] or 0 < self.height != img.shape[0] or \
+                not ((img.ndim == 2 and not self.rgb) or (img.ndim == 3 and self.rgb and img.shape[2] == 3)):
+            raise ValueError("Incorrect image shape for listener")
+        return img
+
+
+@Listeners.register("AudioChunk", "shm")
+class ShmAudioChunkListener(ShmNativeObjectListener):
+    def __init__(self, name: str, in_topic: str, carrier: str = "ipc", should_wait: bool = True,
+                 channels: int = 1, rate: int = 44100, chunk: int = -1, **kwargs):
+        """
+        The AudioChunk listener using shared memory parsed to a read-only numpy array.
+
+        :param name: str: Name of the subscriber
+        :param in_topic: str: Name of the input topic preceded by '/' (e.g. '/topic')
+        :param carrier: str: Carrier protocol. The shared memory middleware only supports 'ipc'. Default is 'ipc'
+        :param should_wait: bool: Whether the subscriber should wait for the publisher to transmit a message. Default is True
+        :param channels: int: Number of channels in the audio. Default is 1
+        :param rate: int: Sampling rate of the audio. Default is 44100
+        :param chunk: int: Number of samples in the audio chunk. Default is -1 (use the chunk size of the received audio)
+        """
+        super().__init__(name, in_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+        self.channels = channels
+        self.rate = rate
+        self.chunk = chunk
+
+    def listen(self):
+        """
+        Listen for a message.
+
+        :return: Tuple[np.ndarray, int]: The received message as a numpy array formatted as (np.ndarray[audio_chunk, channels], int[samplerate])
+        """
+        obj = super().listen()
+        if obj is None:
+            return None, self.rate
+        chunk, channels, rate, aud = obj
+        if 0 < self.rate != rate:
+            raise ValueError("Incorrect audio rate for listener")
+        if 0 < self.chunk != chunk or self.channels != channels or aud.size != chunk * channels:
+            raise ValueError("Incorrect audio shape for listener")
+        return aud, rate
+
+
+@Listeners.register("Properties", "shm")
+class ShmPropertiesListener(ShmListener):
+    def __init__(self, name, in_topic, **kwargs):
+        super().__init__(name, in_topic, **kwargs)
+        raise NotImplementedError
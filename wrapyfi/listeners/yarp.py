@@ -1,17 +1,15 @@
 import logging
-import json
 import time
 import base64
 import io
 from typing import Optional, Literal
 
 import numpy as np
-import cv2
 import yarp
 
 from wrapyfi.connect.listeners import Listener, Listeners, ListenerWatchDog
 from wrapyfi.middlewares.yarp import YarpMiddleware
-from wrapyfi.encoders import JsonDecodeHook
+from wrapyfi.encoders import JsonDecodeHook, ImageCodecs
 
 
 WATCHDOG_POLL_REPEAT = None
@@ -111,8 +109,8 @@ class YarpNativeObjectListener(YarpListener):
         super().__init__(name, in_topic, carrier=carrier, should_wait=should_wait, persistent=persistent, **kwargs)
         self._port = self._netconnect = None
 
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         if not self.should_wait:
             ListenerWatchDog().add_listener(self)
@@ -147,7 +145,7 @@ class YarpNativeObjectListener(YarpListener):
                 return None
         obj_port = self.read_port(self._port)
         if obj_port is not None:
-            return json.loads(obj_port.get(0).asString(), object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+            return self._plugin_decoder.decode(obj_port.get(0).asString())
         else:
             return None
 
@@ -156,7 +154,8 @@ class YarpNativeObjectListener(YarpListener):
 class YarpImageListener(YarpListener):
 
     def __init__(self, name: str, in_topic: str, carrier: Literal["tcp", "udp", "mcast"] = "tcp", should_wait: bool = True,
-                 persistent: bool = True, width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False, **kwargs):
+                 persistent: bool = True, width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, **kwargs):
         """
         The Image listener using the BufferedPortImage construct parsed to a numpy array.
 
@@ -170,13 +169,15 @@ class YarpImageListener(YarpListener):
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
         :param jpg: bool: True if the image should be decompressed from JPG. Default is False
+        :param codec: str: Any image codec other than 'raw' selects the compressed transport similar to ``jpg``. The codec
+                      is detected from the received image. Default is None
         """
         super().__init__(name, in_topic, carrier=carrier, should_wait=should_wait, persistent=persistent, **kwargs)
         self.width = width
         self.height = height
         self.rgb = rgb
         self.fp = fp
-        self.jpg = jpg
+        self.jpg = jpg or codec not in (None, "raw")
 
         self._port = self._type = self._netconnect = None
 
@@ -224,11 +225,7 @@ class YarpImageListener(YarpListener):
             img_str = ret_img_msg.get(0).asString()
             with io.BytesIO(base64.b64decode(img_str.encode('ascii'))) as memfile:
                 img_str = np.load(memfile)
-            if self.rgb:
-                img = cv2.imdecode(np.frombuffer(img_str, np.uint8), cv2.IMREAD_COLOR)
-            else:
-                img = cv2.imdecode(np.frombuffer(img_str, np.uint8), cv2.IMREAD_GRAYSCALE)
-            return img
+            return ImageCodecs.decode(np.frombuffer(img_str, np.uint8), rgb=self.rgb)
         else:
             if 0 < self.width != ret_img_msg.width() or 0 < self.height != ret_img_msg.height():
                 raise ValueError("Incorrect image shape for listener")
@@ -1,16 +1,21 @@
 import logging
-import json
 import time
 import os
+import queue
+import threading
+import asyncio
+from concurrent.futures import Future
+from functools import partial
 from typing import Optional
 
 import numpy as np
 import cv2
 import zmq
+import zmq.asyncio
 
 from wrapyfi.connect.listeners import Listener, Listeners, ListenerWatchDog
-from wrapyfi.middlewares.zeromq import ZeroMQMiddlewarePubSub
-from wrapyfi.encoders import JsonDecodeHook
+from wrapyfi.middlewares.zeromq import ZeroMQMiddlewarePubSub, ZeroMQArrayHeader, zeromq_recv_into
+from wrapyfi.encoders import JsonDecodeHook, ImageCodecs, ImageCodecPool, MessageTrace
 
 
 SOCKET_IP = os.environ.get("WRAPYFI_ZEROMQ_SOCKET_IP", "127.0.0.1")
@@ -26,7 +31,7 @@ class ZeroMQListener(Listener):
                  socket_ip: str = SOCKET_IP, socket_pub_port: int = SOCKET_PUB_PORT,
                  pubsub_monitor_topic: str = ZEROMQ_PUBSUB_MONITOR_TOPIC,
                  pubsub_monitor_listener_spawn: Optional[str] = ZEROMQ_PUBSUB_MONITOR_LISTENER_SPAWN,
-                 zeromq_kwargs: Optional[dict] = None, **kwargs):
+                 latest_only: bool = False, zeromq_kwargs: Optional[dict] = None, **kwargs):
         """
         Initialize the subscriber.
 
@@ -40,6 +45,8 @@ class ZeroMQListener(Listener):
                                  Default is 5555
         :param pubsub_monitor_topic: str: Topic to monitor the connections. Default is 'ZEROMQ/CONNECTIONS'
         :param pubsub_monitor_listener_spawn: str: Whether to spawn the PUB/SUB monitor listener as a process or thread. Default is 'process'
+        :param latest_only: bool: Whether to drain all queued messages on each listen, decoding only the newest one.
+                            The discarded messages are counted in ``skipped_messages``. Default is False
         :param zeromq_kwargs: dict: Additional kwargs for the ZeroMQ middleware
         :param kwargs: dict: Additional kwargs for the subscriber
         """
@@ -47,6 +54,9 @@ class ZeroMQListener(Listener):
             logging.warning("[ZeroMQ] ZeroMQ does not support other carriers than TCP for PUB/SUB pattern. Using TCP.")
             carrier = "tcp"
         super().__init__(name, in_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+        self.latest_only = latest_only
+        self.skipped_messages = 0
+        self._asocket = None
 
         self.socket_address = f"{carrier}://{socket_ip}:{socket_pub_port}"
 
@@ -66,7 +76,6 @@ class ZeroMQListener(Listener):
         :param repeats: int: Number of repeats to await connection. None for infinite. Default is None
         :return: bool: True if connection established, False otherwise
         """
-        connected = False
         if in_topic is None:
             in_topic = self.in_topic
         logging.info(f"[ZeroMQ] Waiting for input port: {in_topic}")
@@ -76,15 +85,94 @@ class ZeroMQListener(Listener):
             else:
                 return True
 
-        while repeats > 0 or repeats <= -1:
-            repeats -= 1
-            connected = ZeroMQMiddlewarePubSub().shared_monitor_data.is_connected(in_topic)
-            if connected:
-                logging.info(f"[ZeroMQ] Connected to input port: {in_topic}")
-                break
-            time.sleep(0.2)
+        # block on the monitor condition until the subscription is registered, instead of polling the connection state
+        connected = ZeroMQMiddlewarePubSub().shared_monitor_data.wait_for_connection(
+            in_topic, timeout=None if repeats <= -1 else repeats * 0.2)
+        if connected:
+            logging.info(f"[ZeroMQ] Connected to input port: {in_topic}")
         return connected
 
+    def recv_multipart(self, copy: bool = True):
+        """
+        Receive a multipart message, waiting for it if the subscriber should wait. When ``latest_only`` is True, all
+        queued messages are received without being decoded and only the newest one is returned. Messages are drained
+        instead of setting ``zmq.CONFLATE`` on the socket, since conflation does not support multipart messages.
+
+        :param copy: bool: Whether to copy the message frames. Default is True
+        :return: List[Union[bytes, zmq.Frame]]: The message frames or None if no message was received
+        """
+        if not self._socket.poll(timeout=None if self.should_wait else 0):
+            return None
+        if not self.latest_only:
+            return self._socket.recv_multipart(copy=copy)
+        # receive the frames without copying, so only the frames of the newest message are copied
+        return self._recv_latest(self._socket.recv_multipart(copy=False), copy=copy)
+
+    async def arecv_multipart(self, copy: bool = True):
+        """
+        Receive a multipart message without blocking the event loop, awaiting it if the subscriber should wait.
+        The socket is shadowed by a ``zmq.asyncio`` socket, so that the message is awaited on the event loop.
+
+        :param copy: bool: Whether to copy the message frames. Default is True
+        :return: List[Union[bytes, zmq.Frame]]: The message frames or None if no message was received
+        """
+        if not self.should_wait and not self._socket.poll(timeout=0):
+            return None
+        if self._asocket is None or self._asocket.underlying != self._socket.underlying:
+            self._asocket = zmq.asyncio.Socket.from_socket(self._socket)
+        if not self.latest_only:
+            return await self._asocket.recv_multipart(copy=copy)
+        return self._recv_latest(await self._asocket.recv_multipart(copy=False), copy=copy)
+
+    def _recv_latest(self, obj: list, copy: bool = True):
+        """
+        Receive the queued messages without blocking, returning the newest one.
+
+        :param obj: List[zmq.Frame]: The frames of the first received message
+        :param copy: bool: Whether to copy the frames of the newest message. Default is True
+        :return: List[Union[bytes, zmq.Frame]]: The frames of the newest message
+        """
+        while True:
+            try:
+                obj = self._socket.recv_multipart(zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                break
+            self.skipped_messages += 1
+        return obj if not copy else [frame.bytes for frame in obj]
+
+    async def alisten(self):
+        """
+        Listen for a message without blocking the event loop. The connection is established in the default executor
+        of the event loop, whereas the messages are awaited on the event loop.
+
+        :return: Any: The received message
+        """
+        if not self.established:
+            established = await asyncio.get_running_loop().run_in_executor(
+                None, partial(self.establish, repeats=WATCHDOG_POLL_REPEAT))
+            if not established:
+                return None
+        return self._decode_message(await self.arecv_multipart(copy=False))
+
+    def _decode_message(self, obj: Optional[list]):
+        """
+        Decode a received message.
+
+        :param obj: List[zmq.Frame]: The message frames or None if no message was received
+        :return: Any: The decoded message
+        """
+        raise NotImplementedError
+
+    def _record_trace_frame(self, obj: list, index: int):
+        """
+        Record the tracing envelope transmitted in the trailing frame of a message, if the publisher traces its messages.
+
+        :param obj: List[zmq.Frame]: The message frames
+        :param index: int: The index of the trailing frame holding the tracing envelope
+        """
+        if len(obj) > index:
+            self._record_trace(MessageTrace.unpack(obj[index]))
+
     def read_socket(self, socket):
         """
         Read the socket.
@@ -122,7 +210,9 @@ class ZeroMQNativeObjectListener(ZeroMQListener):
                  deserializer_kwargs: Optional[dict] = None, **kwargs):
         """
         The NativeObject listener using the ZeroMQ message construct assuming the data is serialized as a JSON string.
-        Deserializes the data (including plugins) using the decoder and parses it to a native object.
+        Deserializes the data (including plugins) using the decoder and parses it to a native object. Raw buffers
+        transmitted in additional message frames (publisher with ``raw_buffers=True``) are detected automatically and
+        decoded without copying.
 
         :param name: str: Name of the subscriber
         :param in_topic: str: Name of the input topic preceded by '/' (e.g. '/topic')
@@ -133,8 +223,8 @@ class ZeroMQNativeObjectListener(ZeroMQListener):
         super().__init__(name, in_topic, carrier=carrier, should_wait=should_wait, **kwargs)
         self._socket = self._netconnect = None
 
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs)
 
         if not self.should_wait:
             ListenerWatchDog().add_listener(self)
@@ -170,23 +260,34 @@ class ZeroMQNativeObjectListener(ZeroMQListener):
             established = self.establish(repeats=WATCHDOG_POLL_REPEAT)
             if not established:
                 return None
-        if self._socket.poll(timeout=None if self.should_wait else 0):
-            obj = self._socket.recv_multipart()
-            if obj is not None:
-                return json.loads(obj[1].decode(), object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
-            else:
-                return None
-        else:
+        return self._decode_message(self.recv_multipart(copy=False))
+
+    def _decode_message(self, obj: Optional[list]):
+        """
+        Decode a received message, including the raw buffers transmitted in additional message frames.
+
+        :param obj: List[zmq.Frame]: The message frames or None if no message was received
+        :return: Any: The received message as a native python object
+        """
+        if obj is None:
             return None
+        self._plugin_decoder.buffers = [frame.buffer for frame in obj[2:]]
+        try:
+            return self._plugin_decoder.decode(obj[1].bytes)
+        finally:
+            self._plugin_decoder.buffers = None
 
 
 @Listeners.register("Image", "zeromq")
 class ZeroMQImageListener(ZeroMQNativeObjectListener):
 
     def __init__(self, name: str, in_topic: str, carrier: str = "tcp", should_wait: bool = True,
-                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False, **kwargs):
+                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 out_buffer: Optional[np.ndarray] = None, codec_pool: bool = False, codec_pool_size: int = 4, **kwargs):
         """
-        The Image listener using the ZeroMQ message construct parsed to a numpy array.
+        The Image listener using the ZeroMQ message construct parsed to a numpy array. Raw images are returned as
+        arrays viewing the received message frame without copying, whereas compressed images are decoded using the
+        codec detected from the message header.
 
         :param name: str: Name of the subscriber
         :param in_topic: str: Name of the input topic preceded by '/' (e.g. '/topic')
@@ -196,7 +297,16 @@ class ZeroMQImageListener(ZeroMQNativeObjectListener):
         :param height: int: Height of the image. Default is -1 (use the height of the received image)
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
-        :param jpg: bool: True if the image should be decompressed from JPG. Default is False
+        :param jpg: bool: True if the image should be decompressed from JPG when received from earlier Wrapyfi versions
+                    not transmitting the codec in the message header. Default is False
+        :param out_buffer: np.ndarray: Preallocated C-contiguous array (e.g. in pinned memory) matching the shape and
+                           dtype of the received images. When provided, each image is received into the buffer, which
+                           is returned instead of a new array. Default is None
+        :param codec_pool: bool: Whether to receive the images on a background thread and decompress them on the thread
+                           pool shared by all Image communicators of the process, returning them in receiving order.
+                           Default is False
+        :param codec_pool_size: int: Maximum number of received images awaiting ``listen`` before the background thread
+                                stops receiving (or discards the oldest image when ``latest_only`` is True). Default is 4
         """
         super().__init__(name, in_topic, carrier=carrier, should_wait=should_wait, **kwargs)
         self.width = width
@@ -204,8 +314,17 @@ class ZeroMQImageListener(ZeroMQNativeObjectListener):
         self.rgb = rgb
         self.fp = fp
         self.jpg = jpg
+        if out_buffer is not None and not out_buffer.flags['C_CONTIGUOUS']:
+            raise ValueError("The output buffer must be C-contiguous")
+        self.out_buffer = out_buffer
 
         self._type = np.float32 if self.fp else np.uint8
+        self._codecs = {}
+
+        self.codec_pool = codec_pool
+        self._codec_queue = queue.Queue(maxsize=codec_pool_size) if codec_pool else None
+        self._codec_thread = None
+        self._codec_stop = threading.Event()
 
     def listen(self):
         """
@@ -217,25 +336,232 @@ class ZeroMQImageListener(ZeroMQNativeObjectListener):
             established = self.establish(repeats=WATCHDOG_POLL_REPEAT)
             if not established:
                 return None
-        if self._socket.poll(timeout=None if self.should_wait else 0):
-            obj = self._socket.recv_multipart()
-            if obj is None:
+        if self._codec_queue is not None:
+            img = self._listen_codec_pool()
+            if img is None:
                 return None
-            elif self.jpg:
-                if self.rgb:
-                    img = cv2.imdecode(np.frombuffer(obj[2], np.uint8), cv2.IMREAD_COLOR)
-                else:
-                    img = cv2.imdecode(np.frombuffer(obj[2], np.uint8), cv2.IMREAD_GRAYSCALE)
-                return img
-            else:
-                img = json.loads(obj[2].decode(), object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
-                if 0 < self.width != img.shape[1] or 0 < self.height != img.shape[0] or \
-                        not ((img.ndim == 2 and not self.rgb) or (img.ndim == 3 and self.rgb and img.shape[2] == 3)):
-                    raise ValueError("Incorrect image shape for listener")
-                return img
+        elif self.out_buffer is not None and not self.latest_only:
+            return self._recv_into_buffer()
+        else:
+            return self._decode_message(self.recv_multipart(copy=False))
+        return self._check_image(img)
+
+    async def alisten(self):
+        """
+        Listen for a message without blocking the event loop. Images retrieved from the shared thread pool or received
+        directly into the output buffer are listened to in the default executor of the event loop.
+
+        :return: np.ndarray: The received message as a numpy array formatted as a cv2 image np.ndarray[img_height, img_width, channels]
+        """
+        if self._codec_queue is not None or (self.out_buffer is not None and not self.latest_only):
+            return await asyncio.get_running_loop().run_in_executor(None, self.listen)
+        return await super().alisten()
+
+    def _decode_message(self, obj: Optional[list]):
+        """
+        Decode a received image message.
+
+        :param obj: List[zmq.Frame]: The message frames or None if no message was received
+        :return: np.ndarray: The decoded image
+        """
+        if obj is None:
+            return None
+        self._record_trace_frame(obj, 3)
+        return self._check_image(self._decode_frames(obj))
+
+    def _check_image(self, img: np.ndarray):
+        """
+        Check the shape of the received image, copying it into the output buffer if provided.
+
+        :param img: np.ndarray: The received image
+        :return: np.ndarray: The received image or the output buffer
+        """
+        self._check_shape(img)
+        if self.out_buffer is not None:
+            np.copyto(self._get_out_buffer(img.shape, img.dtype), img)
+            return self.out_buffer
+        return img
+
+    def _decode_frames(self, obj: list, header: Optional[dict] = None):
+        """
+        Decode the image from the received message frames.
+
+        :param obj: List[zmq.Frame]: The message frames
+        :param header: dict: The unpacked message header. Default is None (unpack the header from the frames)
+        :return: np.ndarray: The decoded image
+        """
+        header = header or ZeroMQArrayHeader.unpack(obj[1].buffer)
+        if header is None:
+            # images published by earlier versions are embedded in the JSON string
+            return self._decode_jpg(obj[2].buffer) if self.jpg else self._plugin_decoder.decode(obj[2].bytes)
+        elif header["codec"] == "raw":
+            return np.ndarray(header["shape"], dtype=header["dtype"], buffer=obj[2].buffer, strides=header["strides"])
         else:
+            return self._decode_image(header, obj[2].buffer)
+
+    def _listen_codec_pool(self):
+        """
+        Retrieve the next image decoded on the shared thread pool, starting the background receiving thread on the
+        first call.
+
+        :return: np.ndarray: The decoded image or None if no image was received
+        """
+        if self._codec_thread is None:
+            self._codec_thread = threading.Thread(name=f"wrapyfi_codec_listener_{self.in_topic}",
+                                                  target=self._codec_recv_loop, daemon=True)
+            self._codec_thread.start()
+        try:
+            item = self._codec_queue.get(block=self.should_wait)
+        except queue.Empty:
+            return None
+        while self.latest_only:
+            try:
+                item = self._codec_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.skipped_messages += 1
+        try:
+            return item.result() if isinstance(item, Future) else item
+        except Exception as e:
+            logging.error(f"[ZeroMQ] Failed to decode the image on topic {self.in_topic}: {e}")
             return None
 
+    def _codec_recv_loop(self):
+        """
+        Receive the images until the listener is closed, scheduling the compressed ones for decoding on the shared
+        thread pool. Raw images and images published by earlier versions are decoded on the receiving thread.
+        """
+        while not self._codec_stop.is_set():
+            if not self._socket.poll(timeout=100):
+                continue
+            obj = self._socket.recv_multipart(copy=False)
+            try:
+                self._record_trace_frame(obj, 3)
+                header = ZeroMQArrayHeader.unpack(obj[1].buffer)
+                if header is not None and header["codec"] != "raw":
+                    item = ImageCodecPool.submit(self._decode_image, header, obj[2].buffer)
+                else:
+                    item = self._decode_frames(obj, header)
+            except Exception as e:
+                logging.error(f"[ZeroMQ] Failed to decode the image on topic {self.in_topic}: {e}")
+                continue
+            while not self._codec_stop.is_set():
+                try:
+                    self._codec_queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    if self.latest_only:
+                        try:
+                            self._codec_queue.get_nowait()
+                            self.skipped_messages += 1
+                        except queue.Empty:
+                            pass
+
+    def close(self):
+        """
+        Stop the background receiving thread, then close the subscriber.
+        """
+        codec_thread = getattr(self, "_codec_thread", None)
+        if codec_thread is not None and codec_thread is not threading.current_thread():
+            self._codec_stop.set()
+            codec_thread.join()
+        super().close()
+
+    def _recv_into_buffer(self):
+        """
+        Receive a raw image directly into the output buffer. Compressed images are decompressed into the buffer.
+
+        :return: np.ndarray: The output buffer or None if no message was received
+        """
+        if not self._socket.poll(timeout=None if self.should_wait else 0):
+            return None
+        self._socket.recv()
+        header = ZeroMQArrayHeader.unpack(self._socket.recv())
+        if header is not None and header["codec"] == "raw":
+            try:
+                out_buffer = zeromq_recv_into(self._socket, self._get_out_buffer(header["shape"], header["dtype"]))
+            except ValueError:
+                # discard the remaining frames, so the next message is received from its first frame
+                self._discard_frames()
+                raise
+            self._recv_trace_frame()
+            self._check_shape(out_buffer)
+            return out_buffer
+        obj_str = self._socket.recv(copy=False)
+        self._recv_trace_frame()
+        if header is not None:
+            img = self._decode_image(header, obj_str.buffer, out=self._get_out_buffer(header["shape"], header["dtype"]))
+        elif self.jpg:
+            img = self._decode_jpg(obj_str.buffer)
+        else:
+            img = self._plugin_decoder.decode(obj_str.bytes)
+        self._check_shape(img)
+        if img is self.out_buffer:
+            return img
+        np.copyto(self._get_out_buffer(img.shape, img.dtype), img)
+        return self.out_buffer
+
+    def _discard_frames(self):
+        """
+        Receive and discard the remaining frames of the message being received.
+        """
+        while self._socket.getsockopt(zmq.RCVMORE):
+            self._socket.recv(copy=False)
+
+    def _recv_trace_frame(self):
+        """
+        Receive and record the tracing envelope transmitted in the trailing frame of the message being received, if the
+        publisher traces its messages.
+        """
+        if self._socket.getsockopt(zmq.RCVMORE):
+            self._record_trace(MessageTrace.unpack(self._socket.recv()))
+
+    def _get_out_buffer(self, shape: tuple, dtype: np.dtype):
+        """
+        Get the output buffer, ensuring it matches the received image.
+
+        :param shape: tuple: The shape of the received image
+        :param dtype: np.dtype: The dtype of the received image
+        :return: np.ndarray: The output buffer
+        """
+        if self.out_buffer.shape != tuple(shape) or self.out_buffer.dtype != dtype:
+            raise ValueError(f"Output buffer of shape {self.out_buffer.shape} and dtype {self.out_buffer.dtype} does "
+                             f"not match the received image of shape {tuple(shape)} and dtype {dtype}")
+        return self.out_buffer
+
+    def _decode_image(self, header: dict, img_buffer, out: Optional[np.ndarray] = None):
+        """
+        Decompress an image using the codec specified in the message header.
+
+        :param header: dict: The unpacked message header
+        :param img_buffer: memoryview: The compressed image
+        :param out: np.ndarray: Preallocated array to decompress the image into. Default is None
+        :return: np.ndarray: The decompressed image
+        """
+        codec = self._codecs.get(header["codec"])
+        if codec is None:
+            codec = self._codecs.setdefault(header["codec"], ImageCodecs.create(header["codec"]))
+        return codec.decode(img_buffer, dtype=header["dtype"], shape=header["shape"], out=out)
+
+    def _decode_jpg(self, img_buffer):
+        """
+        Decompress a JPG image sent without a message header by earlier Wrapyfi versions.
+
+        :param img_buffer: memoryview: The JPG encoded image
+        :return: np.ndarray: The decompressed image
+        """
+        return cv2.imdecode(np.frombuffer(img_buffer, np.uint8), cv2.IMREAD_COLOR if self.rgb else cv2.IMREAD_GRAYSCALE)
+
+    def _check_shape(self, img: np.ndarray):
+        """
+        Check whether the received image matches the expected shape.
+
+        :param img: np.ndarray: The received image
+        """
+        if 0 < self.width != img.shape[1] or 0 < self.height != img.shape[0] or \
+                not ((img.ndim == 2 and not self.rgb) or (img.ndim == 3 and self.rgb and img.shape[2] == 3)):
+            raise ValueError("Incorrect image shape for listener")
+
 
 @Listeners.register("AudioChunk", "zeromq")
 class ZeroMQAudioChunkListener(ZeroMQImageListener):
@@ -269,16 +595,32 @@ class ZeroMQAudioChunkListener(ZeroMQImageListener):
             established = self.establish(repeats=WATCHDOG_POLL_REPEAT)
             if not established:
                 return None
-        if self._socket.poll(timeout=None if self.should_wait else 0):
-            obj = self._socket.recv_multipart()
-            chunk, channels, rate, aud = json.loads(obj[2].decode(), object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs) if obj is not None else None
-            if 0 < self.rate != rate:
-                raise ValueError("Incorrect audio rate for listener")
-            if 0 < self.chunk != chunk or self.channels != channels or aud.size != chunk * channels:
-                raise ValueError("Incorrect audio shape for listener")
-            return aud, rate
-        else:
+        return self._decode_message(self.recv_multipart(copy=False))
+
+    async def alisten(self):
+        """
+        Listen for a message without blocking the event loop.
+
+        :return: Tuple[np.ndarray, int]: The received message as a numpy array formatted as (np.ndarray[audio_chunk, channels], int[samplerate])
+        """
+        return await ZeroMQListener.alisten(self)
+
+    def _decode_message(self, obj: Optional[list]):
+        """
+        Decode a received audio chunk message.
+
+        :param obj: List[zmq.Frame]: The message frames or None if no message was received
+        :return: Tuple[np.ndarray, int]: The audio chunk formatted as (np.ndarray[audio_chunk, channels], int[samplerate])
+        """
+        if obj is None:
             return None, self.rate
+        self._record_trace_frame(obj, 3)
+        chunk, channels, rate, aud = self._plugin_decoder.decode(obj[2].bytes)
+        if 0 < self.rate != rate:
+            raise ValueError("Incorrect audio rate for listener")
+        if 0 < self.chunk != chunk or self.channels != channels or aud.size != chunk * channels:
+            raise ValueError("Incorrect audio shape for listener")
+        return aud, rate
 
 
 @Listeners.register("Properties", "zeromq")
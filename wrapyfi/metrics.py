@@ -0,0 +1,390 @@
+import os
+import time
+import threading
+import logging
+from typing import Optional
+
+from wrapyfi.utils import SingletonOptimized
+from wrapyfi.encoders import HOSTNAME
+
+
+METRICS_ENABLED = os.environ.get("WRAPYFI_METRICS", "False") == "True"
+HISTOGRAM_SIGNIFICANT_BITS = int(os.environ.get("WRAPYFI_METRICS_HISTOGRAM_BITS", 5))
+PROMETHEUS_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class Counter(object):
+    """
+    A monotonically increasing counter.
+    """
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        """
+        Increment the counter.
+
+        :param amount: int: The amount to increment the counter by. Default is 1
+        """
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self):
+        """
+        Return the current value of the counter.
+
+        :return: dict: The value of the counter
+        """
+        return {"value": self.value}
+
+
+class Histogram(object):
+    """
+    An HDR-style histogram of non-negative integers (e.g. latencies in nanoseconds) with logarithmically growing
+    buckets, each divided into linear sub-buckets. Values below 2 ** ``significant_bits`` are recorded exactly, whereas
+    larger values are recorded with a relative error below 2 ** (1 - ``significant_bits``), independently of their
+    magnitude. The buckets are allocated sparsely, so the memory grows with the number of distinct buckets recorded.
+    """
+    def __init__(self, significant_bits: int = HISTOGRAM_SIGNIFICANT_BITS, scale: float = 1.0):
+        """
+        Initialize the histogram.
+
+        :param significant_bits: int: The number of significant bits of the recorded values. Default is 5
+        :param scale: float: The factor converting the recorded values to the exported unit (e.g. 1e-9 to export
+                      nanoseconds as seconds). Default is 1.0
+        """
+        self.significant_bits = significant_bits
+        self.scale = scale
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+        self._half = 1 << (significant_bits - 1)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _index(self, value: int):
+        """
+        Internal method to compute the bucket index of a value.
+
+        :param value: int: The value
+        :return: int: The bucket index
+        """
+        shift = value.bit_length() - self.significant_bits
+        if shift <= 0:
+            return value
+        return shift * self._half + (value >> shift)
+
+    def _bounds(self, index: int):
+        """
+        Internal method to compute the lowest and highest value of a bucket.
+
+        :param index: int: The bucket index
+        :return: Tuple[int, int]: The lowest and highest value of the bucket
+        """
+        if index < 2 * self._half:
+            return index, index
+        shift = index // self._half - 1
+        mantissa = index - shift * self._half
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int):
+        """
+        Record a value.
+
+        :param value: int: The value to record. Negative values are recorded as 0
+        """
+        value = max(int(value), 0)
+        index = self._index(value)
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self.count += 1
+            self.sum += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def quantile(self, q: float):
+        """
+        Estimate a quantile of the recorded values as the highest value of the bucket containing it, bounded by the
+        highest recorded value.
+
+        :param q: float: The quantile in the range [0, 1]
+        :return: float: The estimated quantile in the exported unit, or None if no values were recorded
+        """
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(1, int(q * self.count + 0.5))
+            seen = 0
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if seen >= rank:
+                    return min(self._bounds(index)[1], self.max) * self.scale
+            return self.max * self.scale
+
+    def snapshot(self):
+        """
+        Return the summary of the recorded values.
+
+        :return: dict: The count, sum, min, max, and quantiles of the recorded values in the exported unit
+        """
+        snapshot = {"count": self.count, "sum": self.sum * self.scale,
+                    "min": None if self.min is None else self.min * self.scale,
+                    "max": None if self.max is None else self.max * self.scale}
+        snapshot.update({f"p{q * 100:g}": self.quantile(q) for q in PROMETHEUS_QUANTILES})
+        return snapshot
+
+
+class MetricsRegistry(metaclass=SingletonOptimized):
+    """
+    The registry of the metrics collected by the communicators. This class is a singleton. Metrics are only collected
+    by communicators created after the registry is enabled (using ``enable`` or by setting the environment variable
+    ``WRAPYFI_METRICS=True``), so that the communicators do not pay any cost when the metrics are disabled.
+    """
+    enabled = METRICS_ENABLED
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._http_server = None
+
+    @classmethod
+    def enable(cls, enabled: bool = True):
+        """
+        Enable (or disable) the collection of metrics by communicators created afterwards.
+
+        :param enabled: bool: Whether to collect metrics. Default is True
+        """
+        cls.enabled = enabled
+
+    def _get(self, metric_cls: type, name: str, labels: dict, **kwargs):
+        """
+        Internal method to get a metric, creating it if necessary.
+
+        :param metric_cls: type: The class of the metric
+        :param name: str: The name of the metric
+        :param labels: dict: The labels of the metric
+        :param kwargs: dict: Additional kwargs for the metric constructor
+        :return: Union[Counter, Histogram]: The metric
+        """
+        key = (name, tuple(sorted(labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = self._metrics[key] = metric_cls(**kwargs)
+        return metric
+
+    def counter(self, metric: str, **labels):
+        """
+        Get a counter, creating it if necessary.
+
+        :param metric: str: The name of the counter
+        :param labels: dict: The labels of the counter
+        :return: Counter: The counter
+        """
+        return self._get(Counter, metric, labels)
+
+    def histogram(self, metric: str, scale: float = 1.0, **labels):
+        """
+        Get a histogram, creating it if necessary.
+
+        :param metric: str: The name of the histogram
+        :param scale: float: The factor converting the recorded values to the exported unit. Default is 1.0
+        :param labels: dict: The labels of the histogram
+        :return: Histogram: The histogram
+        """
+        return self._get(Histogram, metric, labels, scale=scale)
+
+    def collect(self):
+        """
+        Collect the current values of all metrics.
+
+        :return: List[dict]: The name, labels, type, and values of each metric
+        """
+        with self._lock:
+            metrics = list(self._metrics.items())
+        return [{"name": name, "labels": dict(labels), "type": "counter" if isinstance(metric, Counter) else "summary",
+                 **metric.snapshot()} for (name, labels), metric in metrics]
+
+    def clear(self):
+        """
+        Remove all metrics. Communicators created before clearing the registry keep updating their removed metrics.
+        """
+        with self._lock:
+            self._metrics.clear()
+
+    def prometheus_text(self):
+        """
+        Format all metrics in the Prometheus text exposition format, exporting the histograms as summaries.
+
+        :return: str: The formatted metrics
+        """
+        lines = []
+        declared = set()
+        for metric in sorted(self.collect(), key=lambda metric: metric["name"]):
+            name = metric["name"]
+            if name not in declared:
+                lines.append(f"# TYPE {name} {metric['type']}")
+                declared.add(name)
+            labels = ",".join(f'{key}="{_escape_label(value)}"' for key, value in sorted(metric["labels"].items()))
+            if metric["type"] == "counter":
+                lines.append(f"{name}{{{labels}}} {metric['value']}")
+                continue
+            for q in PROMETHEUS_QUANTILES:
+                value = metric[f"p{q * 100:g}"]
+                quantile_labels = f'{labels},quantile="{q}"' if labels else f'quantile="{q}"'
+                lines.append(f"{name}{{{quantile_labels}}} {'NaN' if value is None else value}")
+            lines.append(f"{name}_sum{{{labels}}} {metric['sum']}")
+            lines.append(f"{name}_count{{{labels}}} {metric['count']}")
+        return "\n".join(lines) + "\n"
+
+    def serve_prometheus(self, port: int = 9464, host: str = "127.0.0.1"):
+        """
+        Serve the metrics in the Prometheus text exposition format over HTTP on a background thread.
+
+        :param port: int: The port of the HTTP server. Default is 9464
+        :param host: str: The host of the HTTP server. Default is '127.0.0.1' (only served locally)
+        :return: ThreadingHTTPServer: The HTTP server, which is shut down by ``stop_prometheus``
+        """
+        # imported here, since the HTTP server is rarely needed and slows down importing Wrapyfi
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+        if self._http_server is not None:
+            return self._http_server
+        registry = self
+
+        class PrometheusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.prometheus_text().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logging.debug(f"[Metrics] {format % args}")
+
+        self._http_server = ThreadingHTTPServer((host, port), PrometheusHandler)
+        self._http_server.daemon_threads = True
+        threading.Thread(name="wrapyfi_metrics_prometheus", target=self._http_server.serve_forever,
+                         daemon=True).start()
+        return self._http_server
+
+    def stop_prometheus(self):
+        """
+        Shut down the HTTP server started by ``serve_prometheus``.
+        """
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+class CommunicatorMetrics(object):
+    """
+    The metrics of a communicator, labelled by its role, middleware, data type, name, and topic. The counters and
+    histograms are resolved once, so that recording a message does not look up the registry. The latency histogram of
+    each operation is available as an attribute named after the operation.
+    """
+    def __init__(self, role: str, communicator, topic: Optional[str] = None, operations: tuple = ()):
+        """
+        Initialize the metrics of a communicator.
+
+        :param role: str: The role of the communicator (e.g. 'publisher', 'listener', 'server', or 'client')
+        :param communicator: Union[Publisher, Listener, Server, Client]: The communicator
+        :param topic: str: The topic of the communicator
+        :param operations: tuple: The operations of the communicator whose latency is recorded (e.g. ('publish',))
+        """
+        registry = MetricsRegistry()
+        self.labels = {"role": role, "middleware": getattr(communicator, "middleware", None) or "",
+                       "data_type": getattr(communicator, "data_type", None) or "",
+                       "name": communicator.__name__, "topic": topic or ""}
+        self.messages = registry.counter("wrapyfi_messages_total", **self.labels)
+        self.bytes_out = registry.counter("wrapyfi_bytes_total", direction="out", **self.labels)
+        self.bytes_in = registry.counter("wrapyfi_bytes_total", direction="in", **self.labels)
+        self.serialize = self.latency("serialize")
+        self.deserialize = self.latency("deserialize")
+        for operation in operations:
+            setattr(self, operation, self.latency(operation))
+        self.attached = False
+
+    def latency(self, operation: str):
+        """
+        Get the latency histogram of an operation, recording nanoseconds and exporting seconds.
+
+        :param operation: str: The operation (e.g. 'publish', 'listen', 'serialize', or 'deserialize')
+        :return: Histogram: The latency histogram
+        """
+        return MetricsRegistry().histogram("wrapyfi_latency_seconds", scale=1e-9, operation=operation, **self.labels)
+
+    def attach(self, communicator):
+        """
+        Attach the metrics to the JSON encoder and decoder of a communicator, recording the serialization time and
+        the serialized bytes.
+
+        :param communicator: Union[Publisher, Listener, Server, Client]: The communicator
+        """
+        for codec in (getattr(communicator, "_plugin_encoder", None), getattr(communicator, "_plugin_decoder", None)):
+            if codec is not None:
+                codec.metrics = self
+        self.attached = True
+
+
+class MessageTracer(object):
+    """
+    Tracks the tracing envelopes (``wrapyfi.encoders.MessageTrace``) received by a listener, recording the transit
+    latency of each message and detecting the messages lost or reordered since the previous message of the same
+    publisher. The transit latency is measured with the monotonic clock when the publisher runs on the same host, and
+    with the wall clock (subject to the clock offset between hosts) otherwise. Messages received out of order are
+    counted as reordered, after their sequence number was counted as lost when the gap was detected.
+    """
+    def __init__(self, metrics: Optional[CommunicatorMetrics] = None):
+        """
+        Initialize the tracer.
+
+        :param metrics: CommunicatorMetrics: The metrics of the listener, exporting the transit latency, lost messages,
+                        and reordered messages in the registry. Default is None (the statistics are only held by the tracer)
+        """
+        if metrics is not None:
+            registry = MetricsRegistry()
+            self.transit = metrics.latency("transit")
+            self.lost = registry.counter("wrapyfi_trace_lost_total", **metrics.labels)
+            self.reordered = registry.counter("wrapyfi_trace_reordered_total", **metrics.labels)
+        else:
+            self.transit = Histogram(scale=1e-9)
+            self.lost = Counter()
+            self.reordered = Counter()
+        self.last_trace = None
+        self._sequences = {}
+        self._lock = threading.Lock()
+
+    def record(self, trace):
+        """
+        Record a received tracing envelope, setting its ``transit_ns``.
+
+        :param trace: MessageTrace: The tracing envelope
+        """
+        if trace.host == HOSTNAME:
+            trace.transit_ns = time.monotonic_ns() - trace.monotonic_ns
+        else:
+            trace.transit_ns = time.time_ns() - trace.wall_ns
+        self.transit.record(trace.transit_ns)
+        with self._lock:
+            last_seq = self._sequences.get(trace.publisher_id)
+            if last_seq is None or trace.seq > last_seq:
+                if last_seq is not None and trace.seq > last_seq + 1:
+                    self.lost.inc(trace.seq - last_seq - 1)
+                self._sequences[trace.publisher_id] = trace.seq
+            else:
+                self.reordered.inc()
+            self.last_trace = trace
@@ -0,0 +1,212 @@
+import logging
+import atexit
+import os
+import struct
+import sys
+import tempfile
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from wrapyfi.utils import SingletonOptimized
+from wrapyfi.connect.wrapper import MiddlewareCommunicator
+
+
+SHM_SLOT_HEADER = struct.Struct("<Q")
+SHM_NOTIFY_HEADER = struct.Struct("<QQ")
+SHM_BUFFER_ENTRY = struct.Struct("<QQ")
+SHM_ALIGNMENT = 64
+
+
+class _SharedMemory(shared_memory.SharedMemory):
+    """
+    Shared memory segment which does not fail on garbage collection while numpy arrays still view its buffer. The
+    mapping is released once the last view is garbage collected.
+    """
+    def __del__(self):
+        try:
+            self.close()
+        except (OSError, BufferError):
+            pass
+
+
+class ShmRingBuffer(object):
+    """
+    A single-writer, multiple-reader ring buffer on top of a ``multiprocessing.shared_memory`` segment. The segment is
+    divided into a fixed number of equally sized slots, each starting with the sequence number of the message it
+    holds. The writer invalidates the sequence number of a slot before overwriting it, so that readers can detect
+    whether a slot was overwritten while they were accessing it. Readers access the slots directly (without copying),
+    therefore a received message remains valid until the writer laps the ring, i.e. for ``slot_count - 1`` subsequent
+    messages.
+    """
+    def __init__(self, name: str, slot_count: int = 0, slot_size: int = 0, create: bool = False):
+        """
+        Create or attach to a shared memory ring buffer.
+
+        :param name: str: Name of the shared memory segment
+        :param slot_count: int: Number of slots in the ring. Only required when creating the segment
+        :param slot_size: int: Size of each slot in bytes excluding the slot header. Only required when creating the segment
+        :param create: bool: Whether to create the segment (writer) or attach to an existing one (reader). Default is False
+        """
+        self.name = name
+        self.slot_count = slot_count
+        self.slot_size = self.align(slot_size)
+        self.slot_stride = SHM_ALIGNMENT + self.slot_size
+        if create:
+            self.shm = _SharedMemory(name=name, create=True, size=self.slot_stride * slot_count)
+        else:
+            self.shm = self._attach(name)
+        self.buf = self.shm.buf
+
+    @staticmethod
+    def _attach(name: str):
+        """
+        Attach to an existing shared memory segment without registering it with the resource tracker, since the
+        segment is owned (and unlinked) by the writer process.
+
+        :param name: str: Name of the shared memory segment
+        :return: shared_memory.SharedMemory: The attached shared memory segment
+        """
+        if sys.version_info >= (3, 13):
+            return _SharedMemory(name=name, track=False)
+        shm = _SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+    @staticmethod
+    def align(size: int):
+        """
+        Round the size up to the next multiple of the alignment, ensuring all buffers are suitably aligned for any
+        numpy dtype.
+
+        :param size: int: The size in bytes
+        :return: int: The aligned size in bytes
+        """
+        return -(-size // SHM_ALIGNMENT) * SHM_ALIGNMENT
+
+    def write(self, seq: int, buffers: List[memoryview]):
+        """
+        Write the buffers into the slot assigned to the sequence number.
+
+        :param seq: int: The sequence number of the message (starting from 1)
+        :param buffers: List[memoryview]: The buffers to write
+        :return: Tuple[int, List[Tuple[int, int]]]: The offset of the slot and the (offset, size) of each buffer within the segment
+        """
+        slot_offset = (seq % self.slot_count) * self.slot_stride
+        SHM_SLOT_HEADER.pack_into(self.buf, slot_offset, 0)
+        offset = slot_offset + SHM_ALIGNMENT
+        entries = []
+        for buffer in buffers:
+            buffer = np.frombuffer(buffer, dtype=np.uint8)
+            self.buf[offset:offset + buffer.nbytes] = buffer
+            entries.append((offset, buffer.nbytes))
+            offset += self.align(buffer.nbytes)
+        SHM_SLOT_HEADER.pack_into(self.buf, slot_offset, seq)
+        return slot_offset, entries
+
+    def read(self, entries: List[Tuple[int, int]]):
+        """
+        Get read-only views of the buffers stored in a slot.
+
+        :param entries: List[Tuple[int, int]]: The (offset, size) of each buffer within the segment
+        :return: List[memoryview]: The read-only buffers
+        """
+        return [self.buf[offset:offset + size].toreadonly() for offset, size in entries]
+
+    def is_valid(self, slot_offset: int, seq: int):
+        """
+        Check whether a slot still holds the message with the given sequence number.
+
+        :param slot_offset: int: The offset of the slot within the segment
+        :param seq: int: The sequence number of the message
+        :return: bool: True if the slot was not overwritten, False otherwise
+        """
+        return SHM_SLOT_HEADER.unpack_from(self.buf, slot_offset)[0] == seq
+
+    def fits(self, buffers: List[memoryview]):
+        """
+        Check whether the buffers fit into a single slot.
+
+        :param buffers: List[memoryview]: The buffers to write
+        :return: bool: True if the buffers fit, False otherwise
+        """
+        return sum(self.align(memoryview(buffer).nbytes) for buffer in buffers) <= self.slot_size
+
+    def close(self, unlink: bool = False):
+        """
+        Close the shared memory segment. The segment cannot be closed while views returned by ``read`` are still in use,
+        in which case it is left to the garbage collector.
+
+        :param unlink: bool: Whether to destroy the shared memory segment. Only the writer should unlink. Default is False
+        """
+        self.buf = None
+        try:
+            self.shm.close()
+        except BufferError:
+            logging.debug(f"[SHM] Shared memory segment {self.name} is still in use and will be closed when released")
+        if unlink:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class ShmMiddleware(metaclass=SingletonOptimized):
+    """
+    Shared memory middleware wrapper for exchanging data between processes on the same host. The data is written into
+    shared memory ring buffers, while only notifications (sequence numbers and small headers) are transmitted using
+    ZeroMQ over ``ipc://``. This class is a singleton, so it can be instantiated only once. The ``activate`` method
+    should be called to initialize the middleware. The ``deinit`` method should be called to deinitialize the middleware
+    and destroy all connections. The ``activate`` and ``deinit`` methods are automatically called when the class is
+    instantiated and when the program exits, respectively.
+    """
+    @staticmethod
+    def activate(**kwargs):
+        """
+        Activate the shared memory middleware. This method should be called to initialize the middleware.
+
+        :param kwargs: dict: Keyword arguments to be passed to the shared memory initialization function
+        """
+        ShmMiddleware(**kwargs)
+
+    def __init__(self, ipc_dir: Optional[str] = None, **kwargs):
+        """
+        Initialize the shared memory middleware. This method is automatically called when the class is instantiated.
+
+        :param ipc_dir: str: Directory in which the ZeroMQ ``ipc://`` notification endpoints are created. Default is the temporary directory
+        :param kwargs: dict: Additional keyword arguments
+        """
+        logging.info("Initialising SHM middleware")
+        self.ipc_dir = ipc_dir or tempfile.gettempdir()
+        atexit.register(MiddlewareCommunicator.close_all_instances)
+        atexit.register(self.deinit)
+
+    def get_ipc_address(self, topic: str):
+        """
+        Get the ZeroMQ ``ipc://`` notification endpoint of a topic.
+
+        :param topic: str: The topic name preceded by '/' (e.g. '/topic')
+        :return: str: The ``ipc://`` address
+        """
+        return "ipc://" + self.get_ipc_path(topic)
+
+    def get_ipc_path(self, topic: str):
+        """
+        Get the file system path of the ZeroMQ ``ipc://`` notification endpoint of a topic.
+
+        :param topic: str: The topic name preceded by '/' (e.g. '/topic')
+        :return: str: The path of the endpoint
+        """
+        return os.path.join(self.ipc_dir, "wrapyfi_shm" + topic.replace("/", "."))
+
+    @staticmethod
+    def deinit():
+        """
+        Deinitialize the shared memory middleware. This method is automatically called when the program exits.
+        """
+        logging.info("Deinitializing SHM middleware")
@@ -3,18 +3,224 @@ import atexit
 import threading
 import multiprocessing
 import time
-from collections import defaultdict
+import struct
+import zlib
+from collections import defaultdict, deque
 import json
 from typing import Optional
 
+import numpy as np
 import zmq
 
 from wrapyfi.utils import SingletonOptimized
 from wrapyfi.connect.wrapper import MiddlewareCommunicator
+from wrapyfi.encoders import ImageCodecs
 
 ZEROMQ_POST_OPTS = ["SUBSCRIBE", "UNSUBSCRIBE", "LINGER", "ROUTER_HANDOVER", "ROUTER_MANDATORY", "PROBE_ROUTER",
                     "XPUB_VERBOSE", "XPUB_VERBOSER", "REQ_CORRELATE", "REQ_RELAXED", "SNDHWM", "RCVHWM"]
 
+ZEROMQ_TOPIC_TABLE_HEADER = struct.Struct("<Q")
+ZEROMQ_TOPIC_TABLE_SLOT = struct.Struct("<IqH242s")
+ZEROMQ_TOPIC_TABLE_SLOTS = 512
+
+ZEROMQ_ARRAY_HEADER = struct.Struct("<4sBB8sBxQd4q4q")
+ZEROMQ_ARRAY_HEADER_MAGIC = b"WRFA"
+ZEROMQ_ARRAY_HEADER_VERSION = 1
+ZEROMQ_ARRAY_MAX_DIMS = 4
+ZEROMQ_AUDIO_HEADER = struct.Struct("<Q")
+ZEROMQ_REQUEST_ID = struct.Struct("<Q")
+ZEROMQ_WORKER_READY = b"\x01"
+# Socket.recv_into was added in pyzmq 26.4
+ZEROMQ_HAVE_RECV_INTO = hasattr(zmq.Socket, "recv_into")
+
+
+class ZeroMQTopicTable(object):
+    """
+    A fixed-size open addressing hash table mapping topics to counts, stored in a flat buffer which can be shared with
+    forked processes. The table is written by a single writer at a time (the callers are responsible for serializing
+    writers), whereas readers access the buffer without locking. The header holds a generation counter, which is odd
+    while a write is in progress and incremented on every change, allowing readers to detect and retry torn reads.
+    Topics are never removed from the table, their count is set to zero instead.
+    """
+    def __init__(self, slot_count: int = ZEROMQ_TOPIC_TABLE_SLOTS, use_multiprocessing: bool = False):
+        """
+        Initialize the topic table.
+
+        :param slot_count: int: Maximum number of topics in the table. Default is 512
+        :param use_multiprocessing: bool: Whether to allocate the table in shared memory (inherited by child processes) or in process memory
+        """
+        self.slot_count = slot_count
+        size = ZEROMQ_TOPIC_TABLE_HEADER.size + ZEROMQ_TOPIC_TABLE_SLOT.size * slot_count
+        if use_multiprocessing:
+            self.buf = memoryview(multiprocessing.RawArray("B", size)).cast("B")
+        else:
+            self.buf = memoryview(bytearray(size))
+
+    def _slot_offset(self, index: int):
+        return ZEROMQ_TOPIC_TABLE_HEADER.size + ZEROMQ_TOPIC_TABLE_SLOT.size * index
+
+    def _find(self, key: bytes, key_hash: int):
+        """
+        Find the slot of a key by linear probing.
+
+        :param key: bytes: The encoded topic
+        :param key_hash: int: The hash of the topic
+        :return: Tuple[int, int]: The offset of the slot and the count of the topic. The count is None if the topic is not in the table, in which case the offset points to the first empty slot (or is None if the table is full)
+        """
+        index = key_hash % self.slot_count
+        for _ in range(self.slot_count):
+            offset = self._slot_offset(index)
+            slot_hash, count, key_len, slot_key = ZEROMQ_TOPIC_TABLE_SLOT.unpack_from(self.buf, offset)
+            if key_len == 0:
+                return offset, None
+            if slot_hash == key_hash and slot_key[:key_len] == key:
+                return offset, count
+            index = (index + 1) % self.slot_count
+        return None, None
+
+    @staticmethod
+    def _encode(topic: str):
+        key = topic.encode("utf-8")
+        if not 0 < len(key) <= ZEROMQ_TOPIC_TABLE_SLOT.size - 14:
+            raise ValueError(f"Topic {topic} cannot be stored in the ZeroMQ topic table")
+        return key, zlib.crc32(key)
+
+    @property
+    def generation(self):
+        """
+        The generation counter of the table.
+
+        :return: int: The generation, which is odd while a write is in progress
+        """
+        return ZEROMQ_TOPIC_TABLE_HEADER.unpack_from(self.buf, 0)[0]
+
+    def get(self, topic: str):
+        """
+        Get the count of a topic without locking, retrying if the table changed while reading.
+
+        :param topic: str: The topic
+        :return: int: The count of the topic, 0 if the topic is not in the table
+        """
+        key, key_hash = self._encode(topic)
+        while True:
+            generation = self.generation
+            if generation % 2:
+                continue
+            _, count = self._find(key, key_hash)
+            if generation == self.generation:
+                return count or 0
+
+    def items(self):
+        """
+        Get all topics with a non-zero count without locking, retrying if the table changed while reading.
+
+        :return: dict: The topics mapped to their counts
+        """
+        while True:
+            generation = self.generation
+            if generation % 2:
+                continue
+            items = {}
+            for index in range(self.slot_count):
+                _, count, key_len, key = ZEROMQ_TOPIC_TABLE_SLOT.unpack_from(self.buf, self._slot_offset(index))
+                if key_len and count:
+                    items[key[:key_len].decode("utf-8")] = count
+            if generation == self.generation:
+                return items
+
+    def set(self, topic: str, count: int):
+        """
+        Set the count of a topic. Must not be called concurrently with other writers.
+
+        :param topic: str: The topic
+        :param count: int: The count of the topic
+        :return: bool: True if the count changed, False otherwise
+        """
+        key, key_hash = self._encode(topic)
+        offset, current_count = self._find(key, key_hash)
+        if current_count == count or (current_count is None and count == 0):
+            return False
+        if offset is None:
+            logging.error(f"[ZeroMQ] Topic table is full. Cannot store topic: {topic}")
+            return False
+        generation = self.generation
+        ZEROMQ_TOPIC_TABLE_HEADER.pack_into(self.buf, 0, generation + 1)
+        ZEROMQ_TOPIC_TABLE_SLOT.pack_into(self.buf, offset, key_hash, count, len(key), key)
+        ZEROMQ_TOPIC_TABLE_HEADER.pack_into(self.buf, 0, generation + 2)
+        return True
+
+
+class ZeroMQArrayHeader(object):
+    """
+    Fixed-size binary header describing an array transmitted as a raw buffer in a separate message frame. The header
+    holds the dtype, shape and strides of the array, the ID of the image codec (``wrapyfi.encoders.ImageCodecs``) used
+    for compressing the buffer ('raw' for uncompressed buffers), the sequence number of the message, and the time it
+    was published.
+    """
+
+    @staticmethod
+    def pack(arr_dtype: np.dtype, shape: tuple, strides: tuple, seq: int, timestamp: float, codec: str = "raw"):
+        """
+        Pack the array description into a header.
+
+        :param arr_dtype: np.dtype: The dtype of the array
+        :param shape: tuple: The shape of the array
+        :param strides: tuple: The strides of the array in bytes
+        :param seq: int: The sequence number of the message
+        :param timestamp: float: The time the message was published in seconds since the epoch
+        :param codec: str: The codec used for compressing the buffer. Default is 'raw'
+        :return: bytes: The packed header
+        """
+        ndim = len(shape)
+        if ndim > ZEROMQ_ARRAY_MAX_DIMS:
+            raise ValueError(f"Arrays with more than {ZEROMQ_ARRAY_MAX_DIMS} dimensions are not supported")
+        padding = (0,) * (ZEROMQ_ARRAY_MAX_DIMS - ndim)
+        return ZEROMQ_ARRAY_HEADER.pack(ZEROMQ_ARRAY_HEADER_MAGIC, ZEROMQ_ARRAY_HEADER_VERSION,
+                                        ImageCodecs.registry[codec].codec_id, np.dtype(arr_dtype).str.encode(), ndim,
+                                        seq, timestamp, *shape, *padding, *strides, *padding)
+
+    @staticmethod
+    def unpack(header: bytes):
+        """
+        Unpack the array description from a header.
+
+        :param header: bytes: The packed header
+        :return: dict: The 'dtype', 'shape', 'strides', 'seq', 'timestamp' and 'codec' of the array or None if the
+                 header was not packed by ``ZeroMQArrayHeader.pack`` (e.g. sent by earlier Wrapyfi versions)
+        """
+        if len(header) != ZEROMQ_ARRAY_HEADER.size or bytes(header[:4]) != ZEROMQ_ARRAY_HEADER_MAGIC:
+            return None
+        magic, version, codec, arr_dtype, ndim, seq, timestamp, *dims = ZEROMQ_ARRAY_HEADER.unpack(header)
+        if codec not in ImageCodecs.ids:
+            raise ValueError(f"Unsupported image codec ID {codec}")
+        return {"dtype": np.dtype(arr_dtype.rstrip(b"\x00").decode()),
+                "shape": tuple(dims[:ndim]),
+                "strides": tuple(dims[ZEROMQ_ARRAY_MAX_DIMS:ZEROMQ_ARRAY_MAX_DIMS + ndim]),
+                "seq": seq, "timestamp": timestamp, "codec": ImageCodecs.ids[codec].name}
+
+
+def zeromq_recv_into(socket: zmq.Socket, out_buffer: np.ndarray):
+    """
+    Receive a message frame directly into a preallocated array. Frames are received without an intermediate copy on
+    pyzmq >= 26.4, and copied from the received frame into the array on earlier versions.
+
+    :param socket: zmq.Socket: The socket to receive the frame from
+    :param out_buffer: np.ndarray: The array to receive the frame into
+    :return: np.ndarray: The output buffer
+    :raises: ValueError: If the size of the received frame differs from the size of the output buffer
+    """
+    if ZEROMQ_HAVE_RECV_INTO:
+        # the size of the frame is returned, even if it was truncated to fit the output buffer
+        nbytes = socket.recv_into(out_buffer)
+    else:
+        frame = socket.recv(copy=False)
+        nbytes = frame.buffer.nbytes
+        if nbytes == out_buffer.nbytes:
+            np.copyto(out_buffer, np.ndarray(out_buffer.shape, dtype=out_buffer.dtype, buffer=frame.buffer))
+    if nbytes != out_buffer.nbytes:
+        raise ValueError(f"Received a frame of {nbytes} bytes into an output buffer of {out_buffer.nbytes} bytes")
+    return out_buffer
+
 
 class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
     """
@@ -26,24 +232,24 @@ class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
     class ZeroMQSharedMonitorData:
         """
         Shared data class for the ZeroMQ PUB/SUB monitor. This class is used to share data between the main process and
-        the monitor listener process/thread.
+        the monitor listener process/thread. Changes to the connections are signalled through a condition variable,
+        allowing publishers and listeners to wait for a connection instead of polling.
         """
         def __init__(self, use_multiprocessing: bool = False):
             """
-            Initialize the shared data class.
+            Initialize the shared data class. The topics and connections are stored in topic tables, which are read
+            without locking, whereas writers are serialized using a condition variable which also signals changes to
+            the connections.
 
             :param use_multiprocessing: bool: Whether to use multiprocessing or threading
             """
             self.use_multiprocessing = use_multiprocessing
+            self.shared_topics = ZeroMQTopicTable(use_multiprocessing=use_multiprocessing)
+            self.shared_connections = ZeroMQTopicTable(use_multiprocessing=use_multiprocessing)
             if use_multiprocessing:
-                manager = multiprocessing.Manager()
-                self.shared_topics = manager.list()
-                self.shared_connections = manager.dict()
-                self.lock = manager.Lock()
+                self.lock = multiprocessing.Condition()
             else:
-                self.shared_topics = []
-                self.shared_connections = {}
-                self.lock = threading.Lock()
+                self.lock = threading.Condition()
 
         def add_topic(self, topic: str):
             """
@@ -52,7 +258,7 @@ class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
             :param topic: str: The topic to add
             """
             with self.lock:
-                self.shared_topics.append(topic)
+                self.shared_topics.set(topic, self.shared_topics.get(topic) + 1)
 
         def remove_topic(self, topic: str):
             """
@@ -61,8 +267,9 @@ class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
             :param topic: str: The topic to remove
             """
             with self.lock:
-                if topic in self.shared_topics:
-                    self.shared_topics.remove(topic)
+                count = self.shared_topics.get(topic)
+                if count:
+                    self.shared_topics.set(topic, count - 1)
 
         def get_topics(self):
             """
@@ -70,18 +277,18 @@ class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
 
             :return: list: The list of topics
             """
-            with self.lock:
-                return list(self.shared_topics)
+            return list(self.shared_topics.items().keys())
 
         def update_connection(self, topic: str, data: dict):
             """
             Update the connection data for a topic, e.g. the number of subscribers.
 
             :param topic: str: The topic to update
-            :param data: dict: The connection data
+            :param data: dict: The connection data mapping the topic to its number of subscribers
             """
             with self.lock:
-                self.shared_connections[topic] = data
+                if self.shared_connections.set(topic, data.get(topic, 0)):
+                    self.lock.notify_all()
 
         def remove_connection(self, topic: str):
             """
@@ -90,8 +297,8 @@ class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
             :param topic: str: The topic to remove
             """
             with self.lock:
-                if topic in list(self.shared_connections.keys()):
-                    del self.shared_connections[topic]
+                if self.shared_connections.set(topic, 0):
+                    self.lock.notify_all()
 
         def get_connections(self):
             """
@@ -99,20 +306,36 @@ class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
 
             :return: dict: The connection data for all topics
             """
-            with self.lock:
-                return dict(self.shared_connections)
+            return {topic: {topic: count} for topic, count in self.shared_connections.items().items()}
+
+        def get_generation(self):
+            """
+            Get the generation of the connection data, which is incremented on every change.
+
+            :return: int: The generation of the connection data
+            """
+            return self.shared_connections.generation
 
         def is_connected(self, topic: str):
             """
-            Check whether a topic is connected.
+            Check whether a topic is connected. This reads the shared memory directly without locking.
 
             :param topic: str: The topic to check
             """
+            return self.shared_connections.get(topic) > 0
+
+        def wait_for_connection(self, topic: str, timeout: Optional[float] = None):
+            """
+            Block until a topic is connected, i.e. has at least one subscriber, or the timeout expires.
+
+            :param topic: str: The topic to wait for
+            :param timeout: float: Maximum time to wait in seconds. None to wait indefinitely. Default is None
+            :return: bool: True if the topic is connected, False if the timeout expired
+            """
+            if self.is_connected(topic):
+                return True
             with self.lock:
-                if topic in list(self.shared_connections.keys()):
-                    return True
-                else:
-                    return False
+                return self.lock.wait_for(lambda: self.is_connected(topic), timeout)
 
     @staticmethod
     def activate(**kwargs):
@@ -189,74 +412,120 @@ class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
     @staticmethod
     def proxy_thread(socket_pub_address: str = "tcp://127.0.0.1:5555",
                      socket_sub_address: str = "tcp://127.0.0.1:5556",
-                     inproc_address: str = "inproc://monitor"):
+                     inproc_address: str = "inproc://monitor",
+                     monitor_ready: Optional[threading.Event] = None):
         """
         Proxy thread for the ZeroMQ PUB/SUB proxy.
 
         :param socket_pub_address: str: The address of the PUB socket
         :param socket_sub_address: str: The address of the SUB socket
         :param inproc_address: str: The address of the inproc socket (connections within the same process, for exchanging subscription data between the proxy and the monitor)
+        :param monitor_ready: threading.Event: Set by the subscription monitor once it is subscribed to the inproc socket. The proxy waits for it before accepting connections, so no subscription messages are missed
         """
         context = zmq.Context.instance()
+        monitor = context.socket(zmq.PUB)
+        monitor.bind(inproc_address)
+        if monitor_ready is not None:
+            monitor_ready.wait()
+
         xpub = context.socket(zmq.XPUB)
         xsub = context.socket(zmq.XSUB)
         xpub.setsockopt(zmq.XPUB_VERBOSE, 1)
+        # pass all unsubscription messages as well (libzmq>=4.2), allowing the monitor to track subscriber counts
+        if hasattr(zmq, "XPUB_VERBOSER"):
+            xpub.setsockopt(zmq.XPUB_VERBOSER, 1)
 
         xpub.bind(socket_pub_address)
         xsub.bind(socket_sub_address)
 
-        monitor = context.socket(zmq.PUB)
-        monitor.bind(inproc_address)
-
         zmq.proxy(xpub, xsub, monitor)
 
     @staticmethod
     def subscription_monitor_thread(inproc_address: str = "inproc://monitor", socket_sub_address: str = "tcp://127.0.0.1:5556",
-                                    pubsub_monitor_topic: str = "ZEROMQ/CONNECTIONS", verbose: bool = False):
+                                    pubsub_monitor_topic: str = "ZEROMQ/CONNECTIONS", verbose: bool = False,
+                                    monitor_ready: Optional[threading.Event] = None):
         """
-        Subscription monitor thread for the ZeroMQ PUB/SUB proxy.
+        Subscription monitor thread for the ZeroMQ PUB/SUB proxy. Waits for (un)subscription messages captured by the
+        proxy, processes all pending messages at once, and publishes the number of subscribers per topic on the monitor
+        topic whenever the counts change or a new monitor listener subscribes.
 
         :param inproc_address: str: The address of the inproc socket (connections within the same process, for exchanging subscription data between the proxy and the monitor)
         :param socket_sub_address: str: The address of the SUB socket
         :param pubsub_monitor_topic: str: The topic to use for publishing subscription data
         :param verbose: bool: Whether to print debug messages
+        :param monitor_ready: threading.Event: Set once subscribed to the inproc socket, allowing the proxy to start
         """
         context = zmq.Context.instance()
         subscriber = context.socket(zmq.SUB)
         subscriber.connect(inproc_address)
         subscriber.setsockopt_string(zmq.SUBSCRIBE, "")
-
-        # pub socket to publish subscriber counts.
-        publisher = context.socket(zmq.PUB)
+        if monitor_ready is not None:
+            monitor_ready.set()
+
+        # xpub socket to publish subscriber counts. Unlike a plain PUB socket, it receives the monitor topic
+        # subscriptions forwarded by the proxy, so the counts are only republished once the socket is able to deliver
+        # them to the new monitor listener
+        publisher = context.socket(zmq.XPUB)
+        publisher.setsockopt(zmq.XPUB_VERBOSE, 1)
         publisher.connect(socket_sub_address)
 
+        poller = zmq.Poller()
+        poller.register(subscriber, zmq.POLLIN)
+        poller.register(publisher, zmq.POLLIN)
+        monitor_subscription = b"\x01" + pubsub_monitor_topic.encode()
+
         topic_subscriber_count = defaultdict(int)
+        track_unsubscriptions = hasattr(zmq, "XPUB_VERBOSER")
 
         while True:
-            time.sleep(1)
             try:
-                message = subscriber.recv()
-                if verbose:
-                    logging.info(f"[ZeroMQ BROKER] Raw message: {message}")
-
-                # ensure the message is a subscription/unsubscription message
-                if len(message) > 1 and (message[0] == 1 or message[0] == 0):
-                    event = message[0]
-                    topic = message[1:].decode('utf-8')
-
+                # block until a message arrives, then drain all pending messages before publishing the counts
+                events = dict(poller.poll())
+                publish_counts = False
+                if publisher in events:
+                    while True:
+                        try:
+                            message = publisher.recv(zmq.NOBLOCK)
+                        except zmq.Again:
+                            break
+                        # republish the counts to newly connected monitor listeners
+                        publish_counts = publish_counts or message == monitor_subscription
+                while subscriber in events:
+                    try:
+                        message = subscriber.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
                     if verbose:
-                        logging.info(f"[ZeroMQ BROKER] Received event: {event}, topic: {topic}")
+                        logging.info(f"[ZeroMQ BROKER] Raw message: {message}")
 
-                    # avoid processing messages on the monitor topic.
-                    if topic == pubsub_monitor_topic:
+                    # ensure the message is a subscription/unsubscription message. Published messages are always
+                    # multipart and their frames (e.g. raw buffers) could otherwise be mistaken for subscription messages
+                    if len(message) != 1:
                         continue
-
-                    # update the count of subscribers for the topic
-                    if event == 1:  # subscribe
-                        topic_subscriber_count[topic] += 1
-                    elif event == 0:  # unsubscribe
-                        topic_subscriber_count[topic] = 0
-
+                    message = message[0]
+                    if len(message) > 1 and (message[0] == 1 or message[0] == 0):
+                        event = message[0]
+                        topic = message[1:].decode('utf-8')
+
+                        if verbose:
+                            logging.info(f"[ZeroMQ BROKER] Received event: {event}, topic: {topic}")
+
+                        # avoid processing messages on the monitor topic, which are received by the publisher socket
+                        if topic == pubsub_monitor_topic:
+                            continue
+
+                        # update the count of subscribers for the topic
+                        if event == 1:  # subscribe
+                            topic_subscriber_count[topic] += 1
+                        elif event == 0:  # unsubscribe
+                            if track_unsubscriptions:
+                                topic_subscriber_count[topic] = max(0, topic_subscriber_count[topic] - 1)
+                            else:
+                                # only the last unsubscription is passed without XPUB_VERBOSER
+                                topic_subscriber_count[topic] = 0
+                        publish_counts = True
+
+                if publish_counts:
                     if verbose:
                         logging.info(f"[ZeroMQ BROKER] Current topic subscriber count: {dict(topic_subscriber_count)}")
 
@@ -279,17 +548,20 @@ class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
         :param kwargs: dict: Keyword arguments to be passed to the ZeroMQ initialization function
         """
         inproc_address = "inproc://monitor"
+        monitor_ready = threading.Event()
 
         threading.Thread(target=self.proxy_thread,
                          kwargs={"socket_pub_address": socket_pub_address,
                                  "socket_sub_address": socket_sub_address,
-                                 "inproc_address": inproc_address}).start(),
+                                 "inproc_address": inproc_address,
+                                 "monitor_ready": monitor_ready}).start(),
 
         threading.Thread(target=self.subscription_monitor_thread,
                          kwargs={"socket_sub_address": socket_sub_address,
                                  "inproc_address": inproc_address,
                                  "pubsub_monitor_topic": pubsub_monitor_topic,
-                                 "verbose": kwargs.get("verbose", False)}).start()
+                                 "verbose": kwargs.get("verbose", False),
+                                 "monitor_ready": monitor_ready}).start()
 
     def __init_monitor_listener(self, socket_pub_address: str = "tcp://127.0.0.1:5555", 
                                 pubsub_monitor_topic: str = "ZEROMQ/CONNECTIONS",
@@ -311,17 +583,22 @@ class ZeroMQMiddlewarePubSub(metaclass=SingletonOptimized):
             while True:
                 _, message = subscriber.recv_multipart()
                 data = json.loads(message.decode('utf-8'))
-                topic = list(data.keys())[0]
                 if verbose:
-                    logging.info(f"[ZeroMQ] Topic: {topic}, Data: {data}")
-
-                if topic in self.shared_monitor_data.get_topics():
-                    self.shared_monitor_data.update_connection(topic, data)
-                    if data[topic] == 0:
-                        logging.info(f"[ZeroMQ] Subscriber disconnected from topic: {topic}")
-                        self.shared_monitor_data.remove_connection(topic)
-                    else:
-                        logging.info(f"[ZeroMQ] Subscriber connected to topic: {topic}")
+                    logging.info(f"[ZeroMQ] Data: {data}")
+
+                # track all topics, since the counts may arrive before the topic is monitored by the main process
+                monitored_topics = self.shared_monitor_data.get_topics()
+                connections = self.shared_monitor_data.get_connections()
+                for topic, count in data.items():
+                    if count == 0:
+                        if topic in connections:
+                            self.shared_monitor_data.remove_connection(topic)
+                            if topic in monitored_topics:
+                                logging.info(f"[ZeroMQ] Subscriber disconnected from topic: {topic}")
+                    elif connections.get(topic, None) != {topic: count}:
+                        self.shared_monitor_data.update_connection(topic, {topic: count})
+                        if topic in monitored_topics:
+                            logging.info(f"[ZeroMQ] Subscriber connected to topic: {topic}")
 
                 if verbose:
                     for monitored_topic in self.shared_monitor_data.get_topics():
@@ -397,12 +674,15 @@ class ZeroMQMiddlewareReqRep(metaclass=SingletonOptimized):
             pass
 
     @staticmethod
-    def __init_device(socket_rep_address: str = "tcp://127.0.0.1:5559", socket_req_address: str = "tcp://127.0.0.1:5560", **kwargs):
+    def __init_device(socket_rep_address: str = "tcp://127.0.0.1:5559", socket_req_address: str = "tcp://127.0.0.1:5560",
+                      proxy_broker_lru: bool = False, **kwargs):
         """
         Initialize the ZeroMQ REQ/REP device broker.
 
         :param socket_rep_address: str: The address of the REP socket
         :param socket_req_address: str: The address of the REQ socket
+        :param proxy_broker_lru: bool: Whether to forward each request to the least recently used worker which is
+                                 ready, instead of distributing the requests among the servers in turn. Default is False
         """
         xrep = zmq.Context.instance().socket(zmq.XREP)
         try:
@@ -410,14 +690,50 @@ class ZeroMQMiddlewareReqRep(metaclass=SingletonOptimized):
         except zmq.ZMQError as e:
             logging.error(f"[ZeroMQ] {e} {socket_rep_address}")
             return
-        xreq = zmq.Context.instance().socket(zmq.XREQ)
+        xreq = zmq.Context.instance().socket(zmq.XREP if proxy_broker_lru else zmq.XREQ)
         try:
             xreq.bind(socket_req_address)
         except zmq.ZMQError as e:
             logging.error(f"[ZeroMQ] {e} {socket_req_address}")
             return
         # logging.info(f"[ZeroMQ] Intialising REQ/REP device broker")
-        zmq.proxy(xrep, xreq)
+        if proxy_broker_lru:
+            ZeroMQMiddlewareReqRep.__route_lru(xrep, xreq)
+        else:
+            zmq.proxy(xrep, xreq)
+
+    @staticmethod
+    def __route_lru(frontend: zmq.Socket, backend: zmq.Socket):
+        """
+        Route the requests of the clients to the least recently used workers. The workers connect REQ sockets to the
+        backend, announcing that they are ready with a single frame, after which every reply announces that the
+        worker is ready for the next request. The requests are only received from the clients while a worker is ready,
+        so that pending requests are queued by the clients instead of the workers.
+
+        :param frontend: zmq.Socket: The ROUTER socket receiving the requests of the clients
+        :param backend: zmq.Socket: The ROUTER socket forwarding the requests to the workers
+        """
+        workers = deque()
+        poller = zmq.Poller()
+        poller.register(backend, zmq.POLLIN)
+        try:
+            while True:
+                events = dict(poller.poll())
+                if backend in events:
+                    # the worker address and empty delimiter are followed by the ready frame or the reply envelope
+                    frames = backend.recv_multipart(copy=False)
+                    if not workers:
+                        poller.register(frontend, zmq.POLLIN)
+                    workers.append(frames[0])
+                    if len(frames) > 3 or frames[2].bytes != ZEROMQ_WORKER_READY:
+                        frontend.send_multipart(frames[2:], copy=False)
+                if frontend in events:
+                    frames = frontend.recv_multipart(copy=False)
+                    backend.send_multipart([workers.popleft(), b"", *frames], copy=False)
+                    if not workers:
+                        poller.unregister(frontend)
+        except zmq.ContextTerminated:
+            pass
 
     @staticmethod
     def deinit():
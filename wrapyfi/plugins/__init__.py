@@ -0,0 +1,37 @@
+"""
+Builtin encoding and decoding plugins of Wrapyfi.
+
+The plugin modules are not imported when Wrapyfi is imported, since they import heavy frameworks (e.g. PyTorch or
+TensorFlow). Instead, ``PLUGIN_MANIFEST`` declares the types encoded and the ``__wrapyfi__`` tags decoded by the plugins
+of each module, and the ``PluginRegistrar`` imports a module when an object of a declared type is first encoded or a
+declared tag is first decoded. The type names are formatted as '<module path>.<qualname>', where the module path may be
+shortened to the top-level package to match the types of a package regardless of the module defining them. New plugin
+modules must be added to the manifest, otherwise they are imported when Wrapyfi is imported.
+"""
+
+PLUGIN_MANIFEST = {
+    "dask_data": {"types": ("dask.DataFrame", "dask.Series", "dask.Array", "dask_expr.DataFrame", "dask_expr.Series"),
+                  "tags": ("DaskData",)},
+    "jax_tensor": {"types": ("jax.Array", "jax.DeviceArray", "jaxlib.DeviceArray"),
+                   "tags": ("JAXTensor",)},
+    "mxnet_tensor": {"types": ("mxnet.NDArray",),
+                     "tags": ("MXNetTensor",)},
+    "paddle_tensor": {"types": ("paddle.Tensor",),
+                      "tags": ("PaddleTensor",)},
+    "pandas_data": {"types": ("pandas.DataFrame", "pandas.Series"),
+                    "tags": ("PandasData",)},
+    "pillow_image": {"types": ("PIL.Image",),
+                     "tags": ("PILImage",)},
+    "pint_quantities": {"types": ("pint.Quantity", "pint.PlainQuantity"),
+                        "tags": ("PintData",)},
+    "pyarrow_array": {"types": ("pyarrow.StructArray",),
+                      "tags": ("PyArrowArray",)},
+    "pytorch_tensor": {"types": ("torch.Tensor",),
+                       "tags": ("PytorchTensor",)},
+    "tensorflow_tensor": {"types": ("tensorflow.Tensor",),
+                          "tags": ("TensorflowTensor",)},
+    "xarray_data": {"types": ("xarray.DataArray", "xarray.Dataset"),
+                    "tags": ("XArrayData",)},
+    "zarr_array": {"types": ("zarr.Array", "zarr.Group"),
+                   "tags": ("ZarrData",)},
+}
@@ -78,3 +78,39 @@ class PILImage(Plugin):
                 memfile.seek(0)
                 return True, Image.open(memfile).copy()
 
+    def encode_binary(self, obj, *args, **kwargs):
+        """
+        Encode PIL Image data into bytes for binary serializers.
+
+        :param obj: Image.Image: The PIL Image data to encode
+        :param args: tuple: Additional arguments (not used)
+        :param kwargs: dict: Additional keyword arguments (not used)
+        :return: Tuple[bool, dict]: A tuple containing:
+            - bool: Always True, indicating that the encoding was successful
+            - dict: A dictionary containing:
+                - '__wrapyfi__': A tuple containing the class name and encoded bytes, with optional image size and mode for raw data
+        """
+        if obj.format is None:
+            return True, dict(__wrapyfi__=(str(self.__class__.__name__), obj.tobytes(), obj.size, obj.mode))
+        else:
+            with io.BytesIO() as memfile:
+                obj.save(memfile, format=obj.format)
+                return True, dict(__wrapyfi__=(str(self.__class__.__name__), memfile.getvalue()))
+
+    def decode_binary(self, obj_type, obj_full, *args, **kwargs):
+        """
+        Decode bytes back into PIL Image data.
+
+        :param obj_type: type: The expected type of the decoded object (not used)
+        :param obj_full: tuple: A tuple containing the encoded bytes and optionally image size and mode for raw data
+        :param args: tuple: Additional arguments (not used)
+        :param kwargs: dict: Additional keyword arguments (not used)
+        :return: Tuple[bool, Image.Image]: A tuple containing:
+            - bool: Always True, indicating that the decoding was successful
+            - Image.Image: The decoded PIL Image data
+        """
+        if len(obj_full) == 4:
+            return True, Image.frombytes(obj_full[3], tuple(obj_full[2]), obj_full[1], "raw")
+        else:
+            with io.BytesIO(obj_full[1]) as memfile:
+                return True, Image.open(memfile).copy()
@@ -2,7 +2,9 @@
 Encoder and Decoder for PyTorch Tensor Data via Wrapyfi.
 
 This script provides mechanisms to encode and decode PyTorch tensor data using Wrapyfi.
-It utilizes base64 encoding to convert binary data into ASCII strings.
+It utilizes base64 encoding to convert binary data into ASCII strings. When a binary serializer is selected, or the
+raw buffers are transmitted separately (e.g., ZeroMQ publishers with ``raw_buffers=True``), the dtype, shape, and
+strides of the tensor are transmitted along with its raw memory instead, which is decoded without copying.
 
 The script contains a class, `PytorchTensor`, registered as a plugin to manage the
 conversion of PyTorch tensor data (if available) between its original and encoded forms.
@@ -31,6 +33,8 @@ except ImportError:
 
 @PluginRegistrar.register(types=None if not HAVE_TORCH else torch.Tensor.__mro__[:-1])
 class PytorchTensor(Plugin):
+    raw_buffers = True
+
     def __init__(self, load_torch_device=None, map_torch_devices=None, **kwargs):
         """
         Initialize the PytorchTensor plugin.
@@ -72,6 +76,9 @@ class PytorchTensor(Plugin):
             - bool: Always True, indicating that the decoding was successful
             - torch.Tensor: The decoded PyTorch tensor data
         """
+        if len(obj_full) != 3:
+            # raw memory transmitted in a separate buffer by encode_binary
+            return self.decode_binary(obj_type, obj_full, *args, **kwargs)
         with io.BytesIO(base64.b64decode(obj_full[1].encode('ascii'))) as memfile:
             obj_device = self.map_torch_devices.get(obj_full[2], self.map_torch_devices.get('default', None))
             if obj_device is not None:
@@ -79,3 +86,77 @@ class PytorchTensor(Plugin):
             else:
                 return True, torch.load(memfile)
 
+    def encode_binary(self, obj, *args, **kwargs):
+        """
+        Encode PyTorch tensor data into its dtype, shape, strides, and raw memory for binary serializers and raw buffers.
+        The memory of CPU tensors is not copied if the tensor is dense (contiguous or a permutation of a contiguous
+        tensor, e.g., transposed). Sparse and quantized tensors are encoded using ``encode``.
+
+        :param obj: torch.Tensor: The PyTorch tensor data to encode
+        :param args: tuple: Additional arguments (not used)
+        :param kwargs: dict: Additional keyword arguments (not used)
+        :return: Tuple[bool, dict]: A tuple containing:
+            - bool: Always True, indicating that the encoding was successful
+            - dict: A dictionary containing:
+                - '__wrapyfi__': A tuple containing the class name, dtype string, shape, strides, device string,
+                  whether the tensor requires gradients, and the raw memory as a flat uint8 numpy array
+        """
+        if obj.layout != torch.strided or obj.is_quantized:
+            return self.encode(obj, *args, **kwargs)
+        tensor = obj.detach().resolve_conj().resolve_neg()
+        if tensor.device.type != "cpu":
+            tensor = tensor.cpu()
+        if not self._is_dense(tensor):
+            tensor = tensor.contiguous()
+        obj_data = torch.as_strided(tensor, (tensor.numel(),), (1,), tensor.storage_offset())
+        obj_data = obj_data.view(torch.uint8).numpy()
+        return True, dict(__wrapyfi__=(str(self.__class__.__name__), str(tensor.dtype), list(tensor.shape),
+                                       list(tensor.stride()), str(obj.device), obj.requires_grad, obj_data))
+
+    def decode_binary(self, obj_type, obj_full, *args, **kwargs):
+        """
+        Decode the dtype, shape, strides, and raw memory back into PyTorch tensor data. CPU tensors share the memory
+        of the received buffer without copying, and must be cloned before being modified if the buffer is read-only.
+
+        :param obj_type: type: The expected type of the decoded object (not used)
+        :param obj_full: tuple: A tuple containing the dtype string, shape, strides, device string, whether the tensor
+                         requires gradients, and the raw memory (or the encoded data string and device string if
+                         encoded using ``encode``)
+        :param args: tuple: Additional arguments (not used)
+        :param kwargs: dict: Additional keyword arguments (not used)
+        :return: Tuple[bool, torch.Tensor]: A tuple containing:
+            - bool: Always True, indicating that the decoding was successful
+            - torch.Tensor: The decoded PyTorch tensor data
+        """
+        if len(obj_full) == 3:
+            return self.decode(obj_type, obj_full, *args, **kwargs)
+        _, obj_dtype, obj_shape, obj_stride, obj_device, obj_requires_grad, obj_data = obj_full
+        obj_dtype = getattr(torch, obj_dtype.rpartition(".")[2])
+        if memoryview(obj_data).nbytes == 0:
+            obj = torch.empty(obj_shape, dtype=obj_dtype)
+        else:
+            obj = torch.frombuffer(obj_data, dtype=obj_dtype).as_strided(obj_shape, obj_stride)
+        obj_device = self.map_torch_devices.get(obj_device, self.map_torch_devices.get('default', obj_device))
+        obj = obj.to(obj_device)
+        if obj_requires_grad:
+            obj.requires_grad_(True)
+        return True, obj
+
+    @staticmethod
+    def _is_dense(tensor):
+        """
+        Check whether the elements of a tensor occupy a contiguous block of memory, in any dimension order.
+
+        :param tensor: torch.Tensor: The tensor to check
+        :return: bool: True if the tensor is dense, False otherwise
+        """
+        if tensor.is_contiguous():
+            return True
+        expected_stride = 1
+        for size, stride in sorted(zip(tensor.shape, tensor.stride()), key=lambda dim: dim[1]):
+            if size == 1:
+                continue
+            if stride != expected_stride:
+                return False
+            expected_stride *= size
+        return True
@@ -1,6 +1,5 @@
 import logging
 import sys
-import json
 import time
 import os
 import base64
@@ -9,14 +8,13 @@ import importlib.util
 from typing import Optional, Tuple
 
 import numpy as np
-import cv2
 import rospy
 import std_msgs.msg
 import sensor_msgs.msg
 
 from wrapyfi.connect.publishers import Publisher, Publishers, PublisherWatchDog
 from wrapyfi.middlewares.ros import ROSMiddleware
-from wrapyfi.encoders import JsonEncoder
+from wrapyfi.encoders import JsonEncoder, ImageCodecs
 
 
 QUEUE_SIZE = int(os.environ.get("WRAPYFI_ROS_QUEUE_SIZE", 5))
@@ -102,9 +100,9 @@ class ROSNativeObjectPublisher(ROSPublisher):
         :param serializer_kwargs: dict: Additional kwargs for the serializer
         """
         super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, queue_size=queue_size, **kwargs)
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
 
         self._publisher = None
 
@@ -134,8 +132,7 @@ class ROSNativeObjectPublisher(ROSPublisher):
                 return
             else:
                 time.sleep(0.2)
-        obj_str = json.dumps(obj, cls=self._plugin_encoder, **self._plugin_kwargs,
-                             serializer_kwrags=self._serializer_kwargs)
+        obj_str = self._plugin_encoder.encode(obj)
         self._publisher.publish(obj_str)
 
 
@@ -143,7 +140,8 @@ class ROSNativeObjectPublisher(ROSPublisher):
 class ROSImagePublisher(ROSPublisher):
 
     def __init__(self, name: str, out_topic: str, carrier: str = "tcp",  should_wait: bool = True, queue_size: int = QUEUE_SIZE,
-                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False, **kwargs):
+                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, codec_kwargs: Optional[dict] = None, **kwargs):
         """
         The ImagePublisher using the ROS Image message assuming a numpy array as input.
 
@@ -157,13 +155,17 @@ class ROSImagePublisher(ROSPublisher):
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
         :param jpg: bool: True if the image should be compressed as JPG. Default is False
+        :param codec: str: The self-describing image codec (e.g. 'png', 'webp', 'qoi') compressing the images. Default is
+                      None (use 'jpg' if ``jpg`` is True else transmit uncompressed images)
+        :param codec_kwargs: dict: Additional kwargs for the image codec (e.g. ``{"quality": 80}``)
         """
         super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, queue_size=queue_size, **kwargs)
         self.width = width
         self.height = height
         self.rgb = rgb
         self.fp = fp
-        self.jpg = jpg
+        self._codec = ImageCodecs.resolve(jpg=jpg, codec=codec, codec_kwargs=codec_kwargs, self_describing=True)
+        self.jpg = self._codec is not None
 
         if self.fp:
             self._encoding = '32FC3' if self.rgb else '32FC1'
@@ -218,8 +220,8 @@ class ROSImagePublisher(ROSPublisher):
         if self.jpg:
             img_msg = sensor_msgs.msg.CompressedImage()
             img_msg.header.stamp = rospy.Time.now()
-            img_msg.format = "jpeg"
-            img_msg.data = np.array(cv2.imencode('.jpg', img)[1]).tobytes()
+            img_msg.format = "jpeg" if self._codec.name == "jpg" else self._codec.name
+            img_msg.data = np.frombuffer(self._codec.encode(img), np.uint8).tobytes()
         else:
             img_msg = sensor_msgs.msg.Image()
             img_msg.header.stamp = rospy.Time.now()
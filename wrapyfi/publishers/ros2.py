@@ -1,13 +1,11 @@
 import logging
 import sys
-import json
 import time
 import os
 import importlib
 from typing import Optional, Tuple
 
 import numpy as np
-import cv2
 import rclpy
 from rclpy.node import Node
 import std_msgs.msg
@@ -15,7 +13,7 @@ import sensor_msgs.msg
 
 from wrapyfi.connect.publishers import Publisher, Publishers, PublisherWatchDog
 from wrapyfi.middlewares.ros2 import ROS2Middleware
-from wrapyfi.encoders import JsonEncoder
+from wrapyfi.encoders import JsonEncoder, ImageCodecs
 
 
 QUEUE_SIZE = int(os.environ.get("WRAPYFI_ROS2_QUEUE_SIZE", 5))
@@ -102,9 +100,9 @@ class ROS2NativeObjectPublisher(ROS2Publisher):
         :param serializer_kwargs: dict: Additional kwargs for the serializer
         """
         super().__init__(name, out_topic, should_wait=should_wait, queue_size=queue_size, **kwargs)
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
 
         self._publisher = None
 
@@ -134,8 +132,7 @@ class ROS2NativeObjectPublisher(ROS2Publisher):
                 return
             else:
                 time.sleep(0.2)
-        obj_str = json.dumps(obj, cls=self._plugin_encoder, **self._plugin_kwargs,
-                             serializer_kwrags=self._serializer_kwargs)
+        obj_str = self._plugin_encoder.encode(obj)
         obj_str_msg = std_msgs.msg.String()
         obj_str_msg.data = obj_str
         self._publisher.publish(obj_str_msg)
@@ -145,7 +142,8 @@ class ROS2NativeObjectPublisher(ROS2Publisher):
 class ROS2ImagePublisher(ROS2Publisher):
 
     def __init__(self, name: str, out_topic: str, should_wait: bool = True, queue_size: int = QUEUE_SIZE,
-                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False, **kwargs):
+                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, codec_kwargs: Optional[dict] = None, **kwargs):
         """
         The ImagePublisher using the ROS 2 Image message assuming a numpy array as input.
 
@@ -158,13 +156,17 @@ class ROS2ImagePublisher(ROS2Publisher):
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
         :param jpg: bool: True if the image should be compressed as JPG. Default is False
+        :param codec: str: The self-describing image codec (e.g. 'png', 'webp', 'qoi') compressing the images. Default is
+                      None (use 'jpg' if ``jpg`` is True else transmit uncompressed images)
+        :param codec_kwargs: dict: Additional kwargs for the image codec (e.g. ``{"quality": 80}``)
         """
         super().__init__(name, out_topic, should_wait=should_wait, queue_size=queue_size, **kwargs)
         self.width = width
         self.height = height
         self.rgb = rgb
         self.fp = fp
-        self.jpg = jpg
+        self._codec = ImageCodecs.resolve(jpg=jpg, codec=codec, codec_kwargs=codec_kwargs, self_describing=True)
+        self.jpg = self._codec is not None
 
         if self.fp:
             self._encoding = '32FC3' if self.rgb else '32FC1'
@@ -219,8 +221,8 @@ class ROS2ImagePublisher(ROS2Publisher):
         if self.jpg:
             img_msg = sensor_msgs.msg.CompressedImage()
             img_msg.header.stamp = rclpy.clock.Clock().now().to_msg()
-            img_msg.format = "jpeg"
-            img_msg.data = np.array(cv2.imencode('.jpg', img)[1]).tobytes()
+            img_msg.format = "jpeg" if self._codec.name == "jpg" else self._codec.name
+            img_msg.data = np.frombuffer(self._codec.encode(img), np.uint8).tobytes()
         else:
             img_msg = sensor_msgs.msg.Image()
             img_msg.header.stamp = self.get_clock().now().to_msg()
@@ -0,0 +1,299 @@
+import logging
+import time
+import os
+import secrets
+from typing import Optional, Tuple
+
+import numpy as np
+import zmq
+
+from wrapyfi.connect.publishers import Publisher, Publishers, PublisherWatchDog
+from wrapyfi.middlewares.shm import ShmMiddleware, ShmRingBuffer, SHM_NOTIFY_HEADER, SHM_BUFFER_ENTRY
+from wrapyfi.encoders import JsonEncoder, ImageCodecs
+
+
+SHM_SLOT_COUNT = int(os.environ.get("WRAPYFI_SHM_SLOT_COUNT", 8))
+SHM_IPC_DIR = os.environ.get("WRAPYFI_SHM_IPC_DIR", None)
+WATCHDOG_POLL_REPEAT = None
+
+
+class ShmPublisher(Publisher):
+    def __init__(self, name: str, out_topic: str, carrier: str = "ipc", should_wait: bool = True,
+                 slot_count: int = SHM_SLOT_COUNT, slot_size: int = 0, ipc_dir: Optional[str] = SHM_IPC_DIR,
+                 serializer_kwargs: Optional[dict] = None, **kwargs):
+        """
+        Initialize the publisher. The data is written into a shared memory ring buffer owned by the publisher, and the
+        listeners are notified over a ZeroMQ ``ipc://`` endpoint. Only a single publisher can be bound to a topic.
+
+        :param name: str: Name of the publisher
+        :param out_topic: str: Name of the output topic preceded by '/' (e.g. '/topic')
+        :param carrier: str: Carrier protocol. The shared memory middleware only supports 'ipc' and ignores any other carrier. Default is 'ipc'
+        :param should_wait: bool: Whether to wait for at least one listener before unblocking the script. Default is True
+        :param slot_count: int: Number of slots in the ring buffer. A received message remains valid until the publisher
+                            transmits ``slot_count - 1`` further messages. Default is 8
+        :param slot_size: int: Minimum size of each slot in bytes. The slots grow automatically to fit larger messages. Default is 0
+        :param ipc_dir: str: Directory in which the ``ipc://`` notification endpoints are created. Default is the temporary directory
+        :param serializer_kwargs: dict: Additional kwargs for the serializer
+        :param kwargs: dict: Additional kwargs for the publisher
+        """
+        carrier = "ipc"
+        super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+        ShmMiddleware.activate(ipc_dir=ipc_dir)
+
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self._socket = self._ring = None
+        self._seq = 0
+        self._subscriber_count = 0
+
+        self._plugin_kwargs = kwargs
+        self._serializer_kwargs = serializer_kwargs or {}
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs)
+
+        if not self.should_wait:
+            PublisherWatchDog().add_publisher(self)
+
+    def establish(self, repeats: Optional[int] = None, **kwargs):
+        """
+        Establish the connection to the listeners.
+
+        :param repeats: int: Number of repeats to await connection. None for infinite. Default is None
+        :return: bool: True if connection established, False otherwise
+        """
+        if self._socket is None:
+            self._socket = zmq.Context.instance().socket(zmq.XPUB)
+            self._socket.setsockopt(zmq.XPUB_VERBOSE, 1)
+            self._socket.setsockopt(zmq.LINGER, 0)
+            self._socket.bind(ShmMiddleware().get_ipc_address(self.out_topic))
+        established = self.await_connection(repeats=repeats)
+        return self.check_establishment(established)
+
+    def await_connection(self, repeats: Optional[int] = None):
+        """
+        Wait for at least one listener to subscribe.
+
+        :param repeats: int: Number of repeats to await connection. None for infinite. Default is None
+        :return: bool: True if connection established, False otherwise
+        """
+        connected = False
+        logging.info(f"[SHM] Waiting for output connection: {self.out_topic}")
+        if repeats is None:
+            if self.should_wait:
+                repeats = -1
+            else:
+                return True
+        while repeats > 0 or repeats <= -1:
+            repeats -= 1
+            self._update_subscriber_count(timeout=20)
+            connected = self._subscriber_count > 0
+            if connected:
+                logging.info(f"[SHM] Output connection established: {self.out_topic}")
+                break
+        return connected
+
+    def _update_subscriber_count(self, timeout: int = 0):
+        """
+        Update the number of subscribed listeners from the (un)subscription messages received by the XPUB socket.
+
+        :param timeout: int: Time in milliseconds to wait for the first subscription message. Default is 0
+        """
+        while self._socket.poll(timeout=timeout):
+            timeout = 0
+            message = self._socket.recv()
+            if message[:1] == b"\x01":
+                self._subscriber_count += 1
+            elif message[:1] == b"\x00":
+                self._subscriber_count = max(0, self._subscriber_count - 1)
+
+    def _write(self, obj):
+        """
+        Serialize the object, write its buffers into the ring buffer and notify the listeners. The notification
+        consists of the sequence number and slot offset, the name of the shared memory segment, the serialized object
+        and the location of each buffer within the segment.
+
+        :param obj: Any: Object to write
+        """
+        obj_str, obj_buffers = self._plugin_encoder.encode_buffers(obj, as_bytes=True)
+        self._seq += 1
+        if obj_buffers:
+            if self._ring is None or not self._ring.fits(obj_buffers):
+                self._resize_ring(obj_buffers)
+            slot_offset, entries = self._ring.write(self._seq, obj_buffers)
+            ring_name = self._ring.name
+        else:
+            slot_offset, entries, ring_name = 0, [], ""
+        self._socket.send_multipart([SHM_NOTIFY_HEADER.pack(self._seq, slot_offset), ring_name.encode(),
+                                     obj_str, b"".join(SHM_BUFFER_ENTRY.pack(*entry) for entry in entries)])
+
+    def _resize_ring(self, obj_buffers):
+        """
+        Replace the ring buffer with one large enough to hold the given buffers. The slot size is at least doubled to
+        avoid frequent reallocations for messages of varying size. Listeners attach to the new shared memory segment
+        upon receiving the next notification.
+
+        :param obj_buffers: List[memoryview]: The buffers to fit in a single slot
+        """
+        slot_size = sum(ShmRingBuffer.align(memoryview(buffer).nbytes) for buffer in obj_buffers)
+        if self._ring is not None:
+            slot_size = max(slot_size, 2 * self._ring.slot_size)
+            self._ring.close(unlink=True)
+        self._ring = ShmRingBuffer("wrapyfi_" + secrets.token_hex(8), slot_count=self.slot_count,
+                                   slot_size=max(slot_size, self.slot_size), create=True)
+
+    def close(self):
+        """
+        Close the publisher and destroy the shared memory segment.
+        """
+        if hasattr(self, "_socket") and self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if hasattr(self, "_ring") and self._ring is not None:
+            self._ring.close(unlink=True)
+            self._ring = None
+
+    def __del__(self):
+        self.close()
+
+
+@Publishers.register("NativeObject", "shm")
+class ShmNativeObjectPublisher(ShmPublisher):
+
+    def __init__(self, name: str, out_topic: str, carrier: str = "ipc", should_wait: bool = True, **kwargs):
+        """
+        The NativeObjectPublisher using shared memory assuming a combination of python native objects and numpy arrays
+        as input. Numpy arrays and bytes-like objects are written into shared memory, while the remaining data is
+        serialized (including plugins) using the encoder and sent as a string notification.
+
+        :param name: str: Name of the publisher
+        :param out_topic: str: Name of the output topic preceded by '/' (e.g. '/topic')
+        :param carrier: str: Carrier protocol. The shared memory middleware only supports 'ipc'. Default is 'ipc'
+        :param should_wait: bool: Whether to wait for at least one listener before unblocking the script. Default is True
+        :param kwargs: dict: Additional kwargs for the publisher
+        """
+        super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+
+    def publish(self, obj):
+        """
+        Publish the object to the middleware.
+
+        :param obj: object: Object to publish
+        """
+        if not self.established:
+            established = self.establish(repeats=WATCHDOG_POLL_REPEAT)
+            if not established:
+                return
+            else:
+                time.sleep(0.2)
+        self._write(obj)
+
+
+@Publishers.register("Image", "shm")
+class ShmImagePublisher(ShmNativeObjectPublisher):
+
+    def __init__(self, name: str, out_topic: str, carrier: str = "ipc", should_wait: bool = True,
+                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, codec_kwargs: Optional[dict] = None, **kwargs):
+        """
+        The ImagePublisher using shared memory assuming a numpy array as input.
+
+        :param name: str: Name of the publisher
+        :param out_topic: str: Name of the output topic preceded by '/' (e.g. '/topic')
+        :param carrier: str: Carrier protocol. The shared memory middleware only supports 'ipc'. Default is 'ipc'
+        :param should_wait: bool: Whether to wait for at least one listener before unblocking the script. Default is True
+        :param width: int: Width of the image. Default is -1 meaning that the width is not fixed
+        :param height: int: Height of the image. Default is -1 meaning that the height is not fixed
+        :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
+        :param fp: bool: True if the image is floating point, False if it is integer. Default is False
+        :param jpg: bool: True if the image should be compressed as JPG. Default is False
+        :param codec: str: The self-describing image codec (e.g. 'png', 'webp', 'qoi') compressing the images. Default is
+                      None (use 'jpg' if ``jpg`` is True else transmit uncompressed images)
+        :param codec_kwargs: dict: Additional kwargs for the image codec (e.g. ``{"quality": 80}``)
+        """
+        super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+        self.width = width
+        self.height = height
+        self.rgb = rgb
+        self.fp = fp
+        self._codec = ImageCodecs.resolve(jpg=jpg, codec=codec, codec_kwargs=codec_kwargs, self_describing=True)
+        self.jpg = self._codec is not None
+
+        self._type = np.float32 if self.fp else np.uint8
+
+    def publish(self, img: np.ndarray):
+        """
+        Publish the image to the middleware.
+
+        :param img: np.ndarray: Image to publish formatted as a cv2 image np.ndarray[img_height, img_width, channels]
+        """
+        if img is None:
+            return
+
+        if not self.established:
+            established = self.establish(repeats=WATCHDOG_POLL_REPEAT)
+            if not established:
+                return
+            else:
+                time.sleep(0.2)
+        if 0 < self.width != img.shape[1] or 0 < self.height != img.shape[0] or \
+                not ((img.ndim == 2 and not self.rgb) or (img.ndim == 3 and self.rgb and img.shape[2] == 3)):
+            raise ValueError("Incorrect image shape for publisher")
+
+        if self.jpg:
+            img = np.frombuffer(self._codec.encode(img), np.uint8)
+        self._write(img)
+
+
+@Publishers.register("AudioChunk", "shm")
+class ShmAudioChunkPublisher(ShmNativeObjectPublisher):
+    def __init__(self, name: str, out_topic: str, carrier: str = "ipc", should_wait: bool = True,
+                 channels: int = 1, rate: int = 44100, chunk: int = -1, **kwargs):
+        """
+        The AudioChunkPublisher using shared memory assuming a numpy array as input.
+
+        :param name: str: Name of the publisher
+        :param out_topic: str: Name of the output topic preceded by '/' (e.g. '/topic')
+        :param carrier: str: Carrier protocol. The shared memory middleware only supports 'ipc'. Default is 'ipc'
+        :param should_wait: bool: Whether to wait for at least one listener before unblocking the script. Default is True
+        :param channels: int: Number of channels. Default is 1
+        :param rate: int: Sampling rate. Default is 44100
+        :param chunk: int: Chunk size. Default is -1 meaning that the chunk size is not fixed
+        """
+        super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+        self.channels = channels
+        self.rate = rate
+        self.chunk = chunk
+
+    def publish(self, aud: Tuple[np.ndarray, int]):
+        """
+        Publish the audio chunk to the middleware.
+
+        :param aud: Tuple[np.ndarray, int]: Audio chunk to publish formatted as (np.ndarray[audio_chunk, channels], int[samplerate])
+        """
+        if not self.established:
+            established = self.establish(repeats=WATCHDOG_POLL_REPEAT)
+            if not established:
+                return
+            else:
+                time.sleep(0.2)
+
+        aud, rate = aud
+        if aud is None:
+            return
+        if 0 < self.rate != rate:
+            raise ValueError("Incorrect audio rate for publisher")
+        chunk, channels = aud.shape if len(aud.shape) > 1 else (aud.shape[0], 1)
+        self.chunk = chunk if self.chunk == -1 else self.chunk
+        self.channels = channels if self.channels == -1 else self.channels
+        if 0 < self.chunk != chunk or 0 < self.channels != channels:
+            raise ValueError("Incorrect audio shape for publisher")
+        aud = np.require(aud, dtype=np.float32, requirements='C')
+
+        self._write((chunk, channels, rate, aud))
+
+
+@Publishers.register("Properties", "shm")
+class ShmPropertiesPublisher(ShmPublisher):
+
+    def __init__(self, name, out_topic, **kwargs):
+        super().__init__(name, out_topic, **kwargs)
+        raise NotImplementedError
@@ -1,17 +1,15 @@
 import logging
-import json
 import time
 import base64
 import io
 from typing import Optional, Literal, Tuple
 
 import numpy as np
-import cv2
 import yarp
 
 from wrapyfi.connect.publishers import Publisher, Publishers, PublisherWatchDog
 from wrapyfi.middlewares.yarp import YarpMiddleware
-from wrapyfi.encoders import JsonEncoder
+from wrapyfi.encoders import JsonEncoder, ImageCodecs
 
 
 WATCHDOG_POLL_REPEAT = None
@@ -102,9 +100,9 @@ class YarpNativeObjectPublisher(YarpPublisher):
         """
         super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, persistent=persistent,
                          out_topic_connect=out_topic_connect, **kwargs)
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
 
         self._port = self._netconnect = None
 
@@ -139,8 +137,7 @@ class YarpNativeObjectPublisher(YarpPublisher):
                 return
             else:
                 time.sleep(0.2)
-        obj_str = json.dumps(obj, cls=self._plugin_encoder, **self._plugin_kwargs,
-                             serializer_kwrags=self._serializer_kwargs)
+        obj_str = self._plugin_encoder.encode(obj)
         obj_port = self._port.prepare()
         obj_port.clear()
         obj_port.addString(obj_str)
@@ -152,7 +149,8 @@ class YarpImagePublisher(YarpPublisher):
 
     def __init__(self, name: str, out_topic: str, carrier: Literal["tcp", "udp", "mcast"] = "tcp", should_wait: bool = True,
                  persistent: bool = True, out_topic_connect: Optional[str] = None, width: int = -1, height: int = -1,
-                 rgb: bool = True, fp: bool = False, jpg: bool = False, **kwargs):
+                 rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, codec_kwargs: Optional[dict] = None, **kwargs):
         """
         The Image publisher using the BufferedPortImage construct assuming a numpy array as input.
 
@@ -168,6 +166,9 @@ class YarpImagePublisher(YarpPublisher):
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
         :param jpg: bool: True if the image should be compressed as JPG. Default is False
+        :param codec: str: The self-describing image codec (e.g. 'png', 'webp', 'qoi') compressing the images. Default is
+                      None (use 'jpg' if ``jpg`` is True else transmit uncompressed images)
+        :param codec_kwargs: dict: Additional kwargs for the image codec (e.g. ``{"quality": 80}``)
         """
         super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, persistent=persistent,
                          out_topic_connect=out_topic_connect, **kwargs)
@@ -175,7 +176,8 @@ class YarpImagePublisher(YarpPublisher):
         self.height = height
         self.rgb = rgb
         self.fp = fp
-        self.jpg = jpg
+        self._codec = ImageCodecs.resolve(jpg=jpg, codec=codec, codec_kwargs=codec_kwargs, self_describing=True)
+        self.jpg = self._codec is not None
 
         self._port = self._type = self._netconnect = None
 
@@ -226,7 +228,7 @@ class YarpImagePublisher(YarpPublisher):
         img = np.require(img, dtype=self._type, requirements='C')
 
         if self.jpg:
-            img_str = np.array(cv2.imencode('.jpg', img)[1]).tostring()
+            img_str = np.frombuffer(self._codec.encode(img), np.uint8).tobytes()
             with io.BytesIO() as memfile:
                 np.save(memfile, img_str)
                 img_str = base64.b64encode(memfile.getvalue()).decode('ascii')
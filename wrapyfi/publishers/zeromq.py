@@ -2,17 +2,18 @@ import logging
 import json
 import time
 import os
+import queue
+import threading
 import base64
 import io
 from typing import Optional, Tuple
 
 import numpy as np
-import cv2
 import zmq
 
 from wrapyfi.connect.publishers import Publisher, Publishers, PublisherWatchDog
-from wrapyfi.middlewares.zeromq import ZeroMQMiddlewarePubSub
-from wrapyfi.encoders import JsonEncoder
+from wrapyfi.middlewares.zeromq import ZeroMQMiddlewarePubSub, ZeroMQArrayHeader
+from wrapyfi.encoders import JsonEncoder, ImageCodecs, ImageCodecPool
 
 
 SOCKET_IP = os.environ.get("WRAPYFI_ZEROMQ_SOCKET_IP", "127.0.0.1")
@@ -79,7 +80,6 @@ class ZeroMQPublisher(Publisher):
         :param repeats: int: Number of repeats to await connection. None for infinite. Default is None
         :return: bool: True if connection established, False otherwise
         """
-        connected = False
         if out_topic is None:
             out_topic = self.out_topic
         logging.info(f"[ZeroMQ] Waiting for output connection: {out_topic}")
@@ -88,15 +88,34 @@ class ZeroMQPublisher(Publisher):
                 repeats = -1
             else:
                 return True
-        while repeats > 0 or repeats <= -1:
-            repeats -= 1
-            connected = ZeroMQMiddlewarePubSub().shared_monitor_data.is_connected(out_topic)
-            if connected:
-                break
-            time.sleep(0.02)
+        # block on the monitor condition until a subscriber connects, instead of polling the connection state
+        connected = ZeroMQMiddlewarePubSub().shared_monitor_data.wait_for_connection(
+            out_topic, timeout=None if repeats <= -1 else repeats * 0.02)
         logging.info(f"[ZeroMQ] Output connection established: {out_topic}")
         return connected
 
+    async def apublish(self, obj):
+        """
+        Publish the object without blocking the event loop. Establishing the connection, which awaits the listeners,
+        runs in the default executor of the event loop. Once established, the object is published directly, since the
+        PUB socket discards messages instead of blocking when its high water mark is reached. The serialization can be
+        offloaded to a background thread with ``async_publish``, unless its overflow policy blocks.
+
+        :param obj: Any: The object to publish
+        """
+        if self.established and not self._publish_may_block():
+            self.publish(obj)
+        else:
+            await super().apublish(obj)
+
+    def _publish_may_block(self):
+        """
+        Check whether publishing may block the calling thread once the connection is established.
+
+        :return: bool: True if publishing may block, False otherwise
+        """
+        return self.async_publish and self.async_overflow == "block"
+
     def close(self):
         """
         Close the publisher.
@@ -116,7 +135,7 @@ class ZeroMQPublisher(Publisher):
 class ZeroMQNativeObjectPublisher(ZeroMQPublisher):
 
     def __init__(self, name: str, out_topic: str, carrier: str = "tcp", should_wait: bool = True,
-                 serializer_kwargs: Optional[dict] = None, **kwargs):
+                 serializer_kwargs: Optional[dict] = None, raw_buffers: bool = False, **kwargs):
         """
         The NativeObjectPublisher using the ZeroMQ message construct assuming a combination of python native objects
         and numpy arrays as input. Serializes the data (including plugins) using the encoder and sends it as a string.
@@ -126,14 +145,18 @@ class ZeroMQNativeObjectPublisher(ZeroMQPublisher):
         :param carrier: str: Carrier protocol. ZeroMQ currently only supports TCP for PUB/SUB pattern. Default is 'tcp'
         :param should_wait: bool: Whether to wait for at least one listener before unblocking the script. Default is True
         :param serializer_kwargs: dict: Additional kwargs for the serializer
+        :param raw_buffers: bool: Whether to send numpy arrays and bytes-like objects as raw buffers in additional
+                            message frames (without copying) instead of embedding them as base64 strings within the
+                            JSON string. Default is False
         :param kwargs: dict: Additional kwargs for the publisher
         """
         super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, **kwargs)
+        self.raw_buffers = raw_buffers
         self._socket = self._netconnect = None
 
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs)
 
         if not self.should_wait:
             PublisherWatchDog().add_publisher(self)
@@ -168,16 +191,21 @@ class ZeroMQNativeObjectPublisher(ZeroMQPublisher):
                 return
             else:
                 time.sleep(0.2)
-        obj_str = json.dumps(obj, cls=self._plugin_encoder, **self._plugin_kwargs,
-                             serializer_kwrags=self._serializer_kwargs)
-        self._socket.send_multipart([self._topic, obj_str.encode()])
+        if self.raw_buffers:
+            obj_str, obj_buffers = self._plugin_encoder.encode_buffers(obj, as_bytes=True)
+            self._socket.send_multipart([self._topic, obj_str, *obj_buffers], copy=False)
+        else:
+            obj_str = self._plugin_encoder.encode_bytes(obj)
+            self._socket.send_multipart([self._topic, obj_str])
 
 
 @Publishers.register("Image", "zeromq")
 class ZeroMQImagePublisher(ZeroMQNativeObjectPublisher):
 
     def __init__(self, name: str, out_topic: str, carrier: str = "tcp", should_wait: bool = True,
-                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False, **kwargs):
+                 width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, codec_kwargs: Optional[dict] = None, codec_pool: bool = False,
+                 codec_pool_size: int = 4, **kwargs):
         """
         The ImagePublisher using the ZeroMQ message construct assuming a numpy array as input.
 
@@ -189,16 +217,33 @@ class ZeroMQImagePublisher(ZeroMQNativeObjectPublisher):
         :param height: int: Height of the image. Default is -1 meaning that the height is not fixed
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
-        :param jpg: bool: True if the image should be compressed as JPG. Default is False
+        :param jpg: bool: True if the image should be compressed as JPG. Equivalent to ``codec='jpg'``. Default is False
+        :param codec: str: The image codec (e.g. 'png', 'webp', 'qoi', 'lz4', 'zstd') compressing the images. The codec is
+                      transmitted in the message header. Default is None (use 'jpg' if ``jpg`` is True else 'raw')
+        :param codec_kwargs: dict: Additional kwargs for the image codec (e.g. ``{"quality": 80}``)
+        :param codec_pool: bool: Whether to compress the images on the thread pool shared by all Image communicators of
+                           the process and transmit them from a background thread in publishing order. The published
+                           images must not be modified afterwards. Default is False
+        :param codec_pool_size: int: Maximum number of images being compressed at once before ``publish`` blocks.
+                                Default is 4
         """
         super().__init__(name, out_topic, carrier=carrier, should_wait=should_wait, **kwargs)
         self.width = width
         self.height = height
         self.rgb = rgb
         self.fp = fp
-        self.jpg = jpg
+        self._codec = ImageCodecs.resolve(jpg=jpg, codec=codec, codec_kwargs=codec_kwargs)
+        self.jpg = self._codec is not None and self._codec.name == "jpg"
 
         self._type = np.float32 if self.fp else np.uint8
+        self._seq = 0
+
+        self._codec_queue = self._codec_thread = None
+        if codec_pool and self._codec is not None:
+            self._codec_queue = queue.Queue(maxsize=codec_pool_size)
+            self._codec_thread = threading.Thread(name=f"wrapyfi_codec_publisher_{out_topic}",
+                                                  target=self._codec_send_loop, daemon=True)
+            self._codec_thread.start()
 
     def publish(self, img: np.ndarray):
         """
@@ -221,13 +266,52 @@ class ZeroMQImagePublisher(ZeroMQNativeObjectPublisher):
         if not img.flags['C_CONTIGUOUS']:
             img = np.ascontiguousarray(img)
 
-        if self.jpg:
-            img_str = np.array(cv2.imencode('.jpg', img)[1]).tostring()
-        else:
-            img_str = json.dumps(img, cls=self._plugin_encoder, **self._plugin_kwargs,
-                                 serializer_kwrags=self._serializer_kwargs).encode()
-        img_header = '{timestamp:' + str(time.time()) + '}'
-        self._socket.send_multipart([self._topic, img_header.encode(), img_str])
+        # the header describes the image, whereas the pixels (raw or compressed) are sent in a separate frame
+        img_header = ZeroMQArrayHeader.pack(img.dtype, img.shape, img.strides, self._seq, time.time(),
+                                            codec="raw" if self._codec is None else self._codec.name)
+        self._seq += 1
+        # the tracing envelope is sent in a trailing frame, which is ignored by listeners not tracing the messages
+        trace_frames = [self._next_trace().pack()] if self.trace else []
+        if self._codec_queue is not None:
+            self._codec_queue.put((img_header, ImageCodecPool.submit(self._codec.encode, img), trace_frames))
+            return
+        if self._codec is not None:
+            img = self._codec.encode(img)
+        self._socket.send_multipart([self._topic, img_header, img, *trace_frames])
+
+    def _publish_may_block(self):
+        """
+        Check whether publishing may block the calling thread once the connection is established. Images compressed
+        on the shared thread pool block once ``codec_pool_size`` images are being compressed.
+
+        :return: bool: True if publishing may block, False otherwise
+        """
+        return self._codec_queue is not None or super()._publish_may_block()
+
+    def _codec_send_loop(self):
+        """
+        Transmit the images compressed on the shared thread pool in publishing order until the publisher is closed.
+        """
+        while True:
+            item = self._codec_queue.get()
+            if item is self._codec_queue:
+                break
+            img_header, img_future, trace_frames = item
+            try:
+                self._socket.send_multipart([self._topic, img_header, img_future.result(), *trace_frames])
+            except Exception as e:
+                logging.error(f"[ZeroMQ] Failed to publish the compressed image on topic {self.out_topic}: {e}")
+
+    def close(self):
+        """
+        Transmit the images being compressed, then close the publisher.
+        """
+        codec_thread = getattr(self, "_codec_thread", None)
+        if codec_thread is not None and codec_thread.is_alive() and codec_thread is not threading.current_thread():
+            # the queue itself marks the end of the queued images
+            self._codec_queue.put(self._codec_queue)
+            codec_thread.join()
+        super().close()
 
 
 @Publishers.register("AudioChunk", "zeromq")
@@ -276,10 +360,10 @@ class ZeroMQAudioChunkPublisher(ZeroMQNativeObjectPublisher):
             raise ValueError("Incorrect audio shape for publisher")
         aud = np.require(aud, dtype=np.float32, requirements='C')
 
-        aud_str = json.dumps((chunk, channels, rate, aud), cls=self._plugin_encoder, **self._plugin_kwargs,
-                             serializer_kwrags=self._serializer_kwargs).encode()
-        aud_header = '{timestamp:' + str(time.time()) + '}'
-        self._socket.send_multipart([self._topic, aud_header.encode(), aud_str])
+        trace_frames = [self._next_trace().pack()] if self.trace else []
+        aud_str = self._plugin_encoder.encode_bytes((chunk, channels, rate, aud))
+        aud_header = json.dumps({"timestamp": time.time()})
+        self._socket.send_multipart([self._topic, aud_header.encode(), aud_str, *trace_frames])
 
 
 @Publishers.register("Properties", "zeromq")
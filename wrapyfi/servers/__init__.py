@@ -1,5 +1,25 @@
+"""
+Builtin servers of Wrapyfi.
+
+The middleware modules are not imported when Wrapyfi is imported, since they import the middleware frameworks.
+Instead, ``MIDDLEWARE_MANIFEST`` declares the data types registered by each module and the top-level packages it
+requires, and ``Servers.registry`` imports a module when one of its servers is first instantiated. New middleware
+modules must be added to the manifest, otherwise they are imported when Wrapyfi is imported.
+"""
 import logging
 
+# defined before importing wrapyfi.connect, whose scan reads the manifest of this partially initialized package
+MIDDLEWARE_MANIFEST = {
+    "ros": {"data_types": ("NativeObject", "Image", "AudioChunk"),
+            "requires": ("numpy", "rospy", "std_msgs", "sensor_msgs")},
+    "ros2": {"data_types": ("NativeObject", "Image", "AudioChunk"),
+             "requires": ("numpy", "rclpy", "std_msgs", "sensor_msgs")},
+    "yarp": {"data_types": ("NativeObject", "Image", "AudioChunk"),
+             "requires": ("numpy", "yarp")},
+    "zeromq": {"data_types": ("NativeObject", "Image", "AudioChunk"),
+               "requires": ("numpy", "zmq")},
+}
+
 from wrapyfi.connect.servers import Server, Servers
 
 
@@ -1,6 +1,5 @@
 import logging
 import sys
-import json
 import time
 import os
 import importlib.util
@@ -65,11 +64,11 @@ class ROSNativeObjectServer(ROSServer):
         """
         super().__init__(name, out_topic, carrier=carrier, **kwargs)
 
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         self._server = None
 
@@ -94,7 +93,7 @@ class ROSNativeObjectServer(ROSServer):
             self.establish()
         try:
             request = ROSNativeObjectServer.RECEIVE_QUEUE.get(block=True)
-            [args, kwargs] = json.loads(request.data, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+            [args, kwargs] = self._plugin_decoder.decode(request.data)
             return args, kwargs
         except rospy.ServiceException as e:
             logging.error("[ROS] Service call failed: %s" % e)
@@ -118,8 +117,7 @@ class ROSNativeObjectServer(ROSServer):
         :param obj: Any: The Python object to be serialized and sent
         """
         try:
-            obj_str = json.dumps(obj, cls=self._plugin_encoder, **self._plugin_kwargs,
-                                 serializer_kwrags=self._serializer_kwargs)
+            obj_str = self._plugin_encoder.encode(obj)
             obj_msg = std_msgs.msg.String()
             obj_msg.data = obj_str
             ROSNativeObjectServer.SEND_QUEUE.put(obj_msg, block=False)
@@ -165,8 +163,8 @@ class ROSImageServer(ROSServer):
             self._type = np.uint8
 
         self._plugin_kwargs = kwargs
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         self._server = None
 
@@ -191,7 +189,7 @@ class ROSImageServer(ROSServer):
             self.establish()
         try:
             request = ROSImageServer.RECEIVE_QUEUE.get(block=True)
-            [args, kwargs] = json.loads(request.data, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+            [args, kwargs] = self._plugin_decoder.decode(request.data)
             return args, kwargs
         except rospy.ServiceException as e:
             logging.error("[ROS] Service call failed: %s" % e)
@@ -254,8 +252,8 @@ class ROSAudioChunkServer(ROSServer):
         """
         super().__init__(name, out_topic, carrier=carrier, **kwargs)
         self._plugin_kwargs = kwargs
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         self._server = self._rep_msg = None
 
@@ -294,8 +292,7 @@ class ROSAudioChunkServer(ROSServer):
             self.establish()
         try:
             request = ROSAudioChunkServer.RECEIVE_QUEUE.get(block=True)
-            [args, kwargs] = json.loads(request.request, object_hook=self._plugin_decoder_hook,
-                                        **self._deserializer_kwargs)
+            [args, kwargs] = self._plugin_decoder.decode(request.request)
             return args, kwargs
         except rospy.ServiceException as e:
             logging.error("[ROS] Service call failed: %s" % e)
@@ -1,6 +1,5 @@
 import logging
 import sys
-import json
 import time
 import threading
 import os
@@ -9,7 +8,6 @@ import queue
 from typing import Optional, Tuple
 
 import numpy as np
-import cv2
 import rclpy
 from rclpy.node import Node
 import std_msgs.msg
@@ -17,7 +15,7 @@ import sensor_msgs.msg
 
 from wrapyfi.connect.servers import Server, Servers
 from wrapyfi.middlewares.ros2 import ROS2Middleware
-from wrapyfi.encoders import JsonEncoder, JsonDecodeHook
+from wrapyfi.encoders import JsonEncoder, JsonDecodeHook, ImageCodecs
 
 
 class ROS2Server(Server, Node):
@@ -73,11 +71,11 @@ class ROS2NativeObjectServer(ROS2Server):
         :param deserializer_kwargs: dict: Additional kwargs for the deserializer
         """
         super().__init__(name, out_topic, **kwargs)
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         self._server = None
 
@@ -120,7 +118,7 @@ class ROS2NativeObjectServer(ROS2Server):
             self._background_callback.start()
 
             request = ROS2NativeObjectServer.RECEIVE_QUEUE.get(block=True)
-            [args, kwargs] = json.loads(request.request, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+            [args, kwargs] = self._plugin_decoder.decode(request.request)
             return args, kwargs
         except Exception as e:
             logging.error("[ROS 2] Service call failed %s" % e)
@@ -145,8 +143,7 @@ class ROS2NativeObjectServer(ROS2Server):
         :param obj: Any: The Python object to be serialized and sent
         """
         try:
-            obj_str = json.dumps(obj, cls=self._plugin_encoder, **self._plugin_kwargs,
-                                 serializer_kwrags=self._serializer_kwargs)
+            obj_str = self._plugin_encoder.encode(obj)
             self._rep_msg.response = obj_str
             ROS2NativeObjectServer.SEND_QUEUE.put(self._rep_msg, block=False)
         except queue.Full:
@@ -161,6 +158,7 @@ class ROS2ImageServer(ROS2Server):
 
     def __init__(self, name: str, out_topic: str,
                  width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, codec_kwargs: Optional[dict] = None,
                  deserializer_kwargs: Optional[dict] = None, **kwargs):
         """
         Specific server handling native Python objects, serializing them to JSON strings for transmission.
@@ -172,19 +170,23 @@ class ROS2ImageServer(ROS2Server):
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
         :param jpg: bool: True if the image should be decompressed from JPG. Default is False
+        :param codec: str: The self-describing image codec (e.g. 'png', 'webp', 'qoi') compressing the images. Default is
+                      None (use 'jpg' if ``jpg`` is True else transmit uncompressed images)
+        :param codec_kwargs: dict: Additional kwargs for the image codec (e.g. ``{"quality": 80}``)
         :param deserializer_kwargs: dict: Additional kwargs for the deserializer
         """
         super().__init__(name, out_topic, **kwargs)
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, text_only=True)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         self.width = width
         self.height = height
         self.rgb = rgb
         self.fp = fp
-        self.jpg = jpg
+        self._codec = ImageCodecs.resolve(jpg=jpg, codec=codec, codec_kwargs=codec_kwargs, self_describing=True)
+        self.jpg = self._codec is not None
 
         if self.fp:
             self._encoding = '32FC3' if self.rgb else '32FC1'
@@ -240,7 +242,7 @@ class ROS2ImageServer(ROS2Server):
             self._background_callback.start()
 
             request = ROS2ImageServer.RECEIVE_QUEUE.get(block=True)
-            [args, kwargs] = json.loads(request.request, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+            [args, kwargs] = self._plugin_decoder.decode(request.request)
             return args, kwargs
         except Exception as e:
             logging.error("[ROS 2] Service call failed %s" % e)
@@ -272,8 +274,8 @@ class ROS2ImageServer(ROS2Server):
             img_msg = self._rep_msg.response
             if self.jpg:
                 img_msg.header.stamp = rclpy.clock.Clock().now().to_msg()
-                img_msg.format = "jpeg"
-                img_msg.data = np.array(cv2.imencode('.jpg', img)[1]).tobytes()
+                img_msg.format = "jpeg" if self._codec.name == "jpg" else self._codec.name
+                img_msg.data = np.frombuffer(self._codec.encode(img), np.uint8).tobytes()
             else:
                 img_msg.header.stamp = rclpy.clock.Clock().now().to_msg()
                 img_msg.height = img.shape[0]
@@ -308,10 +310,10 @@ class ROS2AudioChunkServer(ROS2Server):
         :param deserializer_kwargs: dict: Additional kwargs for the deserializer
         """
         super().__init__(name, out_topic, **kwargs)
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, text_only=True)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         self.channels = channels
         self.rate = rate
@@ -354,7 +356,7 @@ class ROS2AudioChunkServer(ROS2Server):
             self._background_callback.start()
 
             request = ROS2AudioChunkServer.RECEIVE_QUEUE.get(block=True)
-            [args, kwargs] = json.loads(request.request, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+            [args, kwargs] = self._plugin_decoder.decode(request.request)
             return args, kwargs
         except Exception as e:
             logging.error("[ROS 2] Service call failed %s" % e)
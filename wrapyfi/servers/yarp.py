@@ -1,5 +1,4 @@
 import logging
-import json
 from typing import Optional, Literal, Tuple
 
 import numpy as np
@@ -65,11 +64,11 @@ class YarpNativeObjectServer(YarpServer):
         :param deserializer_kwargs: dict: Additional kwargs for the deserializer
         """
         super().__init__(name, out_topic, carrier=carrier, out_topic_connect=out_topic_connect, persistent=persistent, **kwargs)
-        self._plugin_encoder = JsonEncoder
         self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs, text_only=True)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs, text_only=True)
 
         self._port = self._netconnect = None
 
@@ -106,7 +105,7 @@ class YarpNativeObjectServer(YarpServer):
             request = False
             while not request:
                 request = self._port.read(obj_msg, True)
-            [args, kwargs] = json.loads(obj_msg.get(0).asString(), object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
+            [args, kwargs] = self._plugin_decoder.decode(obj_msg.get(0).asString())
             return args, kwargs
         except Exception as e:
             logging.error("[YARP] Service call failed: %s" % e)
@@ -119,8 +118,7 @@ class YarpNativeObjectServer(YarpServer):
 
         :param obj: Any: The Python object to be serialized and sent
         """
-        obj_str = json.dumps(obj, cls=self._plugin_encoder, **self._plugin_kwargs,
-                             serializer_kwrags=self._serializer_kwargs)
+        obj_str = self._plugin_encoder.encode(obj)
         obj_msg = yarp.Bottle()
         obj_msg.clear()
         obj_msg.addString(obj_str)
@@ -1,16 +1,17 @@
 import logging
-import json
+import threading
+import multiprocessing
 import time
 import os
-from typing import Optional, Tuple, Tuple
+from typing import Callable, Optional, Tuple
 
 import numpy as np
-import cv2
 import zmq
 
 from wrapyfi.connect.servers import Server, Servers
-from wrapyfi.middlewares.zeromq import ZeroMQMiddlewareReqRep
-from wrapyfi.encoders import JsonEncoder, JsonDecodeHook
+from wrapyfi.middlewares.zeromq import ZeroMQMiddlewareReqRep, ZeroMQArrayHeader, ZEROMQ_AUDIO_HEADER, \
+    ZEROMQ_WORKER_READY
+from wrapyfi.encoders import JsonEncoder, JsonDecodeHook, ImageCodecs
 
 
 SOCKET_IP = os.environ.get("WRAPYFI_ZEROMQ_SOCKET_IP", "127.0.0.1")
@@ -18,6 +19,8 @@ SOCKET_PUB_PORT = int(os.environ.get("WRAPYFI_ZEROMQ_SOCKET_REQ_PORT", 5558))
 SOCKET_SUB_PORT = int(os.environ.get("WRAPYFI_ZEROMQ_SOCKET_REP_PORT", 5559))
 START_PROXY_BROKER = os.environ.get("WRAPYFI_ZEROMQ_START_PROXY_BROKER", True) != "False"
 PROXY_BROKER_SPAWN = os.environ.get("WRAPYFI_ZEROMQ_PROXY_BROKER_SPAWN", "process")
+PROXY_BROKER_LRU = os.environ.get("WRAPYFI_ZEROMQ_PROXY_BROKER_LRU", False) == "True"
+SERVE_POLL_TIMEOUT = int(os.environ.get("WRAPYFI_ZEROMQ_SERVE_POLL_TIMEOUT", 100))
 WATCHDOG_POLL_REPEAT = None
 
 
@@ -25,7 +28,7 @@ class ZeroMQServer(Server):
     def __init__(self, name: str, out_topic: str, carrier: str = "tcp",
                  socket_ip: str = SOCKET_IP, socket_rep_port: int = SOCKET_PUB_PORT, socket_req_port: int = SOCKET_SUB_PORT,
                  start_proxy_broker: bool = START_PROXY_BROKER, proxy_broker_spawn: bool = PROXY_BROKER_SPAWN,
-                 zeromq_kwargs: Optional[dict] = None, **kwargs):
+                 proxy_broker_lru: bool = PROXY_BROKER_LRU, zeromq_kwargs: Optional[dict] = None, **kwargs):
         """
         Initialize the server and start the device broker if necessary.
 
@@ -37,6 +40,10 @@ class ZeroMQServer(Server):
         :param socket_req_port: int: Port of the socket for REQ pattern. Default is 5559
         :param start_proxy_broker: bool: Whether to start a device broker. Default is True
         :param proxy_broker_spawn: str: Whether to spawn the device broker as a process or thread. Default is 'process'
+        :param proxy_broker_lru: bool: Whether the device broker forwards each request to the least recently used
+                                 worker which is ready. The servers then connect REQ sockets to the broker, announcing
+                                 when they are ready for a request, instead of REP sockets. All servers connected to
+                                 the broker must use the same setting. Default is False
         :param zeromq_kwargs: dict: Additional kwargs for the ZeroMQ Req/Rep middleware
         :param kwargs: dict: Additional kwargs for the server
         """
@@ -50,18 +57,29 @@ class ZeroMQServer(Server):
 
         self.socket_rep_address = f"{carrier}://{socket_ip}:{socket_rep_port}"
         self.socket_req_address = f"{carrier}://{socket_ip}:{socket_req_port}"
+        self.proxy_broker_lru = proxy_broker_lru
+        self._envelope = []
+        self._socket_ready = False
+        self._workers = []
+        self._serve_stop = threading.Event()
         if start_proxy_broker:
             ZeroMQMiddlewareReqRep.activate(socket_rep_address=self.socket_rep_address,
                                             socket_req_address=self.socket_req_address,
                                             proxy_broker_spawn=proxy_broker_spawn,
+                                            proxy_broker_lru=proxy_broker_lru,
                                             **zeromq_kwargs or {})
         else:
             ZeroMQMiddlewareReqRep.activate(**zeromq_kwargs or {})
 
     def close(self):
         """
-        Close the server.
+        Close the server, stopping the workers started by ``serve``.
         """
+        if getattr(self, "_workers", None):
+            self._serve_stop.set()
+            for worker in self._workers:
+                worker.join()
+            self._workers = []
         if hasattr(self, "_socket") and self._socket:
             if self._socket is not None:
                 self._socket.close()
@@ -84,10 +102,11 @@ class ZeroMQNativeObjectServer(ZeroMQServer):
         :param deserializer_kwargs: dict: Additional kwargs for the deserializer
         """
         super().__init__(name, out_topic, carrier=carrier, **kwargs)
-        self._plugin_encoder = JsonEncoder
+        self._plugin_kwargs = kwargs
         self._serializer_kwargs = serializer_kwargs or {}
-        self._plugin_decoder_hook = JsonDecodeHook(**kwargs).object_hook
+        self._plugin_encoder = JsonEncoder(**self._plugin_kwargs, serializer_kwargs=self._serializer_kwargs)
         self._deserializer_kwargs = deserializer_kwargs or {}
+        self._plugin_decoder = JsonDecodeHook(**kwargs, deserializer_kwargs=self._deserializer_kwargs)
 
         self.establish()
 
@@ -95,14 +114,24 @@ class ZeroMQNativeObjectServer(ZeroMQServer):
         """
         Establish the connection to the server.
         """
-        self._socket = zmq.Context().instance().socket(zmq.REP)
+        self._socket = self._create_socket()
+        self.established = True
+
+    def _create_socket(self):
+        """
+        Internal method to create a socket connected to the device broker, which is a REQ socket when the broker
+        forwards the requests to the least recently used worker, or a REP socket otherwise.
+
+        :return: zmq.Socket: The REP or REQ socket
+        """
+        socket = zmq.Context().instance().socket(zmq.REQ if self.proxy_broker_lru else zmq.REP)
         for socket_property in ZeroMQMiddlewareReqRep().zeromq_kwargs.items():
             if isinstance(socket_property[1], str):
-                self._socket.setsockopt_string(getattr(zmq, socket_property[0]), socket_property[1])
+                socket.setsockopt_string(getattr(zmq, socket_property[0]), socket_property[1])
             else:
-                self._socket.setsockopt(getattr(zmq, socket_property[0]), socket_property[1])
-        self._socket.connect(self.socket_req_address)
-        self.established = True
+                socket.setsockopt(getattr(zmq, socket_property[0]), socket_property[1])
+        socket.connect(self.socket_req_address)
+        return socket
 
     def await_request(self, *args, **kwargs):
         """
@@ -114,14 +143,11 @@ class ZeroMQNativeObjectServer(ZeroMQServer):
                  - A list of arguments extracted from the received message
                  - A dictionary of keyword arguments extracted from the received message
         """
-        message = self._socket.recv_string()
-        try:
-            request = json.loads(message, object_hook=self._plugin_decoder_hook, **self._deserializer_kwargs)
-            args, kwargs = request
-            return args, kwargs
-        except json.JSONDecodeError as e:
-            logging.error(f"[ZeroMQ] Failed to decode message: {e}")
-            return [], {}
+        if self.proxy_broker_lru and not self._socket_ready:
+            self._socket.send(ZEROMQ_WORKER_READY)
+            self._socket_ready = True
+        self._envelope, args, kwargs = self._decode_request(self._socket.recv_multipart())
+        return args, kwargs
 
     def reply(self, obj):
         """
@@ -130,8 +156,104 @@ class ZeroMQNativeObjectServer(ZeroMQServer):
 
         :param obj: Any: The Python object to be serialized and sent
         """
-        obj_str = json.dumps(obj, cls=self._plugin_encoder, **self._serializer_kwargs)
-        self._socket.send_string(obj_str)
+        frames = self._encode_reply(obj)
+        if frames is not None:
+            self._socket.send_multipart(self._envelope + frames)
+
+    def serve(self, handler: Callable, workers: int = 4, spawn: str = "thread"):
+        """
+        Serve the requests concurrently on a pool of worker threads or processes, each awaiting the requests on its own
+        socket connected to the device broker, which distributes the requests among the workers. The handler is called
+        with the arguments and keyword arguments of each request, and its return value is sent as the reply. The
+        socket of the server is handed over to the first worker thread, or closed when spawning worker processes. The
+        method returns immediately, and the workers are stopped when the server is closed.
+
+        :param handler: Callable: The function handling the requests. It must be thread-safe when spawning more than
+                        one worker thread
+        :param workers: int: Number of workers. Default is 4
+        :param spawn: str: Whether to spawn the workers as threads or (forked) processes, which are not limited by the
+                      GIL. Default is 'thread'
+        """
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+        if spawn not in ("thread", "process"):
+            raise ValueError(f"Workers can only be spawned as a thread or process, not {spawn}")
+        if self._workers:
+            raise RuntimeError("The server is already serving requests")
+        socket, socket_ready = self._socket, self._socket_ready
+        self._socket, self._socket_ready = None, False
+        if spawn == "process":
+            if socket is not None:
+                socket.close()
+                socket = None
+            self._serve_stop = multiprocessing.Event()
+            worker_cls = multiprocessing.Process
+        else:
+            self._serve_stop = threading.Event()
+            worker_cls = threading.Thread
+        for worker_idx in range(workers):
+            worker = worker_cls(name=f"wrapyfi_zeromq_server_{self.__name__}_{worker_idx}",
+                                target=self._serve_worker, args=(handler, socket, socket_ready), daemon=True)
+            worker.start()
+            self._workers.append(worker)
+            socket, socket_ready = None, False
+
+    def _serve_worker(self, handler: Callable, socket: Optional[zmq.Socket] = None, socket_ready: bool = False):
+        """
+        Internal method running a worker of the pool started by ``serve`` until the server is closed.
+
+        :param handler: Callable: The function handling the requests
+        :param socket: zmq.Socket: The socket handed over to the worker. Default is None (create a new socket)
+        :param socket_ready: bool: Whether the handed over socket already announced that it is ready. Default is False
+        """
+        if socket is None:
+            socket = self._create_socket()
+        if self.proxy_broker_lru and not socket_ready:
+            socket.send(ZEROMQ_WORKER_READY)
+        try:
+            while not self._serve_stop.is_set():
+                if not socket.poll(SERVE_POLL_TIMEOUT):
+                    continue
+                request = socket.recv_multipart()
+                envelope, args, kwargs = self._decode_request(request)
+                try:
+                    frames = self._encode_reply(self.respond(handler, args, kwargs, key=request[-1]))
+                except Exception as e:
+                    logging.error(f"[ZeroMQ] Failed to handle request: {e}")
+                    frames = None
+                if frames is None:
+                    # a reply must always be sent, so the socket can receive the next request
+                    frames = [self._plugin_encoder.encode_bytes(None)]
+                socket.send_multipart(envelope + frames)
+        finally:
+            socket.close()
+
+    def _decode_request(self, frames: list):
+        """
+        Internal method to decode the frames of a request, returning the envelope to prefix the reply with. Requests
+        forwarded to REQ workers by the load-balancing broker are prefixed with the address of the client and an empty
+        delimiter, whereas requests sent by pipelined clients are prefixed with a request ID.
+
+        :param frames: List[bytes]: The request frames
+        :return: Tuple[list, list, dict]: The envelope, arguments, and keyword arguments
+        """
+        envelope = frames[:frames.index(b"") + 1] if self.proxy_broker_lru else []
+        envelope += frames[len(envelope):-1]
+        try:
+            args, kwargs = self._plugin_decoder.decode(frames[-1])
+            return envelope, args, kwargs
+        except ValueError as e:
+            logging.error(f"[ZeroMQ] Failed to decode message: {e}")
+            return envelope, [], {}
+
+    def _encode_reply(self, obj):
+        """
+        Internal method to serialize a reply into its frames.
+
+        :param obj: Any: The Python object to be serialized
+        :return: List[bytes]: The reply frames
+        """
+        return [self._plugin_encoder.encode_bytes(obj)]
 
 
 @Servers.register("Image", "zeromq")
@@ -139,9 +261,11 @@ class ZeroMQImageServer(ZeroMQNativeObjectServer):
 
     def __init__(self, name: str, out_topic: str, carrier: str = "tcp",
                  width: int = -1, height: int = -1, rgb: bool = True, fp: bool = False, jpg: bool = False,
+                 codec: Optional[str] = None, codec_kwargs: Optional[dict] = None,
                  deserializer_kwargs: Optional[dict] = None, **kwargs):
         """
-        Specific server handling image data as numpy arrays, serializing them to JSON strings for transmission.
+        Specific server handling image data as numpy arrays, replying with a binary header followed by the raw (or
+        compressed) image buffer.
 
         :param name: str: Name of the server
         :param out_topic: str: Topics are not supported for the REQ/REP pattern in ZeroMQ. Any given topic is ignored
@@ -150,7 +274,10 @@ class ZeroMQImageServer(ZeroMQNativeObjectServer):
         :param height: int: Height of the image. Default is -1 (use the height of the received image)
         :param rgb: bool: True if the image is RGB, False if it is grayscale. Default is True
         :param fp: bool: True if the image is floating point, False if it is integer. Default is False
-        :param jpg: bool: True if the image should be decompressed from JPG. Default is False
+        :param jpg: bool: True if the image should be compressed as JPG. Equivalent to ``codec='jpg'``. Default is False
+        :param codec: str: The image codec (e.g. 'png', 'webp', 'qoi', 'lz4', 'zstd') compressing the replied images. The
+                      codec is transmitted in the message header. Default is None (use 'jpg' if ``jpg`` is True else 'raw')
+        :param codec_kwargs: dict: Additional kwargs for the image codec (e.g. ``{"quality": 80}``)
         :param deserializer_kwargs: dict: Additional kwargs for the deserializer
         """
         super().__init__(name, out_topic, carrier=carrier, deserializer_kwargs=deserializer_kwargs, **kwargs)
@@ -159,19 +286,22 @@ class ZeroMQImageServer(ZeroMQNativeObjectServer):
         self.height = height
         self.rgb = rgb
         self.fp = fp
-        self.jpg = jpg
+        self._codec = ImageCodecs.resolve(jpg=jpg, codec=codec, codec_kwargs=codec_kwargs)
+        self.jpg = self._codec is not None and self._codec.name == "jpg"
 
         self._type = np.float32 if self.fp else np.uint8
+        self._seq = 0
 
-    def reply(self, img: np.ndarray):
+    def _encode_reply(self, img: np.ndarray):
         """
-        Serialize the provided image data and send it as a reply to the client.
+        Internal method to serialize the provided image data into the reply frames.
 
         :param img: np.ndarray: Image to send formatted as a cv2 image - np.ndarray[img_height, img_width, channels]
+        :return: list: The reply frames, or None if the image is None
         """
         if img is None:
             logging.warning("[ZeroMQ] Image is None. Skipping reply.")
-            return
+            return None
 
         if 0 < self.width != img.shape[1] or 0 < self.height != img.shape[0] or \
                 not ((img.ndim == 2 and not self.rgb) or (img.ndim == 3 and self.rgb and img.shape[2] == 3)):
@@ -180,14 +310,13 @@ class ZeroMQImageServer(ZeroMQNativeObjectServer):
         if not img.flags['C_CONTIGUOUS']:
             img = np.ascontiguousarray(img)
 
-        if self.jpg:
-            _, img_encoded = cv2.imencode('.jpg', img)
-            img_bytes = img_encoded.tobytes()
-            self._socket.send(img_bytes)
-        else:
-            img_list = img.tolist()
-            img_json = json.dumps({"img": img_list})
-            self._socket.send_string(img_json)
+        # the header describes the image, whereas the pixels (raw or compressed) are sent in a separate frame
+        img_header = ZeroMQArrayHeader.pack(img.dtype, img.shape, img.strides, self._seq, time.time(),
+                                            codec="raw" if self._codec is None else self._codec.name)
+        self._seq += 1
+        if self._codec is not None:
+            img = self._codec.encode(img)
+        return [img_header, img]
 
 
 @Servers.register("AudioChunk", "zeromq")
@@ -197,7 +326,8 @@ class ZeroMQAudioChunkServer(ZeroMQNativeObjectServer):
                  channels: int = 1, rate: int = 44100, chunk: int = -1,
                  deserializer_kwargs: Optional[dict] = None, **kwargs):
         """
-        Specific server handling audio data as numpy arrays, serializing them to JSON strings for transmission.
+        Specific server handling audio data as numpy arrays, replying with a binary header and the sampling rate
+        followed by the raw audio buffer.
 
         :param name: str: Name of the server
         :param out_topic: str: Topics are not supported for the REQ/REP pattern in ZeroMQ. Any given topic is ignored
@@ -211,12 +341,14 @@ class ZeroMQAudioChunkServer(ZeroMQNativeObjectServer):
         self.channels = channels
         self.rate = rate
         self.chunk = chunk
+        self._seq = 0
 
-    def reply(self, aud: Tuple[np.ndarray, int]):
+    def _encode_reply(self, aud: Tuple[np.ndarray, int]):
         """
-        Serialize the provided audio data and send it as a reply to the client.
+        Internal method to serialize the provided audio data into the reply frames.
 
         :param aud: Tuple[np.ndarray, int]: Audio chunk to publish formatted as (np.ndarray[audio_chunk, channels], int[samplerate])
+        :return: list: The reply frames
         """
         aud, rate = aud
         if 0 < self.rate != rate:
@@ -226,8 +358,9 @@ class ZeroMQAudioChunkServer(ZeroMQNativeObjectServer):
         self.channels = channels if self.channels == -1 else self.channels
         if 0 < self.chunk != chunk or 0 < self.channels != channels:
             raise ValueError("Incorrect audio shape for publisher")
-        aud = np.require(aud, dtype=np.float32, requirements='C')
+        aud = np.require(aud, dtype=np.float32, requirements='C').reshape(chunk, channels)
 
-        aud_list = aud.tolist()
-        aud_json = json.dumps({"aud": (int(chunk), int(channels), int(rate), aud_list)})
-        self._socket.send_string(aud_json)
\ No newline at end of file
+        # the header describes the audio chunk, followed by the sampling rate and the raw samples
+        aud_header = ZeroMQArrayHeader.pack(aud.dtype, aud.shape, aud.strides, self._seq, time.time())
+        self._seq += 1
+        return [aud_header, ZEROMQ_AUDIO_HEADER.pack(int(rate)), aud]
@@ -0,0 +1,408 @@
+import unittest
+import json
+from datetime import datetime
+
+import numpy as np
+
+from wrapyfi.utils import Plugin, PluginRegistrar
+from wrapyfi.encoders import JsonEncoder, JsonDecodeHook, Serializers, ImageCodecs, ImageCodecPool
+
+
+class JsonEncoderBuffersTest(unittest.TestCase):
+
+    def _roundtrip(self, obj):
+        obj_str, obj_buffers = JsonEncoder().encode_buffers(obj)
+        # simulate the transport by copying each buffer into a separate bytes frame
+        frames = [bytes(buffer) for buffer in obj_buffers]
+        decoder = JsonDecodeHook()
+        decoder.buffers = [memoryview(frame) for frame in frames]
+        return obj_str, obj_buffers, json.loads(obj_str, object_hook=decoder.object_hook)
+
+    def test_encode_buffers_arrays(self):
+        """
+        Test that numpy arrays are extracted into separate buffers and reconstructed with their dtype and shape.
+        """
+        arr = np.arange(24, dtype=np.float32).reshape(4, 6)[:, ::2]
+        obj = {"arr": arr, "scalar": np.zeros((), dtype=np.int16), "empty": np.empty((0, 3)), "list": [1, "a"]}
+        obj_str, obj_buffers, decoded = self._roundtrip(obj)
+        self.assertEqual(len(obj_buffers), 3)
+        self.assertEqual(obj_str.count("numpy.ndarray.raw"), 3)
+        np.testing.assert_array_equal(decoded["arr"], arr)
+        self.assertEqual(decoded["arr"].dtype, arr.dtype)
+        self.assertEqual(decoded["scalar"].shape, ())
+        self.assertEqual(decoded["empty"].shape, (0, 3))
+        self.assertEqual(decoded["list"], [1, "a"])
+
+    def test_encode_buffers_bytes(self):
+        """
+        Test that bytes-like objects are extracted into separate buffers.
+        """
+        obj = {"bytes": b"\x00\x01wrapyfi", "tuple": (1, 2)}
+        _, obj_buffers, decoded = self._roundtrip(obj)
+        self.assertEqual(len(obj_buffers), 1)
+        self.assertEqual(decoded["bytes"], b"\x00\x01wrapyfi")
+        self.assertEqual(decoded["tuple"], (1, 2))
+
+    def test_encode_without_buffers(self):
+        """
+        Test that the default encoding is unaffected after encoding with buffers.
+        """
+        encoder = JsonEncoder()
+        encoder.encode_buffers({"arr": np.ones(3)})
+        obj_str = encoder.encode({"arr": np.ones(3)})
+        decoded = json.loads(obj_str, object_hook=JsonDecodeHook().object_hook)
+        np.testing.assert_array_equal(decoded["arr"], np.ones(3))
+
+
+class JsonEncoderPluginCacheTest(unittest.TestCase):
+
+    def test_register_invalidates_cache(self):
+        """
+        Test that a persistent encoder and decoder pick up plugins registered after their construction.
+        """
+        class CacheTestType(object):
+            def __init__(self, value):
+                self.value = value
+
+        encoder = JsonEncoder()
+        decoder = JsonDecodeHook()
+        with self.assertRaises(TypeError):
+            encoder.encode(CacheTestType(1))
+        self.assertIsNone(encoder.find_plugin(CacheTestType(1)))
+
+        @PluginRegistrar.register(types=(CacheTestType,))
+        class CacheTestPlugin(Plugin):
+            def __init__(self, **kwargs):
+                pass
+
+            def encode(self, obj, *args, **kwargs):
+                return True, dict(__wrapyfi__=(str(self.__class__.__name__), obj.value))
+
+            def decode(self, obj_type, obj_full, *args, **kwargs):
+                return True, CacheTestType(obj_full[1])
+
+        try:
+            plugin = encoder.find_plugin(CacheTestType(1))
+            self.assertIsInstance(plugin, CacheTestPlugin)
+            self.assertIs(encoder.find_plugin(CacheTestType(2)), plugin)
+            decoded = json.loads(encoder.encode({"obj": CacheTestType(3)}), object_hook=decoder.object_hook)
+            self.assertEqual(decoded["obj"].value, 3)
+        finally:
+            del PluginRegistrar.encoder_registry[CacheTestType]
+            del PluginRegistrar.decoder_registry["CacheTestPlugin"]
+            PluginRegistrar.version += 1
+        self.assertIsNone(encoder.find_plugin(CacheTestType(1)))
+
+    def test_lazy_plugins(self):
+        """
+        Test that a declared plugin module is only imported when an object of a declared type is first encoded, or a
+        declared tag is first decoded.
+        """
+        import os
+        import sys
+        import tempfile
+        import textwrap
+        with tempfile.TemporaryDirectory() as plugin_dir:
+            with open(os.path.join(plugin_dir, "lazy_test_types.py"), "w") as f:
+                f.write(textwrap.dedent("""
+                    class LazyTestType(object):
+                        def __init__(self, value):
+                            self.value = value
+                """))
+            with open(os.path.join(plugin_dir, "lazy_test_plugin.py"), "w") as f:
+                f.write(textwrap.dedent("""
+                    from wrapyfi.utils import Plugin, PluginRegistrar
+                    from lazy_test_types import LazyTestType
+
+                    @PluginRegistrar.register(types=(LazyTestType,))
+                    class LazyTestPlugin(Plugin):
+                        def __init__(self, **kwargs):
+                            pass
+
+                        def encode(self, obj, *args, **kwargs):
+                            return True, dict(__wrapyfi__=(str(self.__class__.__name__), obj.value))
+
+                        def decode(self, obj_type, obj_full, *args, **kwargs):
+                            return True, LazyTestType(obj_full[1])
+                """))
+            sys.path.insert(0, plugin_dir)
+            try:
+                from lazy_test_types import LazyTestType
+                encoder = JsonEncoder()
+                for phase in ("encode", "decode"):
+                    with self.subTest(phase=phase):
+                        PluginRegistrar.declare("lazy_test_plugin", types=("lazy_test_types.LazyTestType",),
+                                                tags=("LazyTestPlugin",))
+                        self.assertNotIn("lazy_test_plugin", sys.modules)
+                        if phase == "encode":
+                            obj_str = encoder.encode({"obj": LazyTestType(3)})
+                        else:
+                            obj_str = json.dumps({"obj": {"__wrapyfi__": ["LazyTestPlugin", 3]}})
+                        decoded = json.loads(obj_str, object_hook=JsonDecodeHook().object_hook)
+                        self.assertEqual(decoded["obj"].value, 3)
+                        self.assertIn("lazy_test_plugin", sys.modules)
+                        self.assertNotIn("lazy_test_types.LazyTestType", PluginRegistrar.lazy_types)
+                        del sys.modules["lazy_test_plugin"]
+                        del PluginRegistrar.encoder_registry[LazyTestType]
+                        del PluginRegistrar.decoder_registry["LazyTestPlugin"]
+                        PluginRegistrar.version += 1
+            finally:
+                sys.path.remove(plugin_dir)
+                sys.modules.pop("lazy_test_types", None)
+                sys.modules.pop("lazy_test_plugin", None)
+                PluginRegistrar.lazy_types.pop("lazy_test_types.LazyTestType", None)
+                PluginRegistrar.lazy_tags.pop("LazyTestPlugin", None)
+
+
+class SerializerTest(unittest.TestCase):
+    SERIALIZERS = ("json", "orjson", "msgpack", "cbor")
+
+    def _roundtrip(self, serializer, obj, raw_buffers=False):
+        encoder = JsonEncoder(serializer_kwargs={"serializer": serializer})
+        decoder = JsonDecodeHook(deserializer_kwargs={"serializer": serializer})
+        if raw_buffers:
+            obj_str, obj_buffers = encoder.encode_buffers(obj, as_bytes=True)
+            decoder.buffers = [memoryview(bytes(buffer)) for buffer in obj_buffers]
+        else:
+            obj_str = encoder.encode_bytes(obj)
+        self.assertIsInstance(obj_str, bytes)
+        return decoder.decode(obj_str)
+
+    def test_roundtrip(self):
+        """
+        Test that all available serializers retain the types supported by the encoder and decoder.
+        """
+        obj = {"tuple": (1, "a"), "list": [1.5, None, True], "set": {1, 2}, "datetime": datetime(2024, 1, 2, 3, 4, 5),
+               "datetime64": np.datetime64("2024-01-02"), "arr": np.arange(6, dtype=np.int16).reshape(2, 3),
+               "nested": {"list": [(1, 2), [(3,)]], "str": "wrapyfi"}}
+        for serializer in self.SERIALIZERS:
+            for raw_buffers in (False, True):
+                with self.subTest(serializer=serializer, raw_buffers=raw_buffers):
+                    try:
+                        decoded = self._roundtrip(serializer, obj, raw_buffers=raw_buffers)
+                    except ImportError:
+                        self.skipTest(f"{serializer} not installed")
+                    self.assertEqual(decoded["tuple"], (1, "a"))
+                    self.assertEqual(decoded["list"], [1.5, None, True])
+                    self.assertEqual(decoded["set"], {1, 2})
+                    self.assertEqual(decoded["datetime"], obj["datetime"])
+                    self.assertEqual(decoded["datetime64"], obj["datetime64"])
+                    np.testing.assert_array_equal(decoded["arr"], obj["arr"])
+                    self.assertEqual(decoded["arr"].dtype, np.int16)
+                    self.assertEqual(decoded["nested"]["list"], [(1, 2), [(3,)]])
+                    self.assertEqual(decoded["nested"]["str"], "wrapyfi")
+
+    def test_json_compatibility(self):
+        """
+        Test that messages encoded with orjson can be decoded by the json serializer and vice versa.
+        """
+        if not self._available("orjson"):
+            self.skipTest("orjson not installed")
+        obj = {"tuple": (1, 2), "arr": np.ones(3)}
+        for src, dst in (("orjson", "json"), ("json", "orjson")):
+            obj_str = JsonEncoder(serializer_kwargs={"serializer": src}).encode(obj)
+            self.assertIsInstance(obj_str, str)
+            decoded = JsonDecodeHook(deserializer_kwargs={"serializer": dst}).decode(obj_str)
+            self.assertEqual(decoded["tuple"], (1, 2))
+            np.testing.assert_array_equal(decoded["arr"], np.ones(3))
+
+    def test_text_only(self):
+        """
+        Test that binary serializers are rejected by text-only transports, and unknown serializers are rejected.
+        """
+        if not self._available("msgpack"):
+            self.skipTest("msgpack not installed")
+        with self.assertRaises(ValueError):
+            JsonEncoder(serializer_kwargs={"serializer": "msgpack"}, text_only=True)
+        with self.assertRaises(ValueError):
+            JsonDecodeHook(deserializer_kwargs={"serializer": "msgpack"}, text_only=True)
+        with self.assertRaises(ValueError):
+            JsonEncoder(serializer_kwargs={"serializer": "unknown"})
+
+    def test_binary_plugin(self):
+        """
+        Test that binary serializers call the binary hooks of the plugins.
+        """
+        if not self._available("msgpack"):
+            self.skipTest("msgpack not installed")
+
+        class BinaryTestType(object):
+            def __init__(self, value):
+                self.value = value
+
+        @PluginRegistrar.register(types=(BinaryTestType,))
+        class BinaryTestPlugin(Plugin):
+            def __init__(self, **kwargs):
+                pass
+
+            def encode(self, obj, *args, **kwargs):
+                return True, dict(__wrapyfi__=(str(self.__class__.__name__), obj.value.hex()))
+
+            def decode(self, obj_type, obj_full, *args, **kwargs):
+                return True, BinaryTestType(bytes.fromhex(obj_full[1]))
+
+            def encode_binary(self, obj, *args, **kwargs):
+                return True, dict(__wrapyfi__=(str(self.__class__.__name__), obj.value))
+
+            def decode_binary(self, obj_type, obj_full, *args, **kwargs):
+                return True, BinaryTestType(obj_full[1])
+
+        try:
+            encoder = JsonEncoder(serializer_kwargs={"serializer": "msgpack"})
+            obj_str = encoder.encode({"obj": BinaryTestType(b"\x00\xff")})
+            self.assertIn(b"\x00\xff", obj_str)
+            decoded = JsonDecodeHook(deserializer_kwargs={"serializer": "msgpack"}).decode(obj_str)
+            self.assertEqual(decoded["obj"].value, b"\x00\xff")
+        finally:
+            del PluginRegistrar.encoder_registry[BinaryTestType]
+            del PluginRegistrar.decoder_registry["BinaryTestPlugin"]
+            PluginRegistrar.version += 1
+
+    def test_raw_buffers_plugin(self):
+        """
+        Test that text serializers encoding raw buffers call the binary hooks of the plugins supporting raw buffers,
+        and transmit the arrays returned by the plugins as buffers.
+        """
+        class RawBufferTestType(object):
+            def __init__(self, value):
+                self.value = value
+
+        @PluginRegistrar.register(types=(RawBufferTestType,))
+        class RawBufferTestPlugin(Plugin):
+            raw_buffers = True
+
+            def __init__(self, **kwargs):
+                pass
+
+            def encode(self, obj, *args, **kwargs):
+                return True, dict(__wrapyfi__=(str(self.__class__.__name__), obj.value.tolist()))
+
+            def decode(self, obj_type, obj_full, *args, **kwargs):
+                return True, RawBufferTestType(np.asarray(obj_full[1]))
+
+            def encode_binary(self, obj, *args, **kwargs):
+                return True, dict(__wrapyfi__=(str(self.__class__.__name__), obj.value, "raw"))
+
+        try:
+            value = np.arange(6, dtype=np.float32)
+            obj_str, obj_buffers = JsonEncoder().encode_buffers({"obj": RawBufferTestType(value)})
+            self.assertEqual(len(obj_buffers), 1)
+            self.assertEqual(bytes(obj_buffers[0]), value.tobytes())
+            obj_str, obj_buffers = JsonEncoder().encode_buffers({"obj": value.tolist()})
+            self.assertEqual(obj_buffers, [])
+            self.assertEqual(json.loads(JsonEncoder().encode({"obj": RawBufferTestType(value)}))["obj"]["__wrapyfi__"],
+                             ["RawBufferTestPlugin", value.tolist()])
+        finally:
+            del PluginRegistrar.encoder_registry[RawBufferTestType]
+            del PluginRegistrar.decoder_registry["RawBufferTestPlugin"]
+            PluginRegistrar.version += 1
+
+    def test_pytorch_tensor(self):
+        """
+        Test that PyTorch tensors are transmitted as raw memory by binary serializers and raw buffers, including
+        non-contiguous tensors, and decoded without copying the received buffers.
+        """
+        try:
+            import torch
+        except ImportError:
+            self.skipTest("torch not installed")
+
+        tensors = {"contiguous": torch.arange(12, dtype=torch.float64).reshape(3, 4),
+                   "transposed": torch.arange(12, dtype=torch.int32).reshape(3, 4).t(),
+                   "sliced": torch.arange(24, dtype=torch.float32).reshape(4, 6)[:, 1:4],
+                   "scalar": torch.tensor(1.5, dtype=torch.bfloat16),
+                   "empty": torch.zeros((0, 3), dtype=torch.int64)}
+        for serializer, raw_buffers in (("json", True), ("msgpack", False), ("msgpack", True)):
+            if not self._available(serializer):
+                continue
+            with self.subTest(serializer=serializer, raw_buffers=raw_buffers):
+                decoded = self._roundtrip(serializer, tensors, raw_buffers=raw_buffers)
+                for key, tensor in tensors.items():
+                    self.assertEqual(decoded[key].dtype, tensor.dtype)
+                    self.assertEqual(decoded[key].shape, tensor.shape)
+                    self.assertTrue(torch.equal(decoded[key], tensor))
+                self.assertEqual(decoded["transposed"].stride(), tensors["transposed"].stride())
+
+    @staticmethod
+    def _available(serializer):
+        try:
+            Serializers.create(serializer)
+            return True
+        except ImportError:
+            return False
+
+
+class ImageCodecTest(unittest.TestCase):
+
+    def test_roundtrip(self):
+        """
+        Test that the available image codecs restore the images of the supported dtypes, and lossless codecs restore
+        them exactly.
+        """
+        imgs = {np.uint8: np.random.randint(0, 256, (48, 64, 3), dtype=np.uint8),
+                np.uint16: np.random.randint(0, 5000, (48, 64), dtype=np.uint16),
+                np.float32: np.random.rand(48, 64).astype(np.float32)}
+        for name in ImageCodecs.registry:
+            try:
+                codec = ImageCodecs.create(name)
+            except ImportError:
+                continue
+            for dtype, img in imgs.items():
+                with self.subTest(codec=name, dtype=dtype.__name__):
+                    try:
+                        img_encoded = codec.encode(img)
+                    except ValueError:
+                        # all codecs support 8-bit color images
+                        self.assertIsNot(dtype, np.uint8)
+                        continue
+                    out = np.empty_like(img)
+                    for decode_out in (None, out):
+                        decoded = codec.decode(memoryview(img_encoded).cast("B"), dtype=img.dtype, shape=img.shape,
+                                               out=decode_out)
+                        self.assertEqual((decoded.dtype, decoded.shape), (img.dtype, img.shape))
+                        self.assertTrue(decoded.flags.writeable)
+                        if decode_out is not None:
+                            self.assertIs(decoded, out)
+                        if codec.lossless:
+                            np.testing.assert_array_equal(decoded, img)
+                    if codec.self_describing:
+                        self.assertIs(ImageCodecs.detect(img_encoded), type(codec))
+
+    def test_resolve(self):
+        """
+        Test that the jpg argument is equivalent to the jpg codec, codecs requiring a header are rejected by
+        self-describing transports, and unknown codecs are rejected.
+        """
+        self.assertIsNone(ImageCodecs.resolve())
+        self.assertEqual(ImageCodecs.resolve(jpg=True).name, "jpg")
+        self.assertEqual(ImageCodecs.resolve(jpg=True, codec="png", codec_kwargs={"level": 9}).params[1], 9)
+        with self.assertRaises(ValueError):
+            ImageCodecs.resolve(codec="zstd", self_describing=True)
+        with self.assertRaises(ValueError):
+            ImageCodecs.resolve(codec="unknown")
+
+    def test_codec_pool(self):
+        """
+        Test that images compressed concurrently on the shared thread pool are decoded correctly.
+        """
+        codec = ImageCodecs.create("png")
+        imgs = [np.random.randint(0, 256, (48, 64, 3), dtype=np.uint8) for _ in range(16)]
+        futures = [ImageCodecPool.submit(codec.encode, img) for img in imgs]
+        decoded = [ImageCodecPool.submit(codec.decode, future.result()) for future in futures]
+        for img, future in zip(imgs, decoded):
+            np.testing.assert_array_equal(future.result(), img)
+
+    def test_decode_channels(self):
+        """
+        Test that self-describing images are converted to the requested number of channels.
+        """
+        img = np.random.randint(0, 256, (48, 64, 3), dtype=np.uint8)
+        img_encoded = ImageCodecs.create("png").encode(img)
+        self.assertEqual(ImageCodecs.decode(img_encoded).shape, (48, 64, 3))
+        self.assertEqual(ImageCodecs.decode(img_encoded, rgb=False).shape, (48, 64))
+        with self.assertRaises(ValueError):
+            ImageCodecs.decode(b"unknown image format")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,22 @@
+import os
+import re
+import sys
+import importlib.util
 import unittest
+import subprocess
 import multiprocessing
 from multiprocessing import Queue
 import queue
+import threading
+import itertools
+import time
+
+import numpy as np
+
+from wrapyfi.connect.publishers import Publisher
+from wrapyfi.connect.listeners import Listener
+from wrapyfi.utils import ResponseCache
+from wrapyfi.metrics import MetricsRegistry, Histogram
 
 
 class ZeroMQTestMiddleware(unittest.TestCase):
@@ -45,6 +60,485 @@ class ZeroMQTestMiddleware(unittest.TestCase):
                 self.assertEqual(i, 9)
 
 
+def _latest_only_listen(result_queue, published):
+    from wrapyfi.connect.listeners import Listeners
+    listener = Listeners.registry["NativeObject:zeromq"]("LatestOnlyTest", "/latest_only_test", should_wait=True,
+                                                         latest_only=True)
+    listener.establish()
+    published.wait(timeout=20)
+    time.sleep(0.5)
+    result_queue.put((listener.listen(), listener.skipped_messages))
+
+
+def _latest_only_publish(published):
+    from wrapyfi.connect.publishers import Publishers
+    publisher = Publishers.registry["NativeObject:zeromq"]("LatestOnlyTest", "/latest_only_test", should_wait=True)
+    for count in range(10):
+        publisher.publish({"count": count})
+    published.set()
+    time.sleep(1)
+
+
+class ZeroMQLatestOnlyTest(unittest.TestCase):
+
+    def test_latest_only(self):
+        """
+        Test that a listener with ``latest_only=True`` decodes only the newest queued message and counts the skipped
+        messages.
+        """
+        result_queue = Queue()
+        published = multiprocessing.Event()
+        test_lsn = multiprocessing.Process(target=_latest_only_listen, args=(result_queue, published))
+        test_pub = multiprocessing.Process(target=_latest_only_publish, args=(published,))
+        test_lsn.start()
+        test_pub.start()
+        obj, skipped_messages = result_queue.get(timeout=30)
+        test_lsn.join()
+        test_pub.join()
+        self.assertDictEqual(obj, {"count": 9})
+        self.assertEqual(skipped_messages, 9)
+
+
+def _image_listen(result_queue, listened, out_buffer, codec_pool=False):
+    from wrapyfi.connect.listeners import Listeners
+    listener = Listeners.registry["Image:zeromq"]("ImageTest", "/image_test", should_wait=True, width=64, height=48,
+                                                  out_buffer=out_buffer, codec_pool=codec_pool)
+    imgs = []
+    for _ in range(3):
+        img = listener.listen()
+        imgs.append((img.copy(), img is out_buffer))
+    listened.set()
+    result_queue.put(imgs)
+
+
+def _traced_image_listen(result_queue, listened, out_buffer, codec_pool=False):
+    from wrapyfi.connect.listeners import Listeners
+    listener = Listeners.registry["Image:zeromq"]("ImageTest", "/image_test", should_wait=True, width=64, height=48,
+                                                  out_buffer=out_buffer, codec_pool=codec_pool)
+    transits = []
+    for _ in range(3):
+        listener.listen()
+        transits.append(listener.tracer.last_trace.transit_ns)
+    listened.set()
+    result_queue.put((listener.tracer.last_trace.seq, listener.tracer.lost.value, listener.tracer.reordered.value,
+                      transits))
+
+
+def _image_publish(listened, codec=None, codec_pool=False, trace=False):
+    from wrapyfi.connect.publishers import Publishers
+    publisher = Publishers.registry["Image:zeromq"]("ImageTest", "/image_test", should_wait=True, width=64, height=48,
+                                                    codec=codec, codec_pool=codec_pool, trace=trace)
+    for count in range(3):
+        publisher.publish(np.full((48, 64, 3), count, dtype=np.uint8))
+        time.sleep(0.05)
+    listened.wait(timeout=20)
+
+
+class ZeroMQImageTest(unittest.TestCase):
+
+    def test_array_header(self):
+        """
+        Test that the binary array header retains the array description, and that other headers are not recognized.
+        """
+        from wrapyfi.middlewares.zeromq import ZeroMQArrayHeader
+        arr = np.zeros((4, 5, 3), dtype=np.float32)[:, ::2]
+        header = ZeroMQArrayHeader.unpack(ZeroMQArrayHeader.pack(arr.dtype, arr.shape, arr.strides, 7, 1.5))
+        self.assertEqual(header["dtype"], np.float32)
+        self.assertEqual(header["shape"], arr.shape)
+        self.assertEqual(header["strides"], arr.strides)
+        self.assertEqual((header["seq"], header["timestamp"], header["codec"]), (7, 1.5, "raw"))
+        self.assertIsNone(ZeroMQArrayHeader.unpack(b"{timestamp:1.5}"))
+
+    def test_recv_into(self):
+        """
+        Test that frames are received into the output buffer with and without ``Socket.recv_into``, and that frames
+        whose size differs from the output buffer are rejected instead of truncated.
+        """
+        import zmq
+        import wrapyfi.middlewares.zeromq as zeromq_middleware
+
+        context = zmq.Context.instance()
+        sender, receiver = context.socket(zmq.PAIR), context.socket(zmq.PAIR)
+        receiver.bind("inproc://recv_into_test")
+        sender.connect("inproc://recv_into_test")
+        have_recv_into = zeromq_middleware.ZEROMQ_HAVE_RECV_INTO
+        try:
+            for zeromq_middleware.ZEROMQ_HAVE_RECV_INTO in sorted({False, have_recv_into}):
+                with self.subTest(recv_into=zeromq_middleware.ZEROMQ_HAVE_RECV_INTO):
+                    out_buffer = np.zeros((4, 5), dtype=np.uint16)
+                    sender.send(np.arange(20, dtype=np.uint16).tobytes())
+                    self.assertIs(zeromq_middleware.zeromq_recv_into(receiver, out_buffer), out_buffer)
+                    self.assertEqual(out_buffer.ravel().tolist(), list(range(20)))
+                    for nbytes in (out_buffer.nbytes + 2, out_buffer.nbytes - 2):
+                        sender.send(bytes(nbytes))
+                        with self.assertRaises(ValueError):
+                            zeromq_middleware.zeromq_recv_into(receiver, out_buffer)
+        finally:
+            zeromq_middleware.ZEROMQ_HAVE_RECV_INTO = have_recv_into
+            sender.close()
+            receiver.close()
+
+    def test_recv_into_mismatch(self):
+        """
+        Test that a listener rejecting an image which does not match its output buffer discards the remaining frames
+        of the message, receiving the next message from its first frame.
+        """
+        import zmq
+        from wrapyfi.middlewares.zeromq import ZeroMQArrayHeader
+        from wrapyfi.listeners.zeromq import ZeroMQImageListener
+
+        context = zmq.Context.instance()
+        sender, receiver = context.socket(zmq.PAIR), context.socket(zmq.PAIR)
+        receiver.bind("inproc://recv_into_mismatch_test")
+        sender.connect("inproc://recv_into_mismatch_test")
+        class PairImageListener(ZeroMQImageListener):
+            def close(self):
+                pass
+
+        # a listener without a connection, receiving from the socket pair
+        listener = object.__new__(PairImageListener)
+        listener._socket, listener.should_wait, listener.tracer, listener.metrics = receiver, True, None, None
+        listener.width, listener.height, listener.rgb = 64, 48, True
+        listener.out_buffer = np.zeros((48, 64, 3), dtype=np.uint8)
+        try:
+            small_img = np.ones((24, 32, 3), dtype=np.uint8)
+            sender.send_multipart([b"/image_test", ZeroMQArrayHeader.pack(
+                small_img.dtype, small_img.shape, small_img.strides, 0, 0.), small_img, b"trace"])
+            img = np.full((48, 64, 3), 7, dtype=np.uint8)
+            sender.send_multipart([b"/image_test", ZeroMQArrayHeader.pack(img.dtype, img.shape, img.strides, 1, 0.),
+                                   img])
+            with self.assertRaises(ValueError):
+                listener._recv_into_buffer()
+            self.assertIs(listener._recv_into_buffer(), listener.out_buffer)
+            self.assertTrue(np.array_equal(listener.out_buffer, img))
+        finally:
+            sender.close()
+            receiver.close()
+
+    def test_publish_listen_image(self):
+        """
+        Test that raw images are received with and without a preallocated output buffer.
+        """
+        for out_buffer in (None, np.zeros((48, 64, 3), dtype=np.uint8)):
+            with self.subTest(out_buffer=out_buffer is not None):
+                result_queue = Queue()
+                listened = multiprocessing.Event()
+                test_lsn = multiprocessing.Process(target=_image_listen, args=(result_queue, listened, out_buffer))
+                test_pub = multiprocessing.Process(target=_image_publish, args=(listened,))
+                test_lsn.start()
+                test_pub.start()
+                imgs = result_queue.get(timeout=30)
+                test_lsn.join()
+                test_pub.join()
+                for count, (img, is_out_buffer) in enumerate(imgs):
+                    np.testing.assert_array_equal(img, np.full((48, 64, 3), count, dtype=np.uint8))
+                    self.assertEqual(is_out_buffer, out_buffer is not None)
+
+    def test_publish_listen_codec(self):
+        """
+        Test that compressed images are decoded using the codec transmitted in the message header, and retain their
+        order when compressed and decompressed on the shared thread pool.
+        """
+        from wrapyfi.encoders import ImageCodecs
+        for codec in ("png", "zstd"):
+            try:
+                ImageCodecs.create(codec)
+            except ImportError:
+                continue
+            for out_buffer, codec_pool in ((None, False), (np.zeros((48, 64, 3), dtype=np.uint8), False),
+                                           (None, True), (np.zeros((48, 64, 3), dtype=np.uint8), True)):
+                with self.subTest(codec=codec, out_buffer=out_buffer is not None, codec_pool=codec_pool):
+                    result_queue = Queue()
+                    listened = multiprocessing.Event()
+                    test_lsn = multiprocessing.Process(target=_image_listen,
+                                                       args=(result_queue, listened, out_buffer, codec_pool))
+                    test_pub = multiprocessing.Process(target=_image_publish, args=(listened, codec, codec_pool))
+                    test_lsn.start()
+                    test_pub.start()
+                    imgs = result_queue.get(timeout=30)
+                    test_lsn.join()
+                    test_pub.join()
+                    for count, (img, is_out_buffer) in enumerate(imgs):
+                        np.testing.assert_array_equal(img, np.full((48, 64, 3), count, dtype=np.uint8))
+                        self.assertEqual(is_out_buffer, out_buffer is not None)
+
+    def test_publish_listen_traced(self):
+        """
+        Test that the tracing envelope is transmitted in a trailing frame, and recorded by the listener when receiving
+        the image frames, into the output buffer, and on the shared thread pool.
+        """
+        for out_buffer, codec, codec_pool in ((None, None, False), (np.zeros((48, 64, 3), dtype=np.uint8), None, False),
+                                              (None, "png", True)):
+            with self.subTest(out_buffer=out_buffer is not None, codec_pool=codec_pool):
+                result_queue = Queue()
+                listened = multiprocessing.Event()
+                test_lsn = multiprocessing.Process(target=_traced_image_listen,
+                                                   args=(result_queue, listened, out_buffer, codec_pool))
+                test_pub = multiprocessing.Process(target=_image_publish, args=(listened, codec, codec_pool, True))
+                test_lsn.start()
+                test_pub.start()
+                last_seq, lost, reordered, transits = result_queue.get(timeout=30)
+                test_lsn.join()
+                test_pub.join()
+                self.assertEqual((last_seq, lost, reordered), (2, 0, 0))
+                for transit in transits:
+                    self.assertTrue(0 <= transit < 5e9)
+
+
+def _reply_serve(data_type, replies):
+    from wrapyfi.connect.servers import Servers
+    server = Servers.registry[f"{data_type}:zeromq"](f"{data_type}ReplyTest", "", proxy_broker_spawn="thread")
+    for reply in replies:
+        server.await_request()
+        server.reply(reply)
+    # keep the broker alive until the last reply is forwarded
+    time.sleep(1)
+
+
+def _reply_request(result_queue, data_type, count, out_buffer):
+    from wrapyfi.connect.clients import Clients
+    client = Clients.registry[f"{data_type}:zeromq"](f"{data_type}ReplyTest", "", out_buffer=out_buffer)
+    replies = []
+    for _ in range(count):
+        reply = client.request()
+        reply_arr = reply[0] if isinstance(reply, tuple) else reply
+        replies.append((reply_arr.copy(), reply_arr is out_buffer, reply[1] if isinstance(reply, tuple) else None))
+    result_queue.put(replies)
+
+
+class ZeroMQReplyTest(unittest.TestCase):
+
+    def _request_replies(self, data_type, replies, out_buffer):
+        result_queue = Queue()
+        test_srv = multiprocessing.Process(target=_reply_serve, args=(data_type, replies))
+        test_cli = multiprocessing.Process(target=_reply_request,
+                                           args=(result_queue, data_type, len(replies), out_buffer))
+        test_srv.start()
+        test_cli.start()
+        received = result_queue.get(timeout=30)
+        test_cli.join()
+        test_srv.join()
+        return received
+
+    def test_request_reply_image(self):
+        """
+        Test that raw images are replied with and without a preallocated output buffer.
+        """
+        replies = [np.full((48, 64, 3), count, dtype=np.uint8) for count in range(2)]
+        for out_buffer in (None, np.zeros((48, 64, 3), dtype=np.uint8)):
+            with self.subTest(out_buffer=out_buffer is not None):
+                received = self._request_replies("Image", replies, out_buffer)
+                for reply, (img, is_out_buffer, _) in zip(replies, received):
+                    np.testing.assert_array_equal(img, reply)
+                    self.assertEqual(is_out_buffer, out_buffer is not None)
+
+    def test_request_reply_audio(self):
+        """
+        Test that audio chunks are replied with their sampling rate.
+        """
+        replies = [(np.linspace(-1, 1, 512, dtype=np.float32).reshape(512, 1) * count, 44100) for count in range(2)]
+        received = self._request_replies("AudioChunk", replies, None)
+        for (reply, rate), (aud, _, reply_rate) in zip(replies, received):
+            np.testing.assert_array_equal(aud, reply)
+            self.assertEqual(reply_rate, rate)
+
+
+def _image_alisten(result_queue, listened):
+    import asyncio
+    from wrapyfi.connect.listeners import Listeners
+
+    async def listen():
+        listener = Listeners.registry["Image:zeromq"]("ImageTest", "/image_test", should_wait=True, width=64, height=48)
+        imgs = [(await listener.alisten()).copy()]
+        async for img in listener:
+            imgs.append(img.copy())
+            if len(imgs) == 3:
+                break
+        return imgs
+
+    imgs = asyncio.run(listen())
+    listened.set()
+    result_queue.put(imgs)
+
+
+def _reply_arequest(result_queue, data_type, count):
+    import asyncio
+    from wrapyfi.connect.clients import Clients
+
+    async def request():
+        client = Clients.registry[f"{data_type}:zeromq"](f"{data_type}ReplyTest", "")
+        replies = []
+        for _ in range(count):
+            reply = await client.arequest()
+            replies.append(reply[0].copy() if isinstance(reply, tuple) else reply.copy())
+        return replies
+
+    result_queue.put(asyncio.run(request()))
+
+
+class ZeroMQAsyncTest(unittest.TestCase):
+
+    def test_alisten(self):
+        """
+        Test that images are received by awaiting the listener and iterating over it asynchronously.
+        """
+        result_queue = Queue()
+        listened = multiprocessing.Event()
+        test_lsn = multiprocessing.Process(target=_image_alisten, args=(result_queue, listened))
+        test_pub = multiprocessing.Process(target=_image_publish, args=(listened,))
+        test_lsn.start()
+        test_pub.start()
+        imgs = result_queue.get(timeout=30)
+        test_lsn.join()
+        test_pub.join()
+        for count, img in enumerate(imgs):
+            np.testing.assert_array_equal(img, np.full((48, 64, 3), count, dtype=np.uint8))
+
+    def test_arequest(self):
+        """
+        Test that images and audio chunks are replied to asynchronous requests.
+        """
+        replies = {"Image": [np.full((48, 64, 3), count, dtype=np.uint8) for count in range(2)],
+                   "AudioChunk": [(np.full((512, 1), count, dtype=np.float32), 44100) for count in range(2)]}
+        for data_type, data_replies in replies.items():
+            with self.subTest(data_type=data_type):
+                result_queue = Queue()
+                test_srv = multiprocessing.Process(target=_reply_serve, args=(data_type, data_replies))
+                test_cli = multiprocessing.Process(target=_reply_arequest,
+                                                   args=(result_queue, data_type, len(data_replies)))
+                test_srv.start()
+                test_cli.start()
+                received = result_queue.get(timeout=30)
+                test_cli.join()
+                test_srv.join()
+                for reply, arr in zip(data_replies, received):
+                    np.testing.assert_array_equal(arr, reply[0] if isinstance(reply, tuple) else reply)
+
+
+def _slow_double(value):
+    time.sleep(0.3)
+    return value * 2
+
+
+def _pipeline_serve(served, done, proxy_broker_lru, spawn):
+    from wrapyfi.connect.servers import Servers
+    server = Servers.registry["NativeObject:zeromq"]("PipelineTest", "", proxy_broker_spawn="thread",
+                                                     proxy_broker_lru=proxy_broker_lru)
+    server.serve(_slow_double, workers=4, spawn=spawn)
+    # wait for the workers to connect to the broker
+    time.sleep(1)
+    served.set()
+    done.wait(30)
+    server.close()
+
+
+def _pipeline_request(result_queue, served):
+    from wrapyfi.connect.clients import Clients
+    served.wait(30)
+    client = Clients.registry["NativeObject:zeromq"]("PipelineTest", "", pipelined=True)
+    start_time = time.time()
+    futures = [client.submit(value) for value in range(8)]
+    replies = [future.result(timeout=30) for future in futures]
+    elapsed = time.time() - start_time
+    req_client = Clients.registry["NativeObject:zeromq"]("PipelineReqTest", "")
+    result_queue.put((replies, elapsed, client.request(10), req_client.request(20)))
+    client.close()
+    req_client.close()
+
+
+class ZeroMQPipelineTest(unittest.TestCase):
+
+    def _pipelined_requests(self, proxy_broker_lru, spawn):
+        result_queue = Queue()
+        served = multiprocessing.Event()
+        done = multiprocessing.Event()
+        test_srv = multiprocessing.Process(target=_pipeline_serve, args=(served, done, proxy_broker_lru, spawn))
+        test_cli = multiprocessing.Process(target=_pipeline_request, args=(result_queue, served))
+        test_srv.start()
+        test_cli.start()
+        replies, elapsed, pipelined_reply, req_reply = result_queue.get(timeout=30)
+        done.set()
+        test_cli.join()
+        test_srv.join()
+        self.assertEqual(replies, [value * 2 for value in range(8)])
+        # 8 requests taking 0.3 seconds each would take 2.4 seconds when handled serially
+        self.assertLess(elapsed, 1.8)
+        self.assertEqual(pipelined_reply, 20)
+        self.assertEqual(req_reply, 40)
+
+    def test_pipelined_requests(self):
+        """
+        Test that the requests submitted by a pipelined client are handled concurrently by the server workers, and
+        that the workers reply to REQ clients as well.
+        """
+        self._pipelined_requests(False, "thread")
+
+    def test_load_balancing(self):
+        """
+        Test that the load-balancing broker forwards the requests to worker threads and processes.
+        """
+        for spawn in ("thread", "process"):
+            with self.subTest(spawn=spawn):
+                self._pipelined_requests(True, spawn)
+
+
+_handled_requests = itertools.count()
+
+
+def _counted_double(value):
+    time.sleep(0.3)
+    return value * 2, next(_handled_requests)
+
+
+def _cache_serve(served, done):
+    from wrapyfi.connect.servers import Servers
+    server = Servers.registry["NativeObject:zeromq"]("CacheTest", "", proxy_broker_spawn="thread", cache_size=4)
+    server.serve(_counted_double, workers=4)
+    time.sleep(1)
+    served.set()
+    done.wait(30)
+    server.close()
+
+
+def _cache_request(result_queue, served):
+    from wrapyfi.connect.clients import Clients
+    served.wait(30)
+    client = Clients.registry["NativeObject:zeromq"]("CacheTest", "", pipelined=True)
+    coalesced = [future.result(timeout=30) for future in [client.submit(1) for _ in range(4)]]
+    cached = client.request(1)
+    cache_client = Clients.registry["NativeObject:zeromq"]("CacheClientTest", "", cache_size=4)
+    client_cached = [cache_client.request(2), cache_client.request(2)]
+    result_queue.put((coalesced, cached, client_cached, cache_client.response_cache.hits))
+    client.close()
+    cache_client.close()
+
+
+class ZeroMQCacheTest(unittest.TestCase):
+
+    def test_response_cache(self):
+        """
+        Test that identical concurrent requests are coalesced and replied from the server cache, and that the client
+        cache returns the cached reply without contacting the server.
+        """
+        result_queue = Queue()
+        served = multiprocessing.Event()
+        done = multiprocessing.Event()
+        test_srv = multiprocessing.Process(target=_cache_serve, args=(served, done))
+        test_cli = multiprocessing.Process(target=_cache_request, args=(result_queue, served))
+        test_srv.start()
+        test_cli.start()
+        coalesced, cached, client_cached, client_hits = result_queue.get(timeout=30)
+        done.set()
+        test_cli.join()
+        test_srv.join()
+        # the handler runs once for the identical requests, so all replies share its invocation count
+        self.assertEqual([tuple(reply) for reply in coalesced], [(2, 0)] * 4)
+        self.assertEqual(tuple(cached), (2, 0))
+        self.assertEqual(tuple(client_cached[0]), (4, 1))
+        self.assertEqual(client_cached[0], client_cached[1])
+        self.assertEqual(client_hits, 1)
+
+
 class ROS2TestMiddleware(ZeroMQTestMiddleware):
     """
     Test the ROS 2 wrapper. This test class inherits from the ZeroMQ test class, so all tests from the ZeroMQ test class
@@ -69,5 +563,544 @@ class ROSTestMiddleware(ZeroMQTestMiddleware):
     MWARE = "ros"
 
 
+class ShmTestMiddleware(ZeroMQTestMiddleware):
+    """
+    Test the shared memory wrapper. This test class inherits from the ZeroMQ test class, so all tests from the ZeroMQ
+    test class are also run for the shared memory wrapper.
+    """
+    MWARE = "shm"
+
+
+class BlockedPublisher(Publisher):
+    """
+    A publisher whose transmission blocks until released, allowing the asynchronous publishing queue to fill up.
+    """
+    def __init__(self, **kwargs):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.received = []
+        self.closed = False
+        super().__init__("AsyncPublishTest", "/async_publish_test", async_publish=True, **kwargs)
+
+    def publish(self, obj):
+        self.started.set()
+        self.release.wait()
+        self.received.append(obj)
+
+    def close(self):
+        self.closed = True
+
+
+class AsyncPublishTest(unittest.TestCase):
+
+    def _publish(self, async_overflow, count=5):
+        publisher = BlockedPublisher(async_queue_size=2, async_overflow=async_overflow)
+        publisher.publish(0)
+        # the first object is taken by the background thread, which blocks until released
+        self.assertTrue(publisher.started.wait(timeout=3))
+        for obj in range(1, count):
+            publisher.publish(obj)
+        self.assertEqual(publisher.queued_messages, 2)
+        publisher.release.set()
+        publisher.close()
+        self.assertTrue(publisher.closed)
+        return publisher
+
+    def test_drop_oldest(self):
+        """
+        Test that the oldest queued objects are discarded when the queue is full, and the remaining objects are
+        published in order before closing.
+        """
+        publisher = self._publish("drop_oldest")
+        self.assertEqual(publisher.received, [0, 3, 4])
+        self.assertEqual(publisher.dropped_messages, 2)
+        self.assertEqual(publisher.published_messages, 3)
+
+    def test_drop_newest(self):
+        """
+        Test that the published objects are discarded when the queue is full.
+        """
+        publisher = self._publish("drop_newest")
+        self.assertEqual(publisher.received, [0, 1, 2])
+        self.assertEqual(publisher.dropped_messages, 2)
+
+    def test_block(self):
+        """
+        Test that publishing blocks until the queue has space, without discarding any objects.
+        """
+        publisher = BlockedPublisher(async_queue_size=1, async_overflow="block")
+        publisher.publish(0)
+        self.assertTrue(publisher.started.wait(timeout=3))
+        publisher.publish(1)
+        blocked = threading.Thread(target=publisher.publish, args=(2,))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        self.assertTrue(blocked.is_alive())
+        publisher.release.set()
+        blocked.join(timeout=3)
+        publisher.close()
+        self.assertEqual(publisher.received, [0, 1, 2])
+        self.assertEqual(publisher.dropped_messages, 0)
+
+    def test_invalid_policy(self):
+        """
+        Test that unsupported overflow policies are rejected.
+        """
+        with self.assertRaises(ValueError):
+            BlockedPublisher(async_overflow="drop_all")
+
+
+class RecordingPublisher(Publisher):
+    """
+    A NativeObject publisher transmitting the encoded objects to a list.
+    """
+    data_type = "NativeObject"
+
+    def __init__(self, **kwargs):
+        from wrapyfi.encoders import JsonEncoder
+        self.messages = []
+        self._plugin_encoder = JsonEncoder()
+        super().__init__("BatchPublishTest", "/batch_publish_test", **kwargs)
+
+    def publish(self, obj):
+        self.messages.append(self._plugin_encoder.encode(obj))
+
+    def close(self):
+        pass
+
+
+class ReplayListener(Listener):
+    """
+    A NativeObject listener decoding the messages transmitted by a ``RecordingPublisher``.
+    """
+    data_type = "NativeObject"
+
+    def __init__(self, messages, **kwargs):
+        from wrapyfi.encoders import JsonDecodeHook
+        self.messages = list(messages)
+        self._plugin_decoder = JsonDecodeHook()
+        super().__init__("BatchPublishTest", "/batch_publish_test", **kwargs)
+
+    def listen(self):
+        return self._plugin_decoder.decode(self.messages.pop(0)) if self.messages else None
+
+
+class BatchPublishTest(unittest.TestCase):
+
+    def test_batch_size(self):
+        """
+        Test that objects are published in batches of ``batch_size``, with the incomplete batch published on closing,
+        and unbatched by the listener one object per call or as lists.
+        """
+        publisher = RecordingPublisher(batch_size=4, batch_timeout=10)
+        objs = [{"seq": seq, "arr": np.full(2, seq)} for seq in range(10)]
+        for obj in objs:
+            publisher.publish(obj)
+        self.assertEqual(len(publisher.messages), 2)
+        publisher.close()
+        self.assertEqual(len(publisher.messages), 3)
+
+        listener = ReplayListener(publisher.messages)
+        for obj in objs:
+            received = listener.listen()
+            self.assertEqual(received["seq"], obj["seq"])
+            np.testing.assert_array_equal(received["arr"], obj["arr"])
+        self.assertIsNone(listener.listen())
+
+        listener = ReplayListener(publisher.messages, batch_mode="list")
+        self.assertEqual([[obj["seq"] for obj in listener.listen()] for _ in range(3)],
+                         [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+
+    def test_batch_timeout(self):
+        """
+        Test that incomplete batches are published once their oldest object waited for ``batch_timeout`` seconds.
+        """
+        publisher = RecordingPublisher(batch_size=100, batch_timeout=0.05)
+        publisher.publish(1)
+        publisher.publish(2)
+        self.assertEqual(publisher.messages, [])
+        time.sleep(0.3)
+        self.assertEqual(len(publisher.messages), 1)
+        self.assertEqual(ReplayListener(publisher.messages, batch_mode="list").listen(), [1, 2])
+        publisher.close()
+        self.assertEqual(len(publisher.messages), 1)
+
+    def test_unbatched(self):
+        """
+        Test that unbatched messages are returned unchanged, and batching is rejected by other data types.
+        """
+        listener = ReplayListener([RecordingPublisher()._plugin_encoder.encode([1, 2])], batch_mode="list")
+        self.assertEqual(listener.listen(), [1, 2])
+        with self.assertRaises(ValueError):
+            BlockedPublisher(batch_size=2)
+        with self.assertRaises(ValueError):
+            ReplayListener([], batch_mode="dict")
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used response is evicted when the cache is full.
+        """
+        cache = ResponseCache(maxsize=2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        self.assertEqual(cache.get_or_compute("a", lambda: -1), 1)
+        cache.get_or_compute("c", lambda: 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_or_compute("a", lambda: -1), 1)
+        self.assertEqual(cache.get_or_compute("b", lambda: -2), -2)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_ttl(self):
+        """
+        Test that responses expire after the time to live.
+        """
+        cache = ResponseCache(maxsize=2, ttl=0.05)
+        cache.get_or_compute("a", lambda: 1)
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 1)
+        time.sleep(0.1)
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 2)
+
+    def test_coalescing(self):
+        """
+        Test that concurrent computations of the same key are coalesced, and that failed computations are not cached.
+        """
+        cache = ResponseCache()
+        calls = []
+
+        def compute():
+            calls.append(None)
+            time.sleep(0.2)
+            return len(calls)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("a", compute)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [1] * 4)
+        self.assertEqual(len(calls), 1)
+
+        def fail():
+            raise RuntimeError("failed")
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_compute("b", fail)
+        self.assertEqual(cache.get_or_compute("b", lambda: 2), 2)
+
+    def test_async_coalescing(self):
+        """
+        Test that concurrent coroutines awaiting the same key are coalesced.
+        """
+        import asyncio
+        cache = ResponseCache()
+        calls = []
+
+        async def compute():
+            calls.append(None)
+            await asyncio.sleep(0.1)
+            return len(calls)
+
+        async def gather():
+            return await asyncio.gather(*[cache.aget_or_compute("a", compute) for _ in range(4)])
+
+        self.assertEqual(asyncio.run(gather()), [1] * 4)
+        self.assertEqual(len(calls), 1)
+
+    def test_server_without_encoder(self):
+        """
+        Test that servers without an encoder (e.g. the ROS Image and AudioChunk servers) cache their responses.
+        """
+        from wrapyfi.connect.servers import Server
+
+        server = Server("CacheKeyTest", "/cache_key_test", cache_size=4)
+        self.assertFalse(hasattr(server, "_plugin_encoder"))
+        calls = []
+
+        def compute(value, scale=1):
+            calls.append(value)
+            return value * scale
+
+        self.assertEqual(server.respond(compute, [np.arange(3)], {"scale": 2}).tolist(), [0, 2, 4])
+        self.assertEqual(server.respond(compute, [np.arange(3)], {"scale": 2}).tolist(), [0, 2, 4])
+        self.assertEqual(server.respond(compute, [np.arange(3)], {"scale": 3}).tolist(), [0, 3, 6])
+        self.assertEqual(len(calls), 2)
+
+
+class StreamTest(unittest.TestCase):
+
+    def test_stream(self):
+        """
+        Test that the stream yields the received messages one at a time, unbatching the messages of batching publishers.
+        """
+        publisher = RecordingPublisher(batch_size=4, batch_timeout=10)
+        for seq in range(6):
+            publisher.publish(seq)
+        publisher.close()
+        stream = ReplayListener(publisher.messages).stream()
+        self.assertEqual([next(stream) for _ in range(6)], list(range(6)))
+
+    def test_stream_batch(self):
+        """
+        Test that the stream yields lists of up to ``max_batch`` messages, and yields incomplete batches once
+        ``timeout`` seconds have elapsed since their first message.
+        """
+        publisher = RecordingPublisher()
+        for seq in range(5):
+            publisher.publish(seq)
+        stream = ReplayListener(publisher.messages, should_wait=False).stream(max_batch=2, timeout=0.05)
+        self.assertEqual(next(stream), [0, 1])
+        self.assertEqual(next(stream), [2, 3])
+        start = time.monotonic()
+        self.assertEqual(next(stream), [4])
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+        with self.assertRaises(ValueError):
+            next(ReplayListener([]).stream(max_batch=0))
+
+    def test_stream_batch_deadline(self):
+        """
+        Test that a batch is yielded once ``timeout`` seconds have elapsed while messages keep arriving, and that a
+        listener which is not yet established stops waiting for messages during the batch.
+        """
+        class SlowListener(ReplayListener):
+            def listen(self):
+                self.waits.append(self.should_wait)
+                time.sleep(0.01)
+                return 0
+
+        listener = SlowListener([])
+        listener.waits = []
+        self.assertFalse(listener.established)
+        start = time.monotonic()
+        batch = next(listener.stream(max_batch=1000, timeout=0.05))
+        self.assertLess(len(batch), 1000)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(listener.waits[1:], [False] * (len(listener.waits) - 1))
+        self.assertTrue(listener.should_wait)
+
+
+class MetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        MetricsRegistry().clear()
+        MetricsRegistry.enable()
+
+    def tearDown(self):
+        MetricsRegistry.enable(False)
+        MetricsRegistry().stop_prometheus()
+        MetricsRegistry().clear()
+
+    def test_histogram(self):
+        """
+        Test that the histogram records small values exactly, and estimates quantiles of large values within the
+        relative error of its significant bits.
+        """
+        histogram = Histogram(significant_bits=5)
+        for value in range(1, 11):
+            histogram.record(value)
+        self.assertEqual(histogram.quantile(0.5), 5)
+        self.assertEqual(histogram.quantile(1.0), 10)
+
+        histogram = Histogram(significant_bits=5, scale=1e-9)
+        for value in range(1, 100001):
+            histogram.record(value * 1000)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 100000)
+        self.assertAlmostEqual(snapshot["max"], 0.1)
+        self.assertAlmostEqual(snapshot["p50"], 0.05, delta=0.05 / 16)
+        self.assertAlmostEqual(snapshot["p99"], 0.099, delta=0.099 / 16)
+        self.assertIsNone(Histogram().quantile(0.5))
+
+    def test_communicator_metrics(self):
+        """
+        Test that publishers and listeners count their messages and bytes, and record their latencies, only when the
+        metrics are enabled.
+        """
+        publisher = RecordingPublisher()
+        for seq in range(3):
+            publisher.publish({"seq": seq})
+        listener = ReplayListener(publisher.messages)
+        for seq in range(3):
+            self.assertEqual(listener.listen(), {"seq": seq})
+        self.assertIsNone(listener.listen())
+
+        metrics = {(metric["name"], metric["labels"]["role"], metric["labels"].get("operation"),
+                    metric["labels"].get("direction")): metric for metric in MetricsRegistry().collect()}
+        sent = sum(len(message) for message in publisher.messages)
+        self.assertEqual(metrics["wrapyfi_messages_total", "publisher", None, None]["value"], 3)
+        self.assertEqual(metrics["wrapyfi_messages_total", "listener", None, None]["value"], 3)
+        self.assertEqual(metrics["wrapyfi_bytes_total", "publisher", None, "out"]["value"], sent)
+        self.assertEqual(metrics["wrapyfi_bytes_total", "listener", None, "in"]["value"], sent)
+        self.assertEqual(metrics["wrapyfi_latency_seconds", "publisher", "publish", None]["count"], 3)
+        self.assertEqual(metrics["wrapyfi_latency_seconds", "publisher", "serialize", None]["count"], 3)
+        self.assertEqual(metrics["wrapyfi_latency_seconds", "listener", "listen", None]["count"], 3)
+        self.assertEqual(metrics["wrapyfi_latency_seconds", "listener", "deserialize", None]["count"], 3)
+
+        MetricsRegistry.enable(False)
+        publisher = RecordingPublisher()
+        self.assertIsNone(publisher.metrics)
+        self.assertNotIn("publish", publisher.__dict__)
+        publisher.publish(1)
+        self.assertEqual(metrics["wrapyfi_messages_total", "publisher", None, None]["value"], 3)
+
+    def test_prometheus(self):
+        """
+        Test that the metrics are served in the Prometheus text exposition format.
+        """
+        import urllib.request
+        RecordingPublisher().publish(1)
+        server = MetricsRegistry().serve_prometheus(port=0)
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics", timeout=5) as response:
+            text = response.read().decode()
+        self.assertIn("# TYPE wrapyfi_messages_total counter", text)
+        self.assertIn("# TYPE wrapyfi_latency_seconds summary", text)
+        self.assertRegex(text, r'wrapyfi_messages_total\{[^}]*role="publisher"[^}]*\} 1\n')
+        self.assertRegex(text, r'wrapyfi_latency_seconds_count\{[^}]*operation="publish"[^}]*\} 1\n')
+
+
+class TraceTest(unittest.TestCase):
+
+    def test_trace_envelope(self):
+        """
+        Test that traced objects are unwrapped by the listener, which detects the lost and reordered messages of each
+        publisher, including batched messages.
+        """
+        from wrapyfi.encoders import MessageTrace
+        publisher = RecordingPublisher(trace=True)
+        for seq in range(6):
+            publisher.publish({"seq": seq})
+        messages = publisher.messages
+        # the message 1 is lost, and the messages 3 and 4 are swapped
+        listener = ReplayListener([messages[0], messages[2], messages[4], messages[3], messages[5]])
+        self.assertEqual([listener.listen()["seq"] for _ in range(5)], [0, 2, 4, 3, 5])
+        self.assertIsNone(listener.listen())
+        self.assertEqual((listener.tracer.lost.value, listener.tracer.reordered.value), (2, 1))
+        self.assertEqual(listener.tracer.transit.count, 5)
+        self.assertEqual(listener.tracer.last_trace.seq, 5)
+        self.assertEqual(listener.tracer.last_trace.publisher_id, publisher.publisher_id)
+        self.assertGreaterEqual(listener.tracer.last_trace.transit_ns, 0)
+
+        publisher = RecordingPublisher(trace=True, batch_size=3, batch_timeout=10)
+        for seq in range(6):
+            publisher.publish(seq)
+        listener = ReplayListener(publisher.messages, batch_mode="list")
+        self.assertEqual([listener.listen(), listener.listen()], [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual((listener.tracer.lost.value, listener.tracer.last_trace.seq), (0, 5))
+
+        trace = MessageTrace.unpack(MessageTrace("host:1:2", 3, 4, 5).pack())
+        self.assertEqual((trace.publisher_id, trace.host, trace.seq, trace.monotonic_ns, trace.wall_ns),
+                         ("host:1:2", "host", 3, 4, 5))
+        listener = ReplayListener([RecordingPublisher()._plugin_encoder.encode(1)])
+        self.assertEqual(listener.listen(), 1)
+        self.assertIsNone(listener.tracer)
+
+    def test_trace_metrics(self):
+        """
+        Test that the transit latency and lost messages are exported to the metrics registry when enabled.
+        """
+        MetricsRegistry().clear()
+        MetricsRegistry.enable()
+        try:
+            publisher = RecordingPublisher(trace=True)
+            for seq in range(3):
+                publisher.publish(seq)
+            listener = ReplayListener(publisher.messages[::2])
+            self.assertEqual([listener.listen(), listener.listen()], [0, 2])
+            text = MetricsRegistry().prometheus_text()
+        finally:
+            MetricsRegistry.enable(False)
+            MetricsRegistry().clear()
+        self.assertRegex(text, r'wrapyfi_trace_lost_total\{[^}]*role="listener"[^}]*\} 1\n')
+        self.assertRegex(text, r'wrapyfi_latency_seconds_count\{[^}]*operation="transit"[^}]*\} 2\n')
+
+
+class MiddlewareRegistryTest(unittest.TestCase):
+
+    @staticmethod
+    def _run_fresh(script, lazy=True):
+        """
+        Run a script in a fresh interpreter, importing Wrapyfi from the tested source tree.
+        """
+        import wrapyfi
+
+        env = dict(os.environ, WRAPYFI_MIDDLEWARE_LAZY=str(lazy),
+                   PYTHONPATH=os.pathsep.join(filter(None, [os.path.dirname(os.path.dirname(wrapyfi.__file__)),
+                                                            os.environ.get("PYTHONPATH")])))
+        return subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True)
+
+    def test_manifest(self):
+        """
+        Test that the middleware manifests declare the data types registered by each middleware module.
+        """
+        from wrapyfi import publishers, listeners, servers, clients
+
+        for package, pattern in ((publishers, "Publishers"), (listeners, "Listeners"),
+                                 (servers, "Servers"), (clients, "Clients")):
+            for middleware, entry in package.MIDDLEWARE_MANIFEST.items():
+                with self.subTest(package=package.__name__, middleware=middleware):
+                    with open(os.path.join(os.path.dirname(package.__file__), middleware + ".py")) as module_file:
+                        data_types = re.findall(r'@%s\.register\("(\w+)", "%s"\)' % (pattern, middleware),
+                                                module_file.read())
+                    self.assertCountEqual(entry["data_types"], data_types)
+
+    def test_lazy_import(self):
+        """
+        Test that importing the wrapper does not import the middleware modules, and that a middleware module is
+        imported when its communicator is first looked up in the registry.
+        """
+        from wrapyfi.connect.publishers import Publishers
+
+        if "zeromq" not in Publishers.mwares:
+            self.skipTest("zeromq not installed")
+        script = ("import sys; import wrapyfi.connect.wrapper; from wrapyfi.connect.publishers import Publishers; "
+                  "loaded = 'wrapyfi.publishers.zeromq' in sys.modules; "
+                  "publisher_cls = Publishers.registry['NativeObject:zeromq']; "
+                  "print(loaded, 'wrapyfi.publishers.zeromq' in sys.modules, publisher_cls.__name__)")
+        output = self._run_fresh(script)
+        self.assertEqual(output.returncode, 0, output.stderr)
+        self.assertEqual(output.stdout.split()[-3:], ["False", "True", "ZeroMQNativeObjectPublisher"])
+
+    def test_fresh_import(self):
+        """
+        Test that the communicator packages and their middleware modules can be imported first in a fresh
+        interpreter, with lazy and eager middleware loading.
+        """
+        from wrapyfi import publishers, listeners, servers, clients
+
+        modules = []
+        for package in (publishers, listeners, servers, clients):
+            modules.append(package.__name__)
+            modules.extend(f"{package.__name__}.{middleware}" for middleware, entry in
+                           package.MIDDLEWARE_MANIFEST.items()
+                           if all(importlib.util.find_spec(req) is not None for req in entry["requires"]))
+        for module in modules:
+            for lazy in (True, False):
+                with self.subTest(module=module, lazy=lazy):
+                    output = self._run_fresh(f"import {module}", lazy=lazy)
+                    self.assertEqual(output.returncode, 0, output.stderr)
+
+    def test_missing_middleware(self):
+        """
+        Test that looking up undeclared or unavailable communicators raises a KeyError (employing the fallback).
+        """
+        from wrapyfi.utils import MiddlewareRegistry
+
+        registry = MiddlewareRegistry()
+        registry.declare("wrapyfi.publishers", {"missing": {"data_types": ("NativeObject",),
+                                                            "requires": ("wrapyfi_missing_package",)},
+                                                "broken": {"data_types": ("NativeObject",)}})
+        self.assertNotIn("NativeObject:missing", registry.lazy_modules)
+        with self.assertRaises(KeyError):
+            registry["NativeObject:missing"]
+        with self.assertRaises(KeyError):
+            registry["NativeObject:broken"]
+        self.assertNotIn("NativeObject:broken", registry.lazy_modules)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -134,6 +134,156 @@ class ZeroMQTestWrapper(unittest.TestCase):
 
         self.assertIn(self.MWARE, Test.get_communicators())
 
+    def test_dispatch_cache(self):
+        """
+        Test the dispatch plan caching of the middleware. The communication mode of an instance is resolved on the first
+        call and cached. Calling the ``activate_communication`` method should invalidate the cached plan, so that the
+        new mode is applied on the next call.
+        """
+        import wrapyfi.tests.tools.class_test as class_test
+        Test = class_test.Test
+        Test.close_all_instances()
+
+        if self.MWARE not in Test.get_communicators():
+            self.skipTest(f"{self.MWARE} not installed")
+
+        test = Test()
+        test.activate_communication(test.exchange_object, mode=None)
+        msg_object, = test.exchange_object(msg="cached", mware=self.MWARE)
+        self.assertEqual(msg_object["message"], "cached")
+        self.assertIn(("Test.exchange_object", id(test)), Test._MiddlewareCommunicator__dispatch_plans)
+
+        test.activate_communication(test.exchange_object, mode="disable")
+        self.assertNotIn(("Test.exchange_object", id(test)), Test._MiddlewareCommunicator__dispatch_plans)
+        for i in range(2):
+            msg_object, = test.exchange_object(msg="cached", mware=self.MWARE)
+            self.assertIsNone(msg_object)
+
+        test.activate_communication(test.exchange_object, mode=None)
+        msg_object, = test.exchange_object(msg="uncached", mware=self.MWARE)
+        self.assertEqual(msg_object["message"], "uncached")
+        test.close()
+        self.assertDictEqual(Test._MiddlewareCommunicator__dispatch_plans, {})
+        del test
+
+    def test_stream(self):
+        """
+        Test the stream functionality of the middleware. The ``stream`` method should yield the messages received by the
+        listener of a decorated method in listen mode, in the same structure as the method returns, and in lists of up
+        to ``max_batch`` messages when batching.
+        """
+        import multiprocessing
+        import wrapyfi.tests.tools.class_test as class_test
+        test_func = class_test.test_func
+        Test = class_test.Test
+        Test.close_all_instances()
+
+        if self.MWARE not in Test.get_communicators():
+            self.skipTest(f"{self.MWARE} not installed")
+
+        test = Test()
+        with self.assertRaises(ValueError):
+            next(test.stream("exchange_object"))
+        test.activate_communication(test.exchange_object, mode="listen")
+
+        publish_queue = multiprocessing.Queue(maxsize=10)
+        test_pub = multiprocessing.Process(target=test_func, args=(publish_queue,),
+                                           kwargs={"mode": "publish", "mware": self.MWARE, "iterations": 10,
+                                                   "should_wait": True})
+        test_pub.start()
+        stream = test.stream("exchange_object", mware=self.MWARE, should_wait=True)
+        received = [next(stream) for _ in range(3)]
+        self.assertTrue(all(len(msg) == 1 for msg in received))
+        indices = [int(msg_object["message"].split(":")[1]) for msg_object, in received]
+        self.assertEqual(indices, sorted(indices))
+
+        batch = next(test.stream(test.exchange_object, max_batch=3, timeout=0.2))
+        self.assertTrue(1 <= len(batch) <= 3)
+        self.assertGreater(int(batch[0][0]["message"].split(":")[1]), indices[-1])
+        test_pub.join()
+        test.close()
+        del test
+
+    def test_async(self):
+        """
+        Test the coroutine function support of the middleware. Methods defined with ``async def`` should be wrapped by a
+        coroutine function, awaiting the method when no mode is set, and publishing and listening to its returns without
+        blocking the event loop.
+        """
+        import asyncio
+        import inspect
+        import multiprocessing
+        import wrapyfi.tests.tools.class_test as class_test
+        AsyncTest = class_test.AsyncTest
+        AsyncTest.close_all_instances()
+
+        if self.MWARE not in AsyncTest.get_communicators():
+            self.skipTest(f"{self.MWARE} not installed")
+
+        test = AsyncTest()
+        self.assertTrue(inspect.iscoroutinefunction(test.exchange_object))
+        test.activate_communication(test.exchange_object, mode=None)
+        msg_object, = asyncio.run(test.exchange_object(msg="awaited", mware=self.MWARE))
+        self.assertEqual(msg_object["message"], "awaited")
+        test.activate_communication(test.exchange_object, mode="disable")
+        self.assertEqual(asyncio.run(test.exchange_object(mware=self.MWARE)), [None])
+        test.close()
+        del test
+
+        listen_queue = multiprocessing.Queue(maxsize=10)
+        test_lsn = multiprocessing.Process(target=class_test.async_test_func, args=(listen_queue,),
+                                           kwargs={"mode": "listen", "mware": self.MWARE, "iterations": 5,
+                                                   "should_wait": True})
+        publish_queue = multiprocessing.Queue(maxsize=10)
+        test_pub = multiprocessing.Process(target=class_test.async_test_func, args=(publish_queue,),
+                                           kwargs={"mode": "publish", "mware": self.MWARE, "iterations": 5,
+                                                   "should_wait": True})
+        test_lsn.start()
+        test_pub.start()
+        test_lsn.join()
+        test_pub.join()
+        for i in range(5):
+            self.assertDictEqual(listen_queue.get(timeout=3), publish_queue.get(timeout=3))
+
+
+    def test_serve(self):
+        """
+        Test the serve functionality of the middleware. The ``serve`` method should reply to the requests of a decorated
+        method in reply mode on a pool of workers, and raise a ValueError if the method is not in reply mode.
+        """
+        import multiprocessing
+        import wrapyfi.tests.tools.class_test as class_test
+        Test = class_test.Test
+        Test.close_all_instances()
+
+        if self.MWARE not in Test.get_communicators():
+            self.skipTest(f"{self.MWARE} not installed")
+        if self.MWARE != "zeromq":
+            self.skipTest(f"{self.MWARE} does not support serving on a pool of workers")
+
+        test = Test()
+        with self.assertRaises(ValueError):
+            test.serve(test.exchange_object)
+        test.activate_communication(test.exchange_object, mode="listen")
+        with self.assertRaises(ValueError):
+            test.serve(test.exchange_object)
+        test.close()
+        del test
+
+        done = multiprocessing.Event()
+        test_srv = multiprocessing.Process(target=class_test.serve_test_func, args=(done,),
+                                           kwargs={"mware": self.MWARE, "workers": 2})
+        request_queue = multiprocessing.Queue(maxsize=10)
+        test_req = multiprocessing.Process(target=class_test.test_func, args=(request_queue,),
+                                           kwargs={"mode": "request", "mware": self.MWARE, "iterations": 2})
+        test_srv.start()
+        test_req.start()
+        for i in range(2):
+            self.assertEqual(request_queue.get(timeout=10)["message"], f"signal_idx:{i}")
+        test_req.join()
+        done.set()
+        test_srv.join()
+
 
 class ROS2TestWrapper(ZeroMQTestWrapper):
     """
@@ -159,5 +309,13 @@ class ROSTestWrapper(ZeroMQTestWrapper):
     MWARE = "ros"
 
 
+class ShmTestWrapper(ZeroMQTestWrapper):
+    """
+    Test the shared memory wrapper. This test class inherits from the ZeroMQ test class, so all tests from the ZeroMQ
+    test class are also run for the shared memory wrapper.
+    """
+    MWARE = "shm"
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,63 @@
+import argparse
+import json
+import time
+
+import numpy as np
+
+from wrapyfi.encoders import JsonEncoder, JsonDecodeHook
+
+
+def get_small_dict(count):
+    return {"count": count,
+            "time": time.time(),
+            "label": "wrapyfi",
+            "pose": (0.1, 0.2, 0.3),
+            "flags": {"valid": True, "source": "benchmark"}}
+
+
+def encode_per_message(obj):
+    """
+    Encode an object by constructing a new encoder (and all its plugins) for every message.
+    """
+    return json.dumps(obj, cls=JsonEncoder)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=float, default=1000., help="The message rate in Hz. Set to 0 for no rate limit")
+    parser.add_argument("--trials", type=int, default=5000, help="Number of messages to encode per encoding approach")
+    parser.add_argument("--skip-trials", type=int, default=100, help="Number of trials to skip before logging "
+                                                                    "to avoid warmup time logging")
+    return parser.parse_args()
+
+
+def benchmark(encode, args):
+    decoder_hook = JsonDecodeHook().object_hook
+    encode_times = []
+    period = 1. / args.rate if args.rate > 0 else 0.
+    next_time = time.perf_counter()
+    for counter in range(args.trials + args.skip_trials):
+        obj = get_small_dict(counter)
+        start_time = time.perf_counter_ns()
+        obj_str = encode(obj)
+        encode_time = time.perf_counter_ns() - start_time
+        assert json.loads(obj_str, object_hook=decoder_hook)["pose"] == obj["pose"]
+        if counter >= args.skip_trials:
+            encode_times.append(encode_time)
+        if period:
+            next_time += period
+            sleep_time = next_time - time.perf_counter()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+    return np.array(encode_times) / 1000.
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    persistent_encoder = JsonEncoder()
+    print(f"Registered encoder plugins: {len(persistent_encoder.plugins)}")
+    for approach, encode in (("per_message", encode_per_message), ("persistent", persistent_encoder.encode)):
+        encode_times = benchmark(encode, args)
+        print(f"{approach} :: encode time (us) :: mean: {encode_times.mean():.2f} "
+              f"p50: {np.percentile(encode_times, 50):.2f} p99: {np.percentile(encode_times, 99):.2f} "
+              f"budget at {args.rate:g} Hz: {100. * encode_times.mean() * args.rate / 1e6:.2f}%")
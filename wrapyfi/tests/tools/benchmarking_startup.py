@@ -0,0 +1,39 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=20, help="Number of interpreter startups per loading approach")
+    parser.add_argument("--module", type=str, default="wrapyfi.connect.wrapper", help="The module to import")
+    return parser.parse_args()
+
+
+def benchmark(env, args):
+    """
+    Time a fresh interpreter importing the module, including the interpreter startup time.
+    """
+    startup_times = []
+    for _ in range(args.trials):
+        start_time = time.perf_counter_ns()
+        subprocess.run([sys.executable, "-c", f"import {args.module}"], env=env, check=True)
+        startup_times.append(time.perf_counter_ns() - start_time)
+    return np.array(startup_times) / 1e6
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    baseline_times = benchmark(os.environ.copy(), argparse.Namespace(trials=args.trials, module="sys"))
+    print(f"interpreter :: startup time (ms) :: mean: {baseline_times.mean():.2f} "
+          f"p50: {np.percentile(baseline_times, 50):.2f}")
+    for approach, lazy in (("eager", "False"), ("lazy", "True")):
+        env = dict(os.environ, WRAPYFI_MIDDLEWARE_LAZY=lazy, WRAPYFI_PLUGINS_LAZY=lazy)
+        startup_times = benchmark(env, args)
+        print(f"{approach} :: import {args.module} (ms) :: mean: {startup_times.mean():.2f} "
+              f"p50: {np.percentile(startup_times, 50):.2f} p99: {np.percentile(startup_times, 99):.2f} "
+              f"excluding interpreter: {startup_times.mean() - baseline_times.mean():.2f}")
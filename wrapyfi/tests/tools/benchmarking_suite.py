@@ -0,0 +1,442 @@
+"""
+Throughput and latency benchmark suite for the Wrapyfi communication patterns.
+
+Each benchmark case (middleware, pattern, data type and payload size) runs the sender and receiver in separate
+processes on the same host and reports:
+    - encode/decode: the time taken by the encoder and decoder to serialize and deserialize the payload, measured
+      in-process using the same serializer configuration as the communicators
+    - latency: the one-way delay from before publishing until the listener returns the message (PUB/SUB), or the
+      round-trip time of a request (REQ/REP)
+    - transport: the latency excluding the median encode and decode times (estimated per message)
+    - throughput: the sustained message and byte rates when publishing without a rate limit (``--throughput``)
+
+Timings are measured with ``time.perf_counter_ns``, which is based on the system-wide monotonic clock on Linux and is
+therefore comparable across processes on the same host. Percentiles (p50, p99, p99.9) are reported in microseconds.
+The results are printed and saved as JSON for detecting regressions between runs.
+
+Example (ZeroMQ only, no additional dependencies required):
+    ``python benchmarking_suite.py --mwares zeromq --sizes 1024 65536 1048576 --trials 1000 --throughput``
+"""
+
+import argparse
+import json
+import os
+import platform
+import queue
+import sys
+import time
+import multiprocessing
+
+import numpy as np
+
+from wrapyfi.connect.wrapper import MiddlewareCommunicator
+from wrapyfi.connect.publishers import Publishers
+from wrapyfi.connect.listeners import Listeners
+from wrapyfi.connect.servers import Servers
+from wrapyfi.connect.clients import Clients
+from wrapyfi.encoders import JsonEncoder, JsonDecodeHook
+
+
+PATTERNS = ("pubsub", "reqrep")
+DATA_TYPES = ("NativeObject", "Image", "AudioChunk")
+SENTINEL_SEQ = -1
+STAMP = np.dtype(np.int64)
+RESULT_TIMEOUT = 120
+# cases transmitting the payload as a raw buffer, which bypass the encoder and decoder
+RAW_CASES = {("zeromq", "pubsub", "Image"), ("zeromq", "reqrep", "Image"), ("zeromq", "reqrep", "AudioChunk")}
+
+
+def get_payload(data_type, size, plugin="numpy"):
+    """
+    Create the payload of a benchmark case, approximately ``size`` bytes large.
+
+    :param data_type: str: The data type of the communicator
+    :param size: int: The payload size in bytes
+    :param plugin: str: The type of the NativeObject data ('numpy', 'bytes', 'list', 'pandas', 'pytorch')
+    :return: Tuple[Any, int]: The payload and its actual size in bytes
+    """
+    if data_type == "Image":
+        side = max(4, int(np.sqrt(size / 3)))
+        img = np.random.randint(0, 255, (side, side, 3), dtype=np.uint8)
+        return img, img.nbytes
+    elif data_type == "AudioChunk":
+        aud = np.random.uniform(-1, 1, (max(4, size // 4), 1)).astype(np.float32)
+        return aud, aud.nbytes
+    elif plugin == "numpy":
+        return np.random.randint(0, 255, size, dtype=np.uint8), size
+    elif plugin == "bytes":
+        return os.urandom(size), size
+    elif plugin == "list":
+        return list(range(max(1, size // 8))), size
+    elif plugin == "pandas":
+        import pandas as pd
+        columns = 8
+        return pd.DataFrame(np.ones((max(1, size // (8 * columns)), columns))), size
+    elif plugin == "pytorch":
+        import torch as th
+        return th.ones(max(1, size // 4)), size
+    raise ValueError(f"Unsupported payload plugin: {plugin}")
+
+
+def stamp(arr, seq):
+    """
+    Write the sequence number and send time into the first bytes of a numpy array, for data types without a header.
+
+    :param arr: np.ndarray: The C-contiguous array to stamp
+    :param seq: int: The sequence number
+    """
+    arr.reshape(-1).view(np.uint8)[:2 * STAMP.itemsize] = \
+        np.array([seq, time.perf_counter_ns()], dtype=STAMP).view(np.uint8)
+
+
+def unstamp(arr):
+    """
+    Read the sequence number and send time written by ``stamp``.
+
+    :param arr: np.ndarray: The received array
+    :return: Tuple[int, int]: The sequence number and send time
+    """
+    seq, t_send = np.frombuffer(np.ascontiguousarray(arr).reshape(-1).view(np.uint8)[:2 * STAMP.itemsize].tobytes(),
+                                dtype=STAMP)
+    return int(seq), int(t_send)
+
+
+def get_communicator_kwargs(case, sender=False):
+    """
+    Get the keyword arguments of the communicators of a benchmark case.
+
+    :param case: dict: The benchmark case
+    :param sender: bool: Whether the communicator is the publisher or server of the case
+    :return: dict: The communicator keyword arguments
+    """
+    kwargs = {"should_wait": True,
+              "serializer_kwargs": {"serializer": case["serializer"]},
+              "deserializer_kwargs": {"serializer": case["serializer"]}}
+    if case["mware"] == "zeromq":
+        # spawn the brokers and monitors as threads, so they are terminated along with the processes of the case
+        if sender:
+            kwargs.update(proxy_broker_spawn="thread")
+        if case["pattern"] == "pubsub":
+            kwargs.update(pubsub_monitor_listener_spawn="thread")
+    if case["data_type"] == "Image":
+        kwargs.update(width=case["shape"][1], height=case["shape"][0], rgb=True)
+    elif case["data_type"] == "AudioChunk":
+        kwargs.update(chunk=case["shape"][0], channels=1, rate=44100)
+    elif case["raw_buffers"] and case["pattern"] == "pubsub" and case["mware"] == "zeromq":
+        kwargs.update(raw_buffers=True)
+    return kwargs
+
+
+def run_publisher(case, result_queue):
+    """
+    Publish the payload of a benchmark case, rate-limited in latency mode and as fast as possible in throughput mode.
+    A sentinel message is repeated at the end, until the listener stops or the timeout expires.
+    """
+    payload, _ = get_payload(case["data_type"], case["size"], case["plugin"])
+    publisher = Publishers.registry[f"{case['data_type']}:{case['mware']}"](
+        "Benchmarker", case["topic"], **get_communicator_kwargs(case, sender=True))
+    period = 1. / case["rate"] if case["rate"] > 0 and case["mode"] == "latency" else 0.
+
+    def publish(seq):
+        if case["data_type"] == "NativeObject":
+            publisher.publish({"seq": seq, "time": time.perf_counter_ns(), "data": payload})
+        elif case["data_type"] == "Image":
+            stamp(payload, seq)
+            publisher.publish(payload)
+        else:
+            stamp(payload, seq)
+            publisher.publish((payload, 44100))
+
+    sent = 0
+    start_time = next_time = time.perf_counter()
+    while True:
+        if case["mode"] == "latency" and sent >= case["trials"] + case["skip_trials"]:
+            break
+        if case["mode"] == "throughput" and sent > 0 and time.perf_counter() - start_time >= case["duration"]:
+            break
+        publish(sent)
+        sent += 1
+        if sent == 1:
+            # the first message establishes the connection
+            start_time = next_time = time.perf_counter()
+        if period:
+            next_time += period
+            sleep_time = next_time - time.perf_counter()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+    duration = time.perf_counter() - start_time
+    result_queue.put({"role": "publisher", "sent": sent, "duration": duration})
+    for _ in range(int(case["timeout"] / 0.1)):
+        publish(SENTINEL_SEQ)
+        time.sleep(0.1)
+
+
+def run_listener(case, result_queue):
+    """
+    Receive the messages of a benchmark case, recording the one-way latency of each message.
+    """
+    listener = Listeners.registry[f"{case['data_type']}:{case['mware']}"](
+        "Benchmarker", case["topic"], **get_communicator_kwargs(case))
+    latencies = []
+    received = 0
+    first_time = last_time = None
+    while True:
+        obj = listener.listen()
+        recv_time = time.perf_counter_ns()
+        if obj is None:
+            continue
+        if case["data_type"] == "NativeObject":
+            seq, t_send = obj["seq"], obj["time"]
+        elif case["data_type"] == "Image":
+            seq, t_send = unstamp(obj)
+        else:
+            seq, t_send = unstamp(obj[0])
+        if seq == SENTINEL_SEQ:
+            break
+        received += 1
+        last_time = recv_time
+        if first_time is None:
+            first_time = recv_time
+        if seq >= case["skip_trials"]:
+            latencies.append(recv_time - t_send)
+        if case["mode"] == "latency" and seq >= case["trials"] + case["skip_trials"] - 1:
+            break
+    result_queue.put({"role": "listener", "latencies": latencies, "received": received,
+                      "duration": (last_time - first_time) / 1e9 if received > 1 else 0.})
+
+
+def run_server(case, result_queue):
+    """
+    Reply to the requests of a benchmark case with the payload.
+    """
+    payload, _ = get_payload(case["data_type"], case["size"], case["plugin"])
+    server = Servers.registry[f"{case['data_type']}:{case['mware']}"](
+        "Benchmarker", case["topic"], **get_communicator_kwargs(case, sender=True))
+    if case["data_type"] == "NativeObject":
+        payload = {"data": payload}
+    elif case["data_type"] == "AudioChunk":
+        payload = (payload, 44100)
+    while True:
+        server.await_request()
+        server.reply(payload)
+
+
+def run_client(case, result_queue):
+    """
+    Send requests for a benchmark case, recording the round-trip time of each request.
+    """
+    client = Clients.registry[f"{case['data_type']}:{case['mware']}"](
+        "Benchmarker", case["topic"], **get_communicator_kwargs(case))
+    latencies = []
+    start_time = None
+    for seq in range(case["trials"] + case["skip_trials"]):
+        if seq == case["skip_trials"]:
+            start_time = time.perf_counter()
+        t_send = time.perf_counter_ns()
+        client.request(seq)
+        if seq >= case["skip_trials"]:
+            latencies.append(time.perf_counter_ns() - t_send)
+    duration = time.perf_counter() - start_time if start_time is not None else 0.
+    result_queue.put({"role": "client", "latencies": latencies, "received": len(latencies), "duration": duration})
+
+
+def measure_codec(case):
+    """
+    Measure the encode and decode times of the payload of a benchmark case in-process.
+
+    :param case: dict: The benchmark case
+    :return: Tuple[List[int], List[int], int]: The encode times, the decode times (in ns) and the encoded size in bytes
+    """
+    payload, _ = get_payload(case["data_type"], case["size"], case["plugin"])
+    encoder = JsonEncoder(serializer_kwargs={"serializer": case["serializer"]})
+    decoder = JsonDecodeHook(deserializer_kwargs={"serializer": case["serializer"]})
+    if case["data_type"] == "NativeObject":
+        obj = {"seq": 0, "time": 0, "data": payload}
+    elif case["data_type"] == "AudioChunk":
+        obj = (payload.shape[0], 1, 44100, payload)
+    else:
+        obj = payload
+    raw_buffers = get_communicator_kwargs(case).get("raw_buffers", False)
+    encode_times, decode_times = [], []
+    encoded_size = 0
+    for trial in range(min(case["trials"], case["codec_trials"]) + case["skip_trials"]):
+        start_time = time.perf_counter_ns()
+        if raw_buffers:
+            obj_str, obj_buffers = encoder.encode_buffers(obj, as_bytes=True)
+        else:
+            obj_str, obj_buffers = encoder.encode_bytes(obj), []
+        encode_time = time.perf_counter_ns() - start_time
+        encoded_size = len(obj_str) + sum(memoryview(buffer).nbytes for buffer in obj_buffers)
+        start_time = time.perf_counter_ns()
+        decoder.buffers = obj_buffers
+        decoder.decode(obj_str)
+        decoder.buffers = None
+        decode_time = time.perf_counter_ns() - start_time
+        if trial >= case["skip_trials"]:
+            encode_times.append(encode_time)
+            decode_times.append(decode_time)
+    return encode_times, decode_times, encoded_size
+
+
+def summarize(samples):
+    """
+    Summarize timing samples in nanoseconds.
+
+    :param samples: List[int]: The samples in nanoseconds
+    :return: dict: The sample count, mean, min, max and percentiles in microseconds
+    """
+    if not len(samples):
+        return {"count": 0}
+    samples = np.asarray(samples, dtype=np.float64) / 1e3
+    p50, p99, p999 = np.percentile(samples, (50, 99, 99.9))
+    return {"count": int(samples.size), "mean_us": float(samples.mean()), "min_us": float(samples.min()),
+            "p50_us": float(p50), "p99_us": float(p99), "p999_us": float(p999), "max_us": float(samples.max())}
+
+
+def run_case(case):
+    """
+    Run a benchmark case, spawning the sender and receiver processes.
+
+    :param case: dict: The benchmark case
+    :return: dict: The benchmark results of the case
+    """
+    result = {key: case[key] for key in ("mware", "pattern", "data_type", "mode", "plugin", "serializer",
+                                         "raw_buffers", "size", "payload_bytes")}
+    encode_times = decode_times = [0]
+    if case["mode"] == "latency" and (case["mware"], case["pattern"], case["data_type"]) not in RAW_CASES:
+        encode_times, decode_times, encoded_size = measure_codec(case)
+        result.update(encoded_bytes=encoded_size, encode=summarize(encode_times), decode=summarize(decode_times))
+
+    result_queue = multiprocessing.Queue()
+    if case["pattern"] == "pubsub":
+        receiver = multiprocessing.Process(target=run_listener, args=(case, result_queue))
+        sender = multiprocessing.Process(target=run_publisher, args=(case, result_queue))
+    else:
+        receiver = multiprocessing.Process(target=run_server, args=(case, result_queue))
+        sender = multiprocessing.Process(target=run_client, args=(case, result_queue))
+    receiver.start()
+    sender.start()
+
+    reports = {}
+    expected = ("publisher", "listener") if case["pattern"] == "pubsub" else ("client",)
+    deadline = time.perf_counter() + case["timeout"]
+    while set(expected) - set(reports) and time.perf_counter() < deadline:
+        try:
+            report = result_queue.get(timeout=0.5)
+            reports[report["role"]] = report
+        except queue.Empty:
+            if not receiver.is_alive() and not sender.is_alive():
+                break
+    for process in (sender, receiver):
+        process.join(timeout=1)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+    receiver_report = reports.get("listener", reports.get("client", None))
+    if receiver_report is None:
+        result["error"] = "timeout"
+        return result
+    latencies = receiver_report["latencies"]
+    if case["mode"] == "latency":
+        result["latency"] = summarize(latencies)
+        if case["pattern"] == "pubsub":
+            codec_time = np.median(encode_times) + np.median(decode_times)
+            result["transport"] = summarize([max(0, latency - codec_time) for latency in latencies])
+    received, duration = receiver_report["received"], receiver_report["duration"]
+    sent = reports.get("publisher", {}).get("sent", received)
+    result["throughput"] = {"sent": sent, "received": received, "loss": 1. - received / sent if sent else 0.,
+                            "msgs_per_s": received / duration if duration else 0.,
+                            "mb_per_s": received * case["payload_bytes"] / duration / 1e6 if duration else 0.}
+    return result
+
+
+def get_cases(args):
+    """
+    Generate the benchmark cases from the command line arguments.
+
+    :param args: argparse.Namespace: The command line arguments
+    :return: List[dict]: The benchmark cases
+    """
+    cases = []
+    modes = ["latency"] + (["throughput"] if args.throughput else [])
+    for mware in args.mwares:
+        for pattern in args.patterns:
+            for data_type in args.data_types:
+                for plugin in (args.plugins if data_type == "NativeObject" else ["numpy"]):
+                    for size in args.sizes:
+                        for mode in modes:
+                            if mode == "throughput" and pattern == "reqrep":
+                                # sequential requests are covered by the latency mode
+                                continue
+                            payload, payload_bytes = get_payload(data_type, size, plugin)
+                            cases.append({
+                                "mware": mware, "pattern": pattern, "data_type": data_type, "plugin": plugin,
+                                "size": size, "payload_bytes": payload_bytes, "mode": mode,
+                                "shape": list(payload.shape) if isinstance(payload, np.ndarray) else None,
+                                "serializer": args.serializer, "raw_buffers": args.raw_buffers,
+                                "topic": f"/wrapyfi_benchmark/case_{len(cases)}",
+                                "trials": args.trials, "skip_trials": args.skip_trials,
+                                "codec_trials": args.codec_trials, "rate": args.rate,
+                                "duration": args.duration, "timeout": args.timeout})
+    return cases
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Wrapyfi throughput and latency benchmark suite")
+    parser.add_argument("--mwares", type=str, default=["zeromq"], nargs="+",
+                        choices=MiddlewareCommunicator.get_communicators(),
+                        help="The middlewares to benchmark")
+    parser.add_argument("--patterns", type=str, default=list(PATTERNS), nargs="+", choices=PATTERNS,
+                        help="The communication patterns to benchmark")
+    parser.add_argument("--data-types", type=str, default=list(DATA_TYPES), nargs="+", choices=DATA_TYPES,
+                        help="The data types to benchmark")
+    parser.add_argument("--plugins", type=str, default=["numpy"], nargs="+",
+                        choices=["numpy", "bytes", "list", "pandas", "pytorch"],
+                        help="The NativeObject payload types to benchmark")
+    parser.add_argument("--sizes", type=int, default=[1024, 65536, 1048576], nargs="+",
+                        help="The payload sizes in bytes to sweep")
+    parser.add_argument("--serializer", type=str, default="json", help="The serializer of the NativeObject encoder")
+    parser.add_argument("--raw-buffers", action="store_true",
+                        help="Transmit NativeObject arrays as raw buffers (ZeroMQ PUB/SUB only)")
+    parser.add_argument("--trials", type=int, default=1000, help="Number of messages per latency case")
+    parser.add_argument("--skip-trials", type=int, default=50, help="Number of warmup messages excluded from the results")
+    parser.add_argument("--codec-trials", type=int, default=200, help="Maximum number of in-process encode/decode trials")
+    parser.add_argument("--rate", type=float, default=500., help="The message rate in Hz of the latency cases. "
+                                                                 "Set to 0 for no rate limit")
+    parser.add_argument("--throughput", action="store_true", help="Run the sustained throughput cases (PUB/SUB)")
+    parser.add_argument("--duration", type=float, default=3., help="Duration of each throughput case in seconds")
+    parser.add_argument("--timeout", type=float, default=RESULT_TIMEOUT, help="Timeout of each case in seconds")
+    parser.add_argument("--output", type=str, default=None,
+                        help="The JSON results file. Default is results/benchmarking_suite_<timestamp>.json")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    output = args.output or os.path.join("results", f"benchmarking_suite_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    results = []
+    for case in get_cases(args):
+        result = run_case(case)
+        results.append(result)
+        summary = f"{case['mware']} :: {case['pattern']} :: {case['data_type']} ({case['plugin']}) :: " \
+                  f"{case['payload_bytes']} B :: {case['mode']}"
+        if "error" in result:
+            print(f"{summary} :: {result['error']}")
+        elif case["mode"] == "latency":
+            latency = result["latency"]
+            print(f"{summary} :: latency (us) p50: {latency.get('p50_us', float('nan')):.1f} "
+                  f"p99: {latency.get('p99_us', float('nan')):.1f} p99.9: {latency.get('p999_us', float('nan')):.1f} "
+                  f":: encode p50: {result.get('encode', {}).get('p50_us', 0.):.1f} "
+                  f"decode p50: {result.get('decode', {}).get('p50_us', 0.):.1f}")
+        else:
+            throughput = result["throughput"]
+            print(f"{summary} :: {throughput['msgs_per_s']:.0f} msgs/s {throughput['mb_per_s']:.1f} MB/s "
+                  f"loss: {100. * throughput['loss']:.1f}%")
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as results_file:
+        json.dump({"meta": {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+                            "platform": platform.platform(), "cpu_count": os.cpu_count(), "args": vars(args)},
+                   "results": results}, results_file, indent=2)
+    print(f"Results saved to {output}")
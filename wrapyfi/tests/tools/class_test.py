@@ -1,5 +1,5 @@
 import time
-
+import asyncio
 
 from wrapyfi.connect.wrapper import MiddlewareCommunicator, DEFAULT_COMMUNICATOR
 
@@ -28,3 +28,40 @@ def test_func(queue_buffer, mode="listen", mware=DEFAULT_COMMUNICATOR, topic="/t
             print(f"result {mode}:", my_message[0]["message"])
             queue_buffer.put(my_message[0])
         time.sleep(0.5)
+
+
+class AsyncTest(MiddlewareCommunicator):
+
+    @MiddlewareCommunicator.register("NativeObject", "$mware", "AsyncTest", "$topic",
+                                     should_wait="$should_wait")
+    async def exchange_object(self, msg=None, mware=DEFAULT_COMMUNICATOR, topic="/test/test_native_async_exchange",
+                              should_wait=False):
+        await asyncio.sleep(0)
+        ret = {"message": msg,
+               "list": [[[3, [4], 5.677890, 1.2]]],
+               "dict": {"other": [None, False, 16, 4.32,]}}
+        return ret,
+
+
+def async_test_func(queue_buffer, mode="listen", mware=DEFAULT_COMMUNICATOR, topic="/test/test_native_async_exchange",
+                    iterations=2, should_wait=False):
+    async def exchange():
+        test = AsyncTest()
+        test.activate_communication(test.exchange_object, mode=mode)
+        for i in range(iterations):
+            my_message = await test.exchange_object(msg=f"signal_idx:{i}", mware=mware, topic=topic,
+                                                    should_wait=should_wait)
+            if my_message is not None:
+                print(f"result {mode}:", my_message[0]["message"])
+                queue_buffer.put(my_message[0])
+            await asyncio.sleep(0.5)
+
+    asyncio.run(exchange())
+
+
+def serve_test_func(done, mware=DEFAULT_COMMUNICATOR, workers=2, spawn="thread"):
+    test = Test()
+    test.activate_communication(test.exchange_object, mode="reply")
+    test.serve(test.exchange_object, mware=mware, workers=workers, spawn=spawn)
+    done.wait(30)
+    test.close()
@@ -1,12 +1,19 @@
 import os
+import logging
 from glob import glob
 import threading
 import importlib.util
 import sys
-from typing import Union, Callable, Any, Optional, List
+import time
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Union, Callable, Any, Optional, List, Hashable
 
 
 WRAPYFI_PLUGIN_PATHS = "WRAPYFI_PLUGIN_PATHS"
+PLUGINS_LAZY = os.environ.get("WRAPYFI_PLUGINS_LAZY", "True") != "False"
+MIDDLEWARE_LAZY = os.environ.get("WRAPYFI_MIDDLEWARE_LAZY", "True") != "False"
 
 
 lock = threading.Lock()
@@ -122,6 +129,70 @@ def dynamic_module_import(modules: List[str], globals: dict):
         globals.update({name: getattr(module, name) for name in all_names})
 
 
+class MiddlewareRegistry(dict):
+    """
+    Registry of the communicators (publishers, listeners, servers, or clients) keyed by '<data type>:<middleware>'.
+    Middleware modules declared in a middleware manifest are not imported when Wrapyfi is imported. Instead, a module
+    is imported when one of its declared keys is first looked up (e.g. when the wrapper instantiates a communicator),
+    registering its communicators. Only item access (``registry[key]``) imports declared modules, whereas ``in``,
+    ``get``, and iteration only see the communicators already registered.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_modules = {}
+        self._lazy_lock = threading.RLock()
+
+    def declare(self, package: str, manifest: dict, mwares: Optional[set] = None):
+        """
+        Declare the middleware modules of a package without importing them. Middleware requiring packages that are
+        not installed are skipped, as their modules would fail to import.
+
+        :param package: str: The name of the package containing the middleware modules (e.g. 'wrapyfi.publishers')
+        :param manifest: dict: Mapping of each middleware module name (e.g. 'zeromq') to a dictionary holding the
+                         'data_types' registered by the module and the top-level packages it 'requires'
+        :param mwares: set: The set of available middleware to update with the declared middleware. Default is None
+        """
+        with self._lazy_lock:
+            for middleware, entry in manifest.items():
+                missing = [req for req in entry.get("requires", ()) if importlib.util.find_spec(req) is None]
+                if missing:
+                    logging.debug(f"[Middleware] {package}.{middleware} skipped due to missing packages: {missing}")
+                    continue
+                for data_type in entry["data_types"]:
+                    self.lazy_modules.setdefault(f"{data_type}:{middleware}", f"{package}.{middleware}")
+                if mwares is not None:
+                    mwares.add(middleware)
+
+    def load(self, module: str):
+        """
+        Import a declared middleware module, registering its communicators. The declarations of the module are
+        removed, so that a module failing to import is not imported again.
+
+        :param module: str: The name of the middleware module
+        :return: bool: True if the module was imported, False otherwise
+        """
+        with self._lazy_lock:
+            for key in [key for key, val in self.lazy_modules.items() if val == module]:
+                del self.lazy_modules[key]
+            try:
+                importlib.import_module(module)
+            except ImportError as e:
+                logging.debug(f"[Middleware] Middleware module {module} could not be imported: {e}")
+                return False
+            return True
+
+    def __missing__(self, key):
+        with self._lazy_lock:
+            # another thread may have imported the module while this thread waited for the lock
+            if not dict.__contains__(self, key):
+                module = self.lazy_modules.get(key)
+                if module is None:
+                    raise KeyError(key)
+                self.load(module)
+        return dict.__getitem__(self, key)
+
+
 class SingletonOptimized(type):
     """
     A singleton metaclass that is thread-safe and optimized for speed.
@@ -138,10 +209,138 @@ class SingletonOptimized(type):
         return cls._instances[cls]
 
 
+class ResponseCache(object):
+    """
+    A thread-safe cache of responses with least recently used eviction and an optional time to live. Concurrent
+    computations of the same key are coalesced, so that only the first caller computes the response, whereas the
+    remaining callers wait for its result. Failed computations are not cached.
+    """
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        :param maxsize: int: The maximum number of cached responses. Default is 128
+        :param ttl: float: The seconds a response remains cached. Default is None (responses do not expire)
+        """
+        if maxsize < 1:
+            raise ValueError("The cache size must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable):
+        """
+        Internal method to look up a key, registering a pending computation on a miss. Must be called with the lock
+        acquired.
+
+        :param key: Hashable: The key of the response
+        :return: Tuple[bool, Any, Future]: Whether the response is cached, the cached response, and the future of the
+                 pending computation, which is None if the caller is responsible for computing the response
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expiry, value = entry
+            if expiry is None or expiry > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value, None
+            del self._entries[key]
+        self.misses += 1
+        future = self._pending.get(key)
+        if future is None:
+            self._pending[key] = Future()
+        return False, None, future
+
+    def _resolve(self, key: Hashable, value: Any = None, error: Optional[BaseException] = None):
+        """
+        Internal method to cache the computed response and resolve the future of the pending computation.
+
+        :param key: Hashable: The key of the response
+        :param value: Any: The computed response
+        :param error: BaseException: The error raised by the computation. Default is None
+        """
+        with self._lock:
+            future = self._pending.pop(key)
+            if error is None:
+                self._entries[key] = (None if self.ttl is None else time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        if error is None:
+            future.set_result(value)
+        else:
+            future.set_exception(error)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]):
+        """
+        Return the cached response of a key, or compute and cache it.
+
+        :param key: Hashable: The key of the response
+        :param compute: Callable[[], Any]: The function computing the response
+        :return: Any: The response
+        """
+        with self._lock:
+            cached, value, future = self._lookup(key)
+        if cached:
+            return value
+        if future is not None:
+            return future.result()
+        try:
+            value = compute()
+        except BaseException as e:
+            self._resolve(key, error=e)
+            raise
+        self._resolve(key, value)
+        return value
+
+    async def aget_or_compute(self, key: Hashable, compute: Callable[[], Any]):
+        """
+        Return the cached response of a key, or await and cache it without blocking the event loop.
+
+        :param key: Hashable: The key of the response
+        :param compute: Callable[[], Awaitable]: The coroutine function computing the response
+        :return: Any: The response
+        """
+        with self._lock:
+            cached, value, future = self._lookup(key)
+        if cached:
+            return value
+        if future is not None:
+            return await asyncio.wrap_future(future)
+        try:
+            value = await compute()
+        except BaseException as e:
+            self._resolve(key, error=e)
+            raise
+        self._resolve(key, value)
+        return value
+
+    def clear(self):
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
 class Plugin(object):
     """
     Base class for encoding and decoding plugins.
+
+    Plugins setting ``raw_buffers = True`` are also encoded with ``encode_binary`` by text serializers when the
+    encoder extracts raw buffers (see ``JsonEncoder.encode_buffers``), so that the numpy arrays and bytes-like objects
+    they return are transmitted as separate buffers. Their ``decode`` method must therefore also decode the data
+    returned by ``encode_binary``.
     """
+    raw_buffers = False
+
     def encode(self, *args, **kwargs):
         """
         Encode data into a base64 string.
@@ -167,18 +366,51 @@ class Plugin(object):
         """
         raise NotImplementedError
 
+    def encode_binary(self, *args, **kwargs):
+        """
+        Encode data for binary serializers (e.g. msgpack), which transmit bytes natively. Plugins can override this
+        method to return the data as bytes instead of a base64 string. Defaults to ``encode``.
+
+        :param args: tuple: Additional arguments
+        :param kwargs: dict: Additional keyword arguments
+        :return: Tuple[bool, dict]: A tuple containing:
+            - bool: True if the encoding was successful, False otherwise
+            - dict: A dictionary containing:
+                - '__wrapyfi__': A tuple containing the class name and encoded data (bytes or string)
+        """
+        return self.encode(*args, **kwargs)
+
+    def decode_binary(self, *args, **kwargs):
+        """
+        Decode data encoded by ``encode_binary``. Defaults to ``decode``.
+
+        :param args: tuple: Additional arguments
+        :param kwargs: dict: Additional keyword arguments
+        :return: Tuple[bool, object]: A tuple containing:
+            - bool: True if the decoding was successful, False otherwise
+            - object: The decoded data
+        """
+        return self.decode(*args, **kwargs)
+
 
 class PluginRegistrar(object):
     """
-    Class for registering encoding and decoding plugins.
+    Class for registering encoding and decoding plugins. Plugin modules declared in the plugin manifest
+    (``wrapyfi.plugins.PLUGIN_MANIFEST``) are imported lazily, when an object of a declared type is first encoded or a
+    declared ``__wrapyfi__`` tag is first decoded, so that their frameworks are only imported when needed.
     """
     encoder_registry = {}
     decoder_registry = {}
+    version = 0
+    lazy_types = {}
+    lazy_tags = {}
+    _lazy_lock = threading.RLock()
 
     @staticmethod
     def register(types=None):
         """
-        Register a plugin for encoding and decoding a specific type.
+        Register a plugin for encoding and decoding a specific type. Every registration increments the registry
+        version, invalidating the plugin instances and type resolutions cached by the encoders and decoders.
 
         :param types: tuple: The type(s) to register the plugin for
         """
@@ -187,17 +419,94 @@ class PluginRegistrar(object):
                 for cls_type in types:
                     PluginRegistrar.encoder_registry[cls_type] = cls
                 PluginRegistrar.decoder_registry[str(cls.__name__)] = cls
+                PluginRegistrar.version += 1
             return cls
         return wrapper
 
     @staticmethod
-    def scan():
+    def declare(module: str, types: tuple = (), tags: tuple = ()):
+        """
+        Declare a plugin module without importing it. The module is imported on the first ``load_type`` or
+        ``load_tag`` matching one of its types or tags.
+
+        :param module: str: The name of the plugin module (e.g. 'wrapyfi.plugins.pytorch_tensor')
+        :param types: tuple: The qualified names of the types encoded by the plugins of the module, formatted as
+                      '<module path>.<qualname>'. The module path may be shortened to the top-level package
+                      (e.g. 'torch.Tensor' or 'pandas.DataFrame'), matching the types defined anywhere within the package
+        :param tags: tuple: The ``__wrapyfi__`` tags decoded by the plugins of the module (i.e. the plugin class names)
+        """
+        with PluginRegistrar._lazy_lock:
+            for type_name in types:
+                PluginRegistrar.lazy_types[type_name] = module
+            for tag in tags:
+                PluginRegistrar.lazy_tags[tag] = module
+
+    @staticmethod
+    def load(module: str):
+        """
+        Import a declared plugin module, registering its plugins. The declarations of the module are removed, so that
+        a module failing to import is not imported again.
+
+        :param module: str: The name of the plugin module
+        :return: bool: True if the module was imported, False otherwise
+        """
+        with PluginRegistrar._lazy_lock:
+            for registry in (PluginRegistrar.lazy_types, PluginRegistrar.lazy_tags):
+                for key in [key for key, val in registry.items() if val == module]:
+                    del registry[key]
+            try:
+                importlib.import_module(module)
+            except ImportError as e:
+                logging.debug(f"[Plugins] Plugin module {module} could not be imported: {e}")
+                return False
+            return True
+
+    @staticmethod
+    def load_type(obj_type: type):
+        """
+        Import the declared plugin modules encoding a type or any of its base classes.
+
+        :param obj_type: type: The type of the object being encoded
+        :return: bool: True if any plugin module was imported, False otherwise
+        """
+        if not PluginRegistrar.lazy_types:
+            return False
+        modules = []
+        for cls in obj_type.__mro__[:-1]:
+            cls_module = getattr(cls, "__module__", None) or ""
+            for type_name in (f"{cls_module}.{cls.__qualname__}", f"{cls_module.partition('.')[0]}.{cls.__qualname__}"):
+                module = PluginRegistrar.lazy_types.get(type_name)
+                if module is not None and module not in modules:
+                    modules.append(module)
+        return any([PluginRegistrar.load(module) for module in modules])
+
+    @staticmethod
+    def load_tag(tag: str):
+        """
+        Import the declared plugin module decoding a ``__wrapyfi__`` tag.
+
+        :param tag: str: The tag of the object being decoded
+        :return: bool: True if the plugin module was imported, False otherwise
+        """
+        module = PluginRegistrar.lazy_tags.get(tag)
+        return module is not None and PluginRegistrar.load(module)
+
+    @staticmethod
+    def scan(lazy: bool = PLUGINS_LAZY):
         """
         Scan the plugins directory (Wrapyfi builtin and external) for plugins to register.
         This method is called automatically when the module is imported.
+
+        :param lazy: bool: Whether to declare the builtin plugin modules listed in the plugin manifest instead of
+                     importing them. Default is True (unless the environment variable ``WRAPYFI_PLUGINS_LAZY=False``)
         """
+        from wrapyfi.plugins import PLUGIN_MANIFEST
         modules = glob(os.path.join(os.path.dirname(__file__), "plugins", "*.py"), recursive=True)
         modules = ["wrapyfi.plugins." + module.replace(os.path.dirname(__file__) + "/plugins/", "") for module in modules]
+        if lazy:
+            for module_name, manifest in PLUGIN_MANIFEST.items():
+                PluginRegistrar.declare("wrapyfi.plugins." + module_name, **manifest)
+            modules = [module for module in modules if module[len("wrapyfi.plugins."):-3] not in PLUGIN_MANIFEST]
         dynamic_module_import(modules, globals())
 
         extern_modules_paths = os.environ.get(WRAPYFI_PLUGIN_PATHS, "").split(":")